@@ -1,7 +1,7 @@
 # import inspect
 import os
 import threading
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from enum import Enum
 from typing import Union, Dict
 
@@ -143,68 +143,132 @@ class OrdConsRuleData:
                                    where pcl.pkt_consol_value_1='M' and pcl.lock_pkt_consol_colm_1='Y' and pcl.pkt_consol_attr in ('*') and pcl.rec_type='#P_OR_W#' order by pcl.prty_seq_nbr"""
 
 
+DBLibSettings = namedtuple('DBLibSettings', [
+    'WM_SCHEMA', 'IS_ALLOW_UPDATE_INVN', 'IS_ALLOW_CREATE_INVN', 'IS_ALLOW_CREATE_INVN_IN_VLM',
+    'IS_ALLOW_CREATE_INVN_IN_AUTOSTR', 'IS_ALLOW_CREATE_INVN_IN_ASRS', 'IS_ALLOW_CLEAR_INVN',
+    'IS_ALLOW_CLEAR_INVN_IN_VLM', 'IS_ALLOW_CLEAR_INVN_IN_AUTOSTR', 'IS_ALLOW_CLEAR_INVN_IN_ASRS',
+    'IS_ALLOW_CANCEL_TASK', 'IS_ALLOW_UPDATE_TASK', 'IS_ALLOW_CANCEL_ALLOC', 'IS_ALLOW_UPDATE_LOCN',
+    'IS_ALLOW_CLEAR_CONS_LOCN', 'IS_ALLOW_CLEAR_DOCKDOOR', 'IS_ALLOW_CLOSE_MANIFEST', 'IS_ALLOW_UPDATE_ILPN',
+    'IS_ALLOW_UPDATE_OLPN', 'ENV', 'ENV_TYPE', 'IS_FOR_ARC'])
+
+
 class DBLib:
     logger = Logging.get(__qualname__)
 
+    _SETTINGS = None  # DBLibSettings, read once per process
+    _SETTINGS_LOCK = threading.Lock()
+    _THREAD_DBLIBS = {}  # Pair of (schema name, thread id) and shared DBLib
+
     '''ASN'''
 
-    _fetchASNHdrByASNNum = """select * from asn where tc_asn_id in ('#TC_ASN_ID#')"""
+    _fetchASNHdrByASNNum = """select * from asn where tc_asn_id = :tc_asn_id"""
     _fetchASNDtlsByASNDtls = """select a.tc_asn_id, ad.* from asn_detail ad inner join asn a on ad.asn_id = a.asn_id 
-                                where a.tc_asn_id = '#TC_ASN_ID#' 
+                                where a.tc_asn_id = :tc_asn_id 
                                 #CONDITION#"""
 
     def __init__(self, schema=None):
+        settings = self._get_settings()
         if schema is None:
-            schema = ENV_CONFIG.get('orcl_db', 'wm_schema')
+            schema = settings.WM_SCHEMA
         self.schema = schema
         DBService.connect_db(schema)
 
-        self.IS_ALLOW_UPDATE_INVN = ENV_CONFIG.get('data', 'is_allow_update_invn')
-        self.IS_ALLOW_CREATE_INVN = ENV_CONFIG.get('data', 'is_allow_create_invn')
-        self.IS_ALLOW_CREATE_INVN_IN_VLM = ENV_CONFIG.get('data', 'is_allow_create_invn_in_vlm')
-        self.IS_ALLOW_CREATE_INVN_IN_AUTOSTR = ENV_CONFIG.get('data', 'is_allow_create_invn_in_as')
-        self.IS_ALLOW_CREATE_INVN_IN_ASRS = ENV_CONFIG.get('data', 'is_allow_create_invn_in_asrs')
-        self.IS_ALLOW_CLEAR_INVN = ENV_CONFIG.get('data', 'is_allow_clear_invn')
-        self.IS_ALLOW_CLEAR_INVN_IN_VLM = ENV_CONFIG.get('data', 'is_allow_clear_invn_in_vlm')
-        self.IS_ALLOW_CLEAR_INVN_IN_AUTOSTR = ENV_CONFIG.get('data', 'is_allow_clear_invn_in_as')
-        self.IS_ALLOW_CLEAR_INVN_IN_ASRS = ENV_CONFIG.get('data', 'is_allow_clear_invn_in_asrs')
-        self.IS_ALLOW_CANCEL_TASK = ENV_CONFIG.get('data', 'is_allow_cancel_task')
-        self.IS_ALLOW_UPDATE_TASK = ENV_CONFIG.get('data', 'is_allow_update_task')
-        self.IS_ALLOW_CANCEL_ALLOC = ENV_CONFIG.get('data', 'is_allow_cancel_alloc')
-        self.IS_ALLOW_UPDATE_LOCN = ENV_CONFIG.get('data', 'is_allow_update_locn')
-        self.IS_ALLOW_CLEAR_CONS_LOCN = ENV_CONFIG.get('data', 'is_allow_clear_consol_locn')
-        self.IS_ALLOW_CLEAR_DOCKDOOR = ENV_CONFIG.get('data', 'is_allow_clear_dockdoor')
-        self.IS_ALLOW_CLOSE_MANIFEST = ENV_CONFIG.get('data', 'is_allow_close_manifest')
-        self.IS_ALLOW_UPDATE_ILPN = ENV_CONFIG.get('data', 'is_allow_update_ilpn')
-        self.IS_ALLOW_UPDATE_OLPN = ENV_CONFIG.get('data', 'is_allow_update_olpn')
+        self.IS_ALLOW_UPDATE_INVN = settings.IS_ALLOW_UPDATE_INVN
+        self.IS_ALLOW_CREATE_INVN = settings.IS_ALLOW_CREATE_INVN
+        self.IS_ALLOW_CREATE_INVN_IN_VLM = settings.IS_ALLOW_CREATE_INVN_IN_VLM
+        self.IS_ALLOW_CREATE_INVN_IN_AUTOSTR = settings.IS_ALLOW_CREATE_INVN_IN_AUTOSTR
+        self.IS_ALLOW_CREATE_INVN_IN_ASRS = settings.IS_ALLOW_CREATE_INVN_IN_ASRS
+        self.IS_ALLOW_CLEAR_INVN = settings.IS_ALLOW_CLEAR_INVN
+        self.IS_ALLOW_CLEAR_INVN_IN_VLM = settings.IS_ALLOW_CLEAR_INVN_IN_VLM
+        self.IS_ALLOW_CLEAR_INVN_IN_AUTOSTR = settings.IS_ALLOW_CLEAR_INVN_IN_AUTOSTR
+        self.IS_ALLOW_CLEAR_INVN_IN_ASRS = settings.IS_ALLOW_CLEAR_INVN_IN_ASRS
+        self.IS_ALLOW_CANCEL_TASK = settings.IS_ALLOW_CANCEL_TASK
+        self.IS_ALLOW_UPDATE_TASK = settings.IS_ALLOW_UPDATE_TASK
+        self.IS_ALLOW_CANCEL_ALLOC = settings.IS_ALLOW_CANCEL_ALLOC
+        self.IS_ALLOW_UPDATE_LOCN = settings.IS_ALLOW_UPDATE_LOCN
+        self.IS_ALLOW_CLEAR_CONS_LOCN = settings.IS_ALLOW_CLEAR_CONS_LOCN
+        self.IS_ALLOW_CLEAR_DOCKDOOR = settings.IS_ALLOW_CLEAR_DOCKDOOR
+        self.IS_ALLOW_CLOSE_MANIFEST = settings.IS_ALLOW_CLOSE_MANIFEST
+        self.IS_ALLOW_UPDATE_ILPN = settings.IS_ALLOW_UPDATE_ILPN
+        self.IS_ALLOW_UPDATE_OLPN = settings.IS_ALLOW_UPDATE_OLPN
 
         self.thread_id = threading.current_thread().native_id
 
-        self._ENV = os.environ['env']
-        self._ENV_TYPE = ENV_CONFIG.get('framework', 'env_type')
-        self._IS_FOR_ARC = os.environ['isForARC']
+        self._ENV = settings.ENV
+        self._ENV_TYPE = settings.ENV_TYPE
+        self._IS_FOR_ARC = settings.IS_FOR_ARC
+
+    @classmethod
+    def _get_settings(cls) -> DBLibSettings:
+        """Config/env values used by DBLib, read only once per process
+        """
+        if cls._SETTINGS is None:
+            with cls._SETTINGS_LOCK:
+                if cls._SETTINGS is None:
+                    cls._SETTINGS = DBLibSettings(
+                        WM_SCHEMA=ENV_CONFIG.get('orcl_db', 'wm_schema'),
+                        IS_ALLOW_UPDATE_INVN=ENV_CONFIG.get('data', 'is_allow_update_invn'),
+                        IS_ALLOW_CREATE_INVN=ENV_CONFIG.get('data', 'is_allow_create_invn'),
+                        IS_ALLOW_CREATE_INVN_IN_VLM=ENV_CONFIG.get('data', 'is_allow_create_invn_in_vlm'),
+                        IS_ALLOW_CREATE_INVN_IN_AUTOSTR=ENV_CONFIG.get('data', 'is_allow_create_invn_in_as'),
+                        IS_ALLOW_CREATE_INVN_IN_ASRS=ENV_CONFIG.get('data', 'is_allow_create_invn_in_asrs'),
+                        IS_ALLOW_CLEAR_INVN=ENV_CONFIG.get('data', 'is_allow_clear_invn'),
+                        IS_ALLOW_CLEAR_INVN_IN_VLM=ENV_CONFIG.get('data', 'is_allow_clear_invn_in_vlm'),
+                        IS_ALLOW_CLEAR_INVN_IN_AUTOSTR=ENV_CONFIG.get('data', 'is_allow_clear_invn_in_as'),
+                        IS_ALLOW_CLEAR_INVN_IN_ASRS=ENV_CONFIG.get('data', 'is_allow_clear_invn_in_asrs'),
+                        IS_ALLOW_CANCEL_TASK=ENV_CONFIG.get('data', 'is_allow_cancel_task'),
+                        IS_ALLOW_UPDATE_TASK=ENV_CONFIG.get('data', 'is_allow_update_task'),
+                        IS_ALLOW_CANCEL_ALLOC=ENV_CONFIG.get('data', 'is_allow_cancel_alloc'),
+                        IS_ALLOW_UPDATE_LOCN=ENV_CONFIG.get('data', 'is_allow_update_locn'),
+                        IS_ALLOW_CLEAR_CONS_LOCN=ENV_CONFIG.get('data', 'is_allow_clear_consol_locn'),
+                        IS_ALLOW_CLEAR_DOCKDOOR=ENV_CONFIG.get('data', 'is_allow_clear_dockdoor'),
+                        IS_ALLOW_CLOSE_MANIFEST=ENV_CONFIG.get('data', 'is_allow_close_manifest'),
+                        IS_ALLOW_UPDATE_ILPN=ENV_CONFIG.get('data', 'is_allow_update_ilpn'),
+                        IS_ALLOW_UPDATE_OLPN=ENV_CONFIG.get('data', 'is_allow_update_olpn'),
+                        ENV=os.environ['env'],
+                        ENV_TYPE=ENV_CONFIG.get('framework', 'env_type'),
+                        IS_FOR_ARC=os.environ['isForARC'])
+        return cls._SETTINGS
+
+    @classmethod
+    def get(cls, schema=None) -> 'DBLib':
+        """Returns the shared DBLib of the curr thread for the schema, creates one if not yet created
+        """
+        schema = schema if schema is not None else cls._get_settings().WM_SCHEMA
+        key = (schema, threading.current_thread().native_id)
+
+        dbLib = cls._THREAD_DBLIBS.get(key)
+        if dbLib is None:
+            dbLib = cls(schema)
+            cls._THREAD_DBLIBS[key] = dbLib
+        return dbLib
+
+    @classmethod
+    def release(cls, schema: str = None):
+        """Removes the DBLib of the curr thread and releases its db session, for short-lived worker threads
+        """
+        schema = schema if schema is not None else cls._get_settings().WM_SCHEMA
+        cls._THREAD_DBLIBS.pop((schema, threading.current_thread().native_id), None)
+        DBService.release_conn(schema)
 
     def _clearBadInvnData(self):
         """Clear bad invn records created by automation
         This deletes in wm_inventory and pick_locn_dtl
         TODO Check CREATED_SOURCE from pick_locn_dtl instead of wm_inventory
         """
-        sql = f"""select wi.item_id from wm_inventory wi 
+        sql = """select wi.item_id from wm_inventory wi 
                 where wi.locn_class = 'A' group by wi.item_id having count(wi.item_id) > 1"""
-        dbRows = DBService.fetch_rows(sql, self.schema)
-
-        for i in range(len(dbRows)):
-            itemId = dbRows[i]['ITEM_ID']
-            sql = f"""select distinct ic.item_name,lh.locn_brcd,wi.created_dttm,wi.created_source
+        locnSql = """select distinct ic.item_name,lh.locn_brcd,wi.created_dttm,wi.created_source
                     from wm_inventory wi inner join item_cbo ic on ic.item_id = wi.item_id inner join locn_hdr lh on lh.locn_id = wi.location_id
-                    where wi.item_id = '{itemId}' and wi.locn_class = 'A' order by wi.created_dttm asc
+                    where wi.item_id = :item_id and wi.locn_class = 'A' order by wi.created_dttm asc
                     """
-            locnRecs = DBService.fetch_rows(sql, self.schema)
-            for j in range(1, len(locnRecs)):
-                itemName = locnRecs[j]['ITEM_NAME']
-                locnBrcd = locnRecs[j]['LOCN_BRCD']
-                if locnRecs[j]['CREATED_SOURCE'] == 'AUTOMATION':
-                    DBAdmin._deleteFromActvInvnTables(self.schema, item=itemName, locnBrcd=locnBrcd)
+        for dbRows in DBService.fetch_rows_in_batches(sql, self.schema, isNamedTupleRow=True):
+            for dbRow in dbRows:
+                bindVar = {'item_id': dbRow.ITEM_ID}
+                locnRecs = DBService.fetch_rows(locnSql, self.schema, bind_var=bindVar, isNamedTupleRow=True)
+                for locnRec in locnRecs[1:]:
+                    if locnRec.CREATED_SOURCE == 'AUTOMATION':
+                        DBAdmin._deleteFromActvInvnTables(self.schema, item=locnRec.ITEM_NAME, locnBrcd=locnRec.LOCN_BRCD)
 
     def getTaskPathDefs2(self, taskPath: TaskPath = None) -> list:
         """Returns list of distinct task path def records
@@ -640,32 +704,61 @@ class DBLib:
                    isVLMItem: bool = None, isASItem: bool = None, isASRSItem: bool = None,
                    isFetchByMaxVol:bool=None):
 
-        RuntimeXL.createThreadLockFile()
-        try:
-            sql = self._buildQueryForGetItems(noOfItem=noOfItem,
-                                              # isPCKItem=isPCKItem, isWPItem=isWPItem,
-                                              consolInvnType=consolInvnType, isTHMItem=isTHMItem,
-                                              isItemWithBundleQty=isItemWithBundleQty, isItemForCrossDock=isItemForCrossDock, isHazmatItem=isHazmatItem,
-                                              itemAllocType=itemAllocType, isCubiscanNeed=isCubiscanNeed, ignoreItems=ignoreItems,
-                                              isVLMItem=isVLMItem, isASItem=isASItem, isASRSItem=isASRSItem,
-                                              isFetchByMaxVol=isFetchByMaxVol)
-            dbRows = DBService.fetch_rows(sql, self.schema)
-
-            assert len(dbRows) == noOfItem, f"<Data> {noOfItem} no. of any item not found " + sql
+        def buildQueryFunc():
+            return self._buildQueryForGetItems(noOfItem=noOfItem,
+                                               # isPCKItem=isPCKItem, isWPItem=isWPItem,
+                                               consolInvnType=consolInvnType, isTHMItem=isTHMItem,
+                                               isItemWithBundleQty=isItemWithBundleQty, isItemForCrossDock=isItemForCrossDock, isHazmatItem=isHazmatItem,
+                                               itemAllocType=itemAllocType, isCubiscanNeed=isCubiscanNeed, ignoreItems=ignoreItems,
+                                               isVLMItem=isVLMItem, isASItem=isASItem, isASRSItem=isASRSItem,
+                                               isFetchByMaxVol=isFetchByMaxVol)
+        dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.ITEMS, 'ITEM_NAME', buildQueryFunc, minRows=noOfItem)
 
-            '''Print data'''
-            for i in range(0, noOfItem):
-                self._logDBResult(dbRows[i], ['ITEM_NAME'])
-                self._printItemInvnData(dbRows[i]['ITEM_NAME'])
+        assert len(dbRows) == noOfItem, f"<Data> {noOfItem} no. of any item not found " + sql
 
-            '''Update runtime thread data file'''
-            itemsAsCsv = ','.join(i['ITEM_NAME'] for i in dbRows)
-            RuntimeXL.updateThisAttrForThread(RuntimeAttr.ITEMS, itemsAsCsv)
-        finally:
-            RuntimeXL.removeThreadLockFile()
+        '''Print data'''
+        for i in range(0, noOfItem):
+            self._logDBResult(dbRows[i], ['ITEM_NAME'])
+            self._printItemInvnData(dbRows[i]['ITEM_NAME'])
 
         return dbRows
 
+    def _fetchRowsAndClaim(self, attr_name: RuntimeAttr, claimCol: str, buildQueryFunc, maxTries: int = 5,
+                           minRows: int = None) -> tuple[list[dict], str]:
+        """Runs the finder sql and claims the found vals for curr thread (compare-and-set lease), without thread lock.
+        Sql is built and run again only if other thread claimed any found val in between.
+        Vals newly claimed in a failed attempt, or when less than minRows are found, are released before retry/return.
+        With excel thread data file, uses the thread lock and updates the file
+        """
+        isClaimSupported = RuntimeXL.isClaimSupported()
+        if not isClaimSupported:
+            RuntimeXL.createThreadLockFile()
+            try:
+                sql = buildQueryFunc()
+                dbRows = DBService.fetch_rows(sql, self.schema)
+                RuntimeXL.updateThisAttrForThread(attr_name, ','.join(str(r[claimCol]) for r in dbRows))
+                return dbRows, sql
+            finally:
+                RuntimeXL.removeThreadLockFile()
+
+        ownedVals = set(RuntimeXL.getClaimedAttrForThread(attr_name))
+        for i in range(maxTries):
+            sql = buildQueryFunc()
+            dbRows = DBService.fetch_rows(sql, self.schema)
+            vals = list(dict.fromkeys(str(r[claimCol]) for r in dbRows))
+
+            claimedVals = RuntimeXL.claimThisAttrForThread(attr_name, vals)
+            newVals = [v for v in claimedVals if v not in ownedVals]
+            if len(claimedVals) == len(vals):
+                if minRows is not None and len(dbRows) < minRows:
+                    RuntimeXL.releaseThisAttrForThread(attr_name, newVals)
+                return dbRows, sql
+            RuntimeXL.releaseThisAttrForThread(attr_name, newVals)
+            printit(f"... {attr_name.name} {set(vals).difference(claimedVals)} claimed by other thread, "
+                    f"retry {i + 1} of {maxTries}")
+
+        assert False, f"<Data> {attr_name.name} not claimed after {maxTries} tries " + sql
+
     def getItemsNotInAnyLocn(self, noOfItem: int,
                              # isPCKItem: bool = None, isWPItem: bool = None,
                              consolInvnType: ConsolInvnType = None, isTHMItem: bool = None,
@@ -674,52 +767,45 @@ class DBLib:
                              isHazmatItem: bool = None, ignoreItems: list[str] = None,
                              isVLMItem: bool = None, isASItem: bool = None, isASRSItem: bool = None,
                              isFetchByMaxVol: bool = None):
-        RuntimeXL.createThreadLockFile()
-        try:
-            sql = self._buildQueryForGetItems(noOfItem=noOfItem,
-                                              # isPCKItem=isPCKItem, isWPItem=isWPItem,
-                                              consolInvnType=consolInvnType, isTHMItem=isTHMItem,
-                                              isNotInOnlyResvActv=isNotInOnlyResvActv, isNotInAnyLocn=True,
-                                              isItemWithBundleQty=isItemWithBundleQty, isItemForCrossDock=isItemForCrossDock, isHazmatItem=isHazmatItem,
-                                              itemAllocType=itemAllocType, isCubiscanNeed=isCubiscanNeed,
-                                              isVLMItem=isVLMItem, isASItem=isASItem, isASRSItem=isASRSItem,
-                                              ignoreItems=ignoreItems, isFetchByMaxVol=isFetchByMaxVol)
-            dbRows = DBService.fetch_rows(sql, self.schema)
-
-            isItemNotInAnyLocnFound = True if dbRows is not None and len(dbRows) >= noOfItem else False
-
-            '''Get any item & clear invn'''
-            if not isItemNotInAnyLocnFound:
-                final_isAllowClearInvn = self._decide_isAllowClearInvn(isVLMLocn=isVLMItem, isASLocn=isASItem, isASRSLocn=isASRSItem)
-                if final_isAllowClearInvn:
-                    dbRows = self.getAnyItem(noOfItem=noOfItem,
-                                             # isPCKItem=isPCKItem, isWPItem=isWPItem,
-                                             consolInvnType=consolInvnType, isTHMItem=isTHMItem,
-                                             isItemWithBundleQty=isItemWithBundleQty, isCubiscanNeed=isCubiscanNeed,
-                                             isItemForCrossDock=isItemForCrossDock, isHazmatItem=isHazmatItem,
-                                             itemAllocType=itemAllocType, ignoreItems=ignoreItems,
-                                             isVLMItem=isVLMItem, isASItem=isASItem, isASRSItem=isASRSItem,
-                                             isFetchByMaxVol=isFetchByMaxVol)
-                    
-                    '''Clear invn in both locn'''
-                    for i in range(len(dbRows)):
-                        itemBrcd = dbRows[i]['ITEM_NAME']
-                        self._clearManualActvAndResvInvnForReplen(item=itemBrcd)
-                else:
-                    assert False, 'Clearing invn (clearing invn in actv/resv for replen) is not allowed. Test manually'
-
-            assert len(dbRows) == noOfItem, f"<Data> {noOfItem} no. of items not in any locn not found " + sql
+        def buildQueryFunc():
+            return self._buildQueryForGetItems(noOfItem=noOfItem,
+                                               # isPCKItem=isPCKItem, isWPItem=isWPItem,
+                                               consolInvnType=consolInvnType, isTHMItem=isTHMItem,
+                                               isNotInOnlyResvActv=isNotInOnlyResvActv, isNotInAnyLocn=True,
+                                               isItemWithBundleQty=isItemWithBundleQty, isItemForCrossDock=isItemForCrossDock, isHazmatItem=isHazmatItem,
+                                               itemAllocType=itemAllocType, isCubiscanNeed=isCubiscanNeed,
+                                               isVLMItem=isVLMItem, isASItem=isASItem, isASRSItem=isASRSItem,
+                                               ignoreItems=ignoreItems, isFetchByMaxVol=isFetchByMaxVol)
+        dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.ITEMS, 'ITEM_NAME', buildQueryFunc, minRows=noOfItem)
+
+        isItemNotInAnyLocnFound = True if dbRows is not None and len(dbRows) >= noOfItem else False
+
+        '''Get any item & clear invn'''
+        if not isItemNotInAnyLocnFound:
+            final_isAllowClearInvn = self._decide_isAllowClearInvn(isVLMLocn=isVLMItem, isASLocn=isASItem, isASRSLocn=isASRSItem)
+            if final_isAllowClearInvn:
+                dbRows = self.getAnyItem(noOfItem=noOfItem,
+                                         # isPCKItem=isPCKItem, isWPItem=isWPItem,
+                                         consolInvnType=consolInvnType, isTHMItem=isTHMItem,
+                                         isItemWithBundleQty=isItemWithBundleQty, isCubiscanNeed=isCubiscanNeed,
+                                         isItemForCrossDock=isItemForCrossDock, isHazmatItem=isHazmatItem,
+                                         itemAllocType=itemAllocType, ignoreItems=ignoreItems,
+                                         isVLMItem=isVLMItem, isASItem=isASItem, isASRSItem=isASRSItem,
+                                         isFetchByMaxVol=isFetchByMaxVol)
+
+                '''Clear invn in both locn'''
+                for i in range(len(dbRows)):
+                    itemBrcd = dbRows[i]['ITEM_NAME']
+                    self._clearManualActvAndResvInvnForReplen(item=itemBrcd)
+            else:
+                assert False, 'Clearing invn (clearing invn in actv/resv for replen) is not allowed. Test manually'
 
-            '''Print data'''
-            for i in range(0, noOfItem):
-                self._logDBResult(dbRows[i], ['ITEM_NAME'])
-                self._printItemInvnData(dbRows[i]['ITEM_NAME'])
+        assert len(dbRows) == noOfItem, f"<Data> {noOfItem} no. of items not in any locn not found " + sql
 
-            '''Update runtime thread data file'''
-            itemsAsCsv = ','.join(i['ITEM_NAME'] for i in dbRows)
-            RuntimeXL.updateThisAttrForThread(RuntimeAttr.ITEMS, itemsAsCsv)
-        finally:
-            RuntimeXL.removeThreadLockFile()
+        '''Print data'''
+        for i in range(0, noOfItem):
+            self._logDBResult(dbRows[i], ['ITEM_NAME'])
+            self._printItemInvnData(dbRows[i]['ITEM_NAME'])
 
         return dbRows
 
@@ -1727,8 +1813,7 @@ class DBLib:
         """Get automated actv locns present in wm_inventory and pick location dtl
         eg: VLM, AutoStore
         """
-        RuntimeXL.createThreadLockFile()
-        try:
+        def buildQueryFunc():
             sql = f"""select distinct lh.* from locn_hdr lh
                      where lh.locn_id  in (select location_id from wm_inventory where location_id is not null)
                      and lh.locn_id  in (select locn_id from pick_locn_dtl where locn_id is not null)
@@ -1749,17 +1834,10 @@ class DBLib:
             if threadLocns is not None:
                 sqlCond += " \n and lh.locn_brcd not in " + threadLocns
 
-            sql = sql.replace('#CONDITION#', sqlCond)
-
-            dbRows = DBService.fetch_rows(sql, self.schema)
+            return sql.replace('#CONDITION#', sqlCond)
+        dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.LOCNS, 'LOCN_BRCD', buildQueryFunc)
 
-            # assert len(dbRows) == noOfLocn, str(noOfLocn) + ' no. of actv locns not present in wm not found ' + sql
-
-            '''Update runtime thread data file'''
-            locnAsCsv = ','.join(i['LOCN_BRCD'] for i in dbRows)
-            RuntimeXL.updateThisAttrForThread(RuntimeAttr.LOCNS, locnAsCsv)
-        finally:
-            RuntimeXL.removeThreadLockFile()
+        # assert len(dbRows) == noOfLocn, str(noOfLocn) + ' no. of actv locns not present in wm not found ' + sql
 
         return dbRows
 
@@ -1768,8 +1846,7 @@ class DBLib:
                                taskPath: TaskPath = None, isResvWAInTPDCurrWA: bool = None):
         """Get resv locns not present in wm_inventory
         """
-        RuntimeXL.createThreadLockFile()
-        try:
+        def buildQueryFunc():
             sql = f"""select distinct lh.* from locn_hdr lh
                      where lh.locn_id not in (select location_id from wm_inventory where location_id is not null) 
                      and lh.locn_class='R' and lh.work_grp='{resvWG}'
@@ -1777,14 +1854,15 @@ class DBLib:
                      offset 0 rows fetch next {noOfLocn} rows only
                   """
             sqlCond = ''
+            finalResvWA = resvWA
 
-            if resvWA is None:
+            if finalResvWA is None:
                 if isResvWAInTPDCurrWA:
                     currWAList = self._getCurrWAFromTaskPath2(taskPath)
-                    resvWA = currWAList
-            resvWA = self.removeSpecialCharFromTaskPathVals(resvWA)
-            if resvWA is not None:
-                sqlCond += " \n and lh.work_area in " + Commons.get_tuplestr(resvWA)
+                    finalResvWA = currWAList
+            finalResvWA = self.removeSpecialCharFromTaskPathVals(finalResvWA)
+            if finalResvWA is not None:
+                sqlCond += " \n and lh.work_area in " + Commons.get_tuplestr(finalResvWA)
 
             final_locnBrcd, final_avoidLocnBrcd = self._decide_lh_locnBrcd_forLocnType()
             if final_locnBrcd is not None:
@@ -1808,17 +1886,10 @@ class DBLib:
             if threadLocns is not None:
                 sqlCond += " \n and lh.locn_brcd not in " + threadLocns
 
-            sql = sql.replace('#CONDITION#', sqlCond)
+            return sql.replace('#CONDITION#', sqlCond)
+        dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.LOCNS, 'LOCN_BRCD', buildQueryFunc, minRows=noOfLocn)
 
-            dbRows = DBService.fetch_rows(sql, self.schema)
-
-            assert len(dbRows) == noOfLocn, f"<Data> {noOfLocn} no. of manual resv locns not present in wm not found " + sql
-
-            '''Update runtime thread data file'''
-            locnAsCsv = ','.join(i['LOCN_BRCD'] for i in dbRows)
-            RuntimeXL.updateThisAttrForThread(RuntimeAttr.LOCNS, locnAsCsv)
-        finally:
-            RuntimeXL.removeThreadLockFile()
+        assert len(dbRows) == noOfLocn, f"<Data> {noOfLocn} no. of manual resv locns not present in wm not found " + sql
 
         return dbRows
 
@@ -1830,8 +1901,7 @@ class DBLib:
         """(Generic method) This makes sure any resv.
         Get resv locns
         """
-        RuntimeXL.createThreadLockFile()
-        try:
+        def buildQueryFunc():
             sql = f"""select /*+ PARALLEL(lh,8) */ distinct lh.* from locn_hdr lh 
                      --left outer join wm_inventory wm on lh.locn_id = wm.location_id
                      where lh.locn_class='R' and lh.work_grp='{resvWG}'
@@ -1839,17 +1909,18 @@ class DBLib:
                      offset 0 rows fetch next {noOfLocn} rows only
                   """
             sqlCond = ''
+            finalResvWA = resvWA
 
-            if resvWA is None:
+            if finalResvWA is None:
                 if isResvWAInTPDCurrWA:
                     currWAList = self._getCurrWAFromTaskPath2(taskPath)
-                    resvWA = currWAList
+                    finalResvWA = currWAList
                 elif isResvWAInTPDDestWA:
                     destWAList = self._getDestWAFromTaskPath2(taskPath)
-                    resvWA = destWAList
-            resvWA = self.removeSpecialCharFromTaskPathVals(resvWA)
-            if resvWA is not None:
-                sqlCond += " \n and lh.work_area in " + Commons.get_tuplestr(resvWA)
+                    finalResvWA = destWAList
+            finalResvWA = self.removeSpecialCharFromTaskPathVals(finalResvWA)
+            if finalResvWA is not None:
+                sqlCond += " \n and lh.work_area in " + Commons.get_tuplestr(finalResvWA)
 
             final_locnBrcd, final_avoidLocnBrcd = self._decide_lh_locnBrcd_forLocnType(isASRSLocn=isASRSLocn)
             if final_locnBrcd is not None:
@@ -1895,16 +1966,10 @@ class DBLib:
                 sqlCond += f""" \n and lh.locn_id not in (select location_id from wm_inventory where locn_class='R' 
                                                 and item_id in (select item_id from item_cbo where item_name in {threadItems}))"""
 
-            sql = sql.replace('#CONDITION#', sqlCond)
-            dbRows = DBService.fetch_rows(sql, self.schema)
-
-            # assert len(dbRows) == noOfLocn, str(noOfLocn) + ' no. of resv locns not found ' + sql
+            return sql.replace('#CONDITION#', sqlCond)
+        dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.LOCNS, 'LOCN_BRCD', buildQueryFunc)
 
-            '''Update runtime thread data file'''
-            locnAsCsv = ','.join(i['LOCN_BRCD'] for i in dbRows)
-            RuntimeXL.updateThisAttrForThread(RuntimeAttr.LOCNS, locnAsCsv)
-        finally:
-            RuntimeXL.removeThreadLockFile()
+        # assert len(dbRows) == noOfLocn, str(noOfLocn) + ' no. of resv locns not found ' + sql
 
         return dbRows
 
@@ -2000,9 +2065,8 @@ class DBLib:
     def getOpenDockDoor(self, workGrp: str, workArea: str):
         """Returns a dockdoor with specific WG/WA
         """
-        RuntimeXL.createThreadLockFile()
-        try:
-            sql = f"""select dd.dock_door_name, lh.locn_brcd from dock_door dd inner join sys_code sc on sc.code_id = dd.dock_door_status
+        def buildQueryFunc():
+            sql = """select dd.dock_door_name, lh.locn_brcd from dock_door dd inner join sys_code sc on sc.code_id = dd.dock_door_status
                      inner join locn_hdr lh on dd.dock_door_name='DOOR' || substr(lh.locn_brcd, 6, length(lh.locn_brcd))
                      where 0=0 and sc.code_type='Y04' and sc.code_desc='Open'
                      and dd.dock_door_name like 'DOOR%' and length(dd.dock_door_name) >= 6
@@ -2010,6 +2074,7 @@ class DBLib:
                      and lh.putwy_zone='IBS' 
                      and lh.work_grp like '#WORK_GRP#' and lh.work_area like '#WORK_AREA#'
                      #CONDITION#
+                     offset 0 rows fetch next 1 rows only
                   """
             sql = sql.replace('#WORK_GRP#', workGrp).replace('#WORK_AREA#', workArea)
 
@@ -2018,58 +2083,53 @@ class DBLib:
             '''Exclude runtime thread dockdoor'''
             threadDockdoors = RuntimeXL.getThisAttrFromAllThreads(RuntimeAttr.DOCKDOOR, replaceFrom=',', replaceWith="','")
             if threadDockdoors is not None:
-                sqlCond += " \n and lh.locn_brcd not in " + threadDockdoors
-            sql = sql.replace('#CONDITION#', sqlCond)
-
-            dbRow = DBService.fetch_row(sql, self.schema)
-
-            # assert dbRow is not None and dbRow.get('DOCK_DOOR_NAME') is not None, 'Open dockdoor not found ' + sql
-            isDDFound = dbRow is not None and dbRow.get('DOCK_DOOR_NAME') is not None
-            if not isDDFound:
-                dbRow = self._clearInUseDockDoor(workGrp, workArea)
-            assert dbRow is not None and dbRow.get('DOCK_DOOR_NAME') is not None, '<Data> Open dockdoor not found ' + sql
-
-            systemDockDoor = dbRow.get('DOCK_DOOR_NAME')
-            dbDockDoor = dbRow.get('LOCN_BRCD')
-            self.logger.info(f"Dockdoor {systemDockDoor} {dbDockDoor}")
-
-            '''Update runtime thread data file'''
-            dockDoorAsCsv = dbRow.get('DOCK_DOOR_NAME')
-            RuntimeXL.updateThisAttrForThread(RuntimeAttr.DOCKDOOR, dockDoorAsCsv)
-        finally:
-            RuntimeXL.removeThreadLockFile()
+                sqlCond += " \n and dd.dock_door_name not in " + threadDockdoors
+            return sql.replace('#CONDITION#', sqlCond)
+        dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.DOCKDOOR, 'DOCK_DOOR_NAME', buildQueryFunc, minRows=1)
+
+        # assert dbRow is not None and dbRow.get('DOCK_DOOR_NAME') is not None, 'Open dockdoor not found ' + sql
+        dbRow = dbRows[0] if len(dbRows) > 0 else None
+        isDDFound = dbRow is not None and dbRow.get('DOCK_DOOR_NAME') is not None
+        if not isDDFound:
+            dbRow = self._clearInUseDockDoor(workGrp, workArea)
+        assert dbRow is not None and dbRow.get('DOCK_DOOR_NAME') is not None, '<Data> Open dockdoor not found ' + sql
+
+        systemDockDoor = dbRow.get('DOCK_DOOR_NAME')
+        dbDockDoor = dbRow.get('LOCN_BRCD')
+        self.logger.info(f"Dockdoor {systemDockDoor} {dbDockDoor}")
 
         return systemDockDoor, dbDockDoor
 
     def _clearInUseDockDoor(self, workGrp: str, workArea: str):
         if 'true' in self.IS_ALLOW_CLEAR_DOCKDOOR:
-            sql = f"""select dd.dock_door_id, dd.dock_door_name, lh.locn_brcd from dock_door dd inner join 
-                     dock_door_ref drf on dd.dock_door_id=drf.dock_door_id inner join sys_code sc on sc.code_id=dd.dock_door_status
-                     inner join locn_hdr lh on dd.dock_door_name='DOOR' || substr(LH.LOCN_BRCD, 6, length(LH.LOCN_BRCD))
-                     where 0=0 and sc.code_type='Y04' and sc.code_desc <> 'Open'
-                     and dd.dock_door_name like 'DOOR%' and length(dd.dock_door_name) >= 6
-                     and dd.dock_door_name not in ('DOOR55','DOOR00') --TODO temp fix, remove later
-                     and lh.putwy_zone='IBS'  
-                     and lh.work_grp like '{workGrp}' and lh.work_area like '{workArea}'
-                     #CONDITION#
-                     order by dd.last_updated_dttm
-                     offset 0 rows fetch next 1 rows only"""
-            sqlCond = ''
+            def buildQueryFunc():
+                sql = f"""select dd.dock_door_id, dd.dock_door_name, lh.locn_brcd from dock_door dd inner join 
+                         dock_door_ref drf on dd.dock_door_id=drf.dock_door_id inner join sys_code sc on sc.code_id=dd.dock_door_status
+                         inner join locn_hdr lh on dd.dock_door_name='DOOR' || substr(LH.LOCN_BRCD, 6, length(LH.LOCN_BRCD))
+                         where 0=0 and sc.code_type='Y04' and sc.code_desc <> 'Open'
+                         and dd.dock_door_name like 'DOOR%' and length(dd.dock_door_name) >= 6
+                         and dd.dock_door_name not in ('DOOR55','DOOR00') --TODO temp fix, remove later
+                         and lh.putwy_zone='IBS'  
+                         and lh.work_grp like '{workGrp}' and lh.work_area like '{workArea}'
+                         #CONDITION#
+                         order by dd.last_updated_dttm
+                         offset 0 rows fetch next 1 rows only"""
+                sqlCond = ''
 
-            '''Exclude runtime thread dockdoor'''
-            threadDockdoors = RuntimeXL.getThisAttrFromAllThreads(RuntimeAttr.DOCKDOOR, replaceFrom=',', replaceWith="','")
-            if threadDockdoors is not None:
-                sqlCond += " \n and lh.locn_brcd not in " + threadDockdoors
-            sql = sql.replace('#CONDITION#', sqlCond)
+                '''Exclude runtime thread dockdoor'''
+                threadDockdoors = RuntimeXL.getThisAttrFromAllThreads(RuntimeAttr.DOCKDOOR, replaceFrom=',', replaceWith="','")
+                if threadDockdoors is not None:
+                    sqlCond += " \n and dd.dock_door_name not in " + threadDockdoors
+                return sql.replace('#CONDITION#', sqlCond)
+            dbRows, sql = self._fetchRowsAndClaim(RuntimeAttr.DOCKDOOR, 'DOCK_DOOR_NAME', buildQueryFunc, minRows=1)
 
-            dbRow = DBService.fetch_row(sql, self.schema)
+            dbRow = dbRows[0] if len(dbRows) > 0 else None
+            assert dbRow is not None and dbRow.get('DOCK_DOOR_ID') is not None, '<Data> In use dockdoor not found ' + sql
 
             dockDoorId = dbRow.get('DOCK_DOOR_ID')
             systemDockDoor = dbRow.get('DOCK_DOOR_NAME')
             dbDockDoor = dbRow.get('LOCN_BRCD')
 
-            assert dbRow is not None and dockDoorId is not None, '<Data> In use dockdoor not found ' + sql
-
             updQ1 = f"""update dock_door_ref set asn_id=null,shipment_id=null,appointment_id=null,trailer_number=null,
                        carrier_id=null,trailer_id=null,last_updated_dttm=systimestamp,last_updated_source='AUTOMATION'
                        where dock_door_id in ('{dockDoorId}')"""
@@ -2103,8 +2163,8 @@ class DBLib:
         return dbRow.get('LOCN_BRCD')
 
     def getLocnIdByLocnBrcd(self, locnBrcd: str):
-        sql = f"select locn_id from locn_hdr where locn_brcd='{locnBrcd}'"
-        dbRow = DBService.fetch_row(sql, self.schema)
+        sql = "select locn_id from locn_hdr where locn_brcd = :locn_brcd"
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var={'locn_brcd': locnBrcd})
 
         return dbRow.get('LOCN_ID')
 
@@ -2126,8 +2186,8 @@ class DBLib:
 
         for i in range(3):
             barcode = Commons.get_random_num(prefix=poPrefix, len_with_prefix=poLength)
-            sql = "select tc_purchase_orders_id from purchase_orders where tc_purchase_orders_id = '" + barcode + "'"
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = "select tc_purchase_orders_id from purchase_orders where tc_purchase_orders_id = :barcode"
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': barcode})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TC_PURCHASE_ORDERS_ID') is None:
                 break
 
@@ -2142,8 +2202,8 @@ class DBLib:
 
         for i in range(3):
             barcode = Commons.get_random_num(prefix=asnPrefix, len_with_prefix=asnLength)
-            sql = "select tc_asn_id from asn where tc_asn_id = '" + barcode + "'"
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = "select tc_asn_id from asn where tc_asn_id = :barcode"
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': barcode})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TC_ASN_ID') is None:
                 break
 
@@ -2161,8 +2221,8 @@ class DBLib:
 
         for i in range(3):
             barcode = Commons.get_random_num(prefix=lpnPrefix, len_with_prefix=lpnLength)
-            sql = "select tc_lpn_id from lpn where tc_lpn_id = '" + barcode + "'"
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = "select tc_lpn_id from lpn where tc_lpn_id = :barcode"
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': barcode})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TC_LPN_ID') is None:
                 break
 
@@ -2180,10 +2240,9 @@ class DBLib:
         for i in range(3):
             barcode = Commons.get_random_num(prefix=cartPrefix, len_with_prefix=cartLen)
             # sql = "SELECT task_cmpl_ref_nbr FROM TASK_HDR WHERE TASK_TYPE='75' AND STAT_CODE<'90'"
-            sql = f"""select distinct task_id from task_dtl where (task_genrtn_ref_nbr is not null and task_genrtn_ref_nbr = '#BARCODE#') or 
-                    (task_cmpl_ref_nbr is not null and task_cmpl_ref_nbr = '#BARCODE#')"""
-            sql = sql.replace('#BARCODE#', str(barcode))
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = """select distinct task_id from task_dtl where (task_genrtn_ref_nbr is not null and task_genrtn_ref_nbr = :barcode) or 
+                    (task_cmpl_ref_nbr is not null and task_cmpl_ref_nbr = :barcode)"""
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': str(barcode)})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TASK_ID') is None:
                 break
 
@@ -2214,8 +2273,8 @@ class DBLib:
 
         for i in range(3):
             barcode = Commons.get_random_num(prefix=doPrefix, len_with_prefix=doLength)
-            sql = "select tc_order_id from orders where tc_order_id = '" + barcode + "'"
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = "select tc_order_id from orders where tc_order_id = :barcode"
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': barcode})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TC_ORDER_ID') is None:
                 break
 
@@ -2230,8 +2289,8 @@ class DBLib:
 
         for i in range(3):
             barcode = Commons.get_random_num(prefix=lpnPrefix, len_with_prefix=lpnLength)
-            sql = "select tc_lpn_id from lpn where tc_lpn_id = '" + barcode + "'"
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = "select tc_lpn_id from lpn where tc_lpn_id = :barcode"
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': barcode})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TC_LPN_ID') is None:
                 break
 
@@ -2247,8 +2306,8 @@ class DBLib:
         # barcode = self.getNewILPNNum(trlrPrefix, trlrLength)
         for i in range(3):
             barcode = Commons.get_random_num(prefix=trlrPrefix, len_with_prefix=trlrLength)
-            sql = "select trailer_number from shipment where trailer_number is not null and trailer_number='" + barcode + "'"
-            dbRow = DBService.fetch_row(sql, self.schema)
+            sql = "select trailer_number from shipment where trailer_number is not null and trailer_number = :barcode"
+            dbRow = DBService.fetch_row(sql, self.schema, bind_var={'barcode': barcode})
             if dbRow is None or len(dbRow) == 0 or dbRow.get('TRAILER_NUMBER') is None:
                 break
 
@@ -2591,7 +2650,7 @@ class DBLib:
     def assertNoOfConsolLocnforDO(self, i_order: str, noOfConsolLocn: int):
         """Validate the no. of locn for DO
         """
-        consolLocns = DBLib().getAllConsolLocnsFromDOs([i_order])
+        consolLocns = DBLib.get().getAllConsolLocnsFromDOs([i_order])
 
         assert len(consolLocns) == noOfConsolLocn, f"<DO> No. of consol locn validation failed for do {i_order}"
 
@@ -2599,8 +2658,8 @@ class DBLib:
 
         assertlist = []
 
-        sql = f"""select * from purchase_orders where tc_purchase_orders_id in ('{i_po}')"""
-        dbRow = DBService.fetch_row(sql, self.schema)
+        sql = """select * from purchase_orders where tc_purchase_orders_id = :tc_po_id"""
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var={'tc_po_id': i_po})
 
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_PURCHASE_ORDERS_ID') == i_po, '<POHdr> PO hdr not found ' + sql
 
@@ -2616,16 +2675,16 @@ class DBLib:
 
         assertlist = []
 
-        sql = f"""select po.tc_purchase_orders_id, pol.* 
+        sql = """select po.tc_purchase_orders_id, pol.* 
                     from purchase_orders_line_item pol inner join purchase_orders po on pol.purchase_orders_id = po.purchase_orders_id 
-                    where po.tc_purchase_orders_id in ('{i_po}') 
+                    where po.tc_purchase_orders_id = :tc_po_id 
                     #CONDITION#"""
 
-        sqlCond = " and pol.sku = '" + i_itemBrcd + "'"
+        sqlCond = " and pol.sku = :item_name"
         sqlCond += " \n order by pol.purchase_orders_line_item_id asc"
         sql = sql.replace('#CONDITION#', sqlCond)
 
-        dbRow = DBService.fetch_row(sql, self.schema)
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var={'tc_po_id': i_po, 'item_name': i_itemBrcd})
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_PURCHASE_ORDERS_ID') == i_po, '<PODtl> PO dtl not found ' + sql
 
         if o_dtlStatus is not None:
@@ -2651,20 +2710,70 @@ class DBLib:
 
         assert not assertlist.count(False), f"<PODtl> Few PO dtl validation failed for {i_po} " + sql
 
+    @staticmethod
+    def _assertDtlsInBatch(tag: str, hdrDesc: str, dbRows: list[dict], o_dtls: list[dict],
+                           keyColMap: dict, valColMap: dict, sql: str):
+        """Matches each expected dtl with the 1st db row having same i_* values,
+        compares o_* values in memory and asserts once with all the mismatches
+        """
+        mismatches = []
+        for expDtl in o_dtls:
+            keyVals = {k: v for k, v in expDtl.items() if k in keyColMap and v is not None}
+            keyDesc = ', '.join(f"{k.replace('i_', '')} {v}" for k, v in keyVals.items())
+            dbRow = next((r for r in dbRows
+                          if all(str(r.get(keyColMap[k])) == str(v) for k, v in keyVals.items())), None)
+            if dbRow is None:
+                mismatches.append(f"{tag} dtl not found for {hdrDesc}, {keyDesc}")
+                continue
+            for param, expVal in expDtl.items():
+                if param not in valColMap or expVal is None:
+                    continue
+                expValDesc = expVal.name if isinstance(expVal, Enum) else None
+                expVal = expVal.value if isinstance(expVal, Enum) else expVal
+                dbVal = dbRow.get(valColMap[param])
+                whatIsThisDesc = f"{tag} {param.replace('o_', '')} for {hdrDesc}, {keyDesc}"
+                if not DBService.compareEqual(dbVal, expVal, whatIsThisDesc, expValDesc):
+                    mismatches.append(f"{whatIsThisDesc} actual {dbVal}, expected {expVal}")
+
+        assert len(mismatches) == 0, f"{tag} {len(mismatches)} dtl validation failed for {hdrDesc}:\n" \
+                                     + '\n'.join(mismatches) + '\n' + sql
+
+    def assertPODtlsInBatch(self, i_po: str, o_dtls: list[dict]):
+        """Validates all PO dtls with 1 query
+        o_dtls: list of dict with i_itemBrcd and o_* params of assertPODtls
+        """
+        sql = """select po.tc_purchase_orders_id, pol.* 
+                    from purchase_orders_line_item pol inner join purchase_orders po on pol.purchase_orders_id = po.purchase_orders_id 
+                    where po.tc_purchase_orders_id = :tc_po_id 
+                    order by pol.purchase_orders_line_item_id asc"""
+        dbRows = DBService.fetch_rows(sql, self.schema, bind_var={'tc_po_id': i_po})
+
+        keyColMap = {'i_itemBrcd': 'SKU'}
+        valColMap = {'o_dtlStatus': 'PURCHASE_ORDERS_LINE_STATUS', 'o_origQty': 'ORIG_ORDER_QTY', 'o_qty': 'ORDER_QTY',
+                     'o_receivedQty': 'RECEIVED_QTY', 'o_shippedQty': 'SHIPPED_QTY'}
+        self._assertDtlsInBatch('<PODtl>', i_po, dbRows, o_dtls, keyColMap, valColMap, sql)
+
     def assertWaitASNRecord(self, i_asn: str):
-        sql = self._fetchASNHdrByASNNum.replace('#TC_ASN_ID#', i_asn)
-        DBService.wait_for_records(sql, expected_cnt=1, schema=self.schema)
+        sql = self._fetchASNHdrByASNNum
+        DBService.wait_for_records(sql, expected_cnt=1, schema=self.schema, bind_var={'tc_asn_id': i_asn})
 
     def assertWaitASNStatus(self, i_asn: str, o_status: int = None):
-        sql = self._fetchASNHdrByASNNum.replace('#TC_ASN_ID#', i_asn)
-        DBService.wait_for_value(sql, 'ASN_STATUS', str(o_status), self.schema)
+        sql = self._fetchASNHdrByASNNum
+        DBService.wait_for_value(sql, 'ASN_STATUS', str(o_status), self.schema, bind_var={'tc_asn_id': i_asn})
+
+    def assertWaitASNsStatus(self, i_asns: list[str], o_status: int):
+        """Waits for all asns together, 1 query per poll"""
+        sql = self._fetchASNHdrByASNNum
+        waits = [{'query': sql, 'column': 'ASN_STATUS', 'expected_value': o_status, 'bind_var': {'tc_asn_id': i}}
+                 for i in i_asns]
+        DBService.wait_for_all(waits, self.schema)
 
     def assertASNHdr(self, i_asn: str, o_status: int = None):
 
         assertlist = []
 
-        sql = self._fetchASNHdrByASNNum.replace('#TC_ASN_ID#', i_asn)
-        dbRow = DBService.fetch_row(sql, self.schema)
+        sql = self._fetchASNHdrByASNNum
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var={'tc_asn_id': i_asn})
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_ASN_ID') == i_asn, '<ASNHdr> ASN hdr not found ' + sql
 
         if o_status is not None:
@@ -2677,16 +2786,18 @@ class DBLib:
     def assertASNDtls(self, i_asn: str, i_po: str, i_itemBrcd: str, o_dtlStatus: int = None,
                       o_shippedQty=None, o_receivedQty=None):
 
-        sql = self._fetchASNDtlsByASNDtls.replace('#TC_ASN_ID#', i_asn)
-        sqlCond = " and ad.sku_name = '" + i_itemBrcd + "'"
+        sql = self._fetchASNDtlsByASNDtls
+        bindVar = {'tc_asn_id': i_asn, 'item_name': i_itemBrcd}
+        sqlCond = " and ad.sku_name = :item_name"
         if i_po is not None:
-            sqlCond += " \n and ad.tc_purchase_orders_id = '" + i_po + "'"
+            sqlCond += " \n and ad.tc_purchase_orders_id = :tc_po_id"
+            bindVar['tc_po_id'] = i_po
         sqlCond += " \n order by ad.asn_detail_id asc"
         sql = sql.replace('#CONDITION#', sqlCond)
 
-        DBService.wait_for_value(sql, 'TC_PURCHASE_ORDERS_ID', str(i_po), self.schema, maxWaitInSec=15)
+        DBService.wait_for_value(sql, 'TC_PURCHASE_ORDERS_ID', str(i_po), self.schema, maxWaitInSec=15, bind_var=bindVar)
 
-        dbRow = DBService.fetch_row(sql, self.schema)
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var=bindVar)
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_ASN_ID') is not None, '<ASNDtl> ASN dtl not found ' + sql
 
         assertlist = []
@@ -2704,18 +2815,36 @@ class DBLib:
             assertlist.append(isMatched)
         assert not assertlist.count(False), f'<ASNDtl> Few asn dtl validation failed for {i_asn} ' + sql
 
+    def assertASNDtlsInBatch(self, i_asn: str, o_dtls: list[dict]):
+        """Validates all ASN dtls with 1 query (after waiting for the dtls)
+        o_dtls: list of dict with i_po, i_itemBrcd and o_* params of assertASNDtls
+        """
+        sql = self._fetchASNDtlsByASNDtls
+        sql = sql.replace('#CONDITION#', " \n order by ad.asn_detail_id asc")
+        bindVar = {'tc_asn_id': i_asn}
+
+        noOfDtls = len({(d.get('i_po'), d.get('i_itemBrcd')) for d in o_dtls})
+        DBService.wait_for_records(sql, expected_cnt=noOfDtls, schema=self.schema, maxWaitInSec=15, bind_var=bindVar)
+        dbRows = DBService.fetch_rows(sql, self.schema, bind_var=bindVar)
+
+        keyColMap = {'i_po': 'TC_PURCHASE_ORDERS_ID', 'i_itemBrcd': 'SKU_NAME'}
+        valColMap = {'o_dtlStatus': 'ASN_DETAIL_STATUS', 'o_shippedQty': 'SHIPPED_QTY', 'o_receivedQty': 'RECEIVED_QTY'}
+        self._assertDtlsInBatch('<ASNDtl>', i_asn, dbRows, o_dtls, keyColMap, valColMap, sql)
+
     def assertPONotOnASN(self, i_asn, i_po):
         """Validate provided PO is not on ASN
         """
-        sql = self._fetchASNDtlsByASNDtls.replace('#TC_ASN_ID#', str(i_asn))
+        sql = self._fetchASNDtlsByASNDtls
+        bindVar = {'tc_asn_id': str(i_asn)}
 
         sqlCond = ''
         if i_po is not None:
-            sqlCond += f" \n and ad.tc_purchase_orders_id = '{i_po}'"
+            sqlCond += " \n and ad.tc_purchase_orders_id = :tc_po_id"
+            bindVar['tc_po_id'] = i_po
         sqlCond += " \n order by ad.asn_detail_id asc"
         sql = sql.replace('#CONDITION#', sqlCond)
 
-        dbRow = DBService.fetch_row(sql, self.schema)
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var=bindVar)
         noRecPresent = True if dbRow is None or len(dbRow) == 0 else False
 
         assert noRecPresent, f"<PO> PO {i_po} found on ASN {i_asn}"
@@ -2797,15 +2926,15 @@ class DBLib:
     def assertLPNDtls(self, i_lpn: str, i_itemBrcd: str, o_dtlStatus: int = None, o_qty: int = None,
                       o_receivedQty: int = None, o_initialQty: int = None):
 
-        sql = f"""select l.tc_lpn_id, ic.item_name, ld.* from lpn_detail ld inner join lpn l on ld.lpn_id = l.lpn_id 
+        sql = """select l.tc_lpn_id, ic.item_name, ld.* from lpn_detail ld inner join lpn l on ld.lpn_id = l.lpn_id 
                     inner join item_cbo ic on ld.item_id = ic.item_id
-                    where l.tc_lpn_id in ('{i_lpn}') 
+                    where l.tc_lpn_id = :tc_lpn_id 
                     #CONDITION#"""
-        sqlCond = " and ic.item_name = '" + i_itemBrcd + "'"
+        sqlCond = " and ic.item_name = :item_name"
         sqlCond += " \n order by ld.lpn_detail_id asc"
         sql = sql.replace('#CONDITION#', sqlCond)
 
-        dbRow = DBService.fetch_row(sql, self.schema)
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var={'tc_lpn_id': i_lpn, 'item_name': i_itemBrcd})
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_LPN_ID') is not None, '<LPNDtl> Lpn dtl not found ' + sql
 
         assertlist = []
@@ -2828,6 +2957,21 @@ class DBLib:
 
         assert not assertlist.count(False), '<LPNDtl> Few lpn dtl validation failed for {i_lpn} ' + sql
 
+    def assertLPNDtlsInBatch(self, i_lpn: str, o_dtls: list[dict]):
+        """Validates all LPN dtls with 1 query
+        o_dtls: list of dict with i_itemBrcd and o_* params of assertLPNDtls
+        """
+        sql = """select l.tc_lpn_id, ic.item_name, ld.* from lpn_detail ld inner join lpn l on ld.lpn_id = l.lpn_id 
+                    inner join item_cbo ic on ld.item_id = ic.item_id
+                    where l.tc_lpn_id = :tc_lpn_id 
+                    order by ld.lpn_detail_id asc"""
+        dbRows = DBService.fetch_rows(sql, self.schema, bind_var={'tc_lpn_id': i_lpn})
+
+        keyColMap = {'i_itemBrcd': 'ITEM_NAME'}
+        valColMap = {'o_dtlStatus': 'LPN_DETAIL_STATUS', 'o_qty': 'SIZE_VALUE', 'o_receivedQty': 'RECEIVED_QTY',
+                     'o_initialQty': 'INITIAL_QTY'}
+        self._assertDtlsInBatch('<LPNDtl>', i_lpn, dbRows, o_dtls, keyColMap, valColMap, sql)
+
     def assertLPNHasItems(self, i_lpn: str, o_items: list[str]):
         """ """
         sql = f"""select l.tc_lpn_id, ic.item_name from lpn_detail ld inner join lpn l on ld.lpn_id = l.lpn_id 
@@ -2840,17 +2984,29 @@ class DBLib:
         assert dbRows is not None and len(o_items) == len(dbRows), "<LPN> Lpn details with items not found " + sql
 
     def assertWaitDOStatus(self, i_order: str, o_status: int):
-        sql = f"""select do_status from orders where tc_order_id = '#ORDER#'"""
-        sql = sql.replace('#ORDER#', str(i_order))
+        sql = "select do_status from orders where tc_order_id = :tc_order_id"
 
-        DBService.wait_for_value(sql, 'DO_STATUS', str(o_status), self.schema, maxWaitInSec=35)
+        DBService.wait_for_value(sql, 'DO_STATUS', str(o_status), self.schema, maxWaitInSec=35,
+                                 bind_var={'tc_order_id': str(i_order)})
+
+    def _getDOStatusWait(self, i_order: str, o_status: int) -> dict:
+        sql = "select do_status from orders where tc_order_id = :tc_order_id"
+        return {'query': sql, 'column': 'DO_STATUS', 'expected_value': o_status, 'bind_var': {'tc_order_id': str(i_order)}}
+
+    def assertWaitDOsStatus(self, i_orders: list[str], o_statuses: list[DOStat], maxWaitInSec: int = 25):
+        """Waits for all orders together, 1 query per poll"""
+        waits = [self._getDOStatusWait(i_orders[i], o_statuses[i].value)
+                 for i in range(len(i_orders)) if o_statuses[i] is not None]
+        if len(waits) > 0:
+            DBService.wait_for_all(waits, self.schema, maxWaitInSec=maxWaitInSec)
 
     def assertDOHdr(self, i_order: str, o_status: DOStat = None, o_isParentDOExist: bool = None, o_parentDO: str = None,
-                    o_shipVia: str = None):
-        """"""
+                    o_shipVia: str = None, f_isWaitForStatus: bool = True):
+        """f_isWaitForStatus=False if already waited by assertWaitDOsStatus()"""
         sql = f"""select * from orders where tc_order_id in ('{i_order}')"""
 
-        DBService.wait_for_value(sql, 'DO_STATUS', expected_value=str(o_status.value), schema=self.schema, maxWaitInSec=25)
+        if f_isWaitForStatus:
+            DBService.wait_for_value(sql, 'DO_STATUS', expected_value=str(o_status.value), schema=self.schema, maxWaitInSec=25)
 
         dbRow = DBService.fetch_row(sql, self.schema)
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_ORDER_ID') is not None, '<DOHdr> DO hdr not found ' + sql
@@ -2879,17 +3035,19 @@ class DBLib:
     def assertDODtls(self, i_order: str, i_itemBrcd: str,i_waveNum:str = None, o_dtlStatus: int = None, o_origQty: int = None,
                      o_qty: int = None, o_qtyAllocated: int = None, o_usrCancldQty: int = None):
 
-        sql = f"""select o.tc_order_id, ic.item_name, oli.* from order_line_item oli inner join orders o on oli.order_id = o.order_id
+        sql = """select o.tc_order_id, ic.item_name, oli.* from order_line_item oli inner join orders o on oli.order_id = o.order_id
                     inner join item_cbo ic on oli.item_id = ic.item_id
-                    where o.tc_order_id = '{i_order}' 
+                    where o.tc_order_id = :tc_order_id 
                     #CONDITION#"""
-        sqlCond = " and ic.item_name = '" + i_itemBrcd + "'"
+        bindVar = {'tc_order_id': i_order, 'item_name': i_itemBrcd}
+        sqlCond = " and ic.item_name = :item_name"
         if i_waveNum is not None:
-            sqlCond += " \n and oli.wave_nbr = '" + i_waveNum + "'"
+            sqlCond += " \n and oli.wave_nbr = :wave_nbr"
+            bindVar['wave_nbr'] = i_waveNum
         sqlCond += " \n order by oli.line_item_id asc"
         sql = sql.replace('#CONDITION#', sqlCond)
 
-        dbRow = DBService.fetch_row(sql, self.schema)
+        dbRow = DBService.fetch_row(sql, self.schema, bind_var=bindVar)
         assert dbRow is not None and len(dbRow) > 0 and dbRow.get('TC_ORDER_ID') is not None, '<DODtl> DO dtl not found ' + sql
 
         assertlist = []
@@ -2916,10 +3074,34 @@ class DBLib:
 
         assert not assertlist.count(False), '<DODtl> Few order_line_item validation failed for {i_order} ' + sql
 
+    def assertDODtlsInBatch(self, i_order: str, o_dtls: list[dict], i_waveNum: str = None):
+        """Validates all DO dtls with 1 query
+        o_dtls: list of dict with i_itemBrcd and o_* params of assertDODtls
+        """
+        sql = """select o.tc_order_id, ic.item_name, oli.* from order_line_item oli inner join orders o on oli.order_id = o.order_id
+                    inner join item_cbo ic on oli.item_id = ic.item_id
+                    where o.tc_order_id = :tc_order_id 
+                    #CONDITION#"""
+        bindVar = {'tc_order_id': i_order}
+        sqlCond = ''
+        if i_waveNum is not None:
+            sqlCond += " \n and oli.wave_nbr = :wave_nbr"
+            bindVar['wave_nbr'] = i_waveNum
+        sqlCond += " \n order by oli.line_item_id asc"
+        sql = sql.replace('#CONDITION#', sqlCond)
+
+        dbRows = DBService.fetch_rows(sql, self.schema, bind_var=bindVar)
+
+        keyColMap = {'i_itemBrcd': 'ITEM_NAME'}
+        valColMap = {'o_dtlStatus': 'DO_DTL_STATUS', 'o_origQty': 'ORIG_ORDER_QTY', 'o_qty': 'ORDER_QTY',
+                     'o_qtyAllocated': 'ALLOCATED_QTY', 'o_usrCancldQty': 'USER_CANCELED_QTY'}
+        self._assertDtlsInBatch('<DODtl>', i_order, dbRows, o_dtls, keyColMap, valColMap, sql)
+
     def assertWaitShipmentStatus(self, i_shipment: str, o_status: int):
-        sql = "select * from shipment where tc_shipment_id ='" + i_shipment + "'"
+        sql = "select * from shipment where tc_shipment_id = :tc_shipment_id"
 
-        DBService.wait_for_value(sql, 'SHIPMENT_STATUS', str(o_status), self.schema, maxWaitInSec=10)
+        DBService.wait_for_value(sql, 'SHIPMENT_STATUS', str(o_status), self.schema, maxWaitInSec=10,
+                                 bind_var={'tc_shipment_id': i_shipment})
 
     def assertShipmentStatus(self, i_shipment: str, o_status: int = None, o_noOfStops: int = None):
         """"""
@@ -2968,9 +3150,9 @@ class DBLib:
         assert dbRows is not None and len(dbRows) >= len(i_orders), '<LPN> Olpn from DO with shipment not matched ' + sql
 
     def assertWaitWaveStatus(self, i_wave: str, i_status: int = None):
-        sql = f"""select * from ship_wave_parm where ship_wave_nbr = '#SHIP_WAVE_NBR#'"""
-        sql = sql.replace('#SHIP_WAVE_NBR#', i_wave)
-        DBService.wait_for_value(sql, 'STAT_CODE', str(i_status), self.schema, maxWaitInSec=90)
+        sql = """select * from ship_wave_parm where ship_wave_nbr = :ship_wave_nbr"""
+        DBService.wait_for_value(sql, 'STAT_CODE', str(i_status), self.schema, maxWaitInSec=90,
+                                 bind_var={'ship_wave_nbr': i_wave})
 
     def _printWaveMsgLogs(self, refValue1: str, refValue2: list[str]):
         """refValue1: wave, refValue2: orders
@@ -3550,6 +3732,26 @@ class DBLib:
 
         assert not assertlist.count(False), '<TaskDtl> Few task_dtl validation failed ' + sql
 
+    def assertTaskDtlsInBatch(self, i_task: str, o_dtls: list[dict]):
+        """Validates all task dtls of the task with 1 query
+        o_dtls: list of dict with i_itemBrcd/i_cntrNbr/i_intType/i_pullLocn/i_destLocn and o_* params of assertTaskDtls
+        """
+        sql = """select ic.item_name, lhp.locn_brcd pull_locn_brcd, lhd.locn_brcd dest_locn_brcd, td.* 
+                    from task_dtl td inner join task_hdr th on td.task_id = th.task_id
+                    inner join item_cbo ic on td.item_id = ic.item_id
+                    left outer join locn_hdr lhp on td.pull_locn_id = lhp.locn_id
+                    left outer join locn_hdr lhd on td.dest_locn_id = lhd.locn_id
+                    where td.task_id = :task_id 
+                    order by td.task_seq_nbr asc"""
+        dbRows = DBService.fetch_rows(sql, self.schema, bind_var={'task_id': str(i_task)})
+
+        keyColMap = {'i_itemBrcd': 'ITEM_NAME', 'i_cntrNbr': 'CNTR_NBR', 'i_intType': 'INVN_NEED_TYPE',
+                     'i_pullLocn': 'PULL_LOCN_BRCD', 'i_destLocn': 'DEST_LOCN_BRCD'}
+        valColMap = {'o_taskPriority': 'TASK_PRTY', 'o_taskSeq': 'TASK_SEQ_NBR', 'o_pullLocn': 'PULL_LOCN_BRCD',
+                     'o_destLocn': 'DEST_LOCN_BRCD', 'o_origReqmt': 'ORIG_REQMT', 'o_qtyAlloc': 'QTY_ALLOC',
+                     'o_qtyPulled': 'QTY_PULLD', 'o_statCode': 'STAT_CODE'}
+        self._assertDtlsInBatch('<TaskDtl>', 'task ' + str(i_task), dbRows, o_dtls, keyColMap, valColMap, sql)
+
     def assertTaskCount(self, i_taskGenRefNbr: str = None, i_taskCmplRefNbr: str = None, i_cntr: str = None, o_totalTasks: int = None,
                         o_totalTaskDtls: list[int] = None):
         """"""
@@ -4222,6 +4424,14 @@ class DBLib:
 
         DBService.wait_for_value(sql, 'MANIFEST_STATUS_ID', str(o_status), self.schema, maxWaitInSec=20)
 
+    def assertWaitManifestAndDOStatus(self, i_manifestId: str, o_manifestStatus: int, i_order: str, o_doStatus: int):
+        """Waits for the manifest and the order together, 1 query per poll"""
+        sql = "select manifest_status_id from manifest_hdr where tc_manifest_id = :tc_manifest_id"
+        waits = [{'query': sql, 'column': 'MANIFEST_STATUS_ID', 'expected_value': o_manifestStatus,
+                  'bind_var': {'tc_manifest_id': str(i_manifestId)}},
+                 self._getDOStatusWait(i_order, o_doStatus)]
+        DBService.wait_for_all(waits, self.schema, maxWaitInSec=35)
+
     def assertManifestStatus(self, i_wave: str, i_order: str, o_manifestStatus: int):
         sql = f"""select manifest_status_id,tc_manifest_id from manifest_hdr mh,lpn 
                  where lpn.manifest_nbr=mh.tc_manifest_id and wave_nbr='#WAVENBR#' and tc_order_id='#ORDER#'"""
@@ -5775,7 +5985,7 @@ class DBLib:
                 resvLocnRow = dict()
                 resvLocnIds = []
                 for i in resvLocns:
-                    locnId = DBLib().getLocnIdByLocnBrcd(i)
+                    locnId = DBLib.get().getLocnIdByLocnBrcd(i)
                     resvLocnIds.append(locnId)
                 resvLocnRow['LOCN_BRCD'] = resvLocns[0]
                 resvLocnRow['LOCN_ID'] = resvLocnIds[0]
@@ -5878,7 +6088,7 @@ class DBLib:
             resvLocnRow = dict()
             resvLocnIds = []
             for i in resvLocns:
-                locnId = DBLib().getLocnIdByLocnBrcd(i)
+                locnId = DBLib.get().getLocnIdByLocnBrcd(i)
                 resvLocnIds.append(locnId)
             resvLocnRow['LOCN_BRCD'] = resvLocns[0]
             resvLocnRow['LOCN_ID'] = resvLocnIds[0]
@@ -6986,7 +7196,7 @@ class DBLib:
             
         sql = sql.replace('#CONDITION#', sqlCond)
 
-        dbRows = DBService.fetch_rows(sql, self.schema)
+        dbRows = DBService.fetch_rows(sql, self.schema, arraysize=noOfLPN, prefetchrows=noOfLPN + 1)
         assert len(dbRows) >= noOfLPN and dbRows[0]['TC_LPN_ID'] is not None, f"<Data> {noOfLPN} no. of ilpn not found " + sql
 
         for i in range(len(dbRows)):
@@ -1,5 +1,9 @@
 import inspect
+import json
+import os
 import re
+import threading
+from contextlib import contextmanager
 from typing import Union
 
 from selenium.webdriver import Keys
@@ -10,11 +14,65 @@ from core.config_service import RF_TRAN, ENV_CONST, ENV_CONFIG
 from core.file_service import DataHandler
 from core.log_service import Logging, printit
 from core.rf_paramiko_service import RFParamikoService
+from core.rf_settle_service import RFScreenSettle
 from core.rf_xtermjs_service import RFXtermService
+from root import RUNTIME_DIR
 
 RF_SERVICE_PROVIDER = RFXtermService if ENV_CONST.get('rf', 'rf_service_provider') == 'xtermjs' else RFParamikoService
 
 
+class RFTranMenuCache:
+    """Option number and page of the rf trans in the tran search result, per env and rf user.
+    Learned on 1st use and persisted in runtime dir, so later runs/workers skip the option lookup
+    """
+    CACHE_FILE_PATH = os.path.join(RUNTIME_DIR, ENV_CONST.get('rf', 'tran_menu_cache_file',
+                                                              fallback='rf_tran_menu_cache.json'))
+    _MENU_CACHE = None  # Pair of 'env|rf user' and (pair of displayed tran name and [option num, page num])
+    _LOCK = threading.Lock()
+
+    @staticmethod
+    def _getUserKey(rfUser: str) -> str:
+        return f"{os.environ.get('env', '')}|{rfUser}"
+
+    @classmethod
+    def _readCacheFile(cls) -> dict:
+        try:
+            with open(cls.CACHE_FILE_PATH, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def get(cls, rfUser: str, dispTranName: str) -> Union[tuple[str, int], None]:
+        with cls._LOCK:
+            if cls._MENU_CACHE is None:
+                cls._MENU_CACHE = cls._readCacheFile()
+            entry = cls._MENU_CACHE.get(cls._getUserKey(rfUser), {}).get(dispTranName)
+        return None if entry is None else (entry[0], entry[1])
+
+    @classmethod
+    def put(cls, rfUser: str, dispTranName: str, optionNum: Union[str, None], pageNum: int = 1):
+        """Stores (or removes if optionNum is None) the tran option, merged into the file written by other workers
+        """
+        userKey = cls._getUserKey(rfUser)
+        with cls._LOCK:
+            if cls._MENU_CACHE is None:
+                cls._MENU_CACHE = cls._readCacheFile()
+            fileCache = cls._readCacheFile()
+            for cache in (cls._MENU_CACHE, fileCache):
+                if optionNum is None:
+                    cache.get(userKey, {}).pop(dispTranName, None)
+                else:
+                    cache.setdefault(userKey, {})[dispTranName] = [optionNum, pageNum]
+            tmpFilePath = f"{cls.CACHE_FILE_PATH}.{os.getpid()}.tmp"
+            try:
+                with open(tmpFilePath, 'w', encoding='utf-8') as f:
+                    json.dump(fileCache, f, indent=2)
+                os.replace(tmpFilePath, cls.CACHE_FILE_PATH)
+            except OSError as e:
+                printit('Exception while saving rf tran menu cache: ' + str(e))
+
+
 class RFPage(RF_SERVICE_PROVIDER):
     logger = Logging.get(__qualname__)
     # _TITLE_XPATH = "//h1[contains(.,'xterm.js: A terminal')]"
@@ -22,6 +80,10 @@ class RFPage(RF_SERVICE_PROVIDER):
     RF_USER = None
     RF_PWD = None
 
+    _SESSION_POOL = {}  # Pair of (ssh user, rf user, browser session) and idle logged in sessions
+    _SESSION_POOL_LOCK = threading.Lock()
+    _poolKey = None
+
     def __init__(self, driver, isRFWeighUser: bool = None, isPageOpen: bool = False):
         printit('RF_SERVICE_PROVIDER:', RF_SERVICE_PROVIDER.__name__)
 
@@ -43,6 +105,101 @@ class RFPage(RF_SERVICE_PROVIDER):
         elif RF_SERVICE_PROVIDER.__name__ == RFParamikoService.__name__:
             super().__init__(sshHost, sshUser, sshPwd)
 
+    @staticmethod
+    def _is_use_session_pool() -> bool:
+        _IS_USE_SESSION_POOL = ENV_CONST.get('rf', 'is_use_session_pool', fallback='false')
+        return 'true' in _IS_USE_SESSION_POOL
+
+    @staticmethod
+    def _getPoolKey(driver, isRFWeighUser: bool = None, isRfUser2: bool = None) -> tuple:
+        sshUser = ENV_CONFIG.get('rf', 'rfweigh_ssh_user' if isRFWeighUser else 'ssh_user')
+        rfUser = ENV_CONFIG.get('rf', 'rf_user2' if isRfUser2 else 'rf_user')
+        browserSession = driver.session_id if RF_SERVICE_PROVIDER is RFXtermService and driver is not None else None
+        return sshUser, rfUser, browserSession
+
+    @classmethod
+    def get(cls, driver, isRFWeighUser: bool = None, isRfUser2: bool = None) -> 'RFPage':
+        """Logged in RF session at home screen.
+        With is_use_session_pool=true (env_const [rf]) an idle alive session of the same users is reused
+        """
+        poolKey = cls._getPoolKey(driver, isRFWeighUser, isRfUser2)
+        rfPage = None
+        if cls._is_use_session_pool():
+            with cls._SESSION_POOL_LOCK:
+                idleSessions = cls._SESSION_POOL.get(poolKey, [])
+                while rfPage is None and len(idleSessions) > 0:
+                    rfPage = idleSessions.pop()
+                    if not rfPage.isSessionAlive():
+                        printit(f"RF pooled session of {poolKey[:2]} is dead, discarded")
+                        rfPage = None
+
+        if rfPage is None:
+            rfPage = cls(driver, isRFWeighUser=isRFWeighUser)
+            rfPage.loginRF(isRfUser2=isRfUser2)
+        else:
+            printit(f"RF session of {poolKey[:2]} reused from pool")
+        rfPage._poolKey = poolKey
+        rfPage.goToHomeScreen(isRFUser2=isRfUser2)
+        return rfPage
+
+    @classmethod
+    def release(cls, rfPage: 'RFPage'):
+        """Returns the session (from get()) to the pool for the next test, dead sessions are dropped
+        """
+        RFScreenSettle.end_tran()
+        if not cls._is_use_session_pool() or rfPage._poolKey is None:
+            return
+        isAlive = rfPage.isSessionAlive()
+        with cls._SESSION_POOL_LOCK:
+            cls._purgeDeadBrowserSessions()
+            if isAlive:
+                cls._SESSION_POOL.setdefault(rfPage._poolKey, []).append(rfPage)
+
+    @classmethod
+    def _purgeDeadBrowserSessions(cls):
+        """Drops the idle xterm sessions whose browser is gone, caller holds the pool lock
+        """
+        for poolKey in [k for k in cls._SESSION_POOL.keys() if k[2] is not None]:
+            aliveSessions = [i for i in cls._SESSION_POOL[poolKey] if i.isSessionAlive()]
+            if len(aliveSessions) > 0:
+                cls._SESSION_POOL[poolKey] = aliveSessions
+            else:
+                del cls._SESSION_POOL[poolKey]
+
+    @classmethod
+    @contextmanager
+    def session(cls, driver, isRFWeighUser: bool = None, isRfUser2: bool = None):
+        """RF session from get(), released to the pool when the with block ends
+        """
+        rfPage = cls.get(driver, isRFWeighUser=isRFWeighUser, isRfUser2=isRfUser2)
+        try:
+            yield rfPage
+        finally:
+            cls.release(rfPage)
+
+    @classmethod
+    def warmInBackground(cls, isRFWeighUser: bool = None, isRfUser2: bool = None):
+        """Logs in 1 more session into the pool while the curr test runs, if no idle session is pooled.
+        Only for paramiko, xterm sessions need the browser of the test
+        """
+        if not cls._is_use_session_pool() or RF_SERVICE_PROVIDER is not RFParamikoService:
+            return
+        poolKey = cls._getPoolKey(None, isRFWeighUser, isRfUser2)
+        with cls._SESSION_POOL_LOCK:
+            if len(cls._SESSION_POOL.get(poolKey, [])) > 0:
+                return
+
+        def warmFunc():
+            try:
+                rfPage = cls(None, isRFWeighUser=isRFWeighUser)
+                rfPage.loginRF(isRfUser2=isRfUser2)
+                rfPage._poolKey = poolKey
+                cls.release(rfPage)
+            except Exception as e:
+                printit('RF session warm up failed: ' + str(e))
+
+        threading.Thread(target=warmFunc, daemon=True, name='rf-session-warmer').start()
+
     # def connect_rf(self, host=None, user=None, pwd=None) -> str:
     #     return self.connect_ssh(self.host, self.user, self.pwd)
 
@@ -66,6 +223,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         # self.assertScreenTextExist('Choice: _')
 
     def goToHomeScreen(self, isRFUser2: bool = None) -> bool:
+        RFScreenSettle.end_tran()
         isItHomeScreen = False
 
         screentxt = self.readScreen()
@@ -96,6 +254,26 @@ class RFPage(RF_SERVICE_PROVIDER):
     def goToTransaction(self, tranName, dispModule=None):
         """Ex: SORT iLPN (Inboun
         tranName = SORT iLPN, displayedModule = Inboun"""
+        RFScreenSettle.start_tran(tranName)
+        dispTranName = tranName if dispModule is None else tranName + ' (' + dispModule
+
+        '''Cached option: search and page down without reading the screens in between, validated by 1 read'''
+        cachedOption = RFTranMenuCache.get(self.RF_USER, dispTranName)
+        if cachedOption is not None:
+            cachedOptionNum, cachedPageNum = cachedOption
+            self.sendData(self.KEY_CTRL_F_SearchTran)
+            self.sendData(tranName, isEnter=True)
+            for i in range(cachedPageNum - 1):
+                self.sendData(self.KEY_CTRL_D_GoPageDown)
+            screentxt = self.readScreen()
+            if screentxt.count('Choice:') > 0 \
+                    and self._findTranOptionNumber(screentxt, dispTranName) == cachedOptionNum:
+                self.sendData(cachedOptionNum, isEnter=True)
+                return
+            printit(f"RF tran menu cache mismatch for {dispTranName}, looking up the option")
+            RFTranMenuCache.put(self.RF_USER, dispTranName, None)
+
+        '''Search from page 1'''
         self.sendData(self.KEY_CTRL_F_SearchTran)
         screentxt = self.readScreen()
         if screentxt.count('Transaction Search') == 0:
@@ -106,15 +284,24 @@ class RFPage(RF_SERVICE_PROVIDER):
             if screentxt.count('Choice:') == 0:
                 assert False, 'Transaction choice/option screen didnt come'
             else:
-                dispTranName = tranName if dispModule is None else tranName + ' (' + dispModule
-                optionNum = self._fetchTranOptionNumber(screentxt, dispTranName)
+                pageNum = 1
+                optionNum = self._findTranOptionNumber(screentxt, dispTranName)
                 if optionNum == '':
                     self.sendData(self.KEY_CTRL_D_GoPageDown)
                     screentxt = self.readScreen()
-                    optionNum = self._fetchTranOptionNumber(screentxt, dispTranName)
+                    pageNum += 1
+                    optionNum = self._findTranOptionNumber(screentxt, dispTranName)
+                assert optionNum != '', 'RF transaction not found ' + dispTranName
+                RFTranMenuCache.put(self.RF_USER, dispTranName, optionNum, pageNum)
                 self.sendData(optionNum, isEnter=True)
 
     def _fetchTranOptionNumber(self, screenTexts, tranName) -> str:
+        tran_option_num = self._findTranOptionNumber(screenTexts, tranName)
+        assert tran_option_num != '', 'RF transaction not found ' + tranName
+        return tran_option_num
+
+    def _findTranOptionNumber(self, screenTexts, tranName) -> str:
+        """Returns '' if tranName is not in the screen options"""
         tran_option_num = str()
         if screenTexts == '':
             assert False, 'Screen is empty'
@@ -127,7 +314,6 @@ class RFPage(RF_SERVICE_PROVIDER):
                 if str(opt_name[1]).strip().startswith(tranName):
                     tran_option_num = opt_name[0]
                     break
-        assert tran_option_num != '', 'RF transaction not found ' + tranName
         return tran_option_num
 
     def _decideFinalTaskGrp(self, providedTaskGrp=None, forTaskId=None, forIntType: int = None):
@@ -137,7 +323,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             if providedTaskGrp is None:
                 taskGrp = 'ALL'
         else:
-            allTaskGrps = DBLib().getAllTaskGroupFromTask(taskId=str(forTaskId), intType=forIntType)
+            allTaskGrps = DBLib.get().getAllTaskGroupFromTask(taskId=str(forTaskId), intType=forIntType)
             if providedTaskGrp is None:
                 if 'ALL' in allTaskGrps:
                     taskGrp = 'ALL'
@@ -161,13 +347,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'receivePallet')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        isCubiScanConfigSet = DBLib().isCubiScanWarnConfigSetForReceive()
+        isCubiScanConfigSet = DBLib.get().isCubiScanWarnConfigSetForReceive()
         if dockDoor is None:
-            dockDoor, dbDockDoor = DBLib().getOpenDockDoor(workGrp=workGrp, workArea=workArea)
+            dockDoor, dbDockDoor = DBLib.get().getOpenDockDoor(workGrp=workGrp, workArea=workArea)
         else:
-            dockDoor, dbDockDoor = DBLib().getDockDoorName(locnBrcd=dockDoor)
+            dockDoor, dbDockDoor = DBLib.get().getDockDoorName(locnBrcd=dockDoor)
         if blindIlpn is None:
-            blindIlpn = DBLib().getNewILPNNum()
+            blindIlpn = DBLib.get().getNewILPNNum()
 
         if isNewRcv:
             self.goToHomeScreen()
@@ -211,7 +397,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn, isEnter=True)
         elif actLocn is not None:
             self.assertScreenTextExist('Aloc:')
@@ -247,29 +433,29 @@ class RFPage(RF_SERVICE_PROVIDER):
         lpnDtlQty = 0 if actLocn else qty
 
         if o_asnStatus is not None:
-            DBLib().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
-        DBLib().assertASNDtls(i_asn=asn, i_itemBrcd=itemBrcd, i_po=o_po, o_receivedQty=qty, o_dtlStatus=16)
-        DBLib().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=palletFacStat, o_currLocn=currLocn, o_destLocnType=o_destLocnType)
-        DBLib().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemBrcd, o_qty=lpnDtlQty, o_receivedQty=qty)
+            DBLib.get().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
+        DBLib.get().assertASNDtls(i_asn=asn, i_itemBrcd=itemBrcd, i_po=o_po, o_receivedQty=qty, o_dtlStatus=16)
+        DBLib.get().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=palletFacStat, o_currLocn=currLocn, o_destLocnType=o_destLocnType)
+        DBLib.get().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemBrcd, o_qty=lpnDtlQty, o_receivedQty=qty)
 
         '''Alloc, task validation'''
         if noLocn is None:
-            DBLib().assertAllocDtls(i_cntr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_taskPriority=50, o_statCode=allocStatCode,
-                                    o_pullLocn=pullLocn)
-            DBLib().assertTaskDtls(i_cntrNbr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=pullLocn)
-            taskId = DBLib().getTaskIdByORCond(taskGenRefNbr=blindIlpn, taskCmplRefNbr=blindIlpn, cntr=blindIlpn, intType=o_intType)
-            DBLib().assertTaskHdr(i_task=taskId, o_intType=o_intType, o_status=taskStatCode)
+            DBLib.get().assertAllocDtls(i_cntr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_taskPriority=50, o_statCode=allocStatCode,
+                                        o_pullLocn=pullLocn)
+            DBLib.get().assertTaskDtls(i_cntrNbr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=pullLocn)
+            taskId = DBLib.get().getTaskIdByORCond(taskGenRefNbr=blindIlpn, taskCmplRefNbr=blindIlpn, cntr=blindIlpn, intType=o_intType)
+            DBLib.get().assertTaskHdr(i_task=taskId, o_intType=o_intType, o_status=taskStatCode)
 
         '''Pix validation 100, 617, 606'''
         if not isCubiscanNeed:
-            DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType='617')
+            DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType='617')
             final_tranType = '606' if isItemForCrossDock else '100'
-            DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType=final_tranType)
+            DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType=final_tranType)
 
         '''LM validation (labor_msg_id 63746374)'''
         lmRefNbr = asn  # if actLocn else blindIlpn
-        DBLib().assertLaborMsgHdr(i_refNbr=lmRefNbr, i_actName='RCV PLT')  # RCV PLT
-        DBLib().assertLaborMsgDtl(i_refNbr=lmRefNbr, i_actName='RCV PLT', i_lpn=blindIlpn, i_itemBrcd=itemBrcd)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=lmRefNbr, i_actName='RCV PLT')  # RCV PLT
+        DBLib.get().assertLaborMsgDtl(i_refNbr=lmRefNbr, i_actName='RCV PLT', i_lpn=blindIlpn, i_itemBrcd=itemBrcd)
 
         return blindIlpn, dbDockDoor
 
@@ -288,7 +474,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(asn, isEnter=True)
         self.assertScreenTextExist('LPN:')
         if iLPN is None:
-            iLPN = DBLib().getNewILPNNum()
+            iLPN = DBLib.get().getNewILPNNum()
         self.sendData(iLPN, isEnterIfLT20=True)
 
         if isInvalidBarcode:
@@ -339,19 +525,19 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         if not isItemNotOnASN and not isInvalidBarcode:
-            DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
-            DBLib().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
+            DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+            DBLib.get().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
 
             if o_asnStatus is not None:
-                DBLib().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
-            DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
+                DBLib.get().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
+            DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
 
-            DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='100')
-            DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='617')
+            DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='100')
+            DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='617')
 
             '''LM validation (labor_msg_id 63747220)'''
-            DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV ILPN CA')
-            DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV ILPN CA', i_lpn=iLPN, i_itemBrcd=itemBrcd)
+            DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV ILPN CA')
+            DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV ILPN CA', i_lpn=iLPN, i_itemBrcd=itemBrcd)
 
         return iLPN
 
@@ -364,7 +550,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'receiveSortMixILPN')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        isCubiScanConfigSet = DBLib().isCubiScanWarnConfigSetForReceive()
+        isCubiScanConfigSet = DBLib.get().isCubiScanWarnConfigSetForReceive()
 
         itemList = itemsIn1ActvZone if type(itemsIn1ActvZone) == list else [itemsIn1ActvZone]
         qtyList = qty if type(qty) == list else [qty]
@@ -409,12 +595,12 @@ class RFPage(RF_SERVICE_PROVIDER):
                 else:
                     self.assertScreenTextExist('Rloc:' + fetchedSortLocn)
                 if blindIlpn is None:
-                    blindIlpn = DBLib().getNewILPNNum()
+                    blindIlpn = DBLib.get().getNewILPNNum()
                 self.sendData(blindIlpn, isEnterIfLT20=True)
                 if i == 0:
                     self.assertScreenTextExist('Pallet:')
                     if blindPallet is None:
-                        blindPallet = DBLib().getNewInPalletNum()
+                        blindPallet = DBLib.get().getNewInPalletNum()
                     self.sendData(blindPallet, isEnterIfLT20=True)
                 if i == 0:
                     screentxt = self.readScreen()
@@ -424,29 +610,29 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertASNHdr(i_asn=asn, o_status=30)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=30)
         for i in range(len(itemList)):
-            DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemList[i], o_receivedQty=qtyList[i], o_dtlStatus=16)
+            DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemList[i], o_receivedQty=qtyList[i], o_dtlStatus=16)
 
         if isCubiscanNeed:
             for i in range(len(defaultIlpnPerItem)):
-                DBLib().assertLPNHdr(i_lpn=defaultIlpnPerItem[i], o_facStatus=o_facStatus, o_parentLpn=blindPallet)
-                DBLib().assertLPNDtls(i_lpn=defaultIlpnPerItem[i], i_itemBrcd=itemList[i], o_qty=qtyList[i], o_receivedQty=qtyList[i])
+                DBLib.get().assertLPNHdr(i_lpn=defaultIlpnPerItem[i], o_facStatus=o_facStatus, o_parentLpn=blindPallet)
+                DBLib.get().assertLPNDtls(i_lpn=defaultIlpnPerItem[i], i_itemBrcd=itemList[i], o_qty=qtyList[i], o_receivedQty=qtyList[i])
         else:
-            DBLib().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=o_facStatus, o_parentLpn=blindPallet)
+            DBLib.get().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=o_facStatus, o_parentLpn=blindPallet)
             for i in range(len(itemList)):
-                DBLib().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemList[i], o_qty=qtyList[i], o_receivedQty=qtyList[i])
-                DBLib().assertAllocDtls(i_cntr=blindIlpn, i_intType=o_intType, i_itemBrcd=itemList[i], o_taskPriority=50,
-                                        o_pullLocn=fetchedSortLocn)
+                DBLib.get().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemList[i], o_qty=qtyList[i], o_receivedQty=qtyList[i])
+                DBLib.get().assertAllocDtls(i_cntr=blindIlpn, i_intType=o_intType, i_itemBrcd=itemList[i], o_taskPriority=50,
+                                            o_pullLocn=fetchedSortLocn)
                 '''Pix validation'''
-                defaultLpn = DBLib().getDefaultLpnFromASNItem(asn=asn, itemBrcd=itemList[i])
-                DBLib().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='100')
-                DBLib().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='617')
+                defaultLpn = DBLib.get().getDefaultLpnFromASNItem(asn=asn, itemBrcd=itemList[i])
+                DBLib.get().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='100')
+                DBLib.get().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='617')
 
         '''LM validation'''
-        DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV PLT MIX')
+        DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV PLT MIX')
         for i in range(0, len(itemList)):
-            DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV PLT MIX', i_itemBrcd=itemList[i])
+            DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV PLT MIX', i_itemBrcd=itemList[i])
 
         return blindIlpn, blindPallet, fetchedSortLocn
 
@@ -472,7 +658,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             self.assertScreenTextExist('Rloc:')
             sortLocn = self.readDataForTextInLine('Rloc:').strip()
             if pallet is None:
-                pallet = DBLib().getNewInPalletNum()
+                pallet = DBLib.get().getNewInPalletNum()
             self.sendData(pallet, isEnterIfLT20=True)
             if isPalletInUse:
                 self.assertScreenTextExist('Pallet currently')
@@ -494,22 +680,22 @@ class RFPage(RF_SERVICE_PROVIDER):
             final_currLocn = None if isPalletInUse or isPalletClosed else sortLocn
             final_lpnFacStat = LPNFacStat.ILPN_ALLOCATED if o_facStatus is None else o_facStatus
 
-            DBLib().assertLPNHdr(i_lpn=ilpnList[i], o_facStatus=final_lpnFacStat, o_parentLpn=final_parentLpn, o_currLocn=final_currLocn)
+            DBLib.get().assertLPNHdr(i_lpn=ilpnList[i], o_facStatus=final_lpnFacStat, o_parentLpn=final_parentLpn, o_currLocn=final_currLocn)
 
             for j in range(len(o_items[i])):
-                DBLib().assertAllocDtls(i_cntr=ilpnList[i], i_or_taskRefNbr=ilpnList[i], i_intType=o_intType,
-                                        i_itemBrcd=o_items[i][j], o_taskPriority=50, o_pullLocn=final_currLocn)
+                DBLib.get().assertAllocDtls(i_cntr=ilpnList[i], i_or_taskRefNbr=ilpnList[i], i_intType=o_intType,
+                                            i_itemBrcd=o_items[i][j], o_taskPriority=50, o_pullLocn=final_currLocn)
                 if o_isAssertTask:
-                    DBLib().assertTaskDtls(i_cntrNbr=ilpnList[i], i_itemBrcd=o_items[i][j], i_intType=o_intType,
-                                           o_pullLocn=final_currLocn, o_statCode=TaskDtlStat.UNASSIGNED)
+                    DBLib.get().assertTaskDtls(i_cntrNbr=ilpnList[i], i_itemBrcd=o_items[i][j], i_intType=o_intType,
+                                               o_pullLocn=final_currLocn, o_statCode=TaskDtlStat.UNASSIGNED)
             if o_isAssertTask:
-                DBLib().assertTaskHdr(i_taskGenRefNbr=ilpnList[i], o_intType=o_intType)
+                DBLib.get().assertTaskHdr(i_taskGenRefNbr=ilpnList[i], o_intType=o_intType)
 
         '''LM validation'''
         if not (isPalletInUse or isPalletClosed):
             for i in range(len(ilpnList)):
-                DBLib().assertLaborMsgHdr(i_refNbr=ilpnList[i], i_actName='SORT LPN CA')
-                DBLib().assertLaborMsgDtl(i_refNbr=ilpnList[i], i_actName='SORT LPN CA', i_lpn=ilpnList[i])
+                DBLib.get().assertLaborMsgHdr(i_refNbr=ilpnList[i], i_actName='SORT LPN CA')
+                DBLib.get().assertLaborMsgDtl(i_refNbr=ilpnList[i], i_actName='SORT LPN CA', i_lpn=ilpnList[i])
 
         return sortLocn, pallet
 
@@ -534,17 +720,17 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=pallet)
+        DBLib.get().assertLPNHdr(i_lpn=pallet)
         for i in range(len(o_lpns)):
             for j in range(len(o_items[i])):
-                DBLib().assertTaskDtls(i_cntrNbr=o_lpns[i], i_itemBrcd=o_items[i][j], i_intType=o_intType,
-                                       o_pullLocn=sortLocn, o_statCode=TaskDtlStat.UNASSIGNED)
+                DBLib.get().assertTaskDtls(i_cntrNbr=o_lpns[i], i_itemBrcd=o_items[i][j], i_intType=o_intType,
+                                           o_pullLocn=sortLocn, o_statCode=TaskDtlStat.UNASSIGNED)
 
             if isTaskCreatedForAnyLpn is None:
-                DBLib().assertTaskHdr(i_cntr=o_lpns[i], o_intType=o_intType)
+                DBLib.get().assertTaskHdr(i_cntr=o_lpns[i], o_intType=o_intType)
 
         '''LM validation'''
-        # DBLib().assertLaborMsgHdr(i_refNbr=pallet, i_actName='SORT END PLT')
+        # DBLib.get().assertLaborMsgHdr(i_refNbr=pallet, i_actName='SORT END PLT')
 
     def _changeTaskGroupByCtrl(self, taskGroup='ALL'):
         self.goToHomeScreen()
@@ -585,9 +771,9 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         if taskId is None:
             if isReplenFromWave:
-                taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
+                taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
             elif isReplenFromLT:
-                taskId = DBLib().getTaskIdFromTaskDtl(cntrNbr=fromIlpn[0], isLTRTask=True)
+                taskId = DBLib.get().getTaskIdFromTaskDtl(cntrNbr=fromIlpn[0], isLTRTask=True)
         assert taskId is not None, 'Task not found for replen execution'
 
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
@@ -602,7 +788,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(taskId, isEnter=True)
         self.assertScreenTextExist('Pallet:')
         if blindPallet is None:
-            blindPallet = DBLib().getNewInPalletNum()
+            blindPallet = DBLib.get().getNewInPalletNum()
         self.sendData(blindPallet, isEnterIfLT20=True)
         for i in range(len(fromIlpnList)):
             self.assertScreenTextExist(str(taskId))
@@ -623,11 +809,11 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(0, len(fromIlpnList)):
-            DBLib().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV)
+            DBLib.get().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV)
             for j in range(0, len(itemFromIlpnList[i])):
-                DBLib().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=1, i_itemBrcd=itemFromIlpnList[i][j],
-                                        o_qtyAlloc=int(qtyForItemList[i][j]), o_statCode=AllocStat.TASK_DETAIL_CREATED)
-                DBLib().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
+                DBLib.get().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=1, i_itemBrcd=itemFromIlpnList[i][j],
+                                            o_qtyAlloc=int(qtyForItemList[i][j]), o_statCode=AllocStat.TASK_DETAIL_CREATED)
+                DBLib.get().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
 
         return blindPallet
 
@@ -642,7 +828,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         qtyForItemList = qtyToFill if type(qtyToFill) == list else [qtyToFill]
         actvLocnList = toActvLocn if type(toActvLocn) == list else [toActvLocn]
         if pallet is None:
-            pallet = DBLib().getNewInPalletNum()
+            pallet = DBLib.get().getNewInPalletNum()
 
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
@@ -668,9 +854,9 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
         for i in range(len(fromIlpnList)):
-            DBLib().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV)
+            DBLib.get().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV)
 
     def replenFromResvToDropByCtrlTask(self, fromResvLocn: str, fromIlpn: list[str], itemToPull: list[list[str]], qtyToPull: list[list[int]],
                                        isReplenFromWave: bool = None, waveNbr: str = None, isReplenFromLT:bool = None,
@@ -678,12 +864,12 @@ class RFPage(RF_SERVICE_PROVIDER):
         """pull 1 or more lpns in a pallet and drops in a drop location"""
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, 'Ctrl E')
 
-        blindPallet = DBLib().getNewInPalletNum()
+        blindPallet = DBLib.get().getNewInPalletNum()
         taskId = None
         if isReplenFromWave:
-            taskId = str(DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr))
+            taskId = str(DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr))
         elif isReplenFromLT:
-            taskId = str(DBLib().getTaskIdFromTaskDtl(cntrNbr=fromIlpn[0], isLTRTask=True))
+            taskId = str(DBLib.get().getTaskIdFromTaskDtl(cntrNbr=fromIlpn[0], isLTRTask=True))
         assert taskId is not None, 'Task not found for replen execution'
 
         fromIlpnList = fromIlpn if type(fromIlpn) == list else [fromIlpn]
@@ -718,9 +904,9 @@ class RFPage(RF_SERVICE_PROVIDER):
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
             if isToWrongDrop:
-                toDropLocn = DBLib().getLocnByWGWA(workGrp=workG, ignoreWorkArea=[workA])
+                toDropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, ignoreWorkArea=[workA])
             else:
-                toDropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+                toDropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
         self.sendData(toDropLocn, isEnter=True)
 
         if isToWrongDrop:
@@ -733,8 +919,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         if not isToWrongDrop:
             for i in range(len(fromIlpnList)):
-                DBLib().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=LPNFacStat.ILPN_ALLOCATED_AND_PULLED,
-                                     o_prevLocn=fromResvLocn, o_currLocn=toDropLocn)
+                DBLib.get().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=LPNFacStat.ILPN_ALLOCATED_AND_PULLED,
+                                         o_prevLocn=fromResvLocn, o_currLocn=toDropLocn)
 
         return blindPallet, taskId
 
@@ -769,16 +955,16 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            nextDropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            nextDropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             currDropLocn = nextDropLocn
             self.sendData(nextDropLocn, isEnter=True)
         self.assertScreenTextExist('Task#:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.IN_DROP_ZONE)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.IN_DROP_ZONE)
         for i in range(len(iLpns)):
-            DBLib().assertLPNHdr(i_lpn=iLpns[i], o_parentLpn=pallet, o_prevLocn=prevResvLocn, o_currLocn=currDropLocn)
+            DBLib.get().assertLPNHdr(i_lpn=iLpns[i], o_parentLpn=pallet, o_prevLocn=prevResvLocn, o_currLocn=currDropLocn)
 
         return currDropLocn
     
@@ -802,15 +988,15 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         originalILpns = []
         finalIlpns = []
-        pallet = DBLib().getNewInPalletNum()
-        blindILPN = DBLib().getNewILPNNum()
+        pallet = DBLib.get().getNewInPalletNum()
+        blindILPN = DBLib.get().getNewILPNNum()
         taskId = None
         if isReplenFromWave:
-            taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
+            taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
         assert taskId is not None, 'Task not found for replen execution'
 
         # if taskGrp is None:
-        #     taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+        #     taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
         self.goToHomeScreen()
@@ -871,38 +1057,38 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn)
         self.assertScreenTextExist('Task#:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
         taskHdrStatus = TaskHdrStat.CANCELLED if isCompleteShortPull or isCancelReplenTask else TaskHdrStat.COMPLETE if willTaskComplete else TaskHdrStat.RELEASED
-        DBLib().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
 
         lpnFacStatus = LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY if isCompleteShortPull else LPNFacStat.ILPN_CONSUMED_TO_ACTV if toActvLocn else LPNFacStat.ILPN_PUTAWAY if isCancelReplenTask else LPNFacStat.ILPN_ALLOCATED
         taskDtlStatus = TaskDtlStat.TASK_COMPLETE if toActvLocn else TaskDtlStat.DELETED if isCancelReplenTask else TaskDtlStat.RELEASED
         taskGenRefNbr = waveNbr if waveNbr is not None else None
 
         for i in range(len(finalIlpns)):
-            DBLib().assertLPNHdr(i_lpn=finalIlpns[i], o_facStatus=lpnFacStatus)
-            DBLib().assertTaskDtls(i_task=taskId, i_cntrNbr=finalIlpns[i], o_statCode=taskDtlStatus)
+            DBLib.get().assertLPNHdr(i_lpn=finalIlpns[i], o_facStatus=lpnFacStatus)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_cntrNbr=finalIlpns[i], o_statCode=taskDtlStatus)
 
             for j in range(len(itemFromIlpnList[i])):
-                DBLib().assertAllocDtls(i_itemBrcd=itemFromIlpnList[i][j], i_cntr=finalIlpns[i],
-                                        i_taskGenRefNbr=taskGenRefNbr, i_intType=1,
-                                        o_taskPriority=o_taskPriority, o_statCode=AllocStat.TASK_DETAIL_CREATED)
+                DBLib.get().assertAllocDtls(i_itemBrcd=itemFromIlpnList[i][j], i_cntr=finalIlpns[i],
+                                            i_taskGenRefNbr=taskGenRefNbr, i_intType=1,
+                                            o_taskPriority=o_taskPriority, o_statCode=AllocStat.TASK_DETAIL_CREATED)
         if isAssertNewTask:
-            newTaskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr, i_ignoreTaskId=taskId)
+            newTaskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr, i_ignoreTaskId=taskId)
             for i in range(len(lpnsForNewTask)):
-                DBLib().assertTaskHdr(i_task=newTaskId, i_currTaskPrty=50, i_taskGenRefNbr=waveNbr,
-                                      i_cntr=lpnsForNewTask[i], o_status=TaskHdrStat.RELEASED)
+                DBLib.get().assertTaskHdr(i_task=newTaskId, i_currTaskPrty=50, i_taskGenRefNbr=waveNbr,
+                                          i_cntr=lpnsForNewTask[i], o_status=TaskHdrStat.RELEASED)
 
         if isAssertCycleCnt:
             for i in range(len(fromResvLocn)):
-                locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=fromResvLocn[i])
-                DBLib().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=101, o_status=TaskHdrStat.COMPLETE)
-                # DBLib().assertCycleCountStatus(i_locnBrcd=fromResvLocn[i], i_intType=101, o_statCode=10)
+                locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=fromResvLocn[i])
+                DBLib.get().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=101, o_status=TaskHdrStat.COMPLETE)
+                # DBLib.get().assertCycleCountStatus(i_locnBrcd=fromResvLocn[i], i_intType=101, o_statCode=10)
 
         return taskId
 
@@ -921,15 +1107,15 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         originalILpns = []
         finalIlpns = []
-        pallet = DBLib().getNewInPalletNum()
-        blindILPN = DBLib().getNewILPNNum()
+        pallet = DBLib.get().getNewInPalletNum()
+        blindILPN = DBLib.get().getNewILPNNum()
         taskId = None
         if isReplenFromWave:
-            taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
+            taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
         assert taskId is not None, 'Task not found for replen execution'
 
         # if taskGrp is None:
-        #     taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+        #     taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
         self.goToHomeScreen()
@@ -966,28 +1152,28 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn)
         self.assertScreenTextExist('Task#:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
         taskHdrStatus = TaskHdrStat.COMPLETE if willTaskComplete else TaskHdrStat.RELEASED
-        DBLib().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
 
         lpnFacStatus = LPNFacStat.ILPN_CONSUMED_TO_ACTV if toActvLocn else LPNFacStat.ILPN_ALLOCATED
         taskDtlStatus = TaskDtlStat.TASK_COMPLETE if toActvLocn else TaskDtlStat.RELEASED
         taskGenRefNbr = waveNbr if waveNbr is not None else None
 
         for i in range(len(finalIlpns)):
-            DBLib().assertLPNHdr(i_lpn=finalIlpns[i], o_facStatus=lpnFacStatus)
-            DBLib().assertLPNHdr(i_lpn=originalILpns[i], o_facStatus=LPNFacStat.ILPN_PUTAWAY)
-            DBLib().assertTaskDtls(i_task=taskId, i_cntrNbr=finalIlpns[i], o_statCode=taskDtlStatus)
+            DBLib.get().assertLPNHdr(i_lpn=finalIlpns[i], o_facStatus=lpnFacStatus)
+            DBLib.get().assertLPNHdr(i_lpn=originalILpns[i], o_facStatus=LPNFacStat.ILPN_PUTAWAY)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_cntrNbr=finalIlpns[i], o_statCode=taskDtlStatus)
             for j in range(len(itemFromIlpnList[i])):
-                DBLib().assertAllocDtls(i_itemBrcd=itemFromIlpnList[i][j], i_cntr=finalIlpns[i],
-                                        i_taskGenRefNbr=taskGenRefNbr,
-                                        i_intType=1,
-                                        o_taskPriority=o_taskPriority, o_statCode=AllocStat.TASK_DETAIL_CREATED)
+                DBLib.get().assertAllocDtls(i_itemBrcd=itemFromIlpnList[i][j], i_cntr=finalIlpns[i],
+                                            i_taskGenRefNbr=taskGenRefNbr,
+                                            i_intType=1,
+                                            o_taskPriority=o_taskPriority, o_statCode=AllocStat.TASK_DETAIL_CREATED)
 
         return taskId
 
@@ -1006,15 +1192,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         qtyForItemList = qtyToPull if type(qtyToPull) == list else [qtyToPull]
         toActvLocnList = toActvLocn if type(toActvLocn) == list else [toActvLocn]
 
-        pallet = DBLib().getNewInPalletNum()
-        # blindILPN = DBLib().getNewILPNNum()
+        pallet = DBLib.get().getNewInPalletNum()
+        # blindILPN = DBLib.get().getNewILPNNum()
         taskId = None
         if isReplenFromWave:
-            taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
+            taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
         assert taskId is not None, 'Task not found for replen execution'
 
         # if taskGrp is None:
-        #     taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+        #     taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
         self.goToHomeScreen()
@@ -1053,32 +1239,32 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn)
         self.assertScreenTextExist('Task#:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
         taskHdrStatus = TaskHdrStat.COMPLETE if willTaskComplete else TaskHdrStat.RELEASED
-        DBLib().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
 
         taskDtlStatus = TaskDtlStat.TASK_COMPLETE if toActvLocn else TaskDtlStat.RELEASED
         taskGenRefNbr = waveNbr if waveNbr is not None else None
 
         for i in range(len(fromIlpnList)):
-            DBLib().assertTaskDtls(i_task=taskId, i_cntrNbr=fromIlpnList[i], o_statCode=taskDtlStatus,
-                                   o_taskPriority=o_taskPriority)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_cntrNbr=fromIlpnList[i], o_statCode=taskDtlStatus,
+                                       o_taskPriority=o_taskPriority)
 
             for j in range(len(itemFromIlpnList[i])):
-                DBLib().assertAllocDtls(i_itemBrcd=itemFromIlpnList[i][j], i_cntr=fromIlpnList[i],
-                                        i_taskGenRefNbr=taskGenRefNbr, i_intType=1,
-                                        o_taskPriority=o_taskPriority, o_statCode=AllocStat.TASK_DETAIL_CREATED)
+                DBLib.get().assertAllocDtls(i_itemBrcd=itemFromIlpnList[i][j], i_cntr=fromIlpnList[i],
+                                            i_taskGenRefNbr=taskGenRefNbr, i_intType=1,
+                                            o_taskPriority=o_taskPriority, o_statCode=AllocStat.TASK_DETAIL_CREATED)
         if isAssertNewTask:
-            newTaskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr, i_ignoreTaskId=taskId)
+            newTaskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr, i_ignoreTaskId=taskId)
             for i in range(len(lpnsForNewTask)):
-                DBLib().assertTaskHdr(i_task=newTaskId, i_currTaskPrty=50, i_taskGenRefNbr=waveNbr,
-                                      i_cntr=lpnsForNewTask[i],
-                                      o_intType=1, o_status=TaskHdrStat.RELEASED)
+                DBLib.get().assertTaskHdr(i_task=newTaskId, i_currTaskPrty=50, i_taskGenRefNbr=waveNbr,
+                                          i_cntr=lpnsForNewTask[i],
+                                          o_intType=1, o_status=TaskHdrStat.RELEASED)
 
         return taskId
 
@@ -1095,15 +1281,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         qtyForItemList = qtyToPull if type(qtyToPull) == list else [qtyToPull]
         toActvLocnList = toActvLocn if type(toActvLocn) == list else [toActvLocn]
 
-        pallet = DBLib().getNewInPalletNum()
-        # blindILPN = DBLib().getNewILPNNum()
+        pallet = DBLib.get().getNewInPalletNum()
+        # blindILPN = DBLib.get().getNewILPNNum()
         taskId = None
         if isReplenFromWave:
-            taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
+            taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
         assert taskId is not None, 'Task not found for replen execution'
 
         # if taskGrp is None:
-        #     taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+        #     taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
         self.goToHomeScreen()
@@ -1137,17 +1323,17 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn)
         self.assertScreenTextExist('Task#:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_status=o_taskStatus)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=o_taskStatus)
         taskGenRefNbr = waveNbr if waveNbr is not None else None
 
         for i in range(len(fromIlpnList)):
-            DBLib().assertTaskDtls(i_task=taskId, i_cntrNbr=fromIlpnList[i], o_statCode=o_taskStatus)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_cntrNbr=fromIlpnList[i], o_statCode=o_taskStatus)
 
         return taskId
 
@@ -1165,15 +1351,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         qtyForItemList = qtyToPull if type(qtyToPull) == list else [qtyToPull]
         toActvLocnList = toActvLocn if type(toActvLocn) == list else [toActvLocn]
 
-        pallet = DBLib().getNewInPalletNum()
-        blindILPN = DBLib().getNewILPNNum()
+        pallet = DBLib.get().getNewInPalletNum()
+        blindILPN = DBLib.get().getNewILPNNum()
         taskId = None
         if isReplenFromWave:
-            taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
+            taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr)
         assert taskId is not None, 'Task not found for replen execution'
 
         # if taskGrp is None:
-        #     taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+        #     taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
         self.goToHomeScreen()
@@ -1213,27 +1399,27 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn)
         self.assertScreenTextExist('Task#:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
         taskHdrStatus = TaskHdrStat.CANCELLED if isCompleteShortPull else TaskHdrStat.RELEASED
-        DBLib().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=taskHdrStatus)
 
         lpnFacStatus = LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY if isCompleteShortPull else LPNFacStat.ILPN_ALLOCATED
         taskGenRefNbr = waveNbr if waveNbr is not None else None
 
         for i in range(len(fromIlpnList)):
-            DBLib().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=lpnFacStatus)
+            DBLib.get().assertLPNHdr(i_lpn=fromIlpnList[i], o_facStatus=lpnFacStatus)
 
         if isAssertCycleCnt:
             ccINTType = 100 if isCompleteShortPull else 101
             for i in range(len(fromResvLocn)):
-                locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=fromResvLocn[i])
-                DBLib().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=ccINTType, o_status=TaskHdrStat.RELEASED)
-                # DBLib().assertCycleCountStatus(i_locnBrcd=fromResvLocn[i], i_intType=101, o_statCode=10)
+                locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=fromResvLocn[i])
+                DBLib.get().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=ccINTType, o_status=TaskHdrStat.RELEASED)
+                # DBLib.get().assertCycleCountStatus(i_locnBrcd=fromResvLocn[i], i_intType=101, o_statCode=10)
 
         return taskId
 
@@ -1246,10 +1432,10 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, 'Ctrl E')
 
         blindIlpn = toDropLocn = None
-        blindPallet = DBLib().getNewInPalletNum()
+        blindPallet = DBLib.get().getNewInPalletNum()
         if isLpnPartiallyAllocated:
-            blindIlpn = DBLib().getNewILPNNum()
-        taskId = str(DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr))
+            blindIlpn = DBLib.get().getNewILPNNum()
+        taskId = str(DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr))
 
         self.goToHomeScreen()
         self.sendData(self.KEY_CTRL_E_EnterTask)
@@ -1274,7 +1460,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            toDropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            toDropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(toDropLocn, isEnter=True)
         elif toActvLocn is not None:
             self.assertScreenTextExist('Aloc:' + str(toActvLocn))
@@ -1286,9 +1472,9 @@ class RFPage(RF_SERVICE_PROVIDER):
         finalCurrLocn = toDropLocn if isToDropLocn else toActvLocn
         finalLpn = blindIlpn if isLpnPartiallyAllocated else fromIlpn
         finalTaskStatus = TaskHdrStat.IN_DROP_ZONE if isToDropLocn else TaskHdrStat.COMPLETE
-        DBLib().assertTaskHdr(i_task=taskId, i_cntr=finalLpn, o_status=finalTaskStatus)
+        DBLib.get().assertTaskHdr(i_task=taskId, i_cntr=finalLpn, o_status=finalTaskStatus)
         finalLpnFacStat = LPNFacStat.ILPN_CONSUMED_TO_ACTV if toActvLocn is not None else LPNFacStat.ILPN_ALLOCATED_AND_PULLED
-        DBLib().assertLPNHdr(i_lpn=finalLpn, o_facStatus=finalLpnFacStat, o_prevLocn=fromResvLocn, o_currLocn=finalCurrLocn)
+        DBLib.get().assertLPNHdr(i_lpn=finalLpn, o_facStatus=finalLpnFacStat, o_prevLocn=fromResvLocn, o_currLocn=finalCurrLocn)
 
         return finalLpn
 
@@ -1298,7 +1484,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if dockDoor is None:
-            dockDoor, dbDockDoor = DBLib().getOpenDockDoor(workGrp='RECV', workArea='REC1')
+            dockDoor, dbDockDoor = DBLib.get().getOpenDockDoor(workGrp='RECV', workArea='REC1')
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -1312,15 +1498,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=o_ilpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_asn=asn)
-        DBLib().assertLPNDtls(i_lpn=o_ilpn, i_itemBrcd=o_item, o_qty=o_qty, o_receivedQty=o_qty)
-        DBLib().assertASNHdr(i_asn=asn, o_status=30)
-        DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=o_item, o_dtlStatus=16, o_shippedQty=o_qty, o_receivedQty=o_qty)
-        DBLib().assertPix(i_itemBrcd=o_item, i_caseNbr=o_ilpn, i_tranType='100')
-        DBLib().assertPix(i_itemBrcd=o_item, i_caseNbr=o_ilpn, i_tranType='617')
+        DBLib.get().assertLPNHdr(i_lpn=o_ilpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_asn=asn)
+        DBLib.get().assertLPNDtls(i_lpn=o_ilpn, i_itemBrcd=o_item, o_qty=o_qty, o_receivedQty=o_qty)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=30)
+        DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=o_item, o_dtlStatus=16, o_shippedQty=o_qty, o_receivedQty=o_qty)
+        DBLib.get().assertPix(i_itemBrcd=o_item, i_caseNbr=o_ilpn, i_tranType='100')
+        DBLib.get().assertPix(i_itemBrcd=o_item, i_caseNbr=o_ilpn, i_tranType='617')
         '''LM validation'''
-        DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV FULL ASN')
-        DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV FULL ASN', i_lpn=o_ilpn, i_itemBrcd=o_item)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV FULL ASN')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV FULL ASN', i_lpn=o_ilpn, i_itemBrcd=o_item)
 
     def packILPNFromActiveTran(self, aLoc: str, qty: int, iLPN: str = None, locationEmpty: str = None):
         """"""
@@ -1331,7 +1517,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.goToTransaction(tran_name)
         self.assertScreenTextExist('iLPN:')
         if iLPN is None:
-            iLPN = DBLib().getNewILPNNum()
+            iLPN = DBLib.get().getNewILPNNum()
         self.sendData(iLPN, isEnterIfLT20=True)
         self.assertScreenTextExist('Aloc:')
         self.sendData(aLoc, isEnter=True)
@@ -1346,7 +1532,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY, o_prevLocn=aLoc)
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY, o_prevLocn=aLoc)
 
         return iLPN
 
@@ -1360,7 +1546,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.goToTransaction(tran_name)
         self.assertScreenTextExist('Pallet:')
         if palletId is None:
-            palletId = DBLib().getNewInPalletNum()
+            palletId = DBLib.get().getNewInPalletNum()
         self.sendData(palletId, isEnter=True)
         self.assertScreenTextExist('iLPN:')
         for i in range(0, len(iLPN)):
@@ -1374,11 +1560,11 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(iLPN)):
-            DBLib().assertLPNHdr(i_lpn=iLPN[i], o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY,
-                                 o_parentLpn=palletId)
+            DBLib.get().assertLPNHdr(i_lpn=iLPN[i], o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY,
+                                     o_parentLpn=palletId)
             for j in range(0, len(o_item[i])):
-                DBLib().assertLPNDtls(i_lpn=iLPN[i], i_itemBrcd=o_item[i][j], o_qty=o_qty[i][j],
-                                      o_receivedQty=o_qty[i][j])
+                DBLib.get().assertLPNDtls(i_lpn=iLPN[i], i_itemBrcd=o_item[i][j], o_qty=o_qty[i][j],
+                                          o_receivedQty=o_qty[i][j])
 
         return palletId
 
@@ -1394,18 +1580,18 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(qty, isEnter=True)
         self.assertScreenTextExist('Move To LPN :')
         if toILPN is None:
-            toILPN = DBLib().getNewILPNNum()
+            toILPN = DBLib.get().getNewILPNNum()
         self.sendData(toILPN, isEnter=True)
         self.assertScreenTextExist('Move Qty:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
         '''From ilpn'''
-        DBLib().assertLPNHdr(i_lpn=fromILPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
-        DBLib().assertLPNDtls(i_lpn=fromILPN, i_itemBrcd=o_item, o_qty=qty)
+        DBLib.get().assertLPNHdr(i_lpn=fromILPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+        DBLib.get().assertLPNDtls(i_lpn=fromILPN, i_itemBrcd=o_item, o_qty=qty)
         '''To ilpn'''
-        DBLib().assertLPNHdr(i_lpn=toILPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
-        DBLib().assertLPNDtls(i_lpn=toILPN, i_itemBrcd=o_item, o_qty=qty)
+        DBLib.get().assertLPNHdr(i_lpn=toILPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+        DBLib.get().assertLPNDtls(i_lpn=toILPN, i_itemBrcd=o_item, o_qty=qty)
 
         return toILPN
 
@@ -1431,11 +1617,11 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=toOLpn, o_facStatus=toOLpnFacStat)
+        DBLib.get().assertLPNHdr(i_lpn=toOLpn, o_facStatus=toOLpnFacStat)
         for i in range(len(fromOLpns)):
-            DBLib().assertLPNHdr(i_lpn=fromOLpns[i], o_facStatus=LPNFacStat.OLPN_CANCELLED)
+            DBLib.get().assertLPNHdr(i_lpn=fromOLpns[i], o_facStatus=LPNFacStat.OLPN_CANCELLED)
             for j in range(len(items[i])):
-                DBLib().assertLPNDtls(i_lpn=toOLpn, i_itemBrcd=items[i][j], o_initialQty=qtys[i][j])
+                DBLib.get().assertLPNDtls(i_lpn=toOLpn, i_itemBrcd=items[i][j], o_initialQty=qtys[i][j])
 
     def moveAllOLPNTran(self, fromOLpns: list[str], toOLpn: str, o_items: list[str]=None, o_qtys: list[int]=None,
                     isOLPNFromDiffDOs:bool=None, isDiffConsolLocn:bool=None,o_facStatus: LPNFacStat = None):
@@ -1461,12 +1647,12 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         if not isOLPNFromDiffDOs and not isDiffConsolLocn:
             for i in range(len(fromOLpns)):
-                DBLib().assertLPNHdr(i_lpn=fromOLpns[i], o_facStatus=LPNFacStat.OLPN_CANCELLED)
-            DBLib().assertLPNHdr(i_lpn=toOLpn, o_facStatus=o_facStatus, o_totalLpnQty=sum(o_qtys))
+                DBLib.get().assertLPNHdr(i_lpn=fromOLpns[i], o_facStatus=LPNFacStat.OLPN_CANCELLED)
+            DBLib.get().assertLPNHdr(i_lpn=toOLpn, o_facStatus=o_facStatus, o_totalLpnQty=sum(o_qtys))
             for i in range(len(o_items)):
                 finalPackedQty = o_qtys[i] if o_facStatus == LPNFacStat.OLPN_PACKED else None
                 finalInitialQty = o_qtys[i] if o_facStatus == LPNFacStat.OLPN_PRINTED else None
-                DBLib().assertLPNDtls(i_lpn=toOLpn, i_itemBrcd=o_items[i], o_qty=finalPackedQty, o_initialQty=finalInitialQty)
+                DBLib.get().assertLPNDtls(i_lpn=toOLpn, i_itemBrcd=o_items[i], o_qty=finalPackedQty, o_initialQty=finalInitialQty)
 
     def moveAllILPNTran(self, fromILPN:str, item:list[str], qty:list[int], toILPN:str=None,
                         isFromLpnMultiSku:bool=None, o_item:list[str]=None, o_qty:list[int]=None):
@@ -1476,7 +1662,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if toILPN is None:
-            toILPN = DBLib().getNewILPNNum()
+            toILPN = DBLib.get().getNewILPNNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -1496,15 +1682,15 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         '''From ilpn'''
-        DBLib().assertLPNHdr(i_lpn=fromILPN, o_facStatus=LPNFacStat.ILPN_CONSUMED)
+        DBLib.get().assertLPNHdr(i_lpn=fromILPN, o_facStatus=LPNFacStat.ILPN_CONSUMED)
         if not isFromLpnMultiSku:
-            DBLib().assertLPNDtls(i_lpn=fromILPN, i_itemBrcd=item[0], o_qty=0)
+            DBLib.get().assertLPNDtls(i_lpn=fromILPN, i_itemBrcd=item[0], o_qty=0)
         '''To ilpn'''
         final_items = item if o_item is None else o_item
         final_qtys = qty if o_qty is None else o_qty
-        DBLib().assertLPNHdr(i_lpn=toILPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+        DBLib.get().assertLPNHdr(i_lpn=toILPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
         for i in range(len(final_items)):
-            DBLib().assertLPNDtls(i_lpn=toILPN, i_itemBrcd=final_items[i], o_qty=final_qtys[i])
+            DBLib.get().assertLPNDtls(i_lpn=toILPN, i_itemBrcd=final_items[i], o_qty=final_qtys[i])
 
         return toILPN
 
@@ -1531,19 +1717,19 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=oLPN, o_facStatus=o_lpnFacStat)
+        DBLib.get().assertLPNHdr(i_lpn=oLPN, o_facStatus=o_lpnFacStat)
 
     def inductLocOLPN(self, order: str, palletId: str, o_olpns: list, o_prevLocn: str, inductLocn:str=None):
         """"""
         tran_name = RF_TRAN.get('rf', 'inductLocOLPN')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
 
         olpnList = o_olpns if type(o_olpns) == list else [o_olpns]
 
         if inductLocn is None:
-            inductLocn, inductLocnId = DBLib().getInductLocn(zone='OB')
+            inductLocn, inductLocnId = DBLib.get().getInductLocn(zone='OB')
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -1558,9 +1744,9 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertDOHdr(i_order=pc_order, o_status=DOStat.STAGED)
+        DBLib.get().assertDOHdr(i_order=pc_order, o_status=DOStat.STAGED)
         for i in range(len(olpnList)):
-            DBLib().assertLPNHdr(i_lpn=str(olpnList[i]), o_prevLocn=o_prevLocn, o_currLocn=str(inductLocn))
+            DBLib.get().assertLPNHdr(i_lpn=str(olpnList[i]), o_prevLocn=o_prevLocn, o_currLocn=str(inductLocn))
 
         return inductLocn
 
@@ -1609,8 +1795,8 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(iLPN)):
-            DBLib().assertLPNHdr(i_lpn=lpns[i], o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLocn[i])
-            DBLib().assertLPNDtls(i_lpn=iLPN[i], i_itemBrcd=o_items[i], o_qty=o_qty[i])
+            DBLib.get().assertLPNHdr(i_lpn=lpns[i], o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLocn[i])
+            DBLib.get().assertLPNDtls(i_lpn=iLPN[i], i_itemBrcd=o_items[i], o_qty=o_qty[i])
 
     def packOLPNFromFullILPNByCtrl(self, taskId, blindPallet, resvLocn, iLPNInResv, qty):
         """INT2: Pack 1 oLPN w/ 1 sku from full iLPN in reserve to 1 pallet"""
@@ -1691,40 +1877,40 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         # finalDOStatus = 140 if isOLpnsPending is True or pickQtyIfShorting is not None else 150
         if o_doStatus is not None:
-            DBLib().assertDOHdr(i_order=order, o_status=o_doStatus)
+            DBLib.get().assertDOHdr(i_order=order, o_status=o_doStatus)
 
         if isSkipPick is None:
             final_lpnStat = LPNFacStat.OLPN_CANCELLED if isFullShorting else LPNFacStat.OLPN_PACKED
-            DBLib().assertLPNHdr(i_lpn=oLPN, o_facStatus=final_lpnStat)
-            DBLib().assertLPNDtls(i_lpn=oLPN, i_itemBrcd=itemBrcd, o_qty=finalPickQty)
+            DBLib.get().assertLPNHdr(i_lpn=oLPN, o_facStatus=final_lpnStat)
+            DBLib.get().assertLPNDtls(i_lpn=oLPN, i_itemBrcd=itemBrcd, o_qty=finalPickQty)
 
         if isAssertAlloc:
-            DBLib().assertAllocDtls(i_itemBrcd=itemBrcd, i_taskGenRefNbr=i_waveNum, i_intType=50, o_qtyPulled=finalPickQty, o_statCode=o_allocStatus)
+            DBLib.get().assertAllocDtls(i_itemBrcd=itemBrcd, i_taskGenRefNbr=i_waveNum, i_intType=50, o_qtyPulled=finalPickQty, o_statCode=o_allocStatus)
 
         usrCancelQty = int(qty) - int(pickQtyIfShort) if pickQtyIfShort else qty if isFullShorting else None
 
         if o_doDtlStatus is not None:
-            DBLib().assertDODtls(i_order=order, i_itemBrcd=itemBrcd, o_dtlStatus=o_doDtlStatus, o_usrCancldQty=usrCancelQty)
+            DBLib.get().assertDODtls(i_order=order, i_itemBrcd=itemBrcd, o_dtlStatus=o_doDtlStatus, o_usrCancldQty=usrCancelQty)
 
         if isPartialShorting or isFullShorting:
-            DBLib().assertPickShortItemDtls(i_item=itemBrcd, i_order=order, i_lpn=oLPN, o_qty=usrCancelQty, o_statCode=0)
+            DBLib.get().assertPickShortItemDtls(i_item=itemBrcd, i_order=order, i_lpn=oLPN, o_qty=usrCancelQty, o_statCode=0)
 
         if isAssertCycleCnt:
-            locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=fromActLocn)
-            DBLib().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=101, o_status=TaskHdrStat.RELEASED)
+            locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=fromActLocn)
+            DBLib.get().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=101, o_status=TaskHdrStat.RELEASED)
         elif isAssertNoCycleCnt:
-            locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=fromActLocn)
-            DBLib().assertNoTaskExist(i_cntrNbr=locnId, i_itemBrcd=itemBrcd, i_intType=101)
+            locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=fromActLocn)
+            DBLib.get().assertNoTaskExist(i_cntrNbr=locnId, i_itemBrcd=itemBrcd, i_intType=101)
 
         if isAssertReplenTask:
-            DBLib().assertTaskHdr(i_taskGenRefNbr=i_waveNum, o_intType=1, o_currTaskPrty=o_replenTaskPrty)
+            DBLib.get().assertTaskHdr(i_taskGenRefNbr=i_waveNum, o_intType=1, o_currTaskPrty=o_replenTaskPrty)
 
         if isAssertNewReplenTask:
-            DBLib().assertTaskHdr(i_taskGenRefNbr=i_waveNum, i_ignoreTaskId=existngTaskId, o_intType=1, o_currTaskPrty=10)
+            DBLib.get().assertTaskHdr(i_taskGenRefNbr=i_waveNum, i_ignoreTaskId=existngTaskId, o_intType=1, o_currTaskPrty=10)
 
         if isSkipPickCreatesReplenTask:
-            taskId = DBLib().getTaskIdByItemName(itemName=itemBrcd, intType=1)
-            DBLib().assertTaskHdr(i_task=taskId, i_currTaskPrty=o_replenTaskPrty, o_intType=1, o_status=TaskHdrStat.RELEASED)
+            taskId = DBLib.get().getTaskIdByItemName(itemName=itemBrcd, intType=1)
+            DBLib.get().assertTaskHdr(i_task=taskId, i_currTaskPrty=o_replenTaskPrty, o_intType=1, o_status=TaskHdrStat.RELEASED)
 
     def packOLPNFromResvByActvTran(self, oLPN:str, fromResvLocn:str, itemBrcd:str, qty:int, order:str, i_waveNum:str=None, iLPN:str=None,
                                    o_doStatus: DOStat = None, o_doDtlStatus: int = None,
@@ -1735,7 +1921,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'packOLPNActive')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        allocatedILpn = DBLib().getAllocatedLpnFromAllocInvDtl(waveNum=i_waveNum, item=str(itemBrcd))
+        allocatedILpn = DBLib.get().getAllocatedLpnFromAllocInvDtl(waveNum=i_waveNum, item=str(itemBrcd))
         finalLpn = allocatedILpn if iLPN is None else iLPN
         finalPickQty = pickQtyIfShort if isShorting else qty
 
@@ -1772,26 +1958,26 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         if o_doStatus is not None:
-            DBLib().assertDOHdr(i_order=order, o_status=o_doStatus)
-        DBLib().assertLPNHdr(i_lpn=oLPN, o_facStatus=LPNFacStat.OLPN_PACKED)
+            DBLib.get().assertDOHdr(i_order=order, o_status=o_doStatus)
+        DBLib.get().assertLPNHdr(i_lpn=oLPN, o_facStatus=LPNFacStat.OLPN_PACKED)
         if isAssertAlloc:
-            DBLib().assertAllocDtls(i_itemBrcd=itemBrcd, i_taskGenRefNbr=i_waveNum, i_intType=2,
-                                    o_statCode=o_allocStatus)
+            DBLib.get().assertAllocDtls(i_itemBrcd=itemBrcd, i_taskGenRefNbr=i_waveNum, i_intType=2,
+                                        o_statCode=o_allocStatus)
         if isShorting:
             usrCancldQty = qty - pickQtyIfShort
-            DBLib().assertDODtls(i_order=order, i_itemBrcd=itemBrcd, o_dtlStatus=o_doDtlStatus, o_usrCancldQty=usrCancldQty)
-            DBLib().assertPickShortItemDtls(i_item=itemBrcd, i_order=order, i_lpn=oLPN, o_qty=usrCancldQty, o_statCode=0)
+            DBLib.get().assertDODtls(i_order=order, i_itemBrcd=itemBrcd, o_dtlStatus=o_doDtlStatus, o_usrCancldQty=usrCancldQty)
+            DBLib.get().assertPickShortItemDtls(i_item=itemBrcd, i_order=order, i_lpn=oLPN, o_qty=usrCancldQty, o_statCode=0)
 
         if isAssertCycleCnt:
-            locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=fromResvLocn)
-            DBLib().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=100, o_status=TaskHdrStat.RELEASED)
+            locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=fromResvLocn)
+            DBLib.get().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=100, o_status=TaskHdrStat.RELEASED)
 
         if isAssertSubLpnInOLpn:
-            DBLib().assertLPNHdr(i_lpn=allocatedILpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY)
-            DBLib().assertLPNHdr(i_lpn=iLpnToBeSubstituted, o_facStatus=LPNFacStat.ILPN_CONSUMED)
-            taskId = DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=i_waveNum)
-            DBLib().assertTaskDtls(i_task=taskId, i_cntrNbr=allocatedILpn, i_intType=2, i_pullLocn=fromResvLocn, o_statCode=TaskDtlStat.DELETED)
-            DBLib().assertTaskDtls(i_task=taskId, i_cntrNbr=finalLpn, i_intType=2, i_pullLocn=fromResvLocn, o_statCode=TaskDtlStat.TASK_COMPLETE)
+            DBLib.get().assertLPNHdr(i_lpn=allocatedILpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY)
+            DBLib.get().assertLPNHdr(i_lpn=iLpnToBeSubstituted, o_facStatus=LPNFacStat.ILPN_CONSUMED)
+            taskId = DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=i_waveNum)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_cntrNbr=allocatedILpn, i_intType=2, i_pullLocn=fromResvLocn, o_statCode=TaskDtlStat.DELETED)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_cntrNbr=finalLpn, i_intType=2, i_pullLocn=fromResvLocn, o_statCode=TaskDtlStat.TASK_COMPLETE)
 
     def makePickCartTran(self, i_waveNum: str, oLPNs: list[str], o_taskStatus: TaskHdrStat = None, blindCartId: str = None):
         """"""
@@ -1801,7 +1987,7 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         olpnList = oLPNs if type(oLPNs) == list else [oLPNs]
         if blindCartId is None:
-            blindCartId = DBLib().getNewCartNum()
+            blindCartId = DBLib.get().getNewCartNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -1822,7 +2008,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_taskCmplRefNbr=blindCartId, o_status=o_taskStatus)
+        DBLib.get().assertTaskHdr(i_taskCmplRefNbr=blindCartId, o_status=o_taskStatus)
         return blindCartId
 
     def packPickCartTran(self, order: str, waveNum: str, cartId, slots: list[str], olpns: list[str]):
@@ -1831,7 +2017,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         '''Get slot and olpns as it might be in different seq'''
-        slots, olpns = DBLib().getSlotAndOlpnByPickSeqFromCartNum(cartId=cartId)
+        slots, olpns = DBLib.get().getSlotAndOlpnByPickSeqFromCartNum(cartId=cartId)
 
         slotList = slots if type(slots) == list else [slots]
         olpnList = olpns if type(olpns) == list else [olpns]
@@ -1863,10 +2049,10 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertDOHdr(i_order=order, o_status=DOStat.PACKED)
-        DBLib().assertTaskHdr(i_taskCmplRefNbr=cartId, o_status=TaskHdrStat.COMPLETE)
+        DBLib.get().assertDOHdr(i_order=order, o_status=DOStat.PACKED)
+        DBLib.get().assertTaskHdr(i_taskCmplRefNbr=cartId, o_status=TaskHdrStat.COMPLETE)
         for i in range(len(olpnList)):
-            DBLib().assertLPNHdr(i_lpn=olpnList[i], o_facStatus=LPNFacStat.OLPN_PACKED)
+            DBLib.get().assertLPNHdr(i_lpn=olpnList[i], o_facStatus=LPNFacStat.OLPN_PACKED)
 
     def anchorPalletizeOLPNTran(self, olpns: list, order: str, isLastOlpnIncluded: bool, blindPallet: str = None,
                                 isReAnchorSameOLpn:bool=None, isUpdateStgInd: bool = None, o_doStatus: DOStat = None):
@@ -1875,19 +2061,19 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'anchorPltzOLPN')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        isParentDOExist = DBLib()._isParentDOExist(order=order)
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
+        isParentDOExist = DBLib.get()._isParentDOExist(order=order)
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
 
         consLocn = stagingLocn = None
         if isReAnchorSameOLpn:
-            dbRows = DBLib().getStagingLocn(noOfLocn=1)
+            dbRows = DBLib.get().getStagingLocn(noOfLocn=1)
             stagingLocn = dbRows[0].get('LOCN_BRCD')
 
         if blindPallet is None:
-            blindPallet = DBLib().getNewOutPalletNum()
+            blindPallet = DBLib.get().getNewOutPalletNum()
         if not isReAnchorSameOLpn:
-            consLocn, consLocnId = DBLib().get1ConsolLocnFromOLPNs(oLPNs=olpns)
-        DBLib()._updateOLPNCntrTypeFromSCTForDO(order=pc_order, isUpdateStgInd=isUpdateStgInd)
+            consLocn, consLocnId = DBLib.get().get1ConsolLocnFromOLPNs(oLPNs=olpns)
+        DBLib.get()._updateOLPNCntrTypeFromSCTForDO(order=pc_order, isUpdateStgInd=isUpdateStgInd)
 
         olpnList = olpns if type(olpns) == list else [olpns]
         # orderList = orders if type(orders) == list else [orders]
@@ -1917,8 +2103,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         currLocn = stagingLocn if isReAnchorSameOLpn else consLocn
         for i in range(len(olpnList)):
             # finalDOStat = 165 if isLastOlpnAvail and i == (len(olpnList) - 1) else 150
-            DBLib().assertLPNHdr(i_lpn=str(olpnList[i]), o_currLocn=str(currLocn), o_parentLpn=blindPallet)
-        DBLib().assertDOHdr(i_order=str(pc_order), o_status=o_doStatus)
+            DBLib.get().assertLPNHdr(i_lpn=str(olpnList[i]), o_currLocn=str(currLocn), o_parentLpn=blindPallet)
+        DBLib.get().assertDOHdr(i_order=str(pc_order), o_status=o_doStatus)
 
         return blindPallet, currLocn
 
@@ -1928,15 +2114,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         """
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
 
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
 
         unNumber = None
         if hazmatItem is not None:
-            unNumber = DBLib().getUNNbrFromItem(itemBrcd=hazmatItem)
+            unNumber = DBLib.get().getUNNbrFromItem(itemBrcd=hazmatItem)
 
         rfUser = ENV_CONFIG.get('rf', 'rf_user')
         isContainerFlag = 'Y' if isContainer else 'N'
-        actWeight = DBLib().getTotalEstWeightForPallet(palletId=palletdID)
+        actWeight = DBLib.get().getTotalEstWeightForPallet(palletId=palletdID)
 
         self.assertScreenTextExist('Enter User ID:')
         self.sendData(rfUser, isEnter=True)
@@ -1952,10 +2138,10 @@ class RFPage(RF_SERVICE_PROVIDER):
             self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertDOHdr(i_order=pc_order, o_status=o_doStatus)  # DOStat.STAGED
+        DBLib.get().assertDOHdr(i_order=pc_order, o_status=o_doStatus)  # DOStat.STAGED
         for i in range(len(olpns)):
-            DBLib().assertLPNHdr(i_lpn=olpns[i], o_facStatus=LPNFacStat.OLPN_WEIGHED, isActWeightPresent=True)
-            DBLib().assertNoInvLockForLpn(i_lpn=olpns[i], i_lockCode='WC')
+            DBLib.get().assertLPNHdr(i_lpn=olpns[i], o_facStatus=LPNFacStat.OLPN_WEIGHED, isActWeightPresent=True)
+            DBLib.get().assertNoInvLockForLpn(i_lpn=olpns[i], i_lockCode='WC')
 
     def loadOLPNTran(self, order: str, olpns: list, isFirstOLPNIncluded: bool = None, dockDoor: str = None,
                      isLoadPallet: bool = None, o_prevLocn: str = None, o_parentLpn: str = None,
@@ -1965,13 +2151,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'loadOLPN')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
 
         olpnList = olpns if type(olpns) == list else [olpns]
         loadPalletFlag = 'y' if isLoadPallet else 'n'
-        trailerNum = DBLib().getNewTrailerNum()
+        trailerNum = DBLib.get().getNewTrailerNum()
         if dockDoor is None:
-            dockDoor, systemDockDoor = DBLib().getOpenDockDoor(workGrp='RECV', workArea='REC1')
+            dockDoor, systemDockDoor = DBLib.get().getOpenDockDoor(workGrp='RECV', workArea='REC1')
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -2011,10 +2197,10 @@ class RFPage(RF_SERVICE_PROVIDER):
         final_parentLpn = None if isPartialLoad else o_parentLpn
 
         for i in range(len(olpnList)):
-            DBLib().assertLPNHdr(i_lpn=olpns[i], o_facStatus=final_lpnFacStatus, o_parentLpn=final_parentLpn, o_prevLocn=o_prevLocn)
+            DBLib.get().assertLPNHdr(i_lpn=olpns[i], o_facStatus=final_lpnFacStatus, o_parentLpn=final_parentLpn, o_prevLocn=o_prevLocn)
             # finalDOStat = 180 if isLastOLpnAvail and i == (len(olpnList) - 1) else 165
         if o_doStatus is not None:
-            DBLib().assertDOHdr(i_order=pc_order, o_status=o_doStatus)
+            DBLib.get().assertDOHdr(i_order=pc_order, o_status=o_doStatus)
 
         return dockDoor
 
@@ -2051,15 +2237,15 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            rLoc = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            rLoc = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
         self.sendData(rLoc, isEnter=True)
         self.assertScreenTextExist('LPN:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
         self.logger.info('Executed RF ' + inspect.currentframe().f_code.co_name + ': Ctrl E')
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=pallet, o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_currLocn=rLoc)
-        DBLib().assertWMInvnDtls(i_itemBrcd=o_item[0], i_locn=rLoc, i_lpn=pallet, o_onHandQty=o_qty[0], o_allocatedQty=o_qty[0])
+        DBLib.get().assertLPNHdr(i_lpn=pallet, o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_currLocn=rLoc)
+        DBLib.get().assertWMInvnDtls(i_itemBrcd=o_item[0], i_locn=rLoc, i_lpn=pallet, o_onHandQty=o_qty[0], o_allocatedQty=o_qty[0])
 
     def sysDirPutawayToResvLPNByCtrl(self, pallet: str, o_item: list[str], o_qty: list[int],
                                      o_currPullLocn: str, o_intType: int = None, rLoc: str = None, taskGrp: str = None):
@@ -2088,7 +2274,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             else:
                 rLoc = self.readDataForTextInLine('Rloc:').strip()
             for j in range(len(o_item)):
-                onHandQty.append(DBLib().getWMOnHandQty(itemBrcd=o_item[j], locnBrcd=rLoc))
+                onHandQty.append(DBLib.get().getWMOnHandQty(itemBrcd=o_item[j], locnBrcd=rLoc))
             self.sendData(rLoc, isEnter=True)
         self.assertScreenTextExist('LPN:')
         self.sendData(self.KEY_CTRL_X_ExitTran)
@@ -2096,16 +2282,16 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(palletList)):
-            DBLib().assertLPNHdr(i_lpn=palletList[i], o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=rLoc)
-            DBLib().assertAllocDtls(i_cntr=palletList[i], i_taskCmplRefNbr=palletList[i], i_itemBrcd=o_item[i], i_intType=o_intType,
-                                    o_destLocn=rLoc)
-            DBLib().assertTaskHdr(i_taskCmplRefNbr=palletList[i], o_intType=o_intType, o_status=TaskHdrStat.COMPLETE)
-            DBLib().assertTaskDtls(i_cntrNbr=palletList[i], i_itemBrcd=o_item[i], i_intType=o_intType, o_pullLocn=o_currPullLocn)
-            DBLib().assertWMInvnDtls(i_itemBrcd=o_item[i], i_locn=rLoc, i_lpn=palletList[i], o_onHandQty=o_qty[i])
+            DBLib.get().assertLPNHdr(i_lpn=palletList[i], o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=rLoc)
+            DBLib.get().assertAllocDtls(i_cntr=palletList[i], i_taskCmplRefNbr=palletList[i], i_itemBrcd=o_item[i], i_intType=o_intType,
+                                        o_destLocn=rLoc)
+            DBLib.get().assertTaskHdr(i_taskCmplRefNbr=palletList[i], o_intType=o_intType, o_status=TaskHdrStat.COMPLETE)
+            DBLib.get().assertTaskDtls(i_cntrNbr=palletList[i], i_itemBrcd=o_item[i], i_intType=o_intType, o_pullLocn=o_currPullLocn)
+            DBLib.get().assertWMInvnDtls(i_itemBrcd=o_item[i], i_locn=rLoc, i_lpn=palletList[i], o_onHandQty=o_qty[i])
             # LM validation (labor_msg_id )
-            # DBLib().assertLaborMsgHdr(i_refNbr=palletList[i], i_actName='PTWY RSV CA')
-            # DBLib().assertLaborMsgDtl(i_refNbr=palletList[i], i_actName='PTWY RSV CA', i_lpn=palletList[i],
-            #                           i_itemBrcd=o_item[i])
+            # DBLib.get().assertLaborMsgHdr(i_refNbr=palletList[i], i_actName='PTWY RSV CA')
+            # DBLib.get().assertLaborMsgDtl(i_refNbr=palletList[i], i_actName='PTWY RSV CA', i_lpn=palletList[i],
+            #                               i_itemBrcd=o_item[i])
 
     def sysDirPutawayToActvLPNByCtrl(self, pallet: str, o_item: list[str], o_qty: list[int],
                                      o_currPullLocn: str, o_intType: int = None, aLoc: str = None, taskGrp: str = None):
@@ -2115,7 +2301,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, 'Ctrl E')
 
         palletList = pallet if type(pallet) == list else [pallet]
-        onHandQty = DBLib().getWMOnHandQty(itemBrcd=o_item[0], locnBrcd=aLoc)
+        onHandQty = DBLib.get().getWMOnHandQty(itemBrcd=o_item[0], locnBrcd=aLoc)
 
         taskGrp = self._decideFinalTaskGrp(providedTaskGrp=taskGrp)
 
@@ -2136,19 +2322,19 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(palletList)):
-            DBLib().assertLPNHdr(i_lpn=palletList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLoc)
-            DBLib().assertAllocDtls(i_cntr=palletList[i], i_taskGenRefNbr=palletList[i], i_itemBrcd=o_item[i],
-                                    i_intType=o_intType, o_destLocn=aLoc)
-            taskId = DBLib().getTaskIdByORCond(taskGenRefNbr=palletList[i], taskCmplRefNbr=palletList[i], cntr=palletList[i],
-                                               intType=o_intType)
-            DBLib().assertTaskDtls(i_task=taskId, i_intType=o_intType, o_pullLocn=o_currPullLocn)
-            DBLib().assertTaskHdr(i_task=taskId, o_intType=o_intType, o_status=TaskHdrStat.COMPLETE)
-
-            DBLib().assertWMInvnDtls(i_itemBrcd=o_item[i], i_locn=aLoc, o_onHandQty=int(onHandQty) + o_qty[0])
+            DBLib.get().assertLPNHdr(i_lpn=palletList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLoc)
+            DBLib.get().assertAllocDtls(i_cntr=palletList[i], i_taskGenRefNbr=palletList[i], i_itemBrcd=o_item[i],
+                                        i_intType=o_intType, o_destLocn=aLoc)
+            taskId = DBLib.get().getTaskIdByORCond(taskGenRefNbr=palletList[i], taskCmplRefNbr=palletList[i], cntr=palletList[i],
+                                                   intType=o_intType)
+            DBLib.get().assertTaskDtls(i_task=taskId, i_intType=o_intType, o_pullLocn=o_currPullLocn)
+            DBLib.get().assertTaskHdr(i_task=taskId, o_intType=o_intType, o_status=TaskHdrStat.COMPLETE)
+
+            DBLib.get().assertWMInvnDtls(i_itemBrcd=o_item[i], i_locn=aLoc, o_onHandQty=int(onHandQty) + o_qty[0])
             # LM validation (labor_msg_id )
-            # DBLib().assertLaborMsgHdr(i_refNbr=palletList[i], i_actName='PTWY RSV CA')
-            # DBLib().assertLaborMsgDtl(i_refNbr=palletList[i], i_actName='PTWY RSV CA', i_lpn=palletList[i],
-            #                           i_itemBrcd=o_item[i])
+            # DBLib.get().assertLaborMsgHdr(i_refNbr=palletList[i], i_actName='PTWY RSV CA')
+            # DBLib.get().assertLaborMsgDtl(i_refNbr=palletList[i], i_actName='PTWY RSV CA', i_lpn=palletList[i],
+            #                               i_itemBrcd=o_item[i])
 
     def sysDirPutawayToActvLPNsInPalletByCtrl(self, palletID, iLPN, actvloc):
         """"""
@@ -2199,9 +2385,9 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(items)):
-            DBLib().assertLPNHdr(i_lpn=lpns[i], o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_currLocn=dropLocn)
-            DBLib().assertLPNDtls(i_lpn=lpns[i], i_itemBrcd=items[i], o_qty=qtys[i], o_receivedQty=qtys[i])
-            DBLib().assertWMInvnDtls(i_itemBrcd=items[i], i_locn=dropLocn, i_lpn=lpns[i])
+            DBLib.get().assertLPNHdr(i_lpn=lpns[i], o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_currLocn=dropLocn)
+            DBLib.get().assertLPNDtls(i_lpn=lpns[i], i_itemBrcd=items[i], o_qty=qtys[i], o_receivedQty=qtys[i])
+            DBLib.get().assertWMInvnDtls(i_itemBrcd=items[i], i_locn=dropLocn, i_lpn=lpns[i])
 
     def userDirPutawayToResvTran(self, ilpn: str, o_items: list[str] = None, resvLocn: str = None, resvWG: str = 'RESV',
                                  taskPath: TaskPath = None, isResvWAFromTPathCurrWA: bool = None,
@@ -2213,8 +2399,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if resvLocn is None:
-            resvLocnRow = DBLib().getEmptyManualResvLocn(noOfLocn=1, resvWG=resvWG, taskPath=taskPath,
-                                                         isResvWAInTPDCurrWA=isResvWAFromTPathCurrWA)
+            resvLocnRow = DBLib.get().getEmptyManualResvLocn(noOfLocn=1, resvWG=resvWG, taskPath=taskPath,
+                                                             isResvWAInTPDCurrWA=isResvWAFromTPathCurrWA)
             resvLocn = resvLocnRow[0].get('LOCN_BRCD')
 
         self.goToHomeScreen()
@@ -2241,19 +2427,19 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         final_currLocn = None if isLocnWithTBF else resvLocn
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_facStat, o_currLocn=final_currLocn)
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_facStat, o_currLocn=final_currLocn)
 
         if not isLocnWithTBF:
             for i in range(len(o_items)):
-                DBLib().assertWMInvnDtls(i_locn=resvLocn, i_itemBrcd=o_items[i], i_lpn=ilpn)
+                DBLib.get().assertWMInvnDtls(i_locn=resvLocn, i_itemBrcd=o_items[i], i_lpn=ilpn)
                 if isPixCreated:
                     for j in range(len(o_pixTranType)):
-                        DBLib().assertPix(i_caseNbr=ilpn, i_tranType=o_pixTranType[j], i_itemBrcd=o_items[i])
+                        DBLib.get().assertPix(i_caseNbr=ilpn, i_tranType=o_pixTranType[j], i_itemBrcd=o_items[i])
 
             if o_lpnLock is not None:
-                DBLib().assertLpnLockPresent(i_lpn=ilpn, i_lockCode=o_lpnLock)
+                DBLib.get().assertLpnLockPresent(i_lpn=ilpn, i_lockCode=o_lpnLock)
                 for i in range(len(o_items)):
-                    DBLib().assertPix(i_caseNbr=ilpn, i_tranType='606', i_itemBrcd=o_items[i])
+                    DBLib.get().assertPix(i_caseNbr=ilpn, i_tranType='606', i_itemBrcd=o_items[i])
 
         return resvLocn
 
@@ -2276,7 +2462,7 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         onHandQty = None
         if not isWrongActv:
-            onHandQty = DBLib().getWMOnHandQty(itemBrcd=item, locnBrcd=aLoc)
+            onHandQty = DBLib.get().getWMOnHandQty(itemBrcd=item, locnBrcd=aLoc)
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name, 'Inbo')
@@ -2303,15 +2489,15 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         if isWrongActv:
-            DBLib().assertLPNHdr(i_lpn=lpn, o_facStatus=o_lpnFacStat)
-            DBLib().assertAllocDtls(i_cntr=lpn, i_itemBrcd=item, o_statCode=AllocStat.CANCELLED)
+            DBLib.get().assertLPNHdr(i_lpn=lpn, o_facStatus=o_lpnFacStat)
+            DBLib.get().assertAllocDtls(i_cntr=lpn, i_itemBrcd=item, o_statCode=AllocStat.CANCELLED)
         else:
-            DBLib().assertLPNHdr(i_lpn=lpn, o_facStatus=o_lpnFacStat, o_currLocn=aLoc)
-            DBLib().assertWMInvnDtls(i_itemBrcd=item, i_locn=aLoc, o_onHandQty=int(onHandQty) + qty)
+            DBLib.get().assertLPNHdr(i_lpn=lpn, o_facStatus=o_lpnFacStat, o_currLocn=aLoc)
+            DBLib.get().assertWMInvnDtls(i_itemBrcd=item, i_locn=aLoc, o_onHandQty=int(onHandQty) + qty)
 
             '''LM validation'''
-            DBLib().assertLaborMsgHdr(i_refNbr=lpn, i_actName='FILL ACTIVE CA')
-            DBLib().assertLaborMsgDtl(i_refNbr=lpn, i_actName='FILL ACTIVE CA', i_lpn=lpn, i_itemBrcd=item)
+            DBLib.get().assertLaborMsgHdr(i_refNbr=lpn, i_actName='FILL ACTIVE CA')
+            DBLib.get().assertLaborMsgDtl(i_refNbr=lpn, i_actName='FILL ACTIVE CA', i_lpn=lpn, i_itemBrcd=item)
 
     def fillActiveTranWithMultiLpn(self, palletLPN: str, lpns: list[str], o_itemList: list[list[str]], o_qtyList: list[list[int]],
                                    aLocList: list[list[str]]):
@@ -2332,7 +2518,7 @@ class RFPage(RF_SERVICE_PROVIDER):
 
             temp_onHandQty = []
             for j in range(len(aLocList[i])):
-                temp_onHandQty.append(DBLib().getWMOnHandQty(itemBrcd=o_itemList[i][j], locnBrcd=aLocList[i][j]))
+                temp_onHandQty.append(DBLib.get().getWMOnHandQty(itemBrcd=o_itemList[i][j], locnBrcd=aLocList[i][j]))
 
                 screentxt = self.readScreen()
                 if screentxt.count('Pallet is open') and screentxt.count('continue?'):
@@ -2351,14 +2537,14 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         for i in range(len(lpns)):
             for j in range(len(o_itemList[i])):
-                DBLib().assertLPNHdr(i_lpn=lpns[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLocList[i][j])
-                DBLib().assertWMInvnDtls(i_itemBrcd=o_itemList[i][j], i_locn=aLocList[i][j], o_onHandQty=onHandQty[i][j] + o_qtyList[i][j])
+                DBLib.get().assertLPNHdr(i_lpn=lpns[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLocList[i][j])
+                DBLib.get().assertWMInvnDtls(i_itemBrcd=o_itemList[i][j], i_locn=aLocList[i][j], o_onHandQty=onHandQty[i][j] + o_qtyList[i][j])
 
         '''LM validation'''
-        DBLib().assertLaborMsgHdr(i_refNbr=palletLPN, i_actName='FILL ACTIVE CA')
+        DBLib.get().assertLaborMsgHdr(i_refNbr=palletLPN, i_actName='FILL ACTIVE CA')
         for i in range(len(lpns)):
             for j in range(len(o_itemList[i])):
-                DBLib().assertLaborMsgDtl(i_refNbr=palletLPN, i_actName='FILL ACTIVE CA', i_lpn=lpns[i], i_itemBrcd=o_itemList[i][j])
+                DBLib.get().assertLaborMsgDtl(i_refNbr=palletLPN, i_actName='FILL ACTIVE CA', i_lpn=lpns[i], i_itemBrcd=o_itemList[i][j])
 
     def userDirFillActiveTran(self, lpn: str, aLoc: str, item: str, qty: int):
         """Usr dir fill active 1 lpn with 1 sku to 1 actv locn
@@ -2382,12 +2568,12 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=lpn, o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLoc)
-        DBLib().assertWMInvnDtls(i_itemBrcd=item, i_locn=aLoc, o_onHandQty=qty)
+        DBLib.get().assertLPNHdr(i_lpn=lpn, o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLoc)
+        DBLib.get().assertWMInvnDtls(i_itemBrcd=item, i_locn=aLoc, o_onHandQty=qty)
 
         '''LM validation'''
-        DBLib().assertLaborMsgHdr(i_refNbr=lpn, i_actName='FILL ACTIVE CA')
-        DBLib().assertLaborMsgDtl(i_refNbr=lpn, i_actName='FILL ACTIVE CA', i_lpn=lpn, i_itemBrcd=item)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=lpn, i_actName='FILL ACTIVE CA')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=lpn, i_actName='FILL ACTIVE CA', i_lpn=lpn, i_itemBrcd=item)
 
     def sysDirPutawayByFillActvCartTran(self, lpn: list[str], aLoc: list[str]):
         """Sys dir putaway: multiple lpns to same/diff actv locns
@@ -2425,11 +2611,11 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(lpnList)):
-            DBLib().assertLPNHdr(i_lpn=lpnList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLocList[i])
+            DBLib.get().assertLPNHdr(i_lpn=lpnList[i], o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=aLocList[i])
 
             '''LM validate LM'''
-            DBLib().assertLaborMsgDtl(i_refNbr=lpnList[0], i_actName='FILLACT CART CA', i_lpn=lpnList[i])
-        DBLib().assertLaborMsgHdr(i_refNbr=lpnList[0], i_actName='FILLACT CART CA')
+            DBLib.get().assertLaborMsgDtl(i_refNbr=lpnList[0], i_actName='FILLACT CART CA', i_lpn=lpnList[i])
+        DBLib.get().assertLaborMsgHdr(i_refNbr=lpnList[0], i_actName='FILLACT CART CA')
 
     def sysDirFillActiveCart(self, pallet):
         tran_name = RF_TRAN.get('rf', 'fillActiveCart')
@@ -2481,13 +2667,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV)
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV)
         # TODO below
         # for i in range(0, len(itemList)):
-        #     DBLib().assertWMInvnDtls(i_itemBrcd=itemList[i], i_locn=actLocnListForItem[i], o_onHandQty=int(onHandQty) + qty)
+        #     DBLib.get().assertWMInvnDtls(i_itemBrcd=itemList[i], i_locn=actLocnListForItem[i], o_onHandQty=int(onHandQty) + qty)
         # LM validation (labor_msg_id 63747405)
-        DBLib().assertLaborMsgHdr(i_refNbr=iLPN, i_actName='FILL ACT MIX CA')
-        DBLib().assertLaborMsgDtl(i_refNbr=iLPN, i_actName='FILL ACT MIX CA', i_lpn=iLPN)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=iLPN, i_actName='FILL ACT MIX CA')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=iLPN, i_actName='FILL ACT MIX CA', i_lpn=iLPN)
 
     def loadTrailer(self, oLPN, loadPalletY, trailerNum, dockDoor):
         tran_name = RF_TRAN.get('rf', 'loadTrailer')
@@ -2513,8 +2699,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if shipment is None:
-            pc_orders = DBLib()._getParentDOsIfExistElseChildDOs(orders=orders)
-            shipment = DBLib().get1ShipmentNumFromDOs(orders=pc_orders)
+            pc_orders = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=orders)
+            shipment = DBLib.get().get1ShipmentNumFromDOs(orders=pc_orders)
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -2538,15 +2724,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         for i in range(len(orders)):
             order = orders[i]
-            pc_order = DBLib()._getParentDOsIfExistElseChildDOs([order])[0]
+            pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs([order])[0]
 
-            DBLib().assertDOHdr(i_order=pc_order, o_status=DOStat.SHIPPED)
-            DBLib().assertShipConfirmXmlMsgExist(order=order)
+            DBLib.get().assertDOHdr(i_order=pc_order, o_status=DOStat.SHIPPED)
+            DBLib.get().assertShipConfirmXmlMsgExist(order=order)
             for j in range(len(olpns[i])):
-                DBLib().assertLPNHdr(i_lpn=olpns[i][j], o_facStatus=LPNFacStat.OLPN_SHIPPED, isBOLGenerated=isBOLGenerated)
+                DBLib.get().assertLPNHdr(i_lpn=olpns[i][j], o_facStatus=LPNFacStat.OLPN_SHIPPED, isBOLGenerated=isBOLGenerated)
 
         if shipment is not None:
-            DBLib().assertShipmentStatus(i_shipment=shipment, o_status=80, o_noOfStops=numOfStops)
+            DBLib.get().assertShipmentStatus(i_shipment=shipment, o_status=80, o_noOfStops=numOfStops)
 
     def consumeILPN(self, iLpn: str, reasonCode: str, items: list[str], isAssertNoLockForILPN:bool=None, o_lockCode:str=None):
         """Consume 1 ilpn"""
@@ -2568,13 +2754,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLpn, o_facStatus=LPNFacStat.ILPN_CONSUMED)
+        DBLib.get().assertLPNHdr(i_lpn=iLpn, o_facStatus=LPNFacStat.ILPN_CONSUMED)
         for i in range(len(items)):
-            # DBLib().assertWMInvnDtls(i_itemBrcd=str(items[i]), i_lpn=iLpn)
-            # DBLib().assertLPNDtls(i_lpn=iLpn, i_itemBrcd=str(items[i]))
-            DBLib().assertPix(i_itemBrcd=str(items[i]), i_caseNbr=iLpn, i_tranType='300')
+            # DBLib.get().assertWMInvnDtls(i_itemBrcd=str(items[i]), i_lpn=iLpn)
+            # DBLib.get().assertLPNDtls(i_lpn=iLpn, i_itemBrcd=str(items[i]))
+            DBLib.get().assertPix(i_itemBrcd=str(items[i]), i_caseNbr=iLpn, i_tranType='300')
         if isAssertNoLockForILPN:
-            DBLib().assertNoInvLockForLpn(i_lpn=iLpn, i_lockCode=o_lockCode)
+            DBLib.get().assertNoInvLockForLpn(i_lpn=iLpn, i_lockCode=o_lockCode)
 
     def consumeILPN08Tran(self, iLpn: str, items: list[str], reasonCode: str = '08'):
         """Consume 1 ilpn using tran 08
@@ -2596,10 +2782,10 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLpn, o_facStatus=LPNFacStat.ILPN_CONSUMED)
-        DBLib().assertNoWMInvRecForLpn(i_lpn=iLpn)
+        DBLib.get().assertLPNHdr(i_lpn=iLpn, o_facStatus=LPNFacStat.ILPN_CONSUMED)
+        DBLib.get().assertNoWMInvRecForLpn(i_lpn=iLpn)
         for i in range(len(items)):
-            DBLib().assertPix(i_itemBrcd=str(items[i]), i_caseNbr=iLpn, i_tranType='300', i_tranCode='01', i_invnAdjType='S')
+            DBLib.get().assertPix(i_itemBrcd=str(items[i]), i_caseNbr=iLpn, i_tranType='300', i_tranCode='01', i_invnAdjType='S')
 
     def ilpnInquiryTran(self, iLpn: str, items: list[str], qty: list[int], locn: str, facStatDesc: str):
         """Ilpn inquiry
@@ -2746,7 +2932,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         assert len(itemList) == len(qtys), "no.of items and qtys didnt match"
 
         if taskGrp is None:
-            taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+            taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
 
         self.goToHomeScreen()
         self._changeTaskGroupByCtrl(taskGroup=taskGrp)
@@ -2771,12 +2957,12 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.logger.info('Executed RF ' + inspect.currentframe().f_code.co_name + ': Ctrl E')
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
         for i in range(len(itemList)):
-            DBLib().assertWMInvnDtls(i_itemBrcd=itemList[i], i_locn=actvLocn, o_onHandQty=qtys[i])
-            DBLib().assertNoPixPresent(i_itemBrcd=itemList[i])
-            DBLib().assertLaborMsgHdr(i_taskNbr=taskId, i_actName='CYC CNT ACT')
-            DBLib().assertLaborMsgDtl(i_taskNbr=taskId, i_actName='CYC CNT ACT', i_itemBrcd=itemList[i], o_qty=qtys[i])
+            DBLib.get().assertWMInvnDtls(i_itemBrcd=itemList[i], i_locn=actvLocn, o_onHandQty=qtys[i])
+            DBLib.get().assertNoPixPresent(i_itemBrcd=itemList[i])
+            DBLib.get().assertLaborMsgHdr(i_taskNbr=taskId, i_actName='CYC CNT ACT')
+            DBLib.get().assertLaborMsgDtl(i_taskNbr=taskId, i_actName='CYC CNT ACT', i_itemBrcd=itemList[i], o_qty=qtys[i])
 
     def cycleCountActiveTran(self, actvLocn, isCCPending: bool, items: list[str], qtys: list[int],
                              newQtys: list[list[int]], o_statCode: int, o_taskId: str, isEndLocnWithNoUnit: bool = None):
@@ -2830,14 +3016,14 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=str(o_taskId), o_status=TaskHdrStat.CANCELLED)
-        locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=str(actvLocn))
-        DBLib().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=101, o_status=TaskHdrStat.CANCELLED)
-        # DBLib().assertCycleCountStatus(i_locnBrcd=str(actvLocn), o_statCode=int(o_statCode), i_intType=101)
+        DBLib.get().assertTaskHdr(i_task=str(o_taskId), o_status=TaskHdrStat.CANCELLED)
+        locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=str(actvLocn))
+        DBLib.get().assertTaskHdr(i_taskGenRefNbr=locnId, o_intType=101, o_status=TaskHdrStat.CANCELLED)
+        # DBLib.get().assertCycleCountStatus(i_locnBrcd=str(actvLocn), o_statCode=int(o_statCode), i_intType=101)
         for i in range(len(items)):
-            DBLib().assertWMInvnDtls(i_locn=actvLocn, i_itemBrcd=items[i], o_onHandQty=int(finalCountedQtys[i]))
+            DBLib.get().assertWMInvnDtls(i_locn=actvLocn, i_itemBrcd=items[i], o_onHandQty=int(finalCountedQtys[i]))
             if not isSameQtyList[i]:
-                DBLib().assertPix(i_itemBrcd=items[i], i_tranType='300', i_rsnCode='84')
+                DBLib.get().assertPix(i_itemBrcd=items[i], i_tranType='300', i_rsnCode='84')
 
     def cycleCountResvBulk(self, resvLocn: str, isCCPending: bool, iLpns: Union[str, list], qtys: Union[int, list],
                            isAddILpn: bool = None, iLpnsToBeAdded: list[str] = None, qtysToBeAdded: list[int] = None,
@@ -2880,18 +3066,18 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         if taskId is not None:
-            locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=str(resvLocn))
-            DBLib().assertTaskHdr(i_task=taskId, i_taskGenRefNbr=locnId, i_currTaskPrty=50, o_status=TaskHdrStat.CANCELLED, o_intType=100)
+            locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=str(resvLocn))
+            DBLib.get().assertTaskHdr(i_task=taskId, i_taskGenRefNbr=locnId, i_currTaskPrty=50, o_status=TaskHdrStat.CANCELLED, o_intType=100)
 
         finalILpns = iLpnsToBeAdded if isAddILpn else iLpnsToBeOmitted if isOmitLpn else iLpns
         finalQtys = qtysToBeAdded if isAddILpn else qtysToBeOmitted if isOmitLpn else qtys
         finalLpnFacStat = LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY if isOmitLpn else LPNFacStat.ILPN_PUTAWAY
         for i in range(len(finalILpns)):
-            DBLib().assertLPNHdr(i_lpn=finalILpns[i], o_facStatus=finalLpnFacStat)
-            DBLib().assertCCVariance(i_locnBrcd=resvLocn, i_iLpn=finalILpns[i], isILpnAdded=isAddILpn,
-                                     isILpnOmitted=isOmitLpn, o_qty=finalQtys[i])
+            DBLib.get().assertLPNHdr(i_lpn=finalILpns[i], o_facStatus=finalLpnFacStat)
+            DBLib.get().assertCCVariance(i_locnBrcd=resvLocn, i_iLpn=finalILpns[i], isILpnAdded=isAddILpn,
+                                         isILpnOmitted=isOmitLpn, o_qty=finalQtys[i])
             if isOmitLpn:
-                DBLib().assertLpnLockPresent(i_lpn=finalILpns[i], i_lockCode='LC')
+                DBLib.get().assertLpnLockPresent(i_lpn=finalILpns[i], i_lockCode='LC')
 
     def cycleCountResvSummary(self, taskId:str, resvLocn:str, isCCPending: bool, iLpn: Union[str, list], isAddILpn:bool=None,
                               iLpnsToBeAdded:list[str]=None, isOmitLpn:bool=None, iLpnsToBeOmitted:list[str]=None):
@@ -2923,15 +3109,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=str(resvLocn))
-        DBLib().assertTaskHdr(i_task=taskId, i_taskGenRefNbr=locnId, i_currTaskPrty=50, o_status=TaskHdrStat.CANCELLED, o_intType=100)
+        locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=str(resvLocn))
+        DBLib.get().assertTaskHdr(i_task=taskId, i_taskGenRefNbr=locnId, i_currTaskPrty=50, o_status=TaskHdrStat.CANCELLED, o_intType=100)
 
         finalILpns = iLpnsToBeAdded if isAddILpn else iLpnsToBeOmitted if isOmitLpn else iLpnList
         finalLpnFacStat = LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY if isOmitLpn else LPNFacStat.ILPN_PUTAWAY
         for i in range(len(finalILpns)):
-            DBLib().assertLPNHdr(i_lpn=finalILpns[i], o_facStatus=finalLpnFacStat)
+            DBLib.get().assertLPNHdr(i_lpn=finalILpns[i], o_facStatus=finalLpnFacStat)
             if isOmitLpn:
-                DBLib().assertLpnLockPresent(i_lpn=finalILpns[i], i_lockCode='LC')
+                DBLib.get().assertLpnLockPresent(i_lpn=finalILpns[i], i_lockCode='LC')
 
     def lockILPNTran(self, lockCode, iLPN: str, items: list[str], o_lpnStat: LPNFacStat):
         """Lock 1 ilpn with 1 lock code
@@ -2952,11 +3138,11 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_lpnStat)
-        DBLib().assertLpnLockPresent(i_lpn=iLPN, i_lockCode=lockCode)
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_lpnStat)
+        DBLib.get().assertLpnLockPresent(i_lpn=iLPN, i_lockCode=lockCode)
         for i in range(len(items)):
-            DBLib().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='300', i_tranCode='01', i_invnAdjType='S')
-            DBLib().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='606', i_tranCode='02', i_invnAdjType='A')
+            DBLib.get().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='300', i_tranCode='01', i_invnAdjType='S')
+            DBLib.get().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='606', i_tranCode='02', i_invnAdjType='A')
 
     def unlockILPNTran(self, lockCode, iLPN: str, items: list[str], o_lpnStat: LPNFacStat):
         """Unlock 1 ilpn with 1 lock code
@@ -2977,11 +3163,11 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_lpnStat)
-        DBLib().assertNoInvLockForLpn(i_lpn=iLPN, i_lockCode=lockCode)
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_lpnStat)
+        DBLib.get().assertNoInvLockForLpn(i_lpn=iLPN, i_lockCode=lockCode)
         for i in range(len(items)):
-            DBLib().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='300', i_tranCode='01', i_invnAdjType='A')
-            DBLib().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='606', i_tranCode='02', i_invnAdjType='S')
+            DBLib.get().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='300', i_tranCode='01', i_invnAdjType='A')
+            DBLib.get().assertPix(i_itemBrcd=items[i], i_caseNbr=iLPN, i_tranType='606', i_tranCode='02', i_invnAdjType='S')
 
     def createILPNTran(self, reasonCode, item: list[str], qty: list[int], ilpn: str = None):
         """Create 1 iLPN with 1 or more items
@@ -2993,7 +3179,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         itemList = item if type(item) == list else [item]
         qtyList = qty if type(qty) == list else [qty]
         if ilpn is None:
-            ilpn = DBLib().getNewILPNNum()
+            ilpn = DBLib.get().getNewILPNNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name, 'Inv')
@@ -3017,13 +3203,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
         for i in range(len(item)):
-            # DBLib().assertWMInvnDtls(i_itemBrcd=str(item[i]), i_lpn=ilpn)
-            DBLib().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=str(item[i]), o_qty=qty[i])
-            DBLib().assertWMInvnDtls(i_lpn=ilpn, i_itemBrcd=str(item[i]), o_onHandQty=qty[i], o_allocatableFlag='Y')
-            DBLib().assertPix(i_itemBrcd=str(item[i]), i_caseNbr=ilpn, i_tranType='300', i_invnAdjQty=qty[i],
-                              i_invnAdjType='A', i_rsnCode=reasonCode, o_any_procStatCode=(10, 90))
+            # DBLib.get().assertWMInvnDtls(i_itemBrcd=str(item[i]), i_lpn=ilpn)
+            DBLib.get().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=str(item[i]), o_qty=qty[i])
+            DBLib.get().assertWMInvnDtls(i_lpn=ilpn, i_itemBrcd=str(item[i]), o_onHandQty=qty[i], o_allocatableFlag='Y')
+            DBLib.get().assertPix(i_itemBrcd=str(item[i]), i_caseNbr=ilpn, i_tranType='300', i_invnAdjQty=qty[i],
+                                  i_invnAdjType='A', i_rsnCode=reasonCode, o_any_procStatCode=(10, 90))
         return ilpn
 
     def modifyILPNTran(self, ilpn:str, reasonCode, items:list[str]=None, currQty:list[int]=None, newQty:list[int]=None,
@@ -3067,12 +3253,12 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         if isAddNewItem:
             for i in range(len(itemsToAdd)):
-                DBLib().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=itemsToAdd[i], o_qty=qtysToAdd[i])
-                DBLib().assertWMInvnDtls(i_lpn=ilpn, i_itemBrcd=itemsToAdd[i], o_onHandQty=qtysToAdd[i])
-                DBLib().assertPix(i_itemBrcd=itemsToAdd[i], i_tranType='300', i_rsnCode='84')
+                DBLib.get().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=itemsToAdd[i], o_qty=qtysToAdd[i])
+                DBLib.get().assertWMInvnDtls(i_lpn=ilpn, i_itemBrcd=itemsToAdd[i], o_onHandQty=qtysToAdd[i])
+                DBLib.get().assertPix(i_itemBrcd=itemsToAdd[i], i_tranType='300', i_rsnCode='84')
         else:
-            DBLib().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=items[0], o_qty=newQty[0])
-            DBLib().assertWMInvnDtls(i_lpn=ilpn, i_itemBrcd=items[0], o_onHandQty=newQty[0])
+            DBLib.get().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=items[0], o_qty=newQty[0])
+            DBLib.get().assertWMInvnDtls(i_lpn=ilpn, i_itemBrcd=items[0], o_onHandQty=newQty[0])
 
     # def sendToVLMTran(self, ilpn, o_item: str, o_qty: int):
     #     """1 sorted ilpn in 50 state, allocated to VLM locn"""
@@ -3089,7 +3275,7 @@ class RFPage(RF_SERVICE_PROVIDER):
     #
     #     '''Validation'''
     #     # Verify VLM Message got generated in this format : SequenceNumber^REPLENISHMENT^TLPNNumber^ItemName^ItemQty^1
-    #     DBLib().assertVLMReplenMsg(ilpn=ilpn, o_item=o_item, o_qty=o_qty, o_status='Ready')
+    #     DBLib.get().assertVLMReplenMsg(ilpn=ilpn, o_item=o_item, o_qty=o_qty, o_status='Ready')
 
     def sendToVLMTran(self, ilpn, o_item: str, o_qty: int):
         self.sendToMHETran(ilpn=ilpn, o_item=o_item, o_qty=o_qty)
@@ -3109,8 +3295,8 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         # Verify message to VLM/AS/ASRS got generated
-        final_statName = DBLib()._decide_clm_statusName_forMheMsg()
-        DBLib()._assertPutwyReplenMsgToAutoLocn(ilpn=ilpn, o_locn=o_locn, o_item=o_item, o_qty=o_qty, o_status=final_statName)
+        final_statName = DBLib.get()._decide_clm_statusName_forMheMsg()
+        DBLib.get()._assertPutwyReplenMsgToAutoLocn(ilpn=ilpn, o_locn=o_locn, o_item=o_item, o_qty=o_qty, o_status=final_statName)
 
     def sortMixILPNTran(self, sortZone, iLPN: list[str], o_item: list[list[str]], o_qty: list[list[int]],
                         newIlpn: str = None, pallet: str = None):
@@ -3121,9 +3307,9 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         assert len(iLPN) == len(o_item), 'Set of items for each ilpn missing'
         if newIlpn is None:
-            newIlpn = DBLib().getNewILPNNum()
+            newIlpn = DBLib.get().getNewILPNNum()
         if pallet is None:
-            pallet = DBLib().getNewInPalletNum()
+            pallet = DBLib.get().getNewInPalletNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -3146,13 +3332,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=newIlpn, o_facStatus=LPNFacStat.ILPN_ALLOCATED)
+        DBLib.get().assertLPNHdr(i_lpn=newIlpn, o_facStatus=LPNFacStat.ILPN_ALLOCATED)
         for i in range(len(iLPN)):
-            DBLib().assertLPNHdr(i_lpn=iLPN[i], o_facStatus=LPNFacStat.ILPN_CONSUMED)
+            DBLib.get().assertLPNHdr(i_lpn=iLPN[i], o_facStatus=LPNFacStat.ILPN_CONSUMED)
             for j in range(len(o_item[i])):
-                # DBLib().assertLPNDtlsForItem()
-                DBLib().assertPix(i_itemBrcd=o_item[i][j], i_caseNbr=iLPN[i], i_tranType='100')
-                DBLib().assertPix(i_itemBrcd=o_item[i][j], i_caseNbr=iLPN[i], i_tranType='617')
+                # DBLib.get().assertLPNDtlsForItem()
+                DBLib.get().assertPix(i_itemBrcd=o_item[i][j], i_caseNbr=iLPN[i], i_tranType='100')
+                DBLib.get().assertPix(i_itemBrcd=o_item[i][j], i_caseNbr=iLPN[i], i_tranType='617')
 
         return newIlpn, pallet
 
@@ -3160,7 +3346,7 @@ class RFPage(RF_SERVICE_PROVIDER):
     #                           fromIlpnList:list[str],o_reservLocn:str,palletId:str=None):
     #
     #     if palletId is None:
-    #         palletId=DBLib().getNewInPalletNum()
+    #         palletId=DBLib.get().getNewInPalletNum()
     #     self.goToHomeScreen()
     #     self._changeTaskGroupByCtrl(taskGroup=taskGrp)
     #     self.assertScreenTextExist('Task#:')
@@ -3182,11 +3368,11 @@ class RFPage(RF_SERVICE_PROVIDER):
     #             self.sendData(self.KEY_CTRL_A_AcceptWarning)
     #
     #     '''Validation'''
-    #     DBLib().assertTaskHdr(i_task=taskId,o_status=99)
-    #     DBLib().assertCycleCountStatus(i_locnBrcd=o_reservLocn, i_intType=101, o_statCode=10)
+    #     DBLib.get().assertTaskHdr(i_task=taskId,o_status=99)
+    #     DBLib.get().assertCycleCountStatus(i_locnBrcd=o_reservLocn, i_intType=101, o_statCode=10)
     #     for i in range(0, len(itemList)):
     #         for j in range(0, len(itemList[i])):
-    #             DBLib().assertLPNHdr(i_lpn=fromIlpnList[i][j], o_facStatus=10)
+    #             DBLib.get().assertLPNHdr(i_lpn=fromIlpnList[i][j], o_facStatus=10)
 
     def auditOLPNTran(self, olpn: str, items: list[str], qtys: list[int], isRFUser2: bool = None,
                       o_qaFlag: int = None, isVarianceFound:bool=None, isWrongItem:bool=None):
@@ -3196,7 +3382,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if isVarianceFound:
-            printReqstr = DBLib().getPrintRequestor(codeDesc='Audit oLPN variance report')
+            printReqstr = DBLib.get().getPrintRequestor(codeDesc='Audit oLPN variance report')
         else:
             printReqstr = None
 
@@ -3246,9 +3432,9 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=olpn, o_qaFlag=o_qaFlag)
+        DBLib.get().assertLPNHdr(i_lpn=olpn, o_qaFlag=o_qaFlag)
         if isVarianceFound:
-            DBLib().assertLRFReport(printReqstr=printReqstr)
+            DBLib.get().assertLRFReport(printReqstr=printReqstr)
 
     def loadPltzTran(self, oLpn: str, blindPallet: str = None, order: str = None, o_doStatus: DOStat = None):
         """"""
@@ -3256,7 +3442,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if blindPallet is None:
-            blindPallet = DBLib().getNewOutPalletNum()
+            blindPallet = DBLib.get().getNewOutPalletNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -3268,8 +3454,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=str(oLpn), o_parentLpn=blindPallet)
-        DBLib().assertDOHdr(i_order=str(order), o_status=o_doStatus)
+        DBLib.get().assertLPNHdr(i_lpn=str(oLpn), o_parentLpn=blindPallet)
+        DBLib.get().assertDOHdr(i_order=str(order), o_status=o_doStatus)
 
         return blindPallet
 
@@ -3319,11 +3505,11 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertDOHdr(i_order=order, o_status=o_doStatus)
-        DBLib().assertLPNHdr(i_lpn=oLpn, o_facStatus=LPNFacStat.OLPN_PACKED)
+        DBLib.get().assertDOHdr(i_order=order, o_status=o_doStatus)
+        DBLib.get().assertLPNHdr(i_lpn=oLpn, o_facStatus=LPNFacStat.OLPN_PACKED)
         for i in range(len(items)):
-            DBLib().assertAllocDtls(i_itemBrcd=items[i], i_taskGenRefNbr=waveNum, i_taskCmplRefNbr=oLpn, i_intType=50,
-                                    o_statCode=o_allocStatus)
+            DBLib.get().assertAllocDtls(i_itemBrcd=items[i], i_taskGenRefNbr=waveNum, i_taskCmplRefNbr=oLpn, i_intType=50,
+                                        o_statCode=o_allocStatus)
 
     def packMultiSkuOLpnFromActiveTranWithSplit(self, order: str, waveNum: str = None, oLpn: str = None,
                                                 fromActvLocns: list[list[str]] = None, blindOLpnCnt: int = None, isPickToOrigOLpn: bool = None,
@@ -3340,7 +3526,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             oLpns.append(oLpn)
         k = 1
         for k in range(blindOLpnCnt):
-            blindOLpn = DBLib().getNewOLPNNum()
+            blindOLpn = DBLib.get().getNewOLPNNum()
             oLpns.append(blindOLpn)
 
         self.goToHomeScreen()
@@ -3370,13 +3556,13 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertDOHdr(i_order=order, o_status=o_doStatus)
-        DBLib().assertOLPNCountForDO(i_order=order, o_totalOLPNs=len(oLpns))
+        DBLib.get().assertDOHdr(i_order=order, o_status=o_doStatus)
+        DBLib.get().assertOLPNCountForDO(i_order=order, o_totalOLPNs=len(oLpns))
         for i in range(len(oLpns)):
-            DBLib().assertLPNHdr(i_lpn=oLpns[i], o_facStatus=LPNFacStat.OLPN_PACKED)
+            DBLib.get().assertLPNHdr(i_lpn=oLpns[i], o_facStatus=LPNFacStat.OLPN_PACKED)
             for j in range(len(items[i])):
-                DBLib().assertAllocDtls(i_itemBrcd=items[i][j], i_taskGenRefNbr=waveNum, i_taskCmplRefNbr=oLpns[i],
-                                        i_intType=50, o_statCode=o_allocStatus)
+                DBLib.get().assertAllocDtls(i_itemBrcd=items[i][j], i_taskGenRefNbr=waveNum, i_taskCmplRefNbr=oLpns[i],
+                                            i_intType=50, o_statCode=o_allocStatus)
 
     def executeReplenTaskWithSkip(self, fromResvLocn: str, fromIlpns: list[str], itemsToPull: list[str],
                                   taskGrp: str = None, waveNbr: str = None, iLpnsToSkip: list[str] = None, o_taskDtlStat:list[TaskDtlStat]=None):
@@ -3384,11 +3570,11 @@ class RFPage(RF_SERVICE_PROVIDER):
         """
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, 'Ctrl E')
 
-        pallet = DBLib().getNewInPalletNum()
-        taskId = str(DBLib().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr))
+        pallet = DBLib.get().getNewInPalletNum()
+        taskId = str(DBLib.get().getTaskIdFromGenRefNbr(taskGenRefNbr=waveNbr))
 
         # if taskGrp is None:
-        #     taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+        #     taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
         taskGrp = self._decideFinalTaskGrp(taskGrp, taskId, 1)
 
         self.goToHomeScreen()
@@ -3422,7 +3608,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         '''Validation'''
         if o_taskDtlStat:
             for i in range(len(iLpnsToSkip)):
-                DBLib().assertTaskDtls(i_cntrNbr=iLpnsToSkip[i], o_statCode=o_taskDtlStat[i])
+                DBLib.get().assertTaskDtls(i_cntrNbr=iLpnsToSkip[i], o_statCode=o_taskDtlStat[i])
 
     def cycleCountResvDetailTran(self, resvLocn: str, taskId: str = None, isCCPending: bool = None,
                                  isLocnHasAllocatedLpn: bool = None, iLpns: list[str] = None,
@@ -3488,20 +3674,20 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        locnId = DBLib().getLocnIdByLocnBrcd(locnBrcd=str(resvLocn))
-        DBLib().assertTaskHdr(i_task=taskId, i_taskGenRefNbr=locnId, i_currTaskPrty=50, o_status=TaskHdrStat.CANCELLED, o_intType=100)
+        locnId = DBLib.get().getLocnIdByLocnBrcd(locnBrcd=str(resvLocn))
+        DBLib.get().assertTaskHdr(i_task=taskId, i_taskGenRefNbr=locnId, i_currTaskPrty=50, o_status=TaskHdrStat.CANCELLED, o_intType=100)
         if not (isLocnHasAllocatedLpn or isOmitLpn or isAddILpn):
             for i in range(len(iLpns)):
                 for j in range(len(items[i])):
-                    DBLib().assertWMInvnDtls(i_locn=resvLocn, i_lpn=iLpns[i], i_itemBrcd=items[i][j], o_onHandQty=int(finalCountedQtys[i]))
-                    DBLib().assertPix(i_itemBrcd=items[i][j], i_tranType='300', i_rsnCode='84')
+                    DBLib.get().assertWMInvnDtls(i_locn=resvLocn, i_lpn=iLpns[i], i_itemBrcd=items[i][j], o_onHandQty=int(finalCountedQtys[i]))
+                    DBLib.get().assertPix(i_itemBrcd=items[i][j], i_tranType='300', i_rsnCode='84')
         if isOmitLpn or isAddILpn:
             finalILpns = iLpnsToBeOmitted if isOmitLpn else iLpnsToBeAdded
             finalLpnFacStat = LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY if isOmitLpn else LPNFacStat.ILPN_PUTAWAY
             for i in range(len(finalILpns)):
-                DBLib().assertLPNHdr(i_lpn=finalILpns[i], o_facStatus=finalLpnFacStat)
+                DBLib.get().assertLPNHdr(i_lpn=finalILpns[i], o_facStatus=finalLpnFacStat)
                 if isOmitLpn:
-                    DBLib().assertLpnLockPresent(i_lpn=finalILpns[i], i_lockCode='LC')
+                    DBLib.get().assertLpnLockPresent(i_lpn=finalILpns[i], i_lockCode='LC')
 
     def executeCycleCountResvTaskByCtrl(self, taskId: str, taskGrp: str = None, resvLocn: str = None,
                                         iLpns: list[str] = None, items: list[list[str]] = None, qtys: list[list[int]] = None):
@@ -3513,7 +3699,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         qtyList = qtys if type(qtys) == list else [qtys]
 
         if taskGrp is None:
-            taskGrp = DBLib().getTaskGroupFromTask(taskId=taskId)
+            taskGrp = DBLib.get().getTaskGroupFromTask(taskId=taskId)
 
         self.goToHomeScreen()
         self._changeTaskGroupByCtrl(taskGroup=taskGrp)
@@ -3540,16 +3726,16 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_N_EndLocnDuringCC)
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=TaskHdrStat.COMPLETE)
         for i in range(len(iLpns)):
             for j in range(len(itemList[i])):
-                DBLib().assertWMInvnDtls(i_lpn=iLpns[i], i_itemBrcd=itemList[i][j], i_locn=resvLocn, o_onHandQty=qtys[i][j])
-                DBLib().assertNoPixPresent(i_itemBrcd=itemList[i][j])
+                DBLib.get().assertWMInvnDtls(i_lpn=iLpns[i], i_itemBrcd=itemList[i][j], i_locn=resvLocn, o_onHandQty=qtys[i][j])
+                DBLib.get().assertNoPixPresent(i_itemBrcd=itemList[i][j])
 
-        DBLib().assertLaborMsgHdr(i_taskNbr=taskId, i_actName='CYC CNT BULK')
+        DBLib.get().assertLaborMsgHdr(i_taskNbr=taskId, i_actName='CYC CNT BULK')
         for i in range(len(iLpns)):
             for j in range(len(itemList[i])):
-                DBLib().assertLaborMsgDtl(i_taskNbr=taskId, i_actName='CYC CNT BULK', i_itemBrcd=itemList[i][j], o_qty=qtys[i][j])
+                DBLib.get().assertLaborMsgDtl(i_taskNbr=taskId, i_actName='CYC CNT BULK', i_itemBrcd=itemList[i][j], o_qty=qtys[i][j])
 
     def allocateILPN(self, ilpn: str):
         """Allocate 1 ilpn
@@ -3567,7 +3753,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_ALLOCATED)
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_ALLOCATED)
 
     def putawayCaseTran(self, ilpn: list[str], o_item: list[list[str]], o_qty: list[list[int]],
                         dropLocn: str = None, actLocn: str = None, resvLocn: str = None, o_intType: int = None):
@@ -3593,7 +3779,7 @@ class RFPage(RF_SERVICE_PROVIDER):
                 wgwaSplit = wgwa.split('/')
                 workG = wgwaSplit[0].strip()
                 workA = wgwaSplit[1].strip()
-                _resvLoc = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+                _resvLoc = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
                 final_locns.append(_resvLoc)
                 self.sendData(_resvLoc, isEnter=True)
                 final_lpnStats.append(LPNFacStat.ILPN_ALLOCATED)
@@ -3613,15 +3799,15 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(ilpn)):
-            DBLib().assertLPNHdr(i_lpn=ilpn[i], o_facStatus=final_lpnStats[i], o_currLocn=final_locns[i])
+            DBLib.get().assertLPNHdr(i_lpn=ilpn[i], o_facStatus=final_lpnStats[i], o_currLocn=final_locns[i])
             for j in range(len(o_item[i])):
-                DBLib().assertLPNDtls(i_lpn=ilpn[i], i_itemBrcd=o_item[i][j], o_receivedQty=o_qty[i][j])
-                DBLib().assertAllocDtls(i_cntr=ilpn[i], i_intType=o_intType, i_itemBrcd=o_item[i][j], o_taskPriority=50)
-            taskID = DBLib().getTaskIdByORCond(taskCmplRefNbr=ilpn[i], taskGenRefNbr=ilpn[i], cntr=ilpn[i], intType=o_intType)
-            DBLib().assertTaskHdr(i_task=taskID, o_status=TaskHdrStat.COMPLETE)
+                DBLib.get().assertLPNDtls(i_lpn=ilpn[i], i_itemBrcd=o_item[i][j], o_receivedQty=o_qty[i][j])
+                DBLib.get().assertAllocDtls(i_cntr=ilpn[i], i_intType=o_intType, i_itemBrcd=o_item[i][j], o_taskPriority=50)
+            taskID = DBLib.get().getTaskIdByORCond(taskCmplRefNbr=ilpn[i], taskGenRefNbr=ilpn[i], cntr=ilpn[i], intType=o_intType)
+            DBLib.get().assertTaskHdr(i_task=taskID, o_status=TaskHdrStat.COMPLETE)
 
         '''LM validation'''
-        # DBLib().assertLaborMsgHdr(i_refNbr=, i_actName=)
+        # DBLib.get().assertLaborMsgHdr(i_refNbr=, i_actName=)
 
     def putawayPalletTran(self, ilpn: str, taskGrp: str = None, o_item: str = None, o_qty: int = None,
                           resvLocn: str = None, isSubstitueLPN: bool = None, isToWarnLocnForDiffItem: bool = None,
@@ -3634,8 +3820,8 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         sysDestResvLocn = None
         if isSubstitueLPN:
-            sysDestResvLocn = DBLib().getDestLocnForLpn(lpn=ilpn)
-            DBLib()._updateLocnCCPending(i_locnBrcd=sysDestResvLocn, u_isCCPending=False)
+            sysDestResvLocn = DBLib.get().getDestLocnForLpn(lpn=ilpn)
+            DBLib.get()._updateLocnCCPending(i_locnBrcd=sysDestResvLocn, u_isCCPending=False)
 
         self.goToHomeScreen()
         if taskGrp is not None:
@@ -3672,11 +3858,11 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLocn)
-        DBLib().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=o_item, o_qty=o_qty, o_receivedQty=o_qty)
-        DBLib().assertAllocDtls(i_cntr=ilpn, i_intType=11, i_itemBrcd=o_item, o_taskPriority=50, o_statCode=AllocStat.TASK_DETAIL_CREATED)
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLocn)
+        DBLib.get().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=o_item, o_qty=o_qty, o_receivedQty=o_qty)
+        DBLib.get().assertAllocDtls(i_cntr=ilpn, i_intType=11, i_itemBrcd=o_item, o_taskPriority=50, o_statCode=AllocStat.TASK_DETAIL_CREATED)
         if isAssertCCTask:
-            DBLib().assertCCTask(i_locnBrcd=sysDestResvLocn, i_intType=101, o_status=90)
+            DBLib.get().assertCCTask(i_locnBrcd=sysDestResvLocn, i_intType=101, o_status=90)
 
     def userDirKeepPallet(self, palletLpn: str, resvLoc: str):
         """Putaway pallet to Resv
@@ -3718,7 +3904,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=palletLpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLoc)
+        DBLib.get().assertLPNHdr(i_lpn=palletLpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLoc)
 
     def makingSpotsActvTran(self, palletId: str, o_itemBrcd: str, o_qty: int, o_pullLocn: str, actvLocn: str = None):
         """Scan pallet to temp actv locn
@@ -3738,12 +3924,12 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=palletId, o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=actvLocn)
-        DBLib().assertLPNDtls(i_lpn=palletId, i_itemBrcd=o_itemBrcd, o_receivedQty=o_qty)
-        DBLib().assertTaskHdr(i_cntr=palletId, o_intType=1)
-        DBLib().assertTaskDtls(i_cntrNbr=palletId, i_itemBrcd=o_itemBrcd, i_intType=1)
-        DBLib().assertAllocDtls(i_cntr=palletId, i_intType=1, i_itemBrcd=o_itemBrcd, o_taskPriority=50)
-        # DBLib().assertLaborMsgHdr()
+        DBLib.get().assertLPNHdr(i_lpn=palletId, o_facStatus=LPNFacStat.ILPN_CONSUMED_TO_ACTV, o_currLocn=actvLocn)
+        DBLib.get().assertLPNDtls(i_lpn=palletId, i_itemBrcd=o_itemBrcd, o_receivedQty=o_qty)
+        DBLib.get().assertTaskHdr(i_cntr=palletId, o_intType=1)
+        DBLib.get().assertTaskDtls(i_cntrNbr=palletId, i_itemBrcd=o_itemBrcd, i_intType=1)
+        DBLib.get().assertAllocDtls(i_cntr=palletId, i_intType=1, i_itemBrcd=o_itemBrcd, o_taskPriority=50)
+        # DBLib.get().assertLaborMsgHdr()
 
     def makingSpotsResvTran(self, palletId: str, o_itemBrcd: str, o_qty: int, resvLoc: str = None):
         """Scan pallet to temp reserve locn
@@ -3752,7 +3938,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if resvLoc is None:
-            resvLocnRow = DBLib().getResvLocn(noOfLocn=1)
+            resvLocnRow = DBLib.get().getResvLocn(noOfLocn=1)
             resvLoc = resvLocnRow[0].get('LOCN_BRCD')
 
         self.goToHomeScreen()
@@ -3768,8 +3954,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=palletId, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLoc)
-        DBLib().assertLPNDtls(i_lpn=palletId, i_itemBrcd=o_itemBrcd, o_qty=o_qty)
+        DBLib.get().assertLPNHdr(i_lpn=palletId, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=resvLoc)
+        DBLib.get().assertLPNDtls(i_lpn=palletId, i_itemBrcd=o_itemBrcd, o_qty=o_qty)
         
     def xferReceiveILPNTran(self, asn: str, itemBrcd: str, qty: int, o_po: str, iLPN: str = None):
         """Transfer Receive iLPN
@@ -3783,7 +3969,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(asn, isEnter=True)
         self.assertScreenTextExist('LPN:')
         if iLPN is None:
-            iLPN = DBLib().getNewILPNNum()
+            iLPN = DBLib.get().getNewILPNNum()
         self.sendData(iLPN, isEnterIfLT20=True)
         self.assertScreenTextExist('Item Barcode:')
         self.sendData(itemBrcd, isEnter=True)
@@ -3793,17 +3979,17 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
-        DBLib().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+        DBLib.get().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
 
-        DBLib().assertASNHdr(i_asn=asn, o_status=30)
-        DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=30)
+        DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
 
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='100')
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='617')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='100')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='617')
 
-        DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV ILPN CA')
-        DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV ILPN CA', i_lpn=iLPN, i_itemBrcd=itemBrcd)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV ILPN CA')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV ILPN CA', i_lpn=iLPN, i_itemBrcd=itemBrcd)
 
     def xferReceivePalletTran(self, workGrp: str, workArea: str, asn: str, itemBrcd: str, qty: int,
                           isMatchRFLocn: bool = False, dropLocn: str = None, actLocn: str = None, resvLocn: str = None,
@@ -3814,9 +4000,9 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'xferRcvPallet')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        dockDoor, dbDockDoor = DBLib().getOpenDockDoor(workGrp=workGrp, workArea=workArea)
+        dockDoor, dbDockDoor = DBLib.get().getOpenDockDoor(workGrp=workGrp, workArea=workArea)
         if blindIlpn is None:
-            blindIlpn = DBLib().getNewILPNNum()
+            blindIlpn = DBLib.get().getNewILPNNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -3839,7 +4025,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn, isEnter=True)
         elif actLocn is not None:
             self.assertScreenTextExist('Aloc:')
@@ -3864,19 +4050,19 @@ class RFPage(RF_SERVICE_PROVIDER):
         taskStatCode = TaskHdrStat.IN_DROP_ZONE if dropLocn else TaskHdrStat.COMPLETE
 
         if o_asnStatus is not None:
-            DBLib().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
-        DBLib().assertASNDtls(i_asn=asn, i_itemBrcd=itemBrcd, i_po=o_po, o_receivedQty=qty, o_dtlStatus=16)
-        DBLib().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=palletFacStat, o_currLocn=currLocn)
-        DBLib().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemBrcd, o_qty=lpnDtlQty, o_receivedQty=qty)
+            DBLib.get().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
+        DBLib.get().assertASNDtls(i_asn=asn, i_itemBrcd=itemBrcd, i_po=o_po, o_receivedQty=qty, o_dtlStatus=16)
+        DBLib.get().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=palletFacStat, o_currLocn=currLocn)
+        DBLib.get().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemBrcd, o_qty=lpnDtlQty, o_receivedQty=qty)
         '''Alloc, task validation'''
-        DBLib().assertAllocDtls(i_cntr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_taskPriority=50, o_statCode=allocStatCode,
-                                o_pullLocn=pullLocn)
-        DBLib().assertTaskDtls(i_cntrNbr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=pullLocn)
-        taskId = DBLib().getTaskIdByORCond(taskGenRefNbr=blindIlpn, taskCmplRefNbr=blindIlpn, cntr=blindIlpn, intType=o_intType)
-        DBLib().assertTaskHdr(i_task=taskId, o_intType=o_intType, o_status=taskStatCode)
+        DBLib.get().assertAllocDtls(i_cntr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_taskPriority=50, o_statCode=allocStatCode,
+                                    o_pullLocn=pullLocn)
+        DBLib.get().assertTaskDtls(i_cntrNbr=blindIlpn, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=pullLocn)
+        taskId = DBLib.get().getTaskIdByORCond(taskGenRefNbr=blindIlpn, taskCmplRefNbr=blindIlpn, cntr=blindIlpn, intType=o_intType)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_intType=o_intType, o_status=taskStatCode)
         '''Pix validation 100, 617, 606'''
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType='100')
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType='617')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType='100')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindIlpn, i_tranType='617')
 
         return blindIlpn, dbDockDoor
 
@@ -3908,12 +4094,12 @@ class RFPage(RF_SERVICE_PROVIDER):
             self.assertScreenTextExist('iLPN:')
             self.assertScreenTextExist('Rloc:')
             if blindIlpn is None:
-                blindIlpn = DBLib().getNewILPNNum()
+                blindIlpn = DBLib.get().getNewILPNNum()
             self.sendData(blindIlpn, isEnterIfLT20=True)
             if i == 0:
                 self.assertScreenTextExist('Pallet:')
                 if blindPallet is None:
-                    blindPallet = DBLib().getNewInPalletNum()
+                    blindPallet = DBLib.get().getNewInPalletNum()
                 self.sendData(blindPallet, isEnterIfLT20=True)
             if i == 0:
                 screentxt = self.readScreen()
@@ -3923,22 +4109,22 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_parentLpn=blindPallet)
-        DBLib().assertLPNHdr(i_lpn=blindPallet, o_currLocn=fetchedSortLocn)
-        DBLib().assertASNHdr(i_asn=asn, o_status=30)
+        DBLib.get().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_parentLpn=blindPallet)
+        DBLib.get().assertLPNHdr(i_lpn=blindPallet, o_currLocn=fetchedSortLocn)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=30)
         for i in range(0, len(itemList)):
-            DBLib().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemList[i], o_qty=qtyList[i], o_receivedQty=qtyList[i])
-            DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemList[i], o_receivedQty=qtyList[i], o_dtlStatus=16)
-            DBLib().assertAllocDtls(i_cntr=blindIlpn, i_intType=o_intType, i_itemBrcd=itemList[i], o_taskPriority=50, o_pullLocn=fetchedSortLocn)
+            DBLib.get().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemList[i], o_qty=qtyList[i], o_receivedQty=qtyList[i])
+            DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemList[i], o_receivedQty=qtyList[i], o_dtlStatus=16)
+            DBLib.get().assertAllocDtls(i_cntr=blindIlpn, i_intType=o_intType, i_itemBrcd=itemList[i], o_taskPriority=50, o_pullLocn=fetchedSortLocn)
 
-            defaultLpn = DBLib().getDefaultLpnFromASNItem(asn=asn, itemBrcd=itemList[i])
-            DBLib().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='100')
-            DBLib().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='617')
+            defaultLpn = DBLib.get().getDefaultLpnFromASNItem(asn=asn, itemBrcd=itemList[i])
+            DBLib.get().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='100')
+            DBLib.get().assertPix(i_itemBrcd=itemList[i], i_caseNbr=defaultLpn, i_tranType='617')
 
         '''LM validation (labor_msg_id 63747360 63747359)'''
-        DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV PLT MIX')
+        DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV PLT MIX')
         for i in range(0, len(itemList)):
-            DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV PLT MIX', i_itemBrcd=itemList[i])
+            DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV PLT MIX', i_itemBrcd=itemList[i])
 
         return blindIlpn, blindPallet, fetchedSortLocn
 
@@ -3951,7 +4137,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
         if iLpn is None:
-            iLpn = DBLib().getNewILPNNum()
+            iLpn = DBLib.get().getNewILPNNum()
         self.assertScreenTextExist('iLPN:')
         self.sendData(iLpn, isEnterIfLT20=True)
         self.assertScreenTextExist('Aloc:')
@@ -3967,8 +4153,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=rloc)
-        DBLib().assertLPNDtls(i_lpn=iLpn, i_itemBrcd=o_item, o_qty=qty)
+        DBLib.get().assertLPNHdr(i_lpn=iLpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=rloc)
+        DBLib.get().assertLPNDtls(i_lpn=iLpn, i_itemBrcd=o_item, o_qty=qty)
 
         return iLpn
 
@@ -3983,10 +4169,10 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         dbDockDoor = None
         if dockDoor is None:
-            dockDoor, dbDockDoor = DBLib().getOpenDockDoor(workGrp=currWG, workArea=currWA)
+            dockDoor, dbDockDoor = DBLib.get().getOpenDockDoor(workGrp=currWG, workArea=currWA)
 
         if blindPallet is None:
-            blindPallet = DBLib().getNewInPalletNum()
+            blindPallet = DBLib.get().getNewInPalletNum()
             
         self.goToHomeScreen()
         self.goToTransaction(tran_name, 'In')
@@ -4010,7 +4196,7 @@ class RFPage(RF_SERVICE_PROVIDER):
             wgwaSplit = wgwa.split('/')
             workG = wgwaSplit[0].strip()
             workA = wgwaSplit[1].strip()
-            dropLocn = DBLib().getLocnByWGWA(workGrp=workG, workArea=workA)
+            dropLocn = DBLib.get().getLocnByWGWA(workGrp=workG, workArea=workA)
             self.sendData(dropLocn, isEnter=True)
         elif actvLocn is not None:
             self.assertScreenTextExist('Aloc:')
@@ -4019,19 +4205,19 @@ class RFPage(RF_SERVICE_PROVIDER):
             self.sendData(actvLocn, isEnter=True)
 
         '''Validation'''
-        DBLib().assertASNHdr(i_asn=asn, o_status=30)
-        DBLib().assertASNDtls(i_asn=asn, i_itemBrcd=itemBrcd, i_po=o_po, o_receivedQty=qty, o_dtlStatus=16)
-        DBLib().assertLPNHdr(i_lpn=blindPallet, o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_currLocn=dropLocn)
-        DBLib().assertLPNDtls(i_lpn=blindPallet, i_itemBrcd=itemBrcd, o_receivedQty=qty)
-        DBLib().assertAllocDtls(i_cntr=blindPallet, i_itemBrcd=itemBrcd, i_intType=o_intType, o_taskPriority=50, o_statCode=AllocStat.TASK_DETAIL_CREATED)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=30)
+        DBLib.get().assertASNDtls(i_asn=asn, i_itemBrcd=itemBrcd, i_po=o_po, o_receivedQty=qty, o_dtlStatus=16)
+        DBLib.get().assertLPNHdr(i_lpn=blindPallet, o_facStatus=LPNFacStat.ILPN_ALLOCATED, o_currLocn=dropLocn)
+        DBLib.get().assertLPNDtls(i_lpn=blindPallet, i_itemBrcd=itemBrcd, o_receivedQty=qty)
+        DBLib.get().assertAllocDtls(i_cntr=blindPallet, i_itemBrcd=itemBrcd, i_intType=o_intType, o_taskPriority=50, o_statCode=AllocStat.TASK_DETAIL_CREATED)
         pullLocn = dbDockDoor
-        DBLib().assertTaskDtls(i_cntrNbr=blindPallet, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=pullLocn)
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindPallet, i_tranType='100')
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindPallet, i_tranType='617')
+        DBLib.get().assertTaskDtls(i_cntrNbr=blindPallet, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=pullLocn)
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindPallet, i_tranType='100')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=blindPallet, i_tranType='617')
         lmRefNbr = asn
-        DBLib().assertLaborMsgHdr(i_refNbr=lmRefNbr, i_actName='RCV PLT FLR')
-        DBLib().assertLaborMsgHdr(i_refNbr=lmRefNbr, i_actName='RCV PLT FLR')
-        DBLib().assertLaborMsgDtl(i_refNbr=lmRefNbr, i_actName='RCV PLT FLR', i_lpn=blindPallet, i_itemBrcd=itemBrcd)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=lmRefNbr, i_actName='RCV PLT FLR')
+        DBLib.get().assertLaborMsgHdr(i_refNbr=lmRefNbr, i_actName='RCV PLT FLR')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=lmRefNbr, i_actName='RCV PLT FLR', i_lpn=blindPallet, i_itemBrcd=itemBrcd)
 
     def locnInquiryTran(self, locn: str, items: list[list[str]], qty: list[list[int]], lpn: list[str] = None):
         """Locn inquiry
@@ -4085,7 +4271,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         tran_name = RF_TRAN.get('rf', 'packILPNTrnsl')
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
-        blindIlpn = DBLib().getNewILPNNum()
+        blindIlpn = DBLib.get().getNewILPNNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -4102,8 +4288,8 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.assertScreenTextExist('iLPN:')
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
-        DBLib().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemBrcd, o_qty=qty)
+        DBLib.get().assertLPNHdr(i_lpn=blindIlpn, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY)
+        DBLib.get().assertLPNDtls(i_lpn=blindIlpn, i_itemBrcd=itemBrcd, o_qty=qty)
 
     def exceptionHandlingTran(self, asn: str, itemBrcd: str, qty: int, sortZone: str, iLPN: str = None,
                               pallet: str = None, o_asnStatus: int = None, o_po: str = None,
@@ -4114,9 +4300,9 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if iLPN is None:
-            iLPN = DBLib().getNewILPNNum()
+            iLPN = DBLib.get().getNewILPNNum()
         if pallet is None:
-            pallet = DBLib().getNewInPalletNum()
+            pallet = DBLib.get().getNewInPalletNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -4140,19 +4326,19 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_facStatus, o_currLocn=sortLocn, o_parentLpn=pallet)
-        DBLib().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
-        DBLib().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
-        DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_tranType='100')
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_tranType='617')
-        DBLib().assertAllocDtls(i_cntr=iLPN, i_intType=o_intType, i_itemBrcd=itemBrcd, o_taskPriority=50, o_pullLocn=sortLocn)
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_facStatus, o_currLocn=sortLocn, o_parentLpn=pallet)
+        DBLib.get().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
+        DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_tranType='100')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_tranType='617')
+        DBLib.get().assertAllocDtls(i_cntr=iLPN, i_intType=o_intType, i_itemBrcd=itemBrcd, o_taskPriority=50, o_pullLocn=sortLocn)
         if o_assertTask:
-            DBLib().assertTaskDtls(i_cntrNbr=iLPN, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=sortLocn, o_statCode=TaskDtlStat.UNASSIGNED)
-            DBLib().assertTaskHdr(i_taskGenRefNbr=iLPN, o_intType=o_intType)
+            DBLib.get().assertTaskDtls(i_cntrNbr=iLPN, i_itemBrcd=itemBrcd, i_intType=o_intType, o_pullLocn=sortLocn, o_statCode=TaskDtlStat.UNASSIGNED)
+            DBLib.get().assertTaskHdr(i_taskGenRefNbr=iLPN, o_intType=o_intType)
         '''LM validation'''
-        DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='EXCEPT HNDL')
-        DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='EXCEPT HNDL', i_itemBrcd=itemBrcd, o_qty=qty)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='EXCEPT HNDL')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='EXCEPT HNDL', i_itemBrcd=itemBrcd, o_qty=qty)
 
     def receiveILPNExceptionHandlingTran(self, asn: str, itemBrcd: str, qty: int, iLPN: str = None,
                                          o_asnStatus: int = None, o_lpnFacStat: LPNFacStat = None, o_po: str = None):
@@ -4162,7 +4348,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if iLPN is None:
-            iLPN = DBLib().getNewILPNNum()
+            iLPN = DBLib.get().getNewILPNNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -4179,15 +4365,15 @@ class RFPage(RF_SERVICE_PROVIDER):
         self.sendData(self.KEY_CTRL_X_ExitTran)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_lpnFacStat)
-        DBLib().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
-        DBLib().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
-        DBLib().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='100')
-        DBLib().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='617')
+        DBLib.get().assertLPNHdr(i_lpn=iLPN, o_facStatus=o_lpnFacStat)
+        DBLib.get().assertLPNDtls(i_lpn=iLPN, i_itemBrcd=itemBrcd, o_qty=qty, o_receivedQty=qty)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
+        DBLib.get().assertASNDtls(i_asn=asn, i_po=o_po, i_itemBrcd=itemBrcd, o_receivedQty=qty, o_dtlStatus=16)
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='100')
+        DBLib.get().assertPix(i_itemBrcd=itemBrcd, i_caseNbr=iLPN, i_tranType='617')
         '''LM validation'''
-        DBLib().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV ILPN EX HND')
-        DBLib().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV ILPN EX HND', i_lpn=iLPN, i_itemBrcd=itemBrcd)
+        DBLib.get().assertLaborMsgHdr(i_refNbr=asn, i_actName='RCV ILPN EX HND')
+        DBLib.get().assertLaborMsgDtl(i_refNbr=asn, i_actName='RCV ILPN EX HND', i_lpn=iLPN, i_itemBrcd=itemBrcd)
 
         return iLPN
 
@@ -4211,7 +4397,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger, tran_name)
 
         if palletid is None:
-            palletid = DBLib().getNewInPalletNum()
+            palletid = DBLib.get().getNewInPalletNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name)
@@ -4227,7 +4413,7 @@ class RFPage(RF_SERVICE_PROVIDER):
 
         '''Validation'''
         for i in range(len(lpns)):
-            DBLib().assertLPNHdr(o_parentLpn=palletid, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY, i_lpn=lpns[i])
+            DBLib.get().assertLPNHdr(o_parentLpn=palletid, o_facStatus=LPNFacStat.ILPN_IN_INVENTORY_NOT_PUTAWAY, i_lpn=lpns[i])
 
     def verifyTaskExistForUserByCtrl(self, taskId: str, isRFUser2: bool = None):
         """Verify task for the user by ctrl+s
@@ -4288,7 +4474,7 @@ class RFPage(RF_SERVICE_PROVIDER):
         itemList = item if type(item) == list else [item]
         qtyList = qty if type(qty) == list else [qty]
         if ilpn is None:
-            ilpn = DBLib().getNewILPNNum()
+            ilpn = DBLib.get().getNewILPNNum()
 
         self.goToHomeScreen()
         self.goToTransaction(tran_name, 'Inv')
@@ -1,11 +1,11 @@
 import os
-from typing import Union
+from typing import Iterable, Union
 
 from apps.wms.app_db_lib import DBLib
 from core.config_service import ENV_CONFIG
 from core.log_service import Logging, printit
 from resources.data.template import tags_doxml, tags_lpnlevel_asnxml, tags_skulevel_asnxml, tags_poxml, tags_lpnxml
-from core.file_service import DataGeneric, XMLUtil
+from core.file_service import DataGeneric, XMLEnvelopeWriter, XMLUtil
 
 from root import VARIABLE_FILE
 
@@ -52,13 +52,13 @@ class XMLBuilder:
 
     @classmethod
     def buildDOXml(cls, doType, items: Union[str, list], qtys: Union[int, list], shipVia=None, doNum=None,
-                   varColumn=None, majorOrdGrpAttr=None) -> (str, str):
+                   varColumn=None, majorOrdGrpAttr=None, isToLog: bool = True) -> (str, str):
         """Returns: doNum(str), DO xml(str)
             majorOrdGrpAttr can be Transfer"""
         varFile, varSheet = VARIABLE_FILE, 'DO'
         varColumn = varColumn if varColumn is not None else 'DC-NAPA-89'
         if doNum is None:
-            doNum = DBLib().getNewDONum()
+            doNum = DBLib.get().getNewDONum()
         # majorOrdGrpAttr = str(majorOrdGrpAttr) if majorOrdGrpAttr is not None else ''
         final_xml_lines = str()
         shipVia = '' if shipVia is None else shipVia
@@ -75,16 +75,17 @@ class XMLBuilder:
             assert False, 'Variable file not provided'
         else:
             for i in range(0, len(items_list)):
-                final_xml_lines = final_xml_lines + tags_doxml.LINE.replace('#DO_LINE#', str(i + 1)) \
-                    .replace('#ITEM_NAME#', items_list[i]).replace('#ITEM_QTY#', str(qtys_list[i]))
+                final_xml_lines = final_xml_lines + DataGeneric.replace_user(tags_doxml.LINE, {
+                    'DO_LINE': i + 1, 'ITEM_NAME': items_list[i], 'ITEM_QTY': qtys_list[i]})
 
         if final_xml_lines == '':
             assert False, 'Xml for lines didnt create'
         else:
             final_xml = tags_doxml.XML_START + '\n' \
-                        + tags_doxml.HEADER.replace('#MSG_TYPE#', MSG_TYPE).replace('#REF_NUM#', doNum) + '\n' \
-                        + tags_doxml.MSG_DO_START.replace('#DO_NUM#', doNum).replace('#ORDER_TYPE#', doType) \
-                        .replace('#ORIG_FACILITY_ALIAS_ID#', origFacilityAliasId).replace('#SHIP_VIA#', shipVia) \
+                        + DataGeneric.replace_user(tags_doxml.HEADER, {'MSG_TYPE': MSG_TYPE, 'REF_NUM': doNum}) + '\n' \
+                        + DataGeneric.replace_user(tags_doxml.MSG_DO_START, {
+                            'DO_NUM': doNum, 'ORDER_TYPE': doType, 'ORIG_FACILITY_ALIAS_ID': origFacilityAliasId,
+                            'SHIP_VIA': shipVia}) \
                         + '\n' + final_xml_lines + '\n' + tags_doxml.XML_END
             final_xml = DataGeneric.replace_dyn(final_xml)
         final_xml = XMLUtil.format_xml(final_xml)
@@ -95,26 +96,29 @@ class XMLBuilder:
         dcCntrNbr = varFileData['DEST_FACILITY_ID']
         refField10 = cls._decide_doXml_refField10()
         majorOrdGrpAttr = cls._decide_doXml_majorOrderGrpAttr(doType=doType, dcCntrNbr=dcCntrNbr, refField10=refField10, providedVal=majorOrdGrpAttr)
-        final_xml = final_xml.replace('#MAJOR_ORD_GRP_ATTR#', majorOrdGrpAttr).replace('#REF_FIELD_10#', refField10)
+        final_xml = DataGeneric.replace_user(final_xml, {'MAJOR_ORD_GRP_ATTR': majorOrdGrpAttr, 'REF_FIELD_10': refField10},
+                                             isTemplate=False)
 
         '''Export xml to file'''
         # threadId = str(threading.current_thread().native_id)
         # xmlFilePath = os.path.join(RUNTIME_DIR, threadId + '_doxml_' + Commons.build_date_forfilename() + '.xml')
         # FileUtil.write_file(xmlFilePath, final_xml)
         # printit('DO xml path:' + xmlFilePath)
-        printit('DO xml:', final_xml)
+        if isToLog:
+            printit('DO xml:', final_xml)
 
         return doNum, final_xml
 
     @classmethod
     def buildLpnLevelASNXml(cls, poNum: list[str], items: list[list[str]], qtys: list[list[int]],
-                            poLineNums: list[list[int]], lpns: list[str] = None, asnNum=None, varColumn=None) -> (str, str):
+                            poLineNums: list[list[int]], lpns: list[str] = None, asnNum=None, varColumn=None,
+                            isToLog: bool = True) -> (str, str):
         """Returns: asnNum(str), ASN xml(str)"""
         varFile, varSheet = VARIABLE_FILE, 'PO'
         if varColumn is None:
             varColumn = 'DUMMY'
         if asnNum is None:
-            asnNum = DBLib().getNewASNNum()
+            asnNum = DBLib.get().getNewASNNum()
         MSG_TYPE = ENV_CONFIG.get('data', 'asn_xml_message_type')
         destFacilityAliasId = ENV_CONFIG.get('facility', 'facility_alias_id')
 
@@ -140,24 +144,23 @@ class XMLBuilder:
                 #         .replace('#PO_LINE_NUM#', str(poLineNums_list[i]))
                 # else:
                 for j in range(0, len(items_list[i])):  # 1 item per lpn or list of items per lpn
-                    final_lines_per_lpn = final_lines_per_lpn + '\n' + tags_lpnlevel_asnxml.XML_LPN_DETAIL \
-                        .replace('#ITEM_NAME#', items_list[i][j]).replace('#ITEM_QTY#', str(qtys_list[i][j])) \
-                        .replace('#PO_NUM#', poNum[i]).replace('#LINE_NUM#', str(j + 1)) \
-                        .replace('#PO_LINE_NUM#', str(poLineNums_list[i][j]))
-                final_xml_lpn = final_xml_lpn + tags_lpnlevel_asnxml.XML_LPN.replace('#LPN_ID#', lpns_list[i]) \
-                    .replace('#DEST_FACILITY_ALIAS_ID#', destFacilityAliasId) \
-                    .replace('#CURR_FACILITY_ALIAS_ID#', destFacilityAliasId) \
-                    .replace('#PO_NUM#',
-                             poNum[i]) + '\n' + final_lines_per_lpn + '\n' + tags_lpnlevel_asnxml.XML_LPN_END
+                    final_lines_per_lpn = final_lines_per_lpn + '\n' + DataGeneric.replace_user(
+                        tags_lpnlevel_asnxml.XML_LPN_DETAIL, {
+                            'ITEM_NAME': items_list[i][j], 'ITEM_QTY': qtys_list[i][j], 'PO_NUM': poNum[i],
+                            'LINE_NUM': j + 1, 'PO_LINE_NUM': poLineNums_list[i][j]})
+                final_xml_lpn = final_xml_lpn + DataGeneric.replace_user(tags_lpnlevel_asnxml.XML_LPN, {
+                    'LPN_ID': lpns_list[i], 'DEST_FACILITY_ALIAS_ID': destFacilityAliasId,
+                    'CURR_FACILITY_ALIAS_ID': destFacilityAliasId, 'PO_NUM': poNum[i]}) \
+                    + '\n' + final_lines_per_lpn + '\n' + tags_lpnlevel_asnxml.XML_LPN_END
                 final_all_lpns = final_all_lpns + '\n' + final_xml_lpn
 
         if final_all_lpns == "":
             assert False, 'Xml for lpn didnt create'
         else:
             final_xml = tags_lpnlevel_asnxml.XML_START + '\n' \
-                        + tags_lpnlevel_asnxml.XML_HEADER.replace('#MSG_TYPE#', MSG_TYPE) + '\n' \
-                        + tags_lpnlevel_asnxml.XML_MESSAGE.replace('#ASN_ID#', asnNum) \
-                            .replace('#DEST_FACILITY_ALIAS_ID#', destFacilityAliasId) + '\n' \
+                        + DataGeneric.replace_user(tags_lpnlevel_asnxml.XML_HEADER, {'MSG_TYPE': MSG_TYPE}) + '\n' \
+                        + DataGeneric.replace_user(tags_lpnlevel_asnxml.XML_MESSAGE, {
+                            'ASN_ID': asnNum, 'DEST_FACILITY_ALIAS_ID': destFacilityAliasId}) + '\n' \
                         + final_all_lpns + '\n' + tags_lpnlevel_asnxml.XML_END
             final_xml = DataGeneric.replace_dyn(final_xml)
         final_xml = XMLUtil.format_xml(final_xml)
@@ -171,19 +174,20 @@ class XMLBuilder:
         #                            threadId + '_lpnlvl_asnxml_' + Commons.build_date_forfilename() + '.xml')
         # FileUtil.write_file(xmlFilePath, final_xml)
         # printit('Lpn level ASN xml path:' + xmlFilePath)
-        printit('Lpn level ASN xml:', final_xml)
+        if isToLog:
+            printit('Lpn level ASN xml:', final_xml)
 
         return asnNum, final_xml
 
     @classmethod
     def buildSkuLevelASNXml(cls, poNums: Union[str, list], items: Union[str, list], qtys: Union[int, list],
-                            poLineNums: Union[int, list], asnNum=None, varColumn=None) -> (str, str):
+                            poLineNums: Union[int, list], asnNum=None, varColumn=None, isToLog: bool = True) -> (str, str):
         """Returns: asnNum(str), ASN xml (str)"""
         varFile, varSheet = VARIABLE_FILE, 'PO'
         if varColumn is None:
             varColumn = 'DUMMY'
         if asnNum is None:
-            asnNum = DBLib().getNewASNNum()
+            asnNum = DBLib.get().getNewASNNum()
         final_xml_lines = str()
         MSG_TYPE = ENV_CONFIG.get('data', 'asn_xml_message_type')
         destFacilityAliasId = ENV_CONFIG.get('facility', 'facility_alias_id')
@@ -206,18 +210,17 @@ class XMLBuilder:
             assert False, 'Variable file not provided'
         else:
             for i in range(0, len(items_list)):
-                final_xml_lines = final_xml_lines + tags_skulevel_asnxml.XML_ASN_DETAIL \
-                    .replace('#ITEM_NAME#', items_list[i]).replace('#ITEM_QTY#', str(qtys_list[i])) \
-                    .replace('#SEQ_NUM#', str(i + 1)).replace('#PO_NUM#', pos_list[i]) \
-                    .replace('#PO_LINE_NUM#', str(poLineNums_list[i]))
+                final_xml_lines = final_xml_lines + DataGeneric.replace_user(tags_skulevel_asnxml.XML_ASN_DETAIL, {
+                    'ITEM_NAME': items_list[i], 'ITEM_QTY': qtys_list[i], 'SEQ_NUM': i + 1, 'PO_NUM': pos_list[i],
+                    'PO_LINE_NUM': poLineNums_list[i]})
 
         if final_xml_lines == "":
             assert False, 'Xml for lines didnt create'
         else:
             final_xml = tags_skulevel_asnxml.XML_START + '\n' \
-                        + tags_skulevel_asnxml.XML_HEADER.replace('#MSG_TYPE#', MSG_TYPE) + '\n' \
-                        + tags_skulevel_asnxml.XML_MESSAGE.replace('#ASN_ID#', asnNum) \
-                            .replace('#DEST_FACILITY_ALIAS_ID#', destFacilityAliasId) + '\n' \
+                        + DataGeneric.replace_user(tags_skulevel_asnxml.XML_HEADER, {'MSG_TYPE': MSG_TYPE}) + '\n' \
+                        + DataGeneric.replace_user(tags_skulevel_asnxml.XML_MESSAGE, {
+                            'ASN_ID': asnNum, 'DEST_FACILITY_ALIAS_ID': destFacilityAliasId}) + '\n' \
                         + final_xml_lines + '\n' + tags_skulevel_asnxml.XML_END
             final_xml = DataGeneric.replace_dyn(final_xml)
         final_xml = XMLUtil.format_xml(final_xml)
@@ -231,18 +234,20 @@ class XMLBuilder:
         #                            threadId + '_skulvl_asnxml_' + Commons.build_date_forfilename() + '.xml')
         # FileUtil.write_file(xmlFilePath, final_xml)
         # printit('Sku level ASN xml path:' + xmlFilePath)
-        printit('Sku level ASN xml:', final_xml)
+        if isToLog:
+            printit('Sku level ASN xml:', final_xml)
 
         return asnNum, final_xml
 
     @classmethod
-    def buildPOXml(cls, items: Union[str, list], qtys: Union[int, list], poNum=None, varColumn=None) -> (str, dict):
+    def buildPOXml(cls, items: Union[str, list], qtys: Union[int, list], poNum=None, varColumn=None,
+                   isToLog: bool = True) -> (str, dict):
         """Returns: poNum(str), PO xml (str)"""
         varFile, varSheet = VARIABLE_FILE, 'PO'
         if varColumn is None:
             varColumn = 'DUMMY'
         if poNum is None:
-            poNum = DBLib().getNewPONum()
+            poNum = DBLib.get().getNewPONum()
         final_xml_lines = str()
         MSG_TYPE = ENV_CONFIG.get('data', 'po_xml_message_type')
         destFacilityAliasId = ENV_CONFIG.get('facility', 'facility_alias_id')
@@ -256,16 +261,16 @@ class XMLBuilder:
             assert False, 'Variable file not provided'
         else:
             for i in range(0, len(items_list)):
-                final_xml_lines = final_xml_lines + tags_poxml.LINE.replace('#PO_LINE#', str(i + 1)) \
-                    .replace('#ITEM_NAME#', items_list[i]).replace('#ITEM_QTY#', str(qtys_list[i]))
+                final_xml_lines = final_xml_lines + DataGeneric.replace_user(tags_poxml.LINE, {
+                    'PO_LINE': i + 1, 'ITEM_NAME': items_list[i], 'ITEM_QTY': qtys_list[i]})
 
         if final_xml_lines == '':
             assert False, 'Xml for lines didnt create'
         else:
             final_xml = tags_poxml.XML_START + '\n' \
-                        + tags_poxml.HEADER.replace('#MSG_TYPE#', MSG_TYPE) + '\n' \
-                        + tags_poxml.MSG_PO_START.replace('#PO_NUM#', poNum) \
-                            .replace('#DEST_FACILITY_ALIAS_ID#', destFacilityAliasId) + '\n' + final_xml_lines \
+                        + DataGeneric.replace_user(tags_poxml.HEADER, {'MSG_TYPE': MSG_TYPE}) + '\n' \
+                        + DataGeneric.replace_user(tags_poxml.MSG_PO_START, {
+                            'PO_NUM': poNum, 'DEST_FACILITY_ALIAS_ID': destFacilityAliasId}) + '\n' + final_xml_lines \
                         + '\n' + tags_poxml.XML_END
             final_xml = DataGeneric.replace_dyn(final_xml)
         final_xml = XMLUtil.format_xml(final_xml)
@@ -278,19 +283,20 @@ class XMLBuilder:
         # xmlFilePath = os.path.join(RUNTIME_DIR, threadId + '_poxml_' + Commons.build_date_forfilename() + '.xml')
         # FileUtil.write_file(xmlFilePath, final_xml)
         # printit('PO xml path:' + xmlFilePath)
-        printit('PO xml:', final_xml)
+        if isToLog:
+            printit('PO xml:', final_xml)
 
         return poNum, final_xml
 
     @classmethod
     def buildLPNXml(cls, items: Union[str, list], qtys: Union[int, list], isLpnLock: bool = None,
-                    lpnId=None, varColumn=None) -> (str, dict):
+                    lpnId=None, varColumn=None, isToLog: bool = True) -> (str, dict):
         """Returns: """
         varFile, varSheet = VARIABLE_FILE, 'LPN'
         if varColumn is None:
             varColumn = 'DUMMY'
         if lpnId is None:
-            lpnId = DBLib().getNewILPNNum()
+            lpnId = DBLib.get().getNewILPNNum()
         final_xml_lines = str()
         MSG_TYPE = ENV_CONFIG.get('data', 'lpn_xml_message_type')
         destFacilityAliasId = ENV_CONFIG.get('facility', 'facility_alias_id')
@@ -304,16 +310,16 @@ class XMLBuilder:
             assert False, 'Variable file not provided'
         else:
             if len(items_list) == 1:
-                final_xml_lines = final_xml_lines + tags_lpnxml.MSG_LPN_START.replace('#LPN_ID#', lpnId) \
-                    .replace('#IS_SINGLE_SKU#', 'Y').replace('#DEST_FACILITY_ALIAS_ID#', destFacilityAliasId) \
-                                  + tags_lpnxml.LPN_DETAIL.replace('#ITEM_NAME#', items_list[0]) \
-                                      .replace('#ITEM_QTY#', str(qtys_list[0]))
+                final_xml_lines = final_xml_lines + DataGeneric.replace_user(tags_lpnxml.MSG_LPN_START, {
+                    'LPN_ID': lpnId, 'IS_SINGLE_SKU': 'Y', 'DEST_FACILITY_ALIAS_ID': destFacilityAliasId}) \
+                                  + DataGeneric.replace_user(tags_lpnxml.LPN_DETAIL, {
+                                      'ITEM_NAME': items_list[0], 'ITEM_QTY': qtys_list[0]})
             else:
-                final_xml_lines = final_xml_lines + tags_lpnxml.MSG_LPN_START.replace('#LPN_ID#', lpnId) \
-                    .replace('#IS_SINGLE_SKU#', 'N').replace('#DEST_FACILITY_ALIAS_ID#', destFacilityAliasId)
+                final_xml_lines = final_xml_lines + DataGeneric.replace_user(tags_lpnxml.MSG_LPN_START, {
+                    'LPN_ID': lpnId, 'IS_SINGLE_SKU': 'N', 'DEST_FACILITY_ALIAS_ID': destFacilityAliasId})
                 for i in range(0, len(items_list)):
-                    final_xml_lines = final_xml_lines + tags_lpnxml.LPN_DETAIL \
-                        .replace('#ITEM_NAME#', items_list[i]).replace('#ITEM_QTY#', str(qtys_list[i]))
+                    final_xml_lines = final_xml_lines + DataGeneric.replace_user(tags_lpnxml.LPN_DETAIL, {
+                        'ITEM_NAME': items_list[i], 'ITEM_QTY': qtys_list[i]})
         if isLpnLock:
             final_xml_lines = final_xml_lines + tags_lpnxml.LPN_LOCK
 
@@ -321,7 +327,7 @@ class XMLBuilder:
             assert False, 'Xml for lines didnt create'
         else:
             final_xml = tags_lpnxml.XML_START + '\n' \
-                        + tags_lpnxml.HEADER.replace('#MSG_TYPE#', MSG_TYPE)\
+                        + DataGeneric.replace_user(tags_lpnxml.HEADER, {'MSG_TYPE': MSG_TYPE})\
                         + '\n' + final_xml_lines \
                         + '\n' + tags_lpnxml.XML_END
             final_xml = DataGeneric.replace_dyn(final_xml)
@@ -335,6 +341,53 @@ class XMLBuilder:
         # xmlFilePath = os.path.join(RUNTIME_DIR, threadId + '_lpnxml_' + Commons.build_date_forfilename() + '.xml')
         # FileUtil.write_file(xmlFilePath, final_xml)
         # printit('LPN xml path:' + xmlFilePath)
-        printit('LPN xml:', final_xml)
+        if isToLog:
+            printit('LPN xml:', final_xml)
 
         return lpnId, final_xml
+
+    @classmethod
+    def writeBulkXmls(cls, buildFunc, specs: Iterable[dict], outFilePath: str = None, outStream=None,
+                      msgsPerEnvelope: int = None) -> (list[str], list[str]):
+        """Builds an xml per spec (kwargs of buildFunc, eg XMLBuilder.buildDOXml) and streams its messages
+        into multi message envelopes, specs can be a generator (memory stays flat).
+        outFilePath: 1 file per envelope (<name>_<envelope no.><ext> when msgsPerEnvelope is provided)
+        outStream: all the messages are written in 1 envelope (1 xml document) to the stream (eg socket.makefile('wb'))
+        msgsPerEnvelope: None writes all the messages in 1 envelope, only for outFilePath
+        Returns: doc nums (str), written file paths
+        """
+        assert outFilePath is not None or outStream is not None, 'Out file path or stream not provided'
+        assert outStream is None or msgsPerEnvelope is None, 'msgsPerEnvelope not supported for out stream'
+        docNums, filePaths = [], []
+        writer, outFile = None, None
+
+        def _closeEnvelope():
+            writer.close()
+            if outFile is not None:
+                outFile.close()
+
+        try:
+            for spec in specs:
+                if writer is None:
+                    if outStream is None:
+                        filePath = outFilePath
+                        if msgsPerEnvelope is not None:
+                            fileName, fileExt = os.path.splitext(outFilePath)
+                            filePath = f"{fileName}_{len(filePaths) + 1}{fileExt}"
+                        outFile = open(filePath, 'wb')
+                        filePaths.append(filePath)
+                    writer = XMLEnvelopeWriter(outFile if outStream is None else outStream)
+
+                docNum, xml = buildFunc(**spec, isToLog=False)
+                writer.add_xml(xml)
+                docNums.append(docNum)
+
+                if msgsPerEnvelope is not None and writer.msgCount >= msgsPerEnvelope:
+                    _closeEnvelope()
+                    writer, outFile = None, None
+        finally:
+            if writer is not None:
+                _closeEnvelope()
+
+        printit(f"Bulk xmls built: {len(docNums)} by {buildFunc.__name__}, files {filePaths}")
+        return docNums, filePaths
@@ -0,0 +1,160 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from apps.wms.app_db_lib import DBLib
+from core.config_service import ENV_CONFIG
+from core.db_service import DBService
+from core.file_service import DataHandler
+from core.log_service import Logging, printit
+
+
+class XMLPoster:
+    """Posts WM xmls without the Post Message UI, channel from xml_post_channel in env_config [api]
+        ui (default): WMPostMsgPage types the xml in the UI
+        http: posts to xml_post_url (basic auth by xml_post_user/xml_post_pwd_encrypted if set)
+        db: inserts into cl_message (xml_post_event_id) and queues it in cl_endpoint_queue (xml_post_endpoint_id)
+    """
+    logger = Logging.get(__qualname__)
+
+    _HTTP_SESSIONS = {}  # Pair of thread id and requests session (keep-alive per thread)
+
+    @staticmethod
+    def _getChannel() -> str:
+        return ENV_CONFIG.get('api', 'xml_post_channel', fallback='ui').strip().lower()
+
+    @classmethod
+    def isUIChannel(cls) -> bool:
+        return cls._getChannel() not in ('http', 'db')
+
+    @classmethod
+    def post(cls, xml: str) -> str:
+        """Posts 1 xml by http/db channel, returns the response (http) or cl_message msg_id (db)
+        """
+        channel = cls._getChannel()
+        assert channel in ('http', 'db'), f"Xml post channel {channel} is not a non UI channel"
+        return cls._postByHttp(xml) if channel == 'http' else cls._postByDB(xml)
+
+    @classmethod
+    def postBatch(cls, xmls: list[str]) -> list[str]:
+        """Posts the xmls concurrently (xml_post_max_workers), returns responses in the same order.
+        Db sessions are released after each post, http sessions of the workers are closed when the batch ends
+        """
+        maxWorkers = int(ENV_CONFIG.get('api', 'xml_post_max_workers', fallback='4'))
+        printit(f"Posting {len(xmls)} xmls by {cls._getChannel()} with {maxWorkers} workers")
+        workerIds = set()
+
+        def postFunc(xml: str) -> str:
+            workerIds.add(threading.current_thread().native_id)
+            try:
+                return cls.post(xml)
+            finally:
+                if cls._getChannel() == 'db':
+                    DBLib.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(xmls)))) as executor:
+                return list(executor.map(postFunc, xmls))
+        finally:
+            for workerId in workerIds:
+                session = cls._HTTP_SESSIONS.pop(workerId, None)
+                if session is not None:
+                    session.close()
+
+    @classmethod
+    def _getHttpSession(cls) -> requests.Session:
+        thread_id = threading.current_thread().native_id
+        session = cls._HTTP_SESSIONS.get(thread_id)
+        if session is None:
+            session = requests.Session()
+            session.headers['Content-Type'] = 'application/xml'
+            user = ENV_CONFIG.get('api', 'xml_post_user', fallback='')
+            if user != '':
+                session.auth = (user, DataHandler.decrypt_it(ENV_CONFIG.get('api', 'xml_post_pwd_encrypted')))
+            cls._HTTP_SESSIONS[thread_id] = session
+        return session
+
+    @classmethod
+    def _postByHttp(cls, xml: str) -> str:
+        postUrl = ENV_CONFIG.get('api', 'xml_post_url')
+        timeoutInSec = float(ENV_CONFIG.get('api', 'xml_post_timeout_in_sec', fallback='60'))
+        printit(f"POST xml url {postUrl}", isToPrint=False)
+
+        resp = cls._getHttpSession().post(postUrl, data=xml.encode('utf-8'), timeout=timeoutInSec)
+        response = resp.text
+        assert resp.status_code == 200, f"Xml posting failed, status code {resp.status_code}, response {response}"
+        assert response.count('<Error_Type>0</Error_Type>') > 0, 'Xml posting response has error'
+        return response
+
+    @classmethod
+    def _postByDB(cls, xml: str) -> str:
+        eventId = ENV_CONFIG.get('api', 'xml_post_event_id')
+        endpointId = ENV_CONFIG.get('api', 'xml_post_endpoint_id')
+        schema = DBLib.get().schema
+
+        '''Xml is bound as CLOB (not inlined), large xmls exceed sql literal limit'''
+        with DBService.hold_conn(schema):
+            msgId = str(DBService.fetch_row("select cl_message_id_seq.nextval MSG_ID from dual", schema).get('MSG_ID'))
+            insertMsgQ = """insert into cl_message(version_id,msg_id,event_id,prty,encoding,when_created,source_id,source_uri
+                                ,data,created_dttm,last_updated_dttm)
+                            values (0,:msg_id,:event_id,9999,1,SYSDATE,null,null
+                                ,:data,SYSDATE,SYSDATE)"""
+            isExecuted = DBService.update_db(insertMsgQ, schema, bind_var={'msg_id': msgId, 'event_id': eventId, 'data': xml},
+                                             clob_binds=['data'])
+            assert isExecuted, 'Insert to cl_message didnt work'
+
+            insertQueueQ = """insert into cl_endpoint_queue (version_id,endpoint_queue_id,endpoint_id,msg_id,when_queued,status
+                                 ,prty,hold_until,error_count,error_cost,disposition,when_status_changed,log_id
+                                 ,target_id,target_uri,error_details)
+                             values (1,CL_ENDPOINT_QUEUE_SEQ.NEXTVAL,:endpoint_id,:msg_id,SYSDATE,2
+                                 ,0,null,0,0,0,SYSDATE,null
+                                 ,null,null,null)"""
+            isExecuted = DBService.update_db(insertQueueQ, schema, bind_var={'endpoint_id': endpointId, 'msg_id': msgId})
+            assert isExecuted, 'Insert to cl_endpoint_queue didnt work'
+
+        printit(f"Xml queued with msg_id {msgId}")
+        return msgId
+
+
+class XMLPostStubServer:
+    """Local stand-in of the WM xml post endpoint for tests (xml_post_channel=http, xml_post_url=stub url).
+    Records the posted xmls and answers with an Error_Type 0 response (or respFunc(posted xml))
+    """
+
+    _OK_RESPONSE = '<Response><Error_Type>0</Error_Type><Resp_Code>0</Resp_Code></Response>'
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, respFunc=None):
+        self.postedXmls = []
+        self._respFunc = respFunc
+        self._lock = threading.Lock()
+        stubServer = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8')
+                with stubServer._lock:
+                    stubServer.postedXmls.append(body)
+                response = stubServer._OK_RESPONSE if stubServer._respFunc is None else stubServer._respFunc(body)
+                respBytes = response.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/xml')
+                self.send_header('Content-Length', str(len(respBytes)))
+                self.end_headers()
+                self.wfile.write(respBytes)
+
+            def log_message(self, format, *args):
+                printit('Xml stub server ' + format % args, isToPrint=False)
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self.url = f"http://{host}:{self._server.server_address[1]}/xml"
+
+    def start(self) -> 'XMLPostStubServer':
+        threading.Thread(target=self._server.serve_forever, daemon=True, name='xml-post-stub').start()
+        printit(f"Xml stub server started at {self.url}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -61,14 +61,14 @@ class WMASNPage(WMBasePage):
         self.click_by_xpath(self._CONFIRM_CANCEL_ASN)
 
         # Validate ASN Updates : ASN status must be 60(Canceled)
-        DBLib().assertWaitASNStatus(i_asn=asnNum, o_status=ASNStat.CANCELED.value)
+        DBLib.get().assertWaitASNStatus(i_asn=asnNum, o_status=ASNStat.CANCELED.value)
 
         # Validate PO Updates : PO status must be 20(Created)
-        DBLib().assertPOHdr(i_po=o_po, o_status=POStat.CREATED)
+        DBLib.get().assertPOHdr(i_po=o_po, o_status=POStat.CREATED)
 
         # Validate PO Line Updates : Each PO Line Item must be updated to 20(Created) with Shipped Qty as 0
         for i in range(len(o_item)):
-            DBLib().assertPODtls(i_po=o_po, i_itemBrcd=o_item[i], o_dtlStatus=20, o_shippedQty=0)
+            DBLib.get().assertPODtls(i_po=o_po, i_itemBrcd=o_item[i], o_dtlStatus=20, o_shippedQty=0)
 
     def verifyASN(self, asnNum, isShowOverrideWarn: bool = None):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
@@ -87,7 +87,7 @@ class WMASNPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertASNHdr(i_asn=asnNum, o_status=ASNStat.RECEIVING_VERIFIED.value)
+        DBLib.get().assertASNHdr(i_asn=asnNum, o_status=ASNStat.RECEIVING_VERIFIED.value)
 
     def editLinesInASN(self, asnNum: str, newQty: int, o_po: str, o_item: str):
         """"""
@@ -110,5 +110,5 @@ class WMASNPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertASNHdr(i_asn=asnNum, o_status=ASNStat.IN_TRANSIT.value)
-        DBLib().assertASNDtls(i_asn=asnNum, i_po=o_po, i_itemBrcd=o_item, o_dtlStatus=4, o_shippedQty=newQty)
+        DBLib.get().assertASNHdr(i_asn=asnNum, o_status=ASNStat.IN_TRANSIT.value)
+        DBLib.get().assertASNDtls(i_asn=asnNum, i_po=o_po, i_itemBrcd=o_item, o_dtlStatus=4, o_shippedQty=newQty)
@@ -19,7 +19,6 @@ class WMBasePage(UIService):
     _CLOSE_PAGE_BTN = "(//*[@class='x-tool-img x-tool-close'])[2]"
 
     def __init__(self, driver, page_title_xpath):
-        self.wait_for(1)
         super().__init__(driver, page_title_xpath)
 
     def maximizeMenuPage(self):
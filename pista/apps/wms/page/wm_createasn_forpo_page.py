@@ -95,7 +95,7 @@ class WMCreateASNForPOPage(WMBasePage):
         for p in po:
             self.click_by_xpath(self._CHECKBOX_FOR_PO.replace('#PO_NUM#', p), True)
         if asn is None:
-            asn = DBLib().getNewASNNum()
+            asn = DBLib.get().getNewASNNum()
         self._generateASNNum(asn)
         self.click_by_xpath(self._CHECKBOX_FOR_ASN.replace('#ASN_NO#', str(asn)))
         self.click_by_xpath(self._MOVE_RIGHT_ARROW_ASSIGN_BTN)
@@ -105,17 +105,17 @@ class WMCreateASNForPOPage(WMBasePage):
 
         '''Validation'''
         isOnly1PO = all(element == po[0] for element in po)
-        DBLib().assertWaitASNRecord(i_asn=asn)
-        DBLib().assertASNHdr(i_asn=asn, o_status=20)
+        DBLib.get().assertWaitASNRecord(i_asn=asn)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=20)
         if o_isFullPoShip and isOnly1PO:
-            DBLib().assertPOHdr(i_po=po[0], o_status=POStat.SHIPPED)
+            DBLib.get().assertPOHdr(i_po=po[0], o_status=POStat.SHIPPED)
         for i in range(len(o_item)):
-            DBLib().assertASNDtls(i_asn=asn, i_po=po[0], i_itemBrcd=o_item[i], o_dtlStatus=4,
-                                  o_shippedQty=o_qty[i])
-            DBLib().assertPODtls(i_po=po[0], i_itemBrcd=o_item[i], o_dtlStatus=850, o_origQty=o_qty[i],
-                                 o_qty=o_qty[i])
+            DBLib.get().assertASNDtls(i_asn=asn, i_po=po[0], i_itemBrcd=o_item[i], o_dtlStatus=4,
+                                      o_shippedQty=o_qty[i])
+            DBLib.get().assertPODtls(i_po=po[0], i_itemBrcd=o_item[i], o_dtlStatus=850, o_origQty=o_qty[i],
+                                     o_qty=o_qty[i])
             if o_isFullPoShip and not isOnly1PO:
-                DBLib().assertPOHdr(i_po=po[0], o_status=POStat.SHIPPED)
+                DBLib.get().assertPOHdr(i_po=po[0], o_status=POStat.SHIPPED)
 
         return asn
 
@@ -139,15 +139,15 @@ class WMCreateASNForPOPage(WMBasePage):
             self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
+        DBLib.get().assertASNHdr(i_asn=asn, o_status=o_asnStatus)
         if isASNVerified:
             for i in range(len(po)):
-                DBLib().assertPONotOnASN(i_asn=asn, i_po=po[i])
+                DBLib.get().assertPONotOnASN(i_asn=asn, i_po=po[i])
         else:
             for i in range(len(o_item)):
-                DBLib().assertASNDtls(i_asn=asn, i_po=po[i], i_itemBrcd=o_item[i], o_dtlStatus=4, o_shippedQty=o_qty[i])
-                DBLib().assertPODtls(i_po=po[0], i_itemBrcd=o_item[i], o_dtlStatus=850, o_origQty=o_qty[i], o_qty=o_qty[i])
-            DBLib().assertPOHdr(i_po=po[0], o_status=POStat.SHIPPED)
+                DBLib.get().assertASNDtls(i_asn=asn, i_po=po[i], i_itemBrcd=o_item[i], o_dtlStatus=4, o_shippedQty=o_qty[i])
+                DBLib.get().assertPODtls(i_po=po[0], i_itemBrcd=o_item[i], o_dtlStatus=850, o_origQty=o_qty[i], o_qty=o_qty[i])
+            DBLib.get().assertPOHdr(i_po=po[0], o_status=POStat.SHIPPED)
 
     def _filterByASN(self, ASN: str, isASNVerified: bool = None):
         self.fill_by_xpath(self._ASN_SEARCH_INPUT, ASN)
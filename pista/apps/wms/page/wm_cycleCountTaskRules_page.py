@@ -30,7 +30,7 @@ class WMCycleCountTaskRules(WMBasePage):
         """
         rules = None
         try:
-            rules = DBLib()._presetCCTaskRuleForLocn(taskCriteria='CycleCount', ruleName='AUTOMATION', locnBrcd=locnBrcd)
+            rules = DBLib.get()._presetCCTaskRuleForLocn(taskCriteria='CycleCount', ruleName='AUTOMATION', locnBrcd=locnBrcd)
 
             self.click_by_xpath(self._REFRESH_BTN)
 
@@ -46,12 +46,12 @@ class WMCycleCountTaskRules(WMBasePage):
                 for i in rules:
                     ruleId = i.get('RULE_ID')
                     statCode = i.get('STAT_CODE')
-                    DBLib()._presetWMRuleStatus(ruleId=ruleId, statCode=statCode)
+                    DBLib.get()._presetWMRuleStatus(ruleId=ruleId, statCode=statCode)
 
-        dbRow = DBLib().getCCTask(i_locnBrcd=locnBrcd, i_intType=100, i_currTaskPrty=50)
+        dbRow = DBLib.get().getCCTask(i_locnBrcd=locnBrcd, i_intType=100, i_currTaskPrty=50)
         taskId = dbRow.get('TASK_ID')
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, i_currTaskPrty=50, o_intType=100, o_status=TaskHdrStat.RELEASED)
+        DBLib.get().assertTaskHdr(i_task=taskId, i_currTaskPrty=50, o_intType=100, o_status=TaskHdrStat.RELEASED)
 
         return taskId
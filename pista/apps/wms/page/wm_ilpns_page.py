@@ -62,7 +62,7 @@ class WMILpnsPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY)
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=LPNFacStat.ILPN_PUTAWAY)
 
     def adjustILPN(self, ilpn:str, newQty:int=None, itemBrcd:str=None, isWarnMsgShow:bool=None,
                    o_lpnFacStat:LPNFacStat=None, o_reasonCode:str=None):
@@ -86,10 +86,10 @@ class WMILpnsPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_lpnFacStat)
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_lpnFacStat)
         if not isWarnMsgShow:
-            DBLib().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=itemBrcd, o_qty=newQty)
-            DBLib().assertPix(i_caseNbr=ilpn, i_tranType='300', i_itemBrcd=itemBrcd)
+            DBLib.get().assertLPNDtls(i_lpn=ilpn, i_itemBrcd=itemBrcd, o_qty=newQty)
+            DBLib.get().assertPix(i_caseNbr=ilpn, i_tranType='300', i_itemBrcd=itemBrcd)
 
     # def allocateILPN(self,ilpn:str):
     #     self.filterByILPN(ilpn=ilpn)
@@ -111,10 +111,10 @@ class WMILpnsPage(WMBasePage):
         self.click_by_xpath(self._LOCK_UNLOCK_SAVE_BTN)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_facStat)
-        DBLib().assertLpnLockPresent(i_lpn=ilpn, i_lockCode=lockCode)
-        DBLib().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='300', i_tranCode='01', i_invnAdjType='S')
-        DBLib().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='606', i_tranCode='02', i_invnAdjType='A')
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_facStat)
+        DBLib.get().assertLpnLockPresent(i_lpn=ilpn, i_lockCode=lockCode)
+        DBLib.get().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='300', i_tranCode='01', i_invnAdjType='S')
+        DBLib.get().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='606', i_tranCode='02', i_invnAdjType='A')
 
     def unLockiLPN(self, ilpn: str, lockCode: str, o_item: str, o_facStat: LPNFacStat):
         """"""
@@ -128,8 +128,8 @@ class WMILpnsPage(WMBasePage):
         self.click_by_xpath(self._LOCK_UNLOCK_SAVE_BTN)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_facStat)
-        DBLib().assertNoInvLockForLpn(i_lpn=ilpn, i_lockCode=lockCode)
-        DBLib().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='300', i_tranCode='01', i_invnAdjType='A')
-        DBLib().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='606', i_tranCode='02', i_invnAdjType='S')
+        DBLib.get().assertLPNHdr(i_lpn=ilpn, o_facStatus=o_facStat)
+        DBLib.get().assertNoInvLockForLpn(i_lpn=ilpn, i_lockCode=lockCode)
+        DBLib.get().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='300', i_tranCode='01', i_invnAdjType='A')
+        DBLib.get().assertPix(i_itemBrcd=o_item, i_caseNbr=ilpn, i_tranType='606', i_tranCode='02', i_invnAdjType='S')
         
\ No newline at end of file
@@ -31,8 +31,8 @@ class WMLeanTimeReplenishmentPage(WMBasePage):
     def createReplenByLocn(self, fromLocn: str, toLocn: str, o_iLpns: list[str] = None, o_items: list[str] = None,
                            o_replenLocns: list[str] = None):
         """"""
-        DBLib()._assertLeanTimeReplenRuleExist(ruleDesc='AUTOMATION')
-        DBLib()._presetLTRRuleWithLocnRange(fromLocn=fromLocn, toLocn=toLocn)
+        DBLib.get()._assertLeanTimeReplenRuleExist(ruleDesc='AUTOMATION')
+        DBLib.get()._presetLTRRuleWithLocnRange(fromLocn=fromLocn, toLocn=toLocn)
 
         self.switch_frame(0)
         self.click_by_xpath(self._COLLAPSE_BTN)
@@ -48,19 +48,19 @@ class WMLeanTimeReplenishmentPage(WMBasePage):
 
         '''Validation'''
         # self.wait_for(15)
-        DBLib().assertWaitForTask(i_cntrNbr=o_iLpns[0], i_itemBrcd=o_items[0], i_intType=1, i_destLocn=o_replenLocns[0], i_taskPrty=70)
+        DBLib.get().assertWaitForTask(i_cntrNbr=o_iLpns[0], i_itemBrcd=o_items[0], i_intType=1, i_destLocn=o_replenLocns[0], i_taskPrty=70)
         for i in range(len(o_replenLocns)):
-            DBLib().assertTaskDtls(i_itemBrcd=o_items[i], i_cntrNbr=o_iLpns[i], i_intType=1,
-                                   i_destLocn=o_replenLocns[i], o_statCode=TaskDtlStat.UNASSIGNED, o_taskPriority=70)
+            DBLib.get().assertTaskDtls(i_itemBrcd=o_items[i], i_cntrNbr=o_iLpns[i], i_intType=1,
+                                       i_destLocn=o_replenLocns[i], o_statCode=TaskDtlStat.UNASSIGNED, o_taskPriority=70)
 
     def createReplenByItem(self, itemBrcd:str, isActvPerAboveConfigPer:bool=None, o_iLpns:list[str]=None, o_replenLocns:list[str]=None,
                            isAssertNoTask:bool=None):
         """"""
-        actvUnitsPer = int(DBLib().getActvQtyPercent(item=itemBrcd))
+        actvUnitsPer = int(DBLib.get().getActvQtyPercent(item=itemBrcd))
         cutOffPer = (actvUnitsPer - 1) if isActvPerAboveConfigPer else (actvUnitsPer + 1)
 
-        DBLib()._assertLeanTimeReplenRuleExist(ruleDesc='AUTOMATION')
-        DBLib()._updateLTRRuleWithItem(itemBrcd=itemBrcd, cutOffPercent=cutOffPer)
+        DBLib.get()._assertLeanTimeReplenRuleExist(ruleDesc='AUTOMATION')
+        DBLib.get()._updateLTRRuleWithItem(itemBrcd=itemBrcd, cutOffPercent=cutOffPer)
 
         self.switch_frame(0)
         self.click_by_xpath(self._COLLAPSE_BTN)
@@ -77,9 +77,9 @@ class WMLeanTimeReplenishmentPage(WMBasePage):
         '''Validation'''
         # self.wait_for(15)
         if isAssertNoTask:
-            DBLib().assertNoTaskExist(i_cntrNbr=o_iLpns[0], i_itemBrcd=itemBrcd, i_intType=1, i_destLocn=o_replenLocns[0], i_taskPrty=70)
+            DBLib.get().assertNoTaskExist(i_cntrNbr=o_iLpns[0], i_itemBrcd=itemBrcd, i_intType=1, i_destLocn=o_replenLocns[0], i_taskPrty=70)
         else:
-            DBLib().assertWaitForTask(i_cntrNbr=o_iLpns[0], i_itemBrcd=itemBrcd, i_intType=1, i_destLocn=o_replenLocns[0], i_taskPrty=70)
+            DBLib.get().assertWaitForTask(i_cntrNbr=o_iLpns[0], i_itemBrcd=itemBrcd, i_intType=1, i_destLocn=o_replenLocns[0], i_taskPrty=70)
             for i in range(len(o_replenLocns)):
-                DBLib().assertTaskDtls(i_itemBrcd=itemBrcd, i_cntrNbr=o_iLpns[i], i_intType=1, i_destLocn=o_replenLocns[i],
-                                       o_statCode=TaskDtlStat.UNASSIGNED, o_taskPriority=70)
+                DBLib.get().assertTaskDtls(i_itemBrcd=itemBrcd, i_cntrNbr=o_iLpns[i], i_intType=1, i_destLocn=o_replenLocns[i],
+                                           o_statCode=TaskDtlStat.UNASSIGNED, o_taskPriority=70)
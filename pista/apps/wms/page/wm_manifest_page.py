@@ -48,9 +48,9 @@ class WMManifestPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertWaitManifestStatus(i_manifestId=manifestId, o_status=manifestStatus)
-        # DBLib().assertManifestStatus(i_wave=waveNum, i_order=order, o_manifestStatus=manifestStatus)
-        DBLib().assertWaitDOStatus(i_order=order, o_status=190)
-        # DBLib().assertDOHdr(i_order=order, o_status=190)
-        DBLib().assertLPNHdr(i_lpn=oLpn, o_facStatus=LPNFacStat.OLPN_SHIPPED)
-        DBLib().assertManifestEDIFile(i_manifestId=manifestId)
+        DBLib.get().assertWaitManifestAndDOStatus(i_manifestId=manifestId, o_manifestStatus=manifestStatus,
+                                                  i_order=order, o_doStatus=190)
+        # DBLib.get().assertManifestStatus(i_wave=waveNum, i_order=order, o_manifestStatus=manifestStatus)
+        # DBLib.get().assertDOHdr(i_order=order, o_status=190)
+        DBLib.get().assertLPNHdr(i_lpn=oLpn, o_facStatus=LPNFacStat.OLPN_SHIPPED)
+        DBLib.get().assertManifestEDIFile(i_manifestId=manifestId)
@@ -40,8 +40,8 @@ class WMOLpnsPage(WMBasePage):
 
         '''Validation'''
         self.wait_for(5)
-        DBLib().assertDOHdr(i_order=order, o_status=DOStat.WEIGHED)
-        DBLib().assertLPNHdr(i_lpn=oLpn, o_facStatus=LPNFacStat.OLPN_WEIGHED)
+        DBLib.get().assertDOHdr(i_order=order, o_status=DOStat.WEIGHED)
+        DBLib.get().assertLPNHdr(i_lpn=oLpn, o_facStatus=LPNFacStat.OLPN_WEIGHED)
 
 
 
@@ -71,7 +71,7 @@ class WMOrdersPage(WMBasePage):
     def shipConfirmOrder(self, order: str, oLpns: list):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
 
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs([order])[0]
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs([order])[0]
 
         self.filterByOrder(order)
         self.click_by_xpath(self._MORE)
@@ -79,10 +79,10 @@ class WMOrdersPage(WMBasePage):
         self.click_by_xpath(self._SHP_CNFRM_YES_BTN)
 
         '''Validation'''
-        DBLib().assertWaitDOStatus(i_order=order, o_status=190)
-        DBLib().assertShipConfirmXmlMsgExist(order=order)
+        DBLib.get().assertWaitDOStatus(i_order=order, o_status=190)
+        DBLib.get().assertShipConfirmXmlMsgExist(order=order)
         for i in range(len(oLpns)):
-            DBLib().assertLPNHdr(i_lpn=oLpns[i], o_facStatus=LPNFacStat.OLPN_SHIPPED)
+            DBLib.get().assertLPNHdr(i_lpn=oLpns[i], o_facStatus=LPNFacStat.OLPN_SHIPPED)
 
     def createChaseTask(self, chaseWaveTemplate: str, order: str, item: str, qty: int, o_ordStatus: DOStat = None,
                         isAssertPickingShortItem: bool = None, shortedOLpn: str = None,
@@ -91,7 +91,7 @@ class WMOrdersPage(WMBasePage):
         """creates chase wave for the shorted qty"""
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
 
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=[order])[0]
 
         self.filterByOrder(pc_order)
         self.click_by_xpath(self._MORE)
@@ -106,23 +106,23 @@ class WMOrdersPage(WMBasePage):
         self.logger.info('chaseWavenumber: ' + chaseWaveNum)
 
         '''Validation'''
-        DBLib().assertWaitWaveStatus(i_wave=chaseWaveNum, i_status=90)
-        chaseWaveOLpns = DBLib().getAllOLPNsFromWave(wave=chaseWaveNum)
+        DBLib.get().assertWaitWaveStatus(i_wave=chaseWaveNum, i_status=90)
+        chaseWaveOLpns = DBLib.get().getAllOLPNsFromWave(wave=chaseWaveNum)
         for i in range(len(chaseWaveOLpns)):
-            DBLib().assertLPNHdr(i_lpn=chaseWaveOLpns[i], o_facStatus=LPNFacStat.OLPN_PRINTED, isConsLocnUpdated=True)
+            DBLib.get().assertLPNHdr(i_lpn=chaseWaveOLpns[i], o_facStatus=LPNFacStat.OLPN_PRINTED, isConsLocnUpdated=True)
 
-        DBLib().assertDOHdr(i_order=pc_order, o_status=o_ordStatus)
-        DBLib().assertAllocDtls(i_itemBrcd=item, i_taskGenRefNbr=chaseWaveNum, i_intType=intType,
-                                o_qtyAlloc=qty, o_statCode=o_allocStatus)
+        DBLib.get().assertDOHdr(i_order=pc_order, o_status=o_ordStatus)
+        DBLib.get().assertAllocDtls(i_itemBrcd=item, i_taskGenRefNbr=chaseWaveNum, i_intType=intType,
+                                    o_qtyAlloc=qty, o_statCode=o_allocStatus)
 
         if o_ordLineStatus is not None:
-            DBLib().assertDODtls(i_order=pc_order, i_itemBrcd=item, i_waveNum=chaseWaveNum, o_qtyAllocated=qty,
-                                 o_dtlStatus=o_ordLineStatus)
+            DBLib.get().assertDODtls(i_order=pc_order, i_itemBrcd=item, i_waveNum=chaseWaveNum, o_qtyAllocated=qty,
+                                     o_dtlStatus=o_ordLineStatus)
 
         if isAssertPickingShortItem:
-            DBLib().assertPickShortItemDtls(i_order=order, i_lpn=shortedOLpn, i_item=item, o_statCode=90)
+            DBLib.get().assertPickShortItemDtls(i_order=order, i_lpn=shortedOLpn, i_item=item, o_statCode=90)
 
         if isAssertNoTask:
-            DBLib().assertNoTaskPresent(taskRefNum=chaseWaveNum)
+            DBLib.get().assertNoTaskPresent(taskRefNum=chaseWaveNum)
 
         return chaseWaveNum
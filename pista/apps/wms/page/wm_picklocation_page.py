@@ -55,8 +55,8 @@ class WMPickLocation(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertWMInvnDtls(i_locn=locn, i_itemBrcd=item, o_onHandQty=newQty)
-        DBLib().assertPix(i_itemBrcd=item, i_tranType='300', i_rsnCode=reasonCode)
+        DBLib.get().assertWMInvnDtls(i_locn=locn, i_itemBrcd=item, o_onHandQty=newQty)
+        DBLib.get().assertPix(i_itemBrcd=item, i_tranType='300', i_rsnCode=reasonCode)
 
     def createCycleCountActv(self, item: str, locn: str):
         self.switch_frame(0)
@@ -65,8 +65,8 @@ class WMPickLocation(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        # DBLib().assertCycleCountTask(i_locnBrcd=locn,i_intType=101)
-        # DBLib().assertCycleCountStatus(i_locnBrcd=locn,i_intType=101,o_statCode=10)
-        taskId = DBLib().getCCTask(i_locnBrcd=locn, i_intType=101)
+        # DBLib.get().assertCycleCountTask(i_locnBrcd=locn,i_intType=101)
+        # DBLib.get().assertCycleCountStatus(i_locnBrcd=locn,i_intType=101,o_statCode=10)
+        taskId = DBLib.get().getCCTask(i_locnBrcd=locn, i_intType=101)
         taskId = taskId.get('TASK_ID')
         return taskId
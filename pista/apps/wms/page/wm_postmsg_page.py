@@ -2,8 +2,10 @@ import inspect
 
 from apps.wms.app_db_lib import DBLib
 from apps.wms.app_utils import XMLBuilder
+from apps.wms.app_xml_poster import XMLPoster
 from apps.wms.page.wm_base_page import WMBasePage
 from apps.wms.page.wm_home_page import WMHomePage
+from core.file_service import FileUtil
 from core.log_service import Logging
 from apps.wms.app_status import POStat, ASNStat, DOStat, LPNFacStat
 
@@ -23,16 +25,19 @@ class WMPostMsgPage(WMBasePage):
     _RESET_BTN = "//input[@type='submit' and @id='dataForm:resetCmdId']"
 
     def __init__(self, driver, isPageOpen: bool = False):
-        """Opens post msg UI if not opened and maximize it"""
+        """Opens post msg UI if not opened and maximize it (only for ui xml_post_channel)"""
         super().__init__(driver, None)
-        if not isPageOpen:
+        if not isPageOpen and XMLPoster.isUIChannel():
             WMHomePage(driver, isPageOpen=isPageOpen).openMenuPage(self.PAGE, self.MODULE)
             super().__init__(driver, self._TITLE_XPATH)
             self.wait_for(3)
             self.maximizeMenuPage()
 
     def postMsg(self, filepath=None, content=None) -> str:
-        """"""
+        """Posts by XMLPoster for http/db xml_post_channel, else by the UI"""
+        if not XMLPoster.isUIChannel():
+            return XMLPoster.post(FileUtil.read_file(filepath) if filepath is not None else content)
+
         self.switch_frame(0)
         '''If reset button available, click'''
         allSubmitBtns = self.get_webelements(self._ALL_SUBMIT_BTNS)
@@ -49,6 +54,12 @@ class WMPostMsgPage(WMBasePage):
         self.switch_default_content()
         return response
 
+    def postMsgs(self, contents: list[str]) -> list[str]:
+        """Posts a batch of xmls, concurrently for http/db xml_post_channel"""
+        if not XMLPoster.isUIChannel():
+            return XMLPoster.postBatch(contents)
+        return [self.postMsg(content=c) for c in contents]
+
     def _assertPostResponseOK(self) -> str:
         response = self.get_text_by_xpath(self._POSTMSG_TEXTAREA_OUTBOX)
         assert response.count('<Error_Type>0</Error_Type>') > 0, 'Xml posting response has error'
@@ -66,10 +77,10 @@ class WMPostMsgPage(WMBasePage):
         '''Validation'''
         itemList = items if type(items) == list else [items]
         qtyList = qtys if type(qtys) == list else [qtys]
-        DBLib().assertPOHdr(i_po=poNum, o_status=POStat.CREATED)
-        for i in range(len(itemList)):
-            DBLib().assertPODtls(i_po=poNum, i_itemBrcd=itemList[i], o_dtlStatus=20, o_origQty=qtyList[i],
-                                 o_qty=qtyList[i])
+        DBLib.get().assertPOHdr(i_po=poNum, o_status=POStat.CREATED)
+        poDtls = [{'i_itemBrcd': itemList[i], 'o_dtlStatus': 20, 'o_origQty': qtyList[i], 'o_qty': qtyList[i]}
+                  for i in range(len(itemList))]
+        DBLib.get().assertPODtlsInBatch(i_po=poNum, o_dtls=poDtls)
 
         return poNum
 
@@ -95,16 +106,18 @@ class WMPostMsgPage(WMBasePage):
         #     poList.extend([poNums for i in range(len(itemList))])
         # else:
         #     poList = poNums
-        DBLib().assertASNHdr(i_asn=asnNum, o_status=ASNStat.IN_TRANSIT.value)
+        DBLib.get().assertASNHdr(i_asn=asnNum, o_status=ASNStat.IN_TRANSIT.value)
         if o_fullPoShipped and isOnly1PO:
-            DBLib().assertPOHdr(i_po=poList[0], o_status=POStat.SHIPPED)
-        for i in range(len(itemList)):
-            DBLib().assertASNDtls(i_asn=asnNum, i_po=poList[i], i_itemBrcd=itemList[i], o_dtlStatus=4,
-                                  o_shippedQty=qtyList[i])
-            DBLib().assertPODtls(i_po=poList[i], i_itemBrcd=itemList[i], o_dtlStatus=850, o_origQty=qtyList[i],
-                                 o_qty=qtyList[i])
+            DBLib.get().assertPOHdr(i_po=poList[0], o_status=POStat.SHIPPED)
+        asnDtls = [{'i_po': poList[i], 'i_itemBrcd': itemList[i], 'o_dtlStatus': 4, 'o_shippedQty': qtyList[i]}
+                   for i in range(len(itemList))]
+        DBLib.get().assertASNDtlsInBatch(i_asn=asnNum, o_dtls=asnDtls)
+        for po in dict.fromkeys(poList[:len(itemList)]):
+            poDtls = [{'i_itemBrcd': itemList[i], 'o_dtlStatus': 850, 'o_origQty': qtyList[i], 'o_qty': qtyList[i]}
+                      for i in range(len(itemList)) if poList[i] == po]
+            DBLib.get().assertPODtlsInBatch(i_po=po, o_dtls=poDtls)
             if o_fullPoShipped and not isOnly1PO:
-                DBLib().assertPOHdr(i_po=poList[i], o_status=POStat.SHIPPED)
+                DBLib.get().assertPOHdr(i_po=po, o_status=POStat.SHIPPED)
 
         return asnNum
 
@@ -118,7 +131,7 @@ class WMPostMsgPage(WMBasePage):
         lpnList = []
 
         for i in range(noOfLPNs):
-            lpnList.append(DBLib().getNewILPNNum())
+            lpnList.append(DBLib.get().getNewILPNNum())
 
         lpnList = lpns if lpns is not None else lpnList
 
@@ -127,13 +140,17 @@ class WMPostMsgPage(WMBasePage):
         self.postMsg(content=asnXml)
 
         '''Validation'''
-        DBLib().assertASNHdr(i_asn=asnNum, o_status=ASNStat.IN_TRANSIT.value)
+        DBLib.get().assertASNHdr(i_asn=asnNum, o_status=ASNStat.IN_TRANSIT.value)
+        asnDtls = []
         for i in range(len(lpnList)):
-            DBLib().assertPOHdr(i_po=poNums[i], o_status=POStat.SHIPPED)
-            DBLib().assertLPNHdr(i_lpn=lpnList[i], o_facStatus=LPNFacStat.ILPN_IN_TRANSIT, o_asn=asnNum)
-            for j in range(len(items[i])):
-                DBLib().assertASNDtls(i_asn=asnNum, i_po=poNums[i], i_itemBrcd=items[i][j], o_dtlStatus=4, o_shippedQty=qtys[i][j])
-                DBLib().assertPODtls(i_po=poNums[i], i_itemBrcd=items[i][j], o_dtlStatus=850, o_origQty=qtys[i][j], o_qty=qtys[i][j])
+            DBLib.get().assertPOHdr(i_po=poNums[i], o_status=POStat.SHIPPED)
+            DBLib.get().assertLPNHdr(i_lpn=lpnList[i], o_facStatus=LPNFacStat.ILPN_IN_TRANSIT, o_asn=asnNum)
+            asnDtls.extend({'i_po': poNums[i], 'i_itemBrcd': items[i][j], 'o_dtlStatus': 4, 'o_shippedQty': qtys[i][j]}
+                           for j in range(len(items[i])))
+            poDtls = [{'i_itemBrcd': items[i][j], 'o_dtlStatus': 850, 'o_origQty': qtys[i][j], 'o_qty': qtys[i][j]}
+                      for j in range(len(items[i]))]
+            DBLib.get().assertPODtlsInBatch(i_po=poNums[i], o_dtls=poDtls)
+        DBLib.get().assertASNDtlsInBatch(i_asn=asnNum, o_dtls=asnDtls)
 
         return asnNum
 
@@ -149,10 +166,10 @@ class WMPostMsgPage(WMBasePage):
         '''Validation'''
         itemList = items if type(items) == list else [items]
         qtyList = qtys if type(qtys) == list else [qtys]
-        DBLib().assertDOHdr(i_order=doNum, o_status=DOStat.RELEASED)
-        for i in range(len(itemList)):
-            DBLib().assertDODtls(i_order=doNum, i_itemBrcd=itemList[i], o_dtlStatus=110, o_origQty=qtyList[i],
-                                 o_qty=qtyList[i])
+        DBLib.get().assertDOHdr(i_order=doNum, o_status=DOStat.RELEASED)
+        doDtls = [{'i_itemBrcd': itemList[i], 'o_dtlStatus': 110, 'o_origQty': qtyList[i], 'o_qty': qtyList[i]}
+                  for i in range(len(itemList))]
+        DBLib.get().assertDODtlsInBatch(i_order=doNum, o_dtls=doDtls)
 
         return doNum
 
@@ -170,10 +187,10 @@ class WMPostMsgPage(WMBasePage):
         '''Validation'''
         itemList = items if type(items) == list else [items]
         qtyList = qtys if type(qtys) == list else [qtys]
-        DBLib().assertLPNHdr(i_lpn=lpnId, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=o_lpnCurrLocn)
-        for i in range(len(itemList)):
-            DBLib().assertLPNDtls(i_lpn=lpnId, i_itemBrcd=itemList[i], o_qty=qtyList[i])
+        DBLib.get().assertLPNHdr(i_lpn=lpnId, o_facStatus=LPNFacStat.ILPN_PUTAWAY, o_currLocn=o_lpnCurrLocn)
+        lpnDtls = [{'i_itemBrcd': itemList[i], 'o_qty': qtyList[i]} for i in range(len(itemList))]
+        DBLib.get().assertLPNDtlsInBatch(i_lpn=lpnId, o_dtls=lpnDtls)
         if o_lockCode is not None:
-            DBLib().assertLpnLockPresent(i_lpn=lpnId, i_lockCode='OR')
+            DBLib.get().assertLpnLockPresent(i_lpn=lpnId, i_lockCode='OR')
 
         return lpnId
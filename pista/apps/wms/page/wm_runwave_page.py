@@ -122,8 +122,8 @@ class WMRunWavePage(WMBasePage):
         """Run 1 wave for list of orders"""
         ordersList = [orders] if type(orders) == str else orders
 
-        DBLib()._printWaveTemplateConfig(template)
-        DBLib()._presetWaveTemplateRuleForOrders(template, rule, ordersList)
+        DBLib.get()._printWaveTemplateConfig(template)
+        DBLib.get()._presetWaveTemplateRuleForOrders(template, rule, ordersList)
 
         self.switch_frame(0)
         self.filterByTemplate(template)
@@ -176,22 +176,22 @@ class WMRunWavePage(WMBasePage):
         RuntimeXL.createThreadLockFile(maxWaitSec=300)
         try:
             if u_forceNoOfOlpn is not None:
-                DBLib()._forceNbrOfOlpnCreationForOrders(orders=orders, ordLineItems=o_lineItems, u_forceNoOfOlpn=u_forceNoOfOlpn)
+                DBLib.get()._forceNbrOfOlpnCreationForOrders(orders=orders, ordLineItems=o_lineItems, u_forceNoOfOlpn=u_forceNoOfOlpn)
             # if u_lineLpnTypes is not None:
             #     for i in range(len(orders)):
             #         for j in range(len(o_lineItems[i])):
-            #             DBLib().updateDOLineLpnType(dO=orders[i], lineItem=o_lineItems[i][j], u_lpnType=u_lineLpnTypes[i][j])
+            #             DBLib.get().updateDOLineLpnType(dO=orders[i], lineItem=o_lineItems[i][j], u_lpnType=u_lineLpnTypes[i][j])
 
             '''Check if enough consol locn exist, else clear'''
-            # doTypeCntRows = DBLib().getOrderTypeCountFromDO(orders=orders)
+            # doTypeCntRows = DBLib.get().getOrderTypeCountFromDO(orders=orders)
             # for i in range(len(doTypeCntRows)):
             #     orderType = str(doTypeCntRows[i].get('ORDER_TYPE'))
             #     totalCnt = int(doTypeCntRows[i].get('REQ_CONSOL_COUNT'))
             #     if orderType in ('N', 'J'):
-            #         DBLib().getEmptyConsolLocn(noOfLocns=totalCnt, orderType=orderType)
+            #         DBLib.get().getEmptyConsolLocn(noOfLocns=totalCnt, orderType=orderType)
             consLocnList = None
             if u_ordConsData is not None:
-                consLocnList = DBLib().getEmptyConsLocnByRuleData(u_ordConsData)
+                consLocnList = DBLib.get().getEmptyConsLocnByRuleData(u_ordConsData)
 
             waveNbr = self._runWave(template, rule, orders)
 
@@ -200,14 +200,14 @@ class WMRunWavePage(WMBasePage):
             o_selLnItems = o_selLnItems if o_selLnItems is not None else o_lineItems
             o_selQtys = o_selQtys if o_selQtys is not None else o_qtys
 
-            DBLib().assertWaitWaveStatus(i_wave=waveNbr, i_status=90)
-            DBLib().assertParentDOsForOrdersByGroupAttr(orders=o_selectedDO)
-            DBLib()._printWaveMsgLogs(refValue1=waveNbr, refValue2=o_selectedDO)
-            DBLib()._printConsolLocnData(consolLocnList=consLocnList)
-            # TODO DBLib()._printItemShortageConfig(consolLocnList=consLocnList)
+            DBLib.get().assertWaitWaveStatus(i_wave=waveNbr, i_status=90)
+            DBLib.get().assertParentDOsForOrdersByGroupAttr(orders=o_selectedDO)
+            DBLib.get()._printWaveMsgLogs(refValue1=waveNbr, refValue2=o_selectedDO)
+            DBLib.get()._printConsolLocnData(consolLocnList=consLocnList)
+            # TODO DBLib.get()._printItemShortageConfig(consolLocnList=consLocnList)
 
             '''Update runtime thread data file'''
-            consolLocnRecs = DBLib().getAllConsolLocnsFromWave(wave=waveNbr)
+            consolLocnRecs = DBLib.get().getAllConsolLocnsFromWave(wave=waveNbr)
             if consolLocnRecs is not None:
                 consolLocnsAsCsv = ','.join(i['LOCN_BRCD'] for i in consolLocnRecs if i['LOCN_BRCD'] is not None)
                 RuntimeXL.updateThisAttrForThread(RuntimeAttr.CONSOL_LOCNS, consolLocnsAsCsv)
@@ -216,59 +216,60 @@ class WMRunWavePage(WMBasePage):
 
         '''Validation'''
         if o_totalLines is not None:
-            DBLib().assertDOLineInWave(i_wave=waveNbr, o_totalLines=o_totalLines)
+            DBLib.get().assertDOLineInWave(i_wave=waveNbr, o_totalLines=o_totalLines)
         if o_totalOlpns is not None:
-            DBLib().assertOLPNCountForWave(i_wave=waveNbr, o_totalOLPNs=o_totalOlpns)
+            DBLib.get().assertOLPNCountForWave(i_wave=waveNbr, o_totalOLPNs=o_totalOlpns)
         # if o_totalLines is not None:
-        DBLib().assertDOInWave(i_wave=waveNbr, o_totalOrders=len(o_selectedDO), o_orders=o_selectedDO, isIgnoreCanceledDO=isIgnoreCanceledDO)
+        DBLib.get().assertDOInWave(i_wave=waveNbr, o_totalOrders=len(o_selectedDO), o_orders=o_selectedDO, isIgnoreCanceledDO=isIgnoreCanceledDO)
         if o_totalOlpnPerDO is not None:
             for i in range(len(o_selectedDO)):
-                DBLib().assertOLPNCountForDO(i_order=o_selectedDO[i], o_totalOLPNs=o_totalOlpnPerDO[i])
+                DBLib.get().assertOLPNCountForDO(i_order=o_selectedDO[i], o_totalOLPNs=o_totalOlpnPerDO[i])
 
+        DBLib.get().assertWaitDOsStatus(i_orders=orders, o_statuses=o_ordStatus)
         for i in range(len(orders)):
-            DBLib().assertDOHdr(i_order=orders[i], o_status=o_ordStatus[i])
+            DBLib.get().assertDOHdr(i_order=orders[i], o_status=o_ordStatus[i], f_isWaitForStatus=False)
         if o_ordLineStatus is not None:
             for i in range(len(orders)):
                 for j in range(len(o_lineItems[i])):
-                    DBLib().assertDODtls(i_order=orders[i], i_itemBrcd=o_lineItems[i][j], o_dtlStatus=o_ordLineStatus[i][j])
+                    DBLib.get().assertDODtls(i_order=orders[i], i_itemBrcd=o_lineItems[i][j], o_dtlStatus=o_ordLineStatus[i][j])
 
-        olpns = DBLib().getAllOLPNsFromWave(wave=waveNbr)
+        olpns = DBLib.get().getAllOLPNsFromWave(wave=waveNbr)
         for i in range(len(olpns)):
             final_olpnStat = o_olpnStatus if o_olpnStatus is not None else LPNFacStat.OLPN_PRINTED
-            DBLib().assertLPNHdr(i_lpn=olpns[i], o_facStatus=final_olpnStat)
+            DBLib.get().assertLPNHdr(i_lpn=olpns[i], o_facStatus=final_olpnStat)
             if isAssertConsolLocnExist:
-                DBLib().assertLPNHdr(i_lpn=olpns[i], isConsLocnUpdated=True)
+                DBLib.get().assertLPNHdr(i_lpn=olpns[i], isConsLocnUpdated=True)
             if isAssertNoConsolLocn:
-                DBLib().assertLPNHdr(i_lpn=olpns[i], o_destLocn='null')
+                DBLib.get().assertLPNHdr(i_lpn=olpns[i], o_destLocn='null')
 
         temp_allocStatusList = []
         for i in range(len(o_selectedDO)):
             for j in range(len(o_selLnItems[i])):
                 final_allocPullLocn = None if o_allocPullLocns is None else o_allocPullLocns[i][j]
                 curr_allocStatus = self._decide_aid_statCode_forWaveType(waveTemplate=template, providedVal=o_allocStatus[i][j])
-                DBLib().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=o_intTypes[i][j], i_itemBrcd=o_selLnItems[i][j],
-                                        o_qtyAlloc=o_selQtys[i][j], o_statCode=curr_allocStatus, o_pullLocn=final_allocPullLocn)
+                DBLib.get().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=o_intTypes[i][j], i_itemBrcd=o_selLnItems[i][j],
+                                            o_qtyAlloc=o_selQtys[i][j], o_statCode=curr_allocStatus, o_pullLocn=final_allocPullLocn)
                 temp_allocStatusList.append(curr_allocStatus)
 
         '''If any aid.stat_code is 91, then dont assert no task creation'''
         if isAssertNoTask and AllocStat.TASK_DETAIL_CREATED not in temp_allocStatusList:
-            DBLib().assertNoTaskPresent(taskRefNum=waveNbr)
+            DBLib.get().assertNoTaskPresent(taskRefNum=waveNbr)
         elif AllocStat.TASK_DETAIL_CREATED in temp_allocStatusList:
-            DBLib().assertTaskExist(taskRefNum=waveNbr)
+            DBLib.get().assertTaskExist(taskRefNum=waveNbr)
 
         if o_consolLocns is not None:
             for i in range(len(o_consolLocns)):
-                DBLib().assertConsolLocnForOLPNs(i_order=o_selectedDO[i], o_consolLocn=o_consolLocns[i])
+                DBLib.get().assertConsolLocnForOLPNs(i_order=o_selectedDO[i], o_consolLocn=o_consolLocns[i])
 
         if isAssertReplen:
-            taskId = DBLib().getTaskIdByORCond(taskGenRefNbr=waveNbr, taskCmplRefNbr=waveNbr, cntr=waveNbr, intType=1)
-            DBLib().assertTaskHdr(i_task=taskId, o_intType=1, o_status=TaskHdrStat.RELEASED)
+            taskId = DBLib.get().getTaskIdByORCond(taskGenRefNbr=waveNbr, taskCmplRefNbr=waveNbr, cntr=waveNbr, intType=1)
+            DBLib.get().assertTaskHdr(i_task=taskId, o_intType=1, o_status=TaskHdrStat.RELEASED)
             for i in range(len(o_replenItems)):
-                DBLib().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=1, i_itemBrcd=o_replenItems[i],
-                                        o_qtyAlloc=o_replenQtys[i], o_statCode=AllocStat.TASK_DETAIL_CREATED)
+                DBLib.get().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=1, i_itemBrcd=o_replenItems[i],
+                                            o_qtyAlloc=o_replenQtys[i], o_statCode=AllocStat.TASK_DETAIL_CREATED)
                 finalTaskPrty = o_replnPrty[i] if o_replnPrty is not None else None
-                DBLib().assertTaskDtls(i_task=taskId, i_itemBrcd=o_replenItems[i], i_intType=1,
-                                       o_taskPriority=finalTaskPrty)
+                DBLib.get().assertTaskDtls(i_task=taskId, i_itemBrcd=o_replenItems[i], i_intType=1,
+                                           o_taskPriority=finalTaskPrty)
 
         return waveNbr
 
@@ -286,27 +287,27 @@ class WMRunWavePage(WMBasePage):
             waveNbr = self._runWave(template, rule, orders)
 
             '''Validation'''
-            DBLib().assertWaitWaveStatus(i_wave=waveNbr, i_status=90)
-            DBLib()._printWaveMsgLogs(refValue1=waveNbr, refValue2=orders)
+            DBLib.get().assertWaitWaveStatus(i_wave=waveNbr, i_status=90)
+            DBLib.get()._printWaveMsgLogs(refValue1=waveNbr, refValue2=orders)
         finally:
             RuntimeXL.removeThreadLockFile()
 
         '''Validation'''
-        taskIds = DBLib().getTaskIdsFromGenRefNbr(taskGenRefNbr=waveNbr)
+        taskIds = DBLib.get().getTaskIdsFromGenRefNbr(taskGenRefNbr=waveNbr)
         if o_noOFTasks is not None:
             assert o_noOFTasks == len(taskIds), 'number of Tasks validation failed'
         for i in range(len(taskIds)):
-            DBLib().assertTaskHdr(i_task=taskIds[i], o_intType=1, o_status=TaskHdrStat.RELEASED, o_currTaskPrty=o_replenPrty)
+            DBLib.get().assertTaskHdr(i_task=taskIds[i], o_intType=1, o_status=TaskHdrStat.RELEASED, o_currTaskPrty=o_replenPrty)
 
         for i in range(len(o_replenItems)):
             finalILpn = None if o_replenILpns is None else o_replenILpns[i]
-            DBLib().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=1, i_cntr=finalILpn, i_itemBrcd=o_replenItems[i], o_qtyAlloc=o_replenQtys[i],
-                                    o_statCode=AllocStat.TASK_DETAIL_CREATED)
+            DBLib.get().assertAllocDtls(i_taskGenRefNbr=waveNbr, i_intType=1, i_cntr=finalILpn, i_itemBrcd=o_replenItems[i], o_qtyAlloc=o_replenQtys[i],
+                                        o_statCode=AllocStat.TASK_DETAIL_CREATED)
         if isAssertTaskSeq:
             for i in range(len(o_replenItems)):
                 final_rpelenResvLocn = None if o_replenResvLocns is None else o_replenResvLocns[i]
-                DBLib().assertTaskDtls(i_task=taskIds[0], i_intType=1, i_pullLocn=final_rpelenResvLocn, o_statCode=TaskDtlStat.UNASSIGNED,
-                                       o_taskSeq=int(i + 1))
+                DBLib.get().assertTaskDtls(i_task=taskIds[0], i_intType=1, i_pullLocn=final_rpelenResvLocn, o_statCode=TaskDtlStat.UNASSIGNED,
+                                           o_taskSeq=int(i + 1))
         return waveNbr
 
     # def clickOnWaveNumber(self):
@@ -69,7 +69,7 @@ class WMShipmentPlanPage(WMBasePage):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
         self.logger.info('Creating shipment')
 
-        pc_orders = DBLib()._getParentDOsIfExistElseChildDOs(orders=orders)
+        pc_orders = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=orders)
         orders = pc_orders
 
         listOfOrders = ','.join(orders)
@@ -89,7 +89,7 @@ class WMShipmentPlanPage(WMBasePage):
         isShipmentRowFound = self.is_displayed_by_xpath(self._SHIPMENT_ROW)
         assert isShipmentRowFound, 'No shipment row found'
 
-        shipmentNbr = DBLib().get1ShipmentNumFromDOs(orders=orders)
+        shipmentNbr = DBLib.get().get1ShipmentNumFromDOs(orders=orders)
 
         if u_shipVia is not None:
             self.click_by_xpath(self._SELECT_SHIPMENT.replace('#SHIPMENT#', shipmentNbr))
@@ -106,13 +106,13 @@ class WMShipmentPlanPage(WMBasePage):
             self.switch_default_content()
             
         '''Validation'''
-        DBLib().assertWaitShipmentStatus(i_shipment=shipmentNbr, o_status=o_shipmentStat)
-        DBLib().assertDOInShipment(i_shipment=shipmentNbr, o_orders=orders)
+        DBLib.get().assertWaitShipmentStatus(i_shipment=shipmentNbr, o_status=o_shipmentStat)
+        DBLib.get().assertDOInShipment(i_shipment=shipmentNbr, o_orders=orders)
         if isDOWaved:
-            DBLib().assertShipmentForOLPNFromDO(i_shipment=shipmentNbr, i_orders=orders)
+            DBLib.get().assertShipmentForOLPNFromDO(i_shipment=shipmentNbr, i_orders=orders)
         if isProNumberCreated is not None:
-            proNbrLevel = int(DBLib().getProNumberLevelFromShipVia(shipVia=u_shipVia))
-            DBLib().assertProNumberForShipment(proNumberLevel=proNbrLevel, shipmentId=shipmentNbr)
+            proNbrLevel = int(DBLib.get().getProNumberLevelFromShipVia(shipVia=u_shipVia))
+            DBLib.get().assertProNumberForShipment(proNumberLevel=proNbrLevel, shipmentId=shipmentNbr)
 
         return shipmentNbr
 
@@ -120,9 +120,9 @@ class WMShipmentPlanPage(WMBasePage):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
         self.logger.info('Add order to existing shipment')
 
-        pc_existingOrders = DBLib()._getParentDOsIfExistElseChildDOs(orders=existingOrders)
+        pc_existingOrders = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=existingOrders)
         existingOrders = pc_existingOrders
-        pc_newOrder = DBLib()._getParentDOsIfExistElseChildDOs(orders=[newOrder])[0]
+        pc_newOrder = DBLib.get()._getParentDOsIfExistElseChildDOs(orders=[newOrder])[0]
         newOrder = pc_newOrder
 
         self.click_by_xpath(self._SHIPMENT_CB.replace('#SHIPMENTNBR#', str(shipmentNbr)))
@@ -139,5 +139,5 @@ class WMShipmentPlanPage(WMBasePage):
         existingOrders.append(newOrder)
 
         '''Validation'''
-        DBLib().assertWaitForDOInShipment(shipmentNum=shipmentNbr, order=newOrder)
-        DBLib().assertDOInShipment(i_shipment=shipmentNbr, o_orders=existingOrders)
+        DBLib.get().assertWaitForDOInShipment(shipmentNum=shipmentNbr, order=newOrder)
+        DBLib.get().assertDOInShipment(i_shipment=shipmentNbr, o_orders=existingOrders)
@@ -58,7 +58,7 @@ class WMTasksPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_status=o_taskStat)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_status=o_taskStat)
 
     def assignTaskToUser(self,taskId:str, userId:str, taskPrty:int):
         """"""
@@ -79,4 +79,4 @@ class WMTasksPage(WMBasePage):
         self.switch_default_content()
 
         '''Validation'''
-        DBLib().assertTaskHdr(i_task=taskId, o_currTaskPrty=taskPrty, o_ownerUser=userId, o_status=TaskHdrStat.RELEASED, isIgnoreDateCheck=True)
+        DBLib.get().assertTaskHdr(i_task=taskId, o_currTaskPrty=taskPrty, o_ownerUser=userId, o_status=TaskHdrStat.RELEASED, isIgnoreDateCheck=True)
@@ -50,12 +50,13 @@ class WMWavesPage(WMBasePage):
         # self.clickRefreshBtn()
 
         '''Validation'''
+        DBLib.get().assertWaitDOsStatus(i_orders=o_orders, o_statuses=o_ordStatus)
         for i in range(len(o_orders)):
-            DBLib().assertDOHdr(i_order=o_orders[i], o_status=o_ordStatus[i])
+            DBLib.get().assertDOHdr(i_order=o_orders[i], o_status=o_ordStatus[i], f_isWaitForStatus=False)
             for j in range(len(o_lnItems[i])):
-                DBLib().assertAllocDtls(i_taskGenRefNbr=waveNum, i_intType=o_intTypes[i][j],
-                                        i_itemBrcd=o_lnItems[i][j],
-                                        o_qtyAlloc=o_lnQtys[i][j], o_statCode=o_allocStatus[i][j])
+                DBLib.get().assertAllocDtls(i_taskGenRefNbr=waveNum, i_intType=o_intTypes[i][j],
+                                            i_itemBrcd=o_lnItems[i][j],
+                                            o_qtyAlloc=o_lnQtys[i][j], o_statCode=o_allocStatus[i][j])
 
     # def clickRefreshBtn(self):
     #     while True:
@@ -42,10 +42,10 @@ class WMWeighManifestPage(WMBasePage):
                      o_doStatus: int = None):
         Logging.capture_action_func_start(inspect.currentframe(), self.logger)
 
-        pc_order = DBLib()._getParentDOsIfExistElseChildDOs([order])[0]
+        pc_order = DBLib.get()._getParentDOsIfExistElseChildDOs([order])[0]
 
-        DBLib()._updateOLPNCntrTypeForDO(order=pc_order, olpn=olpn)
-        actWeight = DBLib().getEstWeightFromOLPN(oLpn=olpn)
+        DBLib.get()._updateOLPNCntrTypeForDO(order=pc_order, olpn=olpn)
+        actWeight = DBLib.get().getEstWeightFromOLPN(oLpn=olpn)
 
         self.switch_frame(0)
         self.fill_by_xpath(self._OLPN_TB_IN_SCAN_PAGE, olpn)
@@ -61,10 +61,10 @@ class WMWeighManifestPage(WMBasePage):
         self.click_by_xpath(self._EXIT_BTN)
         self.switch_default_content()
 
-        manifestId = DBLib().getManifestIdFromWaveNum(waveNum=waveNum, order=pc_order, oLpn=olpn)
+        manifestId = DBLib.get().getManifestIdFromWaveNum(waveNum=waveNum, order=pc_order, oLpn=olpn)
 
         '''Validation'''
-        DBLib().assertLPNHdr(i_lpn=olpn, o_facStatus=LPNFacStat.OLPN_MANIFESTED)
-        DBLib().assertDOHdr(i_order=order, o_status=DOStat.MANIFESTED)
+        DBLib.get().assertLPNHdr(i_lpn=olpn, o_facStatus=LPNFacStat.OLPN_MANIFESTED)
+        DBLib.get().assertDOHdr(i_order=order, o_status=DOStat.MANIFESTED)
 
         return manifestId
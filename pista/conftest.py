@@ -0,0 +1,20 @@
+from contextlib import ExitStack
+
+import pytest
+
+
+@pytest.fixture
+def rfPageFactory():
+    """RF page factory for tests: rfPageFactory(driver, isRFWeighUser, isRfUser2) returns a logged in RFPage
+    (RFPage.session(), pooled with is_use_session_pool=true), all the pages are released to the pool at test teardown.
+    1 more session is warmed in background (paramiko) for the next test
+    """
+    from apps.wms.app_rf_page import RFPage
+
+    with ExitStack() as rfSessions:
+        def getRFPage(driver, isRFWeighUser: bool = None, isRfUser2: bool = None) -> RFPage:
+            rfPage = rfSessions.enter_context(RFPage.session(driver, isRFWeighUser=isRFWeighUser, isRfUser2=isRfUser2))
+            RFPage.warmInBackground(isRFWeighUser=isRFWeighUser, isRfUser2=isRfUser2)
+            return rfPage
+
+        yield getRFPage
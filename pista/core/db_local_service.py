@@ -0,0 +1,313 @@
+import csv
+import glob
+import math
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+from core.config_service import ENV_CONFIG
+from core.log_service import Logging, printit
+from root import RESOURCE_DIR
+
+
+class OracleToSQLite:
+    """Dialect shims to run the oracle sqls of DBLib/DBAdmin on sqlite
+    Covers offset/fetch next, sysdate (+/- days, interval), sequences (nextval/currval), dual, nvl, trunc,
+    rownum = n/<= n/< n (where or and form, limit is added at the end of the (sub)query having the rownum)
+    """
+    TRANSLATED_SQLS = {}  # Pair of oracle sql text and sqlite sql text
+
+    '''Oracle date format to strftime format'''
+    DATE_FORMATS = [('YYYY', '%Y'), ('YY', '%y'), ('MM', '%m'), ('DD', '%d'), ('HH24', '%H'), ('HH', '%I'),
+                    ('MI', '%M'), ('SS', '%S')]
+
+    _NOW = "datetime('now', 'localtime')"
+    _ROWNUM_COND = re.compile(r'\s+(where|and)\s+rownum\s*(<=|<|=)\s*(\d+)(\s+and\b)?', flags=re.I)
+
+    @classmethod
+    def translate(cls, query: str) -> str:
+        sql = cls.TRANSLATED_SQLS.get(query)
+        if sql is None:
+            sql = cls._translate(query)
+            cls.TRANSLATED_SQLS[query] = sql
+        return sql
+
+    @classmethod
+    def _translate(cls, query: str) -> str:
+        sql = query.strip().rstrip(';')
+
+        '''Paging'''
+        sql = re.sub(r'offset\s+(\S+)\s+rows?\s+fetch\s+(?:next|first)\s+(\S+)\s+rows?\s+only', r'limit \2 offset \1',
+                     sql, flags=re.I)
+        sql = re.sub(r'fetch\s+(?:next|first)\s+(\S+)\s+rows?\s+only', r'limit \1', sql, flags=re.I)
+        sql = cls._rownum_to_limit(sql)
+
+        '''Dates'''
+        sql = re.sub(r"\b(?:sysdate|systimestamp)\s*([+-])\s*interval\s*'(\d+)'\s*(second|minute|hour|day)",
+                     lambda m: f"datetime('now', 'localtime', '{m.group(1)}{m.group(2)} {m.group(3).lower()}s')",
+                     sql, flags=re.I)
+        sql = re.sub(r'\b(?:sysdate|systimestamp)\s*([+-])\s*(\d+)\s*/\s*(\d+)',
+                     lambda m: f"datetime('now', 'localtime', "
+                               f"'{m.group(1)}{int(m.group(2)) * 86400 // int(m.group(3))} seconds')",
+                     sql, flags=re.I)
+        sql = re.sub(r'\b(?:sysdate|systimestamp)\s*([+-])\s*(\d+(?:\.\d+)?)',
+                     lambda m: f"datetime('now', 'localtime', '{m.group(1)}{m.group(2)} days')", sql, flags=re.I)
+        sql = re.sub(r'\btrunc\s*\(\s*sysdate\s*\)', "date('now', 'localtime')", sql, flags=re.I)
+        sql = re.sub(r'\b(?:sysdate|systimestamp)\b', cls._NOW, sql, flags=re.I)
+
+        '''Sequences'''
+        sql = re.sub(r'\b(\w+)\.(nextval|currval)\b', lambda m: f"{m.group(2).lower()}('{m.group(1).upper()}')",
+                     sql, flags=re.I)
+
+        '''Functions/keywords'''
+        sql = re.sub(r'\s+from\s+dual\b', '', sql, flags=re.I)
+        sql = re.sub(r'\bnvl\s*\(', 'ifnull(', sql, flags=re.I)
+        sql = re.sub(r'\bminus\b', 'except', sql, flags=re.I)
+        sql = re.sub(r'\s+for\s+update(\s+nowait)?', '', sql, flags=re.I)
+
+        return sql
+
+    @classmethod
+    def _rownum_to_limit(cls, sql: str) -> str:
+        """Removes each rownum condition and adds the limit before the ')' closing its (sub)query, or at the end
+        """
+        while True:
+            m = cls._ROWNUM_COND.search(sql)
+            if m is None:
+                return sql
+            keyword, op, noOfRows, trailingAnd = m.groups()
+            limit = int(noOfRows) - 1 if op == '<' else int(noOfRows)
+            replaceWith = (' ' + keyword) if trailingAnd else ''
+
+            depth, end = 0, len(sql)
+            for i in range(m.end(), len(sql)):
+                if sql[i] == '(':
+                    depth += 1
+                elif sql[i] == ')':
+                    depth -= 1
+                    if depth < 0:
+                        end = i
+                        break
+            sql = sql[:m.start()] + replaceWith + sql[m.end():end].rstrip() + f" limit {limit}" + sql[end:]
+
+    @staticmethod
+    def trunc(val, fmt=None):
+        """trunc(number[, decimals]) or trunc(date[, 'MM'/'YYYY']), dates are returned as YYYY-MM-DD
+        """
+        if val is None:
+            return None
+        if not isinstance(val, (int, float)):
+            try:
+                dateVal = datetime.fromisoformat(str(val))
+            except ValueError:
+                val = float(val)
+            else:
+                fmt = 'DD' if fmt is None else str(fmt).upper()
+                if fmt in ('MM', 'MON', 'MONTH'):
+                    dateVal = dateVal.replace(day=1)
+                elif fmt in ('YYYY', 'YY', 'YEAR'):
+                    dateVal = dateVal.replace(month=1, day=1)
+                return dateVal.strftime('%Y-%m-%d')
+        if fmt is None or int(fmt) == 0:
+            return math.trunc(val)
+        factor = 10 ** int(fmt)
+        return math.trunc(val * factor) / factor
+
+    @classmethod
+    def to_strftime_format(cls, oraFormat: str) -> str:
+        pyFormat = oraFormat.upper()
+        for oraToken, pyToken in cls.DATE_FORMATS:
+            pyFormat = pyFormat.replace(oraToken, pyToken)
+        return pyFormat
+
+    @classmethod
+    def to_char(cls, val, oraFormat: str = None):
+        if val is None:
+            return None
+        if oraFormat is not None:
+            try:
+                return datetime.fromisoformat(str(val)).strftime(cls.to_strftime_format(oraFormat))
+            except ValueError:
+                pass
+        return str(val)
+
+    @classmethod
+    def to_date(cls, val, oraFormat: str = None):
+        if val is None:
+            return None
+        if oraFormat is None:
+            return str(val)
+        return str(datetime.strptime(str(val), cls.to_strftime_format(oraFormat)))
+
+    @staticmethod
+    def to_number(val):
+        if val is None or str(val).strip() == '':
+            return None
+        numVal = float(val)
+        return int(numVal) if numVal.is_integer() else numVal
+
+
+class LocalDBCursor:
+    """cx_Oracle like cursor (rowfactory, arraysize, prefetchrows, uppercase description) over sqlite
+    """
+
+    def __init__(self, conn: 'LocalDBConnection'):
+        self._conn = conn
+        self._cursor = conn.sqlite_conn.cursor()
+        self.rowfactory = None
+        self.arraysize = 100
+        self.prefetchrows = 2
+
+    @property
+    def description(self):
+        if self._cursor.description is None:
+            return None
+        return [(col[0].upper(),) + tuple(col[1:]) for col in self._cursor.description]
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def setinputsizes(self, **inputSizes):
+        """Bind types come from the values in sqlite"""
+        pass
+
+    def execute(self, query: str, bind_var: dict = None):
+        sql = OracleToSQLite.translate(query)
+        with self._conn.lock:
+            self._cursor.execute(sql, bind_var if bind_var is not None else {})
+            if self._conn.autocommit:
+                self._conn.sqlite_conn.commit()
+
+    def _to_row(self, row):
+        return self.rowfactory(*row) if self.rowfactory is not None else tuple(row)
+
+    def fetchone(self):
+        with self._conn.lock:
+            row = self._cursor.fetchone()
+        return None if row is None else self._to_row(row)
+
+    def fetchmany(self, numRows: int = None):
+        with self._conn.lock:
+            rows = self._cursor.fetchmany(numRows if numRows is not None else self.arraysize)
+        return [self._to_row(r) for r in rows]
+
+    def fetchall(self):
+        with self._conn.lock:
+            rows = self._cursor.fetchall()
+        return [self._to_row(r) for r in rows]
+
+    def close(self):
+        self._cursor.close()
+
+
+class LocalDBConnection:
+    """cx_Oracle like connection over 1 sqlite connection shared by all threads
+    """
+
+    def __init__(self, sqlite_conn: sqlite3.Connection):
+        self.sqlite_conn = sqlite_conn
+        self.lock = threading.RLock()
+        self.autocommit = False
+        self.stmtcachesize = 0
+        self.callTimeout = 0
+
+    def cursor(self) -> LocalDBCursor:
+        return LocalDBCursor(self)
+
+    def commit(self):
+        with self.lock:
+            self.sqlite_conn.commit()
+
+    def rollback(self):
+        with self.lock:
+            self.sqlite_conn.rollback()
+
+    def close(self):
+        self.sqlite_conn.close()
+
+
+class LocalDBService:
+    """SQLite stand-in of the WMS schema (db_backend=sqlite in env_config [orcl_db]), to run DBLib/DBAdmin offline.
+    Tables are seeded from <fixture dir>/<table name>.csv, header 'COL_NAME' for text or 'COL_NAME:NUMBER' for numeric.
+    Sequences start from user_sequences.csv (SEQUENCE_NAME, LAST_NUMBER) if present, else from 1
+    """
+    logger = Logging.get(__qualname__)
+
+    SEQUENCES = {}  # Pair of sequence name and curr value
+    _SEQ_LOCK = threading.Lock()
+    _NUMERIC_TYPES = ('NUMBER', 'INTEGER', 'INT', 'FLOAT', 'DECIMAL', 'NUMERIC')
+
+    @classmethod
+    def connect(cls, schema: str) -> LocalDBConnection:
+        DB_FILEPATH = ENV_CONFIG.get('orcl_db', 'local_db_filepath', fallback=':memory:')
+        FIXTURE_DIRPATH = ENV_CONFIG.get('orcl_db', 'local_db_fixture_dirpath',
+                                         fallback=os.path.join(RESOURCE_DIR, 'db_fixtures'))
+
+        printit(f"Local DB will connect for {schema} ({DB_FILEPATH})")
+        sqliteConn = sqlite3.connect(DB_FILEPATH, check_same_thread=False)
+        sqliteConn.create_function('nextval', 1, cls.nextval)
+        sqliteConn.create_function('currval', 1, cls.currval)
+        sqliteConn.create_function('to_char', 1, OracleToSQLite.to_char)
+        sqliteConn.create_function('to_char', 2, OracleToSQLite.to_char)
+        sqliteConn.create_function('to_date', 1, OracleToSQLite.to_date)
+        sqliteConn.create_function('to_date', 2, OracleToSQLite.to_date)
+        sqliteConn.create_function('to_number', 1, OracleToSQLite.to_number)
+        sqliteConn.create_function('trunc', 1, OracleToSQLite.trunc)
+        sqliteConn.create_function('trunc', 2, OracleToSQLite.trunc)
+
+        conn = LocalDBConnection(sqliteConn)
+        cls.seed_from_fixtures(conn, FIXTURE_DIRPATH)
+        return conn
+
+    @classmethod
+    def seed_from_fixtures(cls, conn: LocalDBConnection, fixtureDirPath: str):
+        """Creates and fills the tables from csv files, already filled tables are not touched
+        """
+        for filePath in sorted(glob.glob(os.path.join(fixtureDirPath, '*.csv'))):
+            tableName = os.path.splitext(os.path.basename(filePath))[0].lower()
+            with open(filePath, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    continue
+                colNames, colTypes = [], []
+                for col in header:
+                    colName, _, colType = col.strip().partition(':')
+                    colNames.append(colName.lower())
+                    colTypes.append('NUMERIC' if colType.upper() in cls._NUMERIC_TYPES else 'TEXT')
+                rows = [[None if v == '' else v for v in r] for r in reader]
+
+            with conn.lock:
+                colDefs = ', '.join(f"{n} {t}" for n, t in zip(colNames, colTypes))
+                conn.sqlite_conn.execute(f"create table if not exists {tableName} ({colDefs})")
+                noOfExistingRows = conn.sqlite_conn.execute(f"select count(*) from {tableName}").fetchone()[0]
+                if noOfExistingRows == 0 and len(rows) > 0:
+                    binds = ', '.join('?' * len(colNames))
+                    conn.sqlite_conn.executemany(f"insert into {tableName} ({', '.join(colNames)}) values ({binds})", rows)
+                conn.sqlite_conn.commit()
+            printit(f"Local DB table {tableName} seeded with {len(rows)} rows", isToPrint=False)
+
+            if tableName == 'user_sequences':
+                cls._load_sequences(colNames, rows)
+
+    @classmethod
+    def _load_sequences(cls, colNames: list, rows: list):
+        nameIdx, numIdx = colNames.index('sequence_name'), colNames.index('last_number')
+        with cls._SEQ_LOCK:
+            for r in rows:
+                cls.SEQUENCES[str(r[nameIdx]).upper()] = int(r[numIdx]) - 1
+
+    @classmethod
+    def nextval(cls, seqName: str) -> int:
+        with cls._SEQ_LOCK:
+            cls.SEQUENCES[seqName] = cls.SEQUENCES.get(seqName, 0) + 1
+            return cls.SEQUENCES[seqName]
+
+    @classmethod
+    def currval(cls, seqName: str) -> int:
+        with cls._SEQ_LOCK:
+            assert seqName in cls.SEQUENCES, f"Sequence {seqName} nextval not called yet"
+            return cls.SEQUENCES[seqName]
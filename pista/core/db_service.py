@@ -1,8 +1,15 @@
+import os
+import re
+import threading
 import time
+from collections import namedtuple
+from contextlib import closing, contextmanager
+from typing import Iterator
 
 import cx_Oracle
 
 from core.config_service import ENV_CONFIG, ENV_CONST
+from core.db_local_service import LocalDBService
 from core.file_service import DataHandler
 from core.log_service import Logging, printit
 
@@ -14,29 +21,99 @@ class DBService:
     # ORACLE_SCHEMAS = Config.ENV_CONFIG.getlist('db', 'oracle_schemas')
     # MYSQL_SCHEMAS = Config.ENV_CONFIG.getlist('db', 'mysql_schemas')
     DB_CONNS = {}  # Pair of schema name and db connection
+    DB_POOLS = {}  # Pair of schema name and session pool (is_use_session_pool=true)
+    DB_THREAD_CONNS = {}  # Pair of (schema name, thread id) and pooled session held by hold_conn()
+    DB_POOL_STATS = {}  # Pair of schema name and acquire/wait stats of the pool
+    SQL_TEXT_STATS = {}  # Pair of sql text hash and no. of executions, to watch hard parse volume
+    SQL_TEXT_STATS_MAX = 10000  # Distinct sql texts tracked, later ones are counted as untracked
+    SQL_UNTRACKED_EXECS = 0
+    DB_WAIT_STATS = {}  # Pair of test name and no. of db waits/total wait time
+
+    _POOL_LOCK = threading.Lock()
+    _POOL_STATS_LOCK = threading.Lock()
+    _WAIT_STATS_LOCK = threading.Lock()
+    _SQL_STATS_LOCK = threading.Lock()
+    _ROW_CLASSES = {}  # Pair of columns tuple and namedtuple row class (oldest dropped after _MAX_ROW_CLASSES)
+    _MAX_ROW_CLASSES = 256
+    _ROW_CLASSES_LOCK = threading.Lock()
+    _IS_ORA_CLIENT_INIT = False
+    _DB_CREDENTIAL = None  # Host, port, service, user and decrypted pwd, read once per process
+    _DB_SETTINGS = None  # db_backend and is_use_session_pool, read once per process
+    _DEAD_SESSION_ERR_CODES = (28, 1012, 3113, 3114, 3135, 12537, 12570, 24457)  # ORA- codes of broken/timed out session
+
+    @classmethod
+    def _get_db_settings(cls) -> dict:
+        if cls._DB_SETTINGS is None:
+            _DB_BACKEND = ENV_CONFIG.get('orcl_db', 'db_backend', fallback='oracle')
+            _IS_USE_SESSION_POOL = ENV_CONFIG.get('orcl_db', 'is_use_session_pool', fallback='false')
+            isLocalDb = 'sqlite' in _DB_BACKEND
+            cls._DB_SETTINGS = {'isLocalDb': isLocalDb,
+                                'isUseSessionPool': 'true' in _IS_USE_SESSION_POOL and not isLocalDb}
+        return cls._DB_SETTINGS
+
+    @classmethod
+    def _is_local_db(cls) -> bool:
+        """db_backend=sqlite runs the sqls on a local stand-in (LocalDBService) instead of oracle
+        """
+        return cls._get_db_settings()['isLocalDb']
+
+    @classmethod
+    def _is_use_session_pool(cls) -> bool:
+        return cls._get_db_settings()['isUseSessionPool']
+
+    @classmethod
+    def _init_oracle_client(cls):
+        """Oracle client can be initialized only once per process
+        """
+        if not cls._IS_ORA_CLIENT_INIT:
+            ORA_CLIENT_DIRPATH = ENV_CONST.get('db', 'oracle_instaclient_dirpath')
+            cx_Oracle.init_oracle_client(lib_dir=ORA_CLIENT_DIRPATH)
+            cls._IS_ORA_CLIENT_INIT = True
+
+    @classmethod
+    def _get_stmt_cache_size(cls) -> int:
+        """Statement cache size per session, repeated sql texts (with bind vars) are not parsed again
+        """
+        return int(ENV_CONFIG.get('orcl_db', 'stmt_cache_size', fallback='50'))
+
+    @classmethod
+    def _get_db_credential(cls) -> dict:
+        """Returns db host, port, service, user and decrypted pwd, decrypts only once per process
+        """
+        if cls._DB_CREDENTIAL is None:
+            cls._DB_CREDENTIAL = {'host': ENV_CONFIG.get('orcl_db', 'wm_host'),
+                                  'port': ENV_CONFIG.get('orcl_db', 'wm_port'),
+                                  'service': ENV_CONFIG.get('orcl_db', 'wm_service'),
+                                  'user': ENV_CONFIG.get('orcl_db', 'wm_user'),
+                                  'pwd': DataHandler.decrypt_it(ENV_CONFIG.get('orcl_db', 'wm_pwd_encrypted'))}
+        return cls._DB_CREDENTIAL
 
     @classmethod
     def connect_db(cls, schema):
-        ORA_CLIENT_DIRPATH = ENV_CONST.get('db', 'oracle_instaclient_dirpath')
-        OR_HOST = ENV_CONFIG.get('orcl_db', 'wm_host')
-        OR_PORT = ENV_CONFIG.get('orcl_db', 'wm_port')
-        OR_SERVICE = ENV_CONFIG.get('orcl_db', 'wm_service')
-        OR_USER = ENV_CONFIG.get('orcl_db', 'wm_user')
-        OR_PWD = ENV_CONFIG.get('orcl_db', 'wm_pwd_encrypted')
-        OR_PWD = DataHandler.decrypt_it(OR_PWD)
+        if cls._is_use_session_pool():
+            return cls._get_pool(schema)  # Sessions are acquired per db call or per hold_conn() block
 
         # if schema not in cls.ORACLE_SCHEMAS and schema not in cls.MYSQL_SCHEMAS:
         #     assert False, 'Schema not defined: ' + schema
         # else:
+        if (schema not in cls.DB_CONNS.keys() or cls.DB_CONNS[schema] is None) and cls._is_local_db():
+            with cls._POOL_LOCK:
+                if cls.DB_CONNS.get(schema) is None:
+                    cls.DB_CONNS[schema] = LocalDBService.connect(schema)
+
         if schema not in cls.DB_CONNS.keys() or cls.DB_CONNS[schema] is None:
             printit('DB will connect')
 
             try:
-                cx_Oracle.init_oracle_client(lib_dir=ORA_CLIENT_DIRPATH)
+                cred = cls._get_db_credential()
+                OR_HOST, OR_PORT, OR_SERVICE = cred['host'], cred['port'], cred['service']
+                OR_USER, OR_PWD = cred['user'], cred['pwd']
+                cls._init_oracle_client()
                 # conn = None
                 # if schema in cls.ORACLE_SCHEMAS:
                 conn = cx_Oracle.connect(OR_USER + '/' + OR_PWD + '@' + OR_HOST + ':' + OR_PORT + '/' + OR_SERVICE)
                 conn.callTimeout = 1000 * 200  # DPI-1067: call timeout of 1000 ms exceeded with ORA-3156
+                conn.stmtcachesize = cls._get_stmt_cache_size()
                 # elif schema in cls.MYSQL_SCHEMAS:
                 # conn = mysql.connector.connect(user + '/' + passwd + '@' + host_url)
                 # pass
@@ -49,34 +126,254 @@ class DBService:
         return cls.DB_CONNS[schema]
 
     @classmethod
-    def fetch_row(cls, query: str, schema: str = None) -> dict:
-        """returns None if no data
+    def _create_pool(cls, schema):
+        """Creates 1 session pool per schema, sizes are from env_config [orcl_db]
         """
-        printit('Sql', query)
+        cred = cls._get_db_credential()
+        OR_HOST, OR_PORT, OR_SERVICE = cred['host'], cred['port'], cred['service']
+        OR_USER, OR_PWD = cred['user'], cred['pwd']
 
-        assert schema is not None, 'schema missing'
+        POOL_MIN = int(ENV_CONFIG.get('orcl_db', 'pool_min_sessions', fallback='1'))
+        POOL_MAX = int(ENV_CONFIG.get('orcl_db', 'pool_max_sessions', fallback='8'))
+        POOL_INCREMENT = int(ENV_CONFIG.get('orcl_db', 'pool_increment', fallback='1'))
+        POOL_WAITTIME_IN_SEC = int(ENV_CONFIG.get('orcl_db', 'pool_waittime_in_sec', fallback='60'))
 
-        row = {}
-        cursor = None
+        printit(f"DB pool will create for {schema} (min {POOL_MIN}, max {POOL_MAX}, increment {POOL_INCREMENT})")
+        try:
+            cls._init_oracle_client()
+            dsn = cx_Oracle.makedsn(OR_HOST, OR_PORT, service_name=OR_SERVICE)
+            pool = cx_Oracle.SessionPool(user=OR_USER, password=OR_PWD, dsn=dsn,
+                                         min=POOL_MIN, max=POOL_MAX, increment=POOL_INCREMENT, threaded=True,
+                                         getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+                                         wait_timeout=POOL_WAITTIME_IN_SEC * 1000)
+            cls.DB_POOLS[schema] = pool
+            cls.DB_POOL_STATS[schema] = {'acquired': 0, 'released': 0, 'dropped': 0, 'timeouts': 0,
+                                         'total_wait_sec': 0.0, 'max_wait_sec': 0.0}
+        except cx_Oracle.DatabaseError as e:
+            assert False, 'Exception during DB pool creation: ' + str(e)
+        except Exception as e:
+            assert False, 'Exception during DB pool creation: ' + str(e)
+
+        return cls.DB_POOLS[schema]
+
+    @classmethod
+    def _get_pool(cls, schema):
+        with cls._POOL_LOCK:
+            pool = cls.DB_POOLS.get(schema)
+            if pool is None:
+                pool = cls._create_pool(schema)
+        return pool
+
+    @classmethod
+    def _add_pool_stats(cls, schema: str, **counts):
+        with cls._POOL_STATS_LOCK:
+            stats = cls.DB_POOL_STATS[schema]
+            for k, v in counts.items():
+                if k == 'max_wait_sec':
+                    stats[k] = max(stats[k], v)
+                else:
+                    stats[k] += v
+
+    @classmethod
+    def _acquire_pooled_conn(cls, schema):
+        """Acquires a session from the pool, caller releases it by _release_pooled_conn()
+        """
+        pool = cls._get_pool(schema)
+        start_time = time.perf_counter()
         try:
-            conn = cls.DB_CONNS[schema]
-            cursor = conn.cursor()
+            conn = pool.acquire()
+            conn.callTimeout = 1000 * 200  # DPI-1067: call timeout of 1000 ms exceeded with ORA-3156
+            conn.stmtcachesize = cls._get_stmt_cache_size()
+        except cx_Oracle.DatabaseError as e:
+            cls._add_pool_stats(schema, timeouts=1)
+            assert False, f"Exception during DB session acquire (busy {pool.busy}/{pool.max}): " + str(e)
+        finally:
+            wait_sec = time.perf_counter() - start_time
+            cls._add_pool_stats(schema, total_wait_sec=wait_sec, max_wait_sec=wait_sec)
 
-            # if bind_var is None:
+        cls._add_pool_stats(schema, acquired=1)
+        printit(f"DB session acquired in {round(wait_sec, 3)}s", isToPrint=False)
+        return conn
+
+    @classmethod
+    def _release_pooled_conn(cls, schema: str, conn, isDrop: bool = False):
+        pool = cls.DB_POOLS.get(schema)
+        if conn is None or pool is None:
+            return
+        try:
+            if isDrop:
+                pool.drop(conn)
+                cls._add_pool_stats(schema, dropped=1)
+            else:
+                pool.release(conn)
+                cls._add_pool_stats(schema, released=1)
+        except cx_Oracle.DatabaseError as e:
+            printit('Exception during DB session release: ' + str(e))
+
+    @classmethod
+    @contextmanager
+    def hold_conn(cls, schema: str):
+        """Yields the connection for the db calls inside the with block (unit of work).
+        With session pool, 1 session is held by the curr thread for the block and released to the pool
+        when the outermost block ends, db calls outside a block acquire and release a session per call
+        """
+        if not cls._is_use_session_pool():
+            yield cls.DB_CONNS[schema]
+            return
+
+        conn_key = (schema, threading.current_thread().native_id)
+        isOuterBlock = cls.DB_THREAD_CONNS.get(conn_key) is None
+        if isOuterBlock:
+            cls.DB_THREAD_CONNS[conn_key] = cls._acquire_pooled_conn(schema)
+        try:
+            yield cls.DB_THREAD_CONNS[conn_key]
+        finally:
+            if isOuterBlock:
+                cls.release_conn(schema)
+
+    @classmethod
+    def release_conn(cls, schema: str = None, isDrop: bool = False):
+        """Releases the session held by the curr thread back to the pool (for all schemas if schema not provided).
+        isDrop=True removes the session from the pool, used for dead sessions
+        """
+        thread_id = threading.current_thread().native_id
+        schemas = [schema] if schema is not None else list(cls.DB_POOLS.keys())
+
+        for s in schemas:
+            conn = cls.DB_THREAD_CONNS.pop((s, thread_id), None)
+            cls._release_pooled_conn(s, conn, isDrop)
+
+    @classmethod
+    def get_pool_stats(cls, schema: str) -> dict:
+        """Returns pool size and acquire/wait stats for the schema, empty if pool not used
+        """
+        pool = cls.DB_POOLS.get(schema)
+        if pool is None:
+            return {}
+
+        with cls._POOL_STATS_LOCK:
+            stats = dict(cls.DB_POOL_STATS[schema])
+        stats.update({'opened': pool.opened, 'busy': pool.busy, 'min': pool.min, 'max': pool.max,
+                      'increment': pool.increment})
+        stats['avg_wait_sec'] = stats['total_wait_sec'] / stats['acquired'] if stats['acquired'] > 0 else 0.0
+        return stats
+
+    @classmethod
+    @contextmanager
+    def _conn_for_call(cls, schema: str):
+        """Connection for 1 db call, a pooled session not held by hold_conn() goes back to the pool after the call.
+        A dead pooled session (broken/timed out) is dropped from the pool, so that the next call gets a fresh one
+        """
+        if not cls._is_use_session_pool():
+            yield cls.DB_CONNS[schema]
+            return
+
+        conn_key = (schema, threading.current_thread().native_id)
+        heldConn = cls.DB_THREAD_CONNS.get(conn_key)
+        conn = heldConn if heldConn is not None else cls._acquire_pooled_conn(schema)
+        isDead = False
+        try:
+            yield conn
+        except cx_Oracle.DatabaseError as e:
+            isDead = cls._is_dead_session_error(e)
+            raise
+        finally:
+            if isDead:
+                printit('DB session is dead, dropping it from pool')
+            if heldConn is None:
+                cls._release_pooled_conn(schema, conn, isDrop=isDead)
+            elif isDead:
+                cls.release_conn(schema, isDrop=True)
+
+    @classmethod
+    def _is_dead_session_error(cls, e: Exception) -> bool:
+        error = e.args[0] if len(e.args) > 0 else None
+        return getattr(error, 'code', None) in cls._DEAD_SESSION_ERR_CODES or 'DPI-1080' in str(e)
+
+    @classmethod
+    def _execute(cls, cursor, query: str, bind_var: dict = None):
+        """Executes query with named bind vars (eg: where tc_asn_id = :asn, bind_var={'asn': 'A1'})
+        and counts the sql text
+        """
+        sqlHash = hash(query)
+        with cls._SQL_STATS_LOCK:
+            if sqlHash in cls.SQL_TEXT_STATS or len(cls.SQL_TEXT_STATS) < cls.SQL_TEXT_STATS_MAX:
+                cls.SQL_TEXT_STATS[sqlHash] = cls.SQL_TEXT_STATS.get(sqlHash, 0) + 1
+            else:
+                cls.SQL_UNTRACKED_EXECS += 1
+        if bind_var is None:
             cursor.execute(query)
-            # else:
-            #     cursor.execute(query, bind_var)
+        else:
+            cursor.execute(query, bind_var)
+
+    @staticmethod
+    def _query_desc(query: str, bind_var: dict = None) -> str:
+        """Query with bind vars for logs/assert msgs
+        """
+        return query if bind_var is None else f"{query} binds {bind_var}"
 
-            columns = [col[0] for col in cursor.description]
+    @classmethod
+    def _get_row_class(cls, columns: tuple):
+        """Returns the namedtuple class of the columns, built once per distinct columns"""
+        rowClass = cls._ROW_CLASSES.get(columns)
+        if rowClass is None:
+            rowClass = namedtuple('DBRow', columns, rename=True)
+            with cls._ROW_CLASSES_LOCK:
+                if len(cls._ROW_CLASSES) >= cls._MAX_ROW_CLASSES:
+                    cls._ROW_CLASSES.pop(next(iter(cls._ROW_CLASSES)), None)
+                cls._ROW_CLASSES[columns] = rowClass
+        return rowClass
+
+    @classmethod
+    def _set_rowfactory(cls, cursor, isNamedTupleRow: bool = False):
+        """Dict row by default.
+        isNamedTupleRow=True gives lightweight rows sharing 1 column index (row.ITEM_NAME or row[0])
+        """
+        columns = [col[0] for col in cursor.description]
+        if isNamedTupleRow:
+            cursor.rowfactory = cls._get_row_class(tuple(columns))
+        else:
             cursor.rowfactory = lambda *args: dict(zip(columns, args))
-            row = cursor.fetchone()
-        except cx_Oracle.DatabaseError as e:
-            assert False, str(e) + ' exception during query run ' + query
+
+    @staticmethod
+    def _set_fetch_size(cursor, arraysize: int = None, prefetchrows: int = None):
+        """Rows per fetch round trip, driver default is used if not provided
+        """
+        if arraysize is not None:
+            cursor.arraysize = arraysize
+        if prefetchrows is not None:
+            cursor.prefetchrows = prefetchrows
+
+    @classmethod
+    def get_sql_stats(cls) -> dict:
+        """Returns no. of distinct sql texts and executions in this run.
+        Less distinct sql texts means less hard parse in DB
+        """
+        with cls._SQL_STATS_LOCK:
+            total_executions = sum(cls.SQL_TEXT_STATS.values())
+            distinct_sqls = len(cls.SQL_TEXT_STATS)
+            untracked_executions = cls.SQL_UNTRACKED_EXECS
+        return {'distinct_sqls': distinct_sqls, 'executions': total_executions + untracked_executions,
+                'reused_executions': total_executions - distinct_sqls,
+                'untracked_executions': untracked_executions}
+
+    @classmethod
+    def fetch_row(cls, query: str, schema: str = None, bind_var: dict = None) -> dict:
+        """returns None if no data
+        """
+        printit('Sql', cls._query_desc(query, bind_var))
+
+        assert schema is not None, 'schema missing'
+
+        row = {}
+        try:
+            with cls._conn_for_call(schema) as conn, closing(conn.cursor()) as cursor:
+                cls._execute(cursor, query, bind_var)
+
+                cls._set_rowfactory(cursor)
+                row = cursor.fetchone()
         except Exception as e:
-            assert False, str(e) + ' exception during query run ' + query
-        finally:
-            if cursor:
-                cursor.close()
+            assert False, str(e) + ' exception during query run ' + cls._query_desc(query, bind_var)
 
         noOfCol = 0 if row is None else len(row)
         printit('Cols found', str(noOfCol))
@@ -84,34 +381,27 @@ class DBService:
         return row  # row is None if no data
 
     @classmethod
-    def fetch_rows(cls, query: str, schema: str = None) -> list[dict]:
+    def fetch_rows(cls, query: str, schema: str = None, bind_var: dict = None, isNamedTupleRow: bool = False,
+                   arraysize: int = None, prefetchrows: int = None) -> list[dict]:
         """len(returned list) = 0 if no data
+        isNamedTupleRow=True returns namedtuple rows instead of dict rows
+        arraysize/prefetchrows: rows per round trip, use for large result sets
         """
-        printit('Sql', query)
+        printit('Sql', cls._query_desc(query, bind_var))
 
         assert schema is not None, 'schema missing'
 
         rows = [{}]
-        cursor = None
         try:
-            conn = cls.DB_CONNS[schema]
-            cursor = conn.cursor()
+            with cls._conn_for_call(schema) as conn, closing(conn.cursor()) as cursor:
+                cls._set_fetch_size(cursor, arraysize, prefetchrows)
 
-            # if bind_var is None:
-            cursor.execute(query)
-            # else:
-            #     cursor.execute(query, bind_var)
+                cls._execute(cursor, query, bind_var)
 
-            columns = [col[0] for col in cursor.description]
-            cursor.rowfactory = lambda *args: dict(zip(columns, args))
-            rows = cursor.fetchall()
-        except cx_Oracle.DatabaseError as e:
-            assert False, str(e) + ' exception during query run ' + query
+                cls._set_rowfactory(cursor, isNamedTupleRow)
+                rows = cursor.fetchall()
         except Exception as e:
-            assert False, str(e) + ' exception during query run ' + query
-        finally:
-            if cursor:
-                cursor.close()
+            assert False, str(e) + ' exception during query run ' + cls._query_desc(query, bind_var)
 
         noOfRows = 0 if rows is None else len(rows)
         printit('Rows found', str(noOfRows))
@@ -119,34 +409,27 @@ class DBService:
         return rows  # len(rows) = 0 if no data
 
     @classmethod
-    def fetch_only_rows(cls, query: str, how_many_rows: int, schema: str = None) -> list[dict]:
+    def fetch_only_rows(cls, query: str, how_many_rows: int, schema: str = None, bind_var: dict = None,
+                        isNamedTupleRow: bool = False, arraysize: int = None, prefetchrows: int = None) -> list[dict]:
         """len(returned list) = 0 if no data
+        isNamedTupleRow=True returns namedtuple rows instead of dict rows
+        arraysize/prefetchrows: rows per round trip (eg how_many_rows for 1 round trip), driver default if not provided
         """
-        printit('Sql', query)
+        printit('Sql', cls._query_desc(query, bind_var))
 
         assert schema is not None, 'schema missing'
 
         rows = [{}]
-        cursor = None
         try:
-            conn = cls.DB_CONNS[schema]
-            cursor = conn.cursor()
+            with cls._conn_for_call(schema) as conn, closing(conn.cursor()) as cursor:
+                cls._set_fetch_size(cursor, arraysize, prefetchrows)
 
-            # if bind_var is None:
-            cursor.execute(query)
-            # else:
-            #     cursor.execute(query, bind_var)
+                cls._execute(cursor, query, bind_var)
 
-            columns = [col[0] for col in cursor.description]
-            cursor.rowfactory = lambda *args: dict(zip(columns, args))
-            rows = cursor.fetchmany(how_many_rows)
-        except cx_Oracle.DatabaseError as e:
-            assert False, str(e) + ' exception during query run ' + query
+                cls._set_rowfactory(cursor, isNamedTupleRow)
+                rows = cursor.fetchmany(how_many_rows)
         except Exception as e:
-            assert False, str(e) + ' exception during query run ' + query
-        finally:
-            if cursor:
-                cursor.close()
+            assert False, str(e) + ' exception during query run ' + cls._query_desc(query, bind_var)
 
         noOfRows = 0 if rows is None else len(rows)
         printit('Rows found', str(noOfRows))
@@ -154,29 +437,55 @@ class DBService:
         return rows  # len(rows) = 0 if no data
 
     @classmethod
-    def update_db(cls, query: str, schema: str = None) -> bool:
-        printit('::: Sql', query)
+    def fetch_rows_in_batches(cls, query: str, schema: str = None, bind_var: dict = None, batch_size: int = 500,
+                              isNamedTupleRow: bool = False, prefetchrows: int = None) -> Iterator[list]:
+        """Yields list of rows (max batch_size rows per list) until no data.
+        Only the consumed batches are fetched, cursor is closed when the loop ends or breaks
+        """
+        printit('Sql', cls._query_desc(query, bind_var))
 
         assert schema is not None, 'schema missing'
 
-        isExecuted = False
-        cursor = None
+        noOfRows = 0
         try:
-            conn = cls.DB_CONNS[schema]
-            conn.autocommit = True
-            cursor = conn.cursor()
-            cursor.execute(query)
-            # conn.commmit()
-            isExecuted = True
-            if cursor is not None:
-                printit('Rows impacted', str(cursor.rowcount))
-        except cx_Oracle.DatabaseError as e:
-            assert False, str(e) + ' exception during query run ' + query
+            with cls._conn_for_call(schema) as conn, closing(conn.cursor()) as cursor:
+                cls._set_fetch_size(cursor, arraysize=batch_size, prefetchrows=prefetchrows)
+
+                cls._execute(cursor, query, bind_var)
+
+                cls._set_rowfactory(cursor, isNamedTupleRow)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    noOfRows += len(rows)
+                    yield rows
         except Exception as e:
-            assert False, str(e) + ' exception during query run ' + query
+            assert False, str(e) + ' exception during query run ' + cls._query_desc(query, bind_var)
         finally:
-            if cursor:
-                cursor.close()
+            printit('Rows fetched', str(noOfRows))
+
+    @classmethod
+    def update_db(cls, query: str, schema: str = None, bind_var: dict = None, clob_binds: list[str] = None) -> bool:
+        """clob_binds: names of the bind vars to bind as CLOB (eg large xml), else str binds over 4000 chars go as LONG
+        """
+        printit('::: Sql', cls._query_desc(query, bind_var))
+
+        assert schema is not None, 'schema missing'
+
+        isExecuted = False
+        try:
+            with cls._conn_for_call(schema) as conn:
+                conn.autocommit = True
+                with closing(conn.cursor()) as cursor:
+                    if clob_binds:
+                        cursor.setinputsizes(**{bindName: cx_Oracle.DB_TYPE_CLOB for bindName in clob_binds})
+                    cls._execute(cursor, query, bind_var)
+                    # conn.commmit()
+                    isExecuted = True
+                    printit('Rows impacted', str(cursor.rowcount))
+        except Exception as e:
+            assert False, str(e) + ' exception during query run ' + cls._query_desc(query, bind_var)
 
         return isExecuted
 
@@ -187,51 +496,161 @@ class DBService:
         return query
 
     @classmethod
-    def wait_for_records(cls, query: str, expected_cnt: int, schema: str = None, maxWaitInSec: int = None):
-        printit('Sql', query)
+    def _get_poll_intervals(cls) -> tuple[float, float]:
+        """Returns (first, max) poll interval in sec for db waits
+        """
+        minIntervalInMs = ENV_CONFIG.get('orcl_db', 'wait_poll_min_in_ms', fallback='100')
+        maxIntervalInMs = ENV_CONFIG.get('orcl_db', 'wait_poll_max_in_ms', fallback='2000')
+        return int(minIntervalInMs) / 1000, int(maxIntervalInMs) / 1000
 
-        assert schema is not None, 'schema missing'
+    @staticmethod
+    def _get_curr_test_name() -> str:
+        currTest = os.environ.get('PYTEST_CURRENT_TEST')
+        return currTest.rsplit(' ', 1)[0] if currTest else 'NO_TEST'
 
-        record_found = False
+    @classmethod
+    def _add_wait_time(cls, waitInSec: float):
+        testName = cls._get_curr_test_name()
+        with cls._WAIT_STATS_LOCK:
+            stats = cls.DB_WAIT_STATS.setdefault(testName, {'waits': 0, 'total_wait_sec': 0.0})
+            stats['waits'] += 1
+            stats['total_wait_sec'] += waitInSec
+            totalWaitInSec = stats['total_wait_sec']
+        printit(f"DB wait took {round(waitInSec, 3)}s, total db wait in test {round(totalWaitInSec, 3)}s")
 
-        max_waittime_in_sec = maxWaitInSec if maxWaitInSec is not None else 30
-        interval_waittime_in_sec = 3
-        total_iteration = int(max_waittime_in_sec / interval_waittime_in_sec)
-
-        for i in range(0, total_iteration):
-            rows = DBService.fetch_rows(query, schema)
-            if len(rows) >= expected_cnt:
-                record_found = True
-                break
-            else:
-                time.sleep(interval_waittime_in_sec)
-        assert record_found, str(expected_cnt) + ' no. of record not found within waittime: ' + query
+    @classmethod
+    def get_wait_stats(cls, testName: str = None) -> dict:
+        """Returns no. of db waits and total wait time of the test (current test if not provided)
+        """
+        testName = testName if testName is not None else cls._get_curr_test_name()
+        with cls._WAIT_STATS_LOCK:
+            stats = dict(cls.DB_WAIT_STATS.get(testName, {'waits': 0, 'total_wait_sec': 0.0}))
+        stats['total_wait_sec'] = round(stats['total_wait_sec'], 3)
+        return stats
+
+    @classmethod
+    def _wait_until(cls, isMetFunc, maxWaitInSec: float) -> bool:
+        """Calls isMetFunc till it returns True or the deadline is over.
+        Poll interval starts from wait_poll_min_in_ms and doubles till wait_poll_max_in_ms
+        """
+        interval, maxInterval = cls._get_poll_intervals()
+        startTime = time.monotonic()
+        deadline = startTime + maxWaitInSec
+
+        isMet = False
+        try:
+            while True:
+                isMet = isMetFunc()
+                remainingInSec = deadline - time.monotonic()
+                if isMet or remainingInSec <= 0:
+                    break
+                time.sleep(min(interval, remainingInSec))
+                interval = min(interval * 2, maxInterval)
+        finally:
+            cls._add_wait_time(time.monotonic() - startTime)
+
+        return isMet
 
     @classmethod
-    def wait_for_value(cls, query: str, column: str, expected_value: str, schema: str = None, maxWaitInSec: int = None):
-        printit('Sql', query)
+    def wait_for_records(cls, query: str, expected_cnt: int, schema: str = None, maxWaitInSec: int = None,
+                         bind_var: dict = None):
+        printit('Sql', cls._query_desc(query, bind_var))
 
         assert schema is not None, 'schema missing'
 
-        value_updated = False
-        actual_value = ''
+        max_waittime_in_sec = maxWaitInSec if maxWaitInSec is not None else 30
+
+        def isRecordFound():
+            rows = DBService.fetch_rows(query, schema, bind_var)
+            return len(rows) >= expected_cnt
+
+        record_found = cls._wait_until(isRecordFound, max_waittime_in_sec)
+        assert record_found, str(expected_cnt) + ' no. of record not found within waittime: ' + cls._query_desc(query, bind_var)
+
+    @classmethod
+    def wait_for_value(cls, query: str, column: str, expected_value: str, schema: str = None, maxWaitInSec: int = None,
+                       bind_var: dict = None):
+        printit('Sql', cls._query_desc(query, bind_var))
+
+        assert schema is not None, 'schema missing'
 
         max_waittime_in_sec = maxWaitInSec if maxWaitInSec is not None else 25
-        interval_waittime_in_sec = 3
-        total_iteration = int(max_waittime_in_sec / interval_waittime_in_sec)
+        actual_value = ''
 
-        for i in range(0, total_iteration):
-            row = DBService.fetch_row(query, schema)
+        def isValueUpdated():
+            nonlocal actual_value
+            row = DBService.fetch_row(query, schema, bind_var)
             if row is not None and len(row) > 0:
                 actual_value = str(row.get(column))
-                if actual_value == expected_value:
-                    value_updated = True
-                    break
-            if not value_updated:
-                time.sleep(interval_waittime_in_sec)
+            return actual_value == expected_value
+
+        value_updated = cls._wait_until(isValueUpdated, max_waittime_in_sec)
 
         cls.compareEqual(actual_value, expected_value, column + ' value')
-        assert value_updated, column + ' not updated to ' + expected_value + ' within waittime: ' + query
+        assert value_updated, column + ' not updated to ' + expected_value + ' within waittime: ' + cls._query_desc(query, bind_var)
+
+    @staticmethod
+    def _build_multiplexed_sql(waits: list[dict]) -> tuple[str, dict]:
+        """One select from dual having 1 column (W0, W1..) per wait, 1 if the wait is met else 0/null.
+        Expected val/cnt is compared in the db as a typed bind (:wN_expected), bind names are prefixed per wait
+        """
+        selectCols = []
+        multiBindVar = {}
+        for i, wait in enumerate(waits):
+            query = wait['query'].strip().rstrip(';')
+            for bindName, bindVal in (wait.get('bind_var') or {}).items():
+                query = re.sub(rf':{bindName}\b', f':w{i}_{bindName}', query)
+                multiBindVar[f'w{i}_{bindName}'] = bindVal
+            if 'column' in wait:
+                if wait['expected_value'] is None:
+                    isMetCond = f"t.{wait['column']} is null"
+                else:
+                    isMetCond = f"t.{wait['column']} = :w{i}_expected"
+                    multiBindVar[f'w{i}_expected'] = wait['expected_value']
+                selectCols.append(f"(select case when {isMetCond} then 1 else 0 end from ({query}) t where rownum = 1) W{i}")
+            else:
+                multiBindVar[f'w{i}_expected'] = wait['expected_cnt']
+                selectCols.append(f"(select case when count(*) >= :w{i}_expected then 1 else 0 end from ({query})) W{i}")
+        return 'select ' + ',\n'.join(selectCols) + ' from dual', multiBindVar
+
+    @classmethod
+    def wait_for_all(cls, waits: list[dict], schema: str = None, maxWaitInSec: int = None):
+        """Waits for multiple conditions with 1 query per poll, only pending waits are queried again.
+        Each wait is a dict of query, bind_var (optional) and
+        expected_cnt (record wait) or column, expected_value (value wait, pass the val in the column type e.g. int)
+        """
+        assert schema is not None, 'schema missing'
+        assert waits is not None and len(waits) > 0, 'waits missing'
+
+        max_waittime_in_sec = maxWaitInSec if maxWaitInSec is not None else 30
+        pendingWaits = list(waits)
+
+        def isAllMet():
+            sql, bindVar = cls._build_multiplexed_sql(pendingWaits)
+            row = DBService.fetch_row(sql, schema, bindVar)
+            stillPending = []
+            for i, wait in enumerate(pendingWaits):
+                dbVal = row.get(f'W{i}') if row is not None else None
+                if dbVal is None or int(dbVal) != 1:
+                    stillPending.append(wait)
+            pendingWaits[:] = stillPending
+            return len(pendingWaits) == 0
+
+        all_met = cls._wait_until(isAllMet, max_waittime_in_sec)
+
+        if not all_met:
+            failedWaits = []
+            for wait in pendingWaits:
+                rows = DBService.fetch_rows(wait['query'], schema, wait.get('bind_var'))
+                if 'column' in wait:
+                    expected = wait['expected_value']
+                    actual = rows[0].get(wait['column'].upper()) if len(rows) > 0 else None
+                else:
+                    expected = str(wait['expected_cnt']) + ' records'
+                    actual = str(len(rows)) + ' records'
+                failedWaits.append(f"expected {expected}, actual {actual}: "
+                                   + cls._query_desc(wait['query'], wait.get('bind_var')))
+            assert False, f"{len(failedWaits)} of {len(waits)} waits not met within waittime:\n" + '\n'.join(failedWaits)
 
     @classmethod
     def _compareIfNone(cls, actualVal, expectedVal, whatIsThisDesc: str) -> bool:
@@ -1,13 +1,24 @@
 import ftplib
+import hashlib
+import io
 import json
 import os
+import pickle
+import re
 import socket
 import threading
 import time
+from contextlib import contextmanager
 from zipfile import BadZipFile
 
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
 import openpyxl
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import XMLGenerator
 
 import pandas as pd
 from jsonschema.exceptions import ValidationError
@@ -22,12 +33,266 @@ from core.log_service import printit
 from root import OUTPUT_DIR, SCREENSHOT_DIR, RUNTIME_DIR, TEST_DIR, DATAPREP_FILE
 
 
+class ExcelCache:
+    """Process level cache of workbooks/dataframes keyed by file path, reloaded when the file changes (mtime/size).
+    Derived data (eg header maps) is kept with the workbook till it is saved or reloaded.
+    Readers and writers get separate workbooks, so a reader never sees a workbook being edited.
+    Callers hold write_lock(filepath) for a read-modify-save and save once per operation
+    """
+    _ENTRIES = {}  # Pair of (file path, sheet or _WRITE/_READ) and dict of file stamp, obj, derived data, under _LOCK
+    _WRITE, _READ = None, '#read'
+    _LOCKS = {}  # Pair of file path and rlock
+    _LOCK = threading.Lock()
+    _THREAD_LOCAL = threading.local()  # File paths under write_lock() by curr thread
+
+    @staticmethod
+    def get_stamp(filepath: str) -> tuple:
+        """Returns (mtime ns, size) of the file, a changed stamp means the file changed"""
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError as e:
+            assert False, 'File not found: ' + filepath
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def lock(cls, filepath: str) -> threading.RLock:
+        filepath = os.path.abspath(filepath)
+        with cls._LOCK:
+            return cls._LOCKS.setdefault(filepath, threading.RLock())
+
+    @staticmethod
+    def _lock_file(lockFile):
+        while True:
+            try:
+                if os.name == 'nt':
+                    lockFile.seek(0)
+                    msvcrt.locking(lockFile.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except OSError:
+                time.sleep(0.01)
+
+    @staticmethod
+    def _unlock_file(lockFile):
+        try:
+            if os.name == 'nt':
+                lockFile.seek(0)
+                msvcrt.locking(lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+        finally:
+            lockFile.close()
+
+    @classmethod
+    @contextmanager
+    def write_lock(cls, filepath: str):
+        """lock(filepath) plus an exclusive file lock (<file>.lock) shared with the other processes (xdist workers).
+        Cached entries of the file are dropped on entry, so a read-modify-save always starts from the file on disk
+        (the mtime/size stamp can miss a same size change by another process)
+        """
+        with cls.lock(filepath):
+            if not hasattr(cls._THREAD_LOCAL, 'heldFiles'):
+                cls._THREAD_LOCAL.heldFiles = set()
+            heldFiles = cls._THREAD_LOCAL.heldFiles
+            filepath = os.path.abspath(filepath)
+            if filepath in heldFiles:
+                yield
+                return
+
+            lockFile = open(filepath + '.lock', 'a+')
+            cls._lock_file(lockFile)
+            heldFiles.add(filepath)
+            try:
+                cls.invalidate(filepath)
+                yield
+            finally:
+                heldFiles.discard(filepath)
+                cls._unlock_file(lockFile)
+
+    @classmethod
+    def _get_entry(cls, filepath: str, sheet, loadFunc) -> dict:
+        key = (os.path.abspath(filepath), sheet)
+        stamp = cls.get_stamp(filepath)
+        with cls._LOCK:
+            entry = cls._ENTRIES.get(key)
+        if entry is None or entry['stamp'] != stamp:
+            printit(f"Loading excel {filepath} {'' if sheet is None else sheet}", isToPrint=False)
+            entry = {'stamp': stamp, 'obj': loadFunc(), 'derived': {}}
+            with cls._LOCK:
+                cls._ENTRIES[key] = entry
+        return entry
+
+    @classmethod
+    def _pop_entry(cls, key):
+        with cls._LOCK:
+            cls._ENTRIES.pop(key, None)
+
+    @staticmethod
+    def _load_workbook(filepath: str):
+        for _ in range(5):
+            try:
+                return openpyxl.load_workbook(filepath)
+            except BadZipFile as e:
+                time.sleep(2.0)
+        assert False, 'Workbook not readable: ' + filepath
+
+    @classmethod
+    def get_workbook(cls, filepath: str, isForWrite: bool = False):
+        """Returns the cached openpyxl workbook, readers dont change it.
+        isForWrite=True (under write_lock) returns the workbook to edit and save(), changes are kept till save() or reload
+        """
+        with cls.lock(filepath):
+            return cls._get_entry(filepath, cls._WRITE if isForWrite else cls._READ,
+                                  lambda: cls._load_workbook(filepath))['obj']
+
+    @classmethod
+    def get_derived(cls, filepath: str, derivedKey, buildFunc):
+        """Returns buildFunc(workbook) cached with the readers workbook"""
+        with cls.lock(filepath):
+            entry = cls._get_entry(filepath, cls._READ, lambda: cls._load_workbook(filepath))
+            if derivedKey not in entry['derived']:
+                entry['derived'][derivedKey] = buildFunc(entry['obj'])
+            return entry['derived'][derivedKey]
+
+    @classmethod
+    def save(cls, filepath: str):
+        """Saves the workbook got by get_workbook(isForWrite=True) to the file, readers reload it on next get"""
+        key = (os.path.abspath(filepath), cls._WRITE)
+        with cls.lock(filepath):
+            with cls._LOCK:
+                entry = cls._ENTRIES[key]
+            try:
+                entry['obj'].save(filepath)
+            except Exception:
+                cls._pop_entry(key)
+                raise
+            entry['stamp'] = cls.get_stamp(filepath)
+            entry['derived'].clear()
+
+    @staticmethod
+    def _as_str_df(df):
+        df = df.astype(str)
+        return df.replace({'nan': ''})
+
+    @classmethod
+    def get_df(cls, filepath: str, sheet: str):
+        """Returns the cached dataframe of the sheet with all values as str (nan as '')"""
+        with cls.lock(filepath):
+            return cls._get_entry(filepath, sheet, lambda: cls._as_str_df(pd.ExcelFile(filepath).parse(sheet)))['obj']
+
+    @classmethod
+    def get_loaded(cls, filepath: str, key: tuple, loadFunc):
+        """Returns loadFunc() cached with the file under key (eg ('json', sheet, column)), reloaded when the file changes.
+        For data read from the file other than the workbook/sheet df
+        """
+        with cls.lock(filepath):
+            return cls._get_entry(filepath, key, loadFunc)['obj']
+
+    @classmethod
+    def save_df(cls, filepath: str, sheet: str, df):
+        """Writes the dataframe as the only sheet of the file (as to_excel), keeps it cached as get_df() reads it"""
+        key = (os.path.abspath(filepath), sheet)
+        with cls.lock(filepath):
+            try:
+                df.to_excel(filepath, sheet_name=sheet, index=False)
+            except Exception:
+                cls._pop_entry(key)
+                raise
+            entry = {'stamp': cls.get_stamp(filepath), 'obj': cls._as_str_df(df), 'derived': {}}
+            with cls._LOCK:
+                cls._ENTRIES[key] = entry
+
+    @classmethod
+    def invalidate(cls, filepath: str = None):
+        with cls._LOCK:
+            if filepath is None:
+                cls._ENTRIES.clear()
+            else:
+                for key in [k for k in list(cls._ENTRIES) if k[0] == os.path.abspath(filepath)]:
+                    cls._ENTRIES.pop(key, None)
+
+
+class ExcelBinCache:
+    """Build once cache of test data sheets as pickle files in runtime dir (xl_cache), shared across runs/workers.
+    A sheet is converted on 1st read or when the excel stamp (mtime/size) changes, later reads load the pickle
+    """
+    CACHE_DIR = os.path.join(RUNTIME_DIR, 'xl_cache')
+
+    _LOADED = {}  # Pair of cache file path and (excel stamp, data)
+
+    @classmethod
+    def _get_cache_filepath(cls, filepath: str, sheet, kind: str) -> str:
+        filepath = os.path.abspath(filepath)
+        keyHash = hashlib.md5(f"{filepath}|{sheet}|{kind}".encode('utf-8')).hexdigest()[:12]
+        return os.path.join(cls.CACHE_DIR, f"{os.path.splitext(os.path.basename(filepath))[0]}_{kind}_{keyHash}.pkl")
+
+    @classmethod
+    def get(cls, filepath: str, sheet, kind: str, buildFunc):
+        """Returns the cached data of the sheet, buildFunc() converts the sheet when the excel changed.
+        kind names the data built by buildFunc (eg df, columns). Dont change the returned data
+        """
+        stamp = ExcelCache.get_stamp(filepath)
+        cacheFilepath = cls._get_cache_filepath(filepath, sheet, kind)
+
+        loaded = cls._LOADED.get(cacheFilepath)
+        if loaded is not None and loaded[0] == stamp:
+            return loaded[1]
+
+        loaded = None
+        if os.path.exists(cacheFilepath):
+            try:
+                with open(cacheFilepath, 'rb') as f:
+                    loaded = pickle.load(f)
+            except Exception as e:
+                printit(f"Excel cache {cacheFilepath} not readable, rebuilding: {e}", isToPrint=False)
+        if loaded is None or loaded[0] != stamp:
+            printit(f"Building excel cache of {filepath} {sheet} ({kind})", isToPrint=False)
+            loaded = (stamp, buildFunc())
+            cls._write(cacheFilepath, loaded)
+
+        cls._LOADED[cacheFilepath] = loaded
+        return loaded[1]
+
+    @classmethod
+    def _write(cls, cacheFilepath: str, loaded: tuple):
+        """Writes by temp file and rename, other workers never read a partial file"""
+        tempFilepath = f"{cacheFilepath}.{os.getpid()}.{threading.current_thread().native_id}.tmp"
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            with open(tempFilepath, 'wb') as f:
+                pickle.dump(loaded, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tempFilepath, cacheFilepath)
+        except Exception as e:
+            printit(f"Excel cache {cacheFilepath} not written: {e}")
+            if os.path.exists(tempFilepath):
+                os.remove(tempFilepath)
+
+    @staticmethod
+    def get_columns(filepath: str, sheet) -> dict:
+        """Returns dict of 'row_headers' (col 1 values from row 2) and 'columns' (pair of header and col values
+        from row 2, 1st col with the header)
+        """
+        def _build():
+            worksheet = ExcelUtil.read_xlsheet(filepath, sheet)
+            maxcol, maxrow = worksheet.max_column, worksheet.max_row
+            columns = dict()
+            for c in range(2, maxcol + 1):
+                header = worksheet.cell(1, c).value
+                if header not in columns:
+                    columns[header] = [worksheet.cell(r, c).value for r in range(2, maxrow + 1)]
+            rowHeaders = [worksheet.cell(r, 1).value for r in range(2, maxrow + 1)]
+            return {'row_headers': rowHeaders, 'columns': columns}
+
+        return ExcelBinCache.get(filepath, sheet, 'columns', _build)
+
+
 class ExcelUtil:
     @staticmethod
     def read_xlsheet(filepath: str, sheet) -> Worksheet:
-        """ Get worksheet obj from excel file """
+        """ Get worksheet obj from excel file (cached workbook, dont change it) """
         try:
-            workbook = openpyxl.load_workbook(filepath)
+            workbook = ExcelCache.get_workbook(filepath)
             if sheet is not None and sheet in workbook.sheetnames:
                 print('Reading worksheet: ' + sheet)
             else:
@@ -46,11 +311,10 @@ class ExcelUtil:
         thread_id = threading.current_thread().native_id
         col_values_str = ''
 
-        col_hdr_num_dict, row_hdr_num_dict, max_row, max_col = cls._get_all_xlheaders_num_dict(filepath)
+        with ExcelCache.lock(filepath):
+            col_hdr_num_dict, row_hdr_num_dict, max_row, max_col = cls._get_all_xlheaders_num_dict(filepath)
 
-        workbook = None
-        try:
-            workbook = openpyxl.load_workbook(filepath, read_only=False)
+            workbook = ExcelCache.get_workbook(filepath)
             sheet = workbook.sheetnames[0]
 
             if row_header_to_avoid is not None and str(row_header_to_avoid) in row_hdr_num_dict.keys():
@@ -71,9 +335,6 @@ class ExcelUtil:
                         col_values_str = curr_cell_val
                     else:
                         col_values_str = col_values_str + ',' + curr_cell_val
-        finally:
-            if workbook is not None:
-                workbook.close()
 
         # for column in workbook[sheet].iter_cols():
         #     column_name = column[0].value
@@ -92,37 +353,25 @@ class ExcelUtil:
     def _get_all_xlheaders_num_dict(cls, filepath: str, sheet:str=None):
         """Gets 2 dicts: column header name with seq num, row header name with seq num
         """
+        return ExcelCache.get_derived(filepath, ('num', sheet), lambda wb: cls._build_xlheaders_num_dict(wb, sheet))
+
+    @staticmethod
+    def _build_xlheaders_num_dict(workbook, sheet:str=None):
         col_hdr_num_dict = dict()
         row_hdr_num_dict = dict()
 
-        workbook = None
-        max_row = None
-        max_col = None
+        sheet = workbook.sheetnames[0] if sheet is None else sheet
 
-        for _ in range(5):
-            try:
-                workbook = openpyxl.load_workbook(filepath, read_only=True)
-                break
-            except BadZipFile as e:
-                time.sleep(2.0)
-
-        try:
-            if workbook is not None:
-                sheet = workbook.sheetnames[0] if sheet is None else sheet
+        max_col = workbook[sheet].max_column
+        max_row = workbook[sheet].max_row
 
-                max_col = workbook[sheet].max_column
-                max_row = workbook[sheet].max_row
+        for i in range(2, max_col + 1):
+            col_header = workbook[sheet].cell(row=1, column=i).value
+            col_hdr_num_dict[col_header] = i
 
-                for i in range(2, max_col + 1):
-                    col_header = workbook[sheet].cell(row=1, column=i).value
-                    col_hdr_num_dict[col_header] = i
-
-                for i in range(2, max_row + 1):
-                    row_header = workbook[sheet].cell(row=i, column=1).value
-                    row_hdr_num_dict[str(row_header)] = i
-        finally:
-            if workbook is not None:
-                workbook.close()
+        for i in range(2, max_row + 1):
+            row_header = workbook[sheet].cell(row=i, column=1).value
+            row_hdr_num_dict[str(row_header)] = i
 
         return col_hdr_num_dict, row_hdr_num_dict, max_row, max_col
 
@@ -130,56 +379,46 @@ class ExcelUtil:
     def _get_all_xlheaders_numrange_dict(cls, filepath: str, sheet:str=None):
         """Gets 2 dicts: column header name with seq num, row header name with seq num
         """
+        return ExcelCache.get_derived(filepath, ('numrange', sheet),
+                                      lambda wb: cls._build_xlheaders_numrange_dict(wb, sheet))
+
+    @staticmethod
+    def _build_xlheaders_numrange_dict(workbook, sheet:str=None):
         col_hdr_num_dict = dict()
         row_hdr_num_dict = dict()
 
-        workbook = None
-        max_row = None
+        sheet = workbook.sheetnames[0] if sheet is None else sheet
 
-        for _ in range(5):
-            try:
-                workbook = openpyxl.load_workbook(filepath, read_only=True)
-                break
-            except BadZipFile as e:
-                time.sleep(2.0)
+        max_col = workbook[sheet].max_column
+        max_row = workbook[sheet].max_row
 
-        try:
-            if workbook is not None:
-                sheet = workbook.sheetnames[0] if sheet is None else sheet
-
-                max_col = workbook[sheet].max_column
-                max_row = workbook[sheet].max_row
-
-                i = 2
-                while i <= max_col:
-                    start = end = i
-                    col_header = workbook[sheet].cell(row=1, column=i).value
-                    for j in range(start+1, max_col + 1):
-                        extra_col_header = workbook[sheet].cell(row=1, column=j).value
-                        if col_header == extra_col_header:
-                            end = j
-                        else:
-                            end = start if end is None else end
-                            break
-                    i = end + 1
-                    col_hdr_num_dict[col_header] = (start, end)
-
-                i = 2
-                while i <= max_row:
-                    start = end = i
-                    row_header = workbook[sheet].cell(row=i, column=1).value
-                    for j in range(start + 1, max_row + 1):
-                        extra_row_header = workbook[sheet].cell(row=j, column=1).value
-                        if row_header == extra_row_header:
-                            end = j
-                        else:
-                            end = start if end is None else end
-                            break
-                    i = end + 1
-                    row_hdr_num_dict[row_header] = (start, end)
-        finally:
-            if workbook is not None:
-                workbook.close()
+        i = 2
+        while i <= max_col:
+            start = end = i
+            col_header = workbook[sheet].cell(row=1, column=i).value
+            for j in range(start+1, max_col + 1):
+                extra_col_header = workbook[sheet].cell(row=1, column=j).value
+                if col_header == extra_col_header:
+                    end = j
+                else:
+                    end = start if end is None else end
+                    break
+            i = end + 1
+            col_hdr_num_dict[col_header] = (start, end)
+
+        i = 2
+        while i <= max_row:
+            start = end = i
+            row_header = workbook[sheet].cell(row=i, column=1).value
+            for j in range(start + 1, max_row + 1):
+                extra_row_header = workbook[sheet].cell(row=j, column=1).value
+                if row_header == extra_row_header:
+                    end = j
+                else:
+                    end = start if end is None else end
+                    break
+            i = end + 1
+            row_hdr_num_dict[row_header] = (start, end)
 
         return col_hdr_num_dict, row_hdr_num_dict, max_row
 
@@ -189,20 +428,10 @@ class ExcelUtil:
         """
         thread_id = threading.current_thread().native_id
 
-        col_hdr_num_dict, row_hdr_num_dict, max_row, max_col = ExcelUtil._get_all_xlheaders_num_dict(filepath)
+        with ExcelCache.write_lock(filepath):
+            col_hdr_num_dict, row_hdr_num_dict, max_row, max_col = ExcelUtil._get_all_xlheaders_num_dict(filepath)
 
-        workbook = None
-
-        for _ in range(5):
-            try:
-                workbook = openpyxl.load_workbook(filepath)
-                break
-            except BadZipFile as e:
-                time.sleep(2.0)
-
-        try:
-            # workbook = openpyxl.load_workbook(filepath)
-            sheet = workbook.active
+            sheet = ExcelCache.get_workbook(filepath, isForWrite=True).active
 
             col_hdr_num = col_hdr_num_dict[col_header]
             if str(row_header) in row_hdr_num_dict.keys():
@@ -222,30 +451,18 @@ class ExcelUtil:
             # print(Commons.build_date_forfilename(), f"{thread_id} updating xl ({row_header},{col_header}): {cell_value}")
             printit(f"... Thread {thread_id} updating excel data ({row_header},{col_header}): {cell_value}")
             sheet.cell(row=row_hdr_num, column=col_hdr_num).value = new_cell_val
-        finally:
-            if workbook is not None:
-                workbook.save(filepath)
-                workbook.close()
+
+            ExcelCache.save(filepath)
 
     @staticmethod
     def clear_xlcells(filepath: str, row_header, col_header: str = None):
         """"""
         thread_id = threading.current_thread().native_id
 
-        col_hdr_num_dict, row_hdr_num_dict, max_row, max_col = ExcelUtil._get_all_xlheaders_num_dict(filepath)
-
-        workbook = None
+        with ExcelCache.write_lock(filepath):
+            col_hdr_num_dict, row_hdr_num_dict, max_row, max_col = ExcelUtil._get_all_xlheaders_num_dict(filepath)
 
-        for _ in range(5):
-            try:
-                workbook = openpyxl.load_workbook(filepath)
-                break
-            except BadZipFile as e:
-                time.sleep(2.0)
-
-        try:
-            # workbook = openpyxl.load_workbook(filepath)
-            sheet = workbook.active
+            sheet = ExcelCache.get_workbook(filepath, isForWrite=True).active
 
             row_hdr_num = row_hdr_num_dict[str(row_header)] if str(row_header) in row_hdr_num_dict.keys() else None
 
@@ -266,17 +483,15 @@ class ExcelUtil:
                     for i in range(2, max_col + 1):
                         printit(f"xl ({row_hdr_num},{i})", isToPrint=False)
                         sheet.cell(row=row_hdr_num, column=i).value = ''
-        finally:
-            if workbook is not None:
-                workbook.save(filepath)
-                workbook.close()
+
+                ExcelCache.save(filepath)
 
     @staticmethod
     def get_dataprep_input(file_path=DATAPREP_FILE, sheet='Sheet1'):
         import pandas as pd
         import numpy as np
         # Replace 'Sheet1' with the name of your sheet
-        df = pd.read_excel(file_path, sheet_name=sheet)
+        df = ExcelBinCache.get(file_path, sheet, 'df', lambda: pd.read_excel(file_path, sheet_name=sheet))
         # Convert all NaN values to None
         df = df.replace(np.nan, None)
         # Group by 'Name' column and return a dictionary
@@ -300,14 +515,8 @@ class ExcelDFUtil:
 
     @classmethod
     def _get_excel_as_df(cls, file_path:str, sheet_name:str):
-        # Load the spreadsheet
-        xls = pd.ExcelFile(file_path)
-        # Load a sheet into a DataFrame by its name
-        df = xls.parse(sheet_name)
-        df = df.astype(str)
-        df = df.replace({'nan': ''})
-
-        return df
+        """Returns the cached dataframe (ExcelCache), writers change a copy and save it by ExcelCache.save_df"""
+        return ExcelCache.get_df(file_path, sheet_name)
 
     @classmethod
     def _get_df_attr(cls, df):
@@ -320,6 +529,11 @@ class ExcelDFUtil:
 
         return final_row_header_dict, final_col_header_dict, max_row, max_col
 
+    @staticmethod
+    def _to_xl_val(data):
+        # data = int(float(data)) if Commons.check_number_type(data) == 'float' else data
+        return int(float(data)) if str(data).endswith('.0') else data
+
     @classmethod
     def read_from_excel(cls, file_path:str, sheet_name:str, row:int, column:int):
         df = cls._get_excel_as_df(file_path, sheet_name)
@@ -327,10 +541,7 @@ class ExcelDFUtil:
         # Read data from a particular cell
         data = df.iat[row, column]
 
-        # data = int(float(data)) if Commons.check_number_type(data) == 'float' else data
-        data = int(float(data)) if str(data).endswith('.0') else data
-        
-        return str(data)
+        return str(cls._to_xl_val(data))
 
     @classmethod
     def read_from_excel_with_header(cls, file_path, sheet_name, row_header, column_header):
@@ -342,10 +553,7 @@ class ExcelDFUtil:
         # Read data from a particular cell
         data = df.loc[row, column_header]
 
-        # data = int(float(data)) if Commons.check_number_type(data) == 'float' else data
-        data = int(float(data)) if str(data).endswith('.0') else data
-
-        return str(data)
+        return str(cls._to_xl_val(data))
 
     @classmethod
     def read_all_xlrows_for_column(cls, filepath: str, col_header: str) -> str:
@@ -376,61 +584,59 @@ class ExcelDFUtil:
     @classmethod
     def write_to_excel(cls, file_path: str, sheet_name: str, row: int, column: int, data):
         # data = np.nan if data is None or data == '' else str(data)
-        data = int(float(data)) if str(data).endswith('.0') else data
+        with ExcelCache.write_lock(file_path):
+            df = cls._get_excel_as_df(file_path, sheet_name).copy()
 
-        df = cls._get_excel_as_df(file_path, sheet_name)
-
-        # Write data to a particular cell
-        df.iat[row, column] = data
-        # Write DataFrame back to Excel file
-        df.to_excel(file_path, sheet_name=sheet_name, index=False)
+            # Write data to a particular cell
+            df.iat[row, column] = cls._to_xl_val(data)
+            # Write DataFrame back to Excel file
+            ExcelCache.save_df(file_path, sheet_name, df)
 
     @classmethod
     def write_to_excel_with_header(cls, file_path: str, sheet_name: str, row_header: str, column_header: str, data):
         # data = np.nan if data is None or data == '' else str(data)
-        data = int(float(data)) if str(data).endswith('.0') else data
-
-        df = cls._get_excel_as_df(file_path, sheet_name)
+        with ExcelCache.write_lock(file_path):
+            df = cls._get_excel_as_df(file_path, sheet_name).copy()
 
-        row_header_dict, col_header_dict, max_row, max_col = cls._get_df_attr(df)
-        row = row_header_dict[row_header]
+            row_header_dict, col_header_dict, max_row, max_col = cls._get_df_attr(df)
+            row = row_header_dict[row_header]
 
-        # Write data to a particular cell
-        df.loc[row, column_header] = data
-        # Write DataFrame back to Excel file
-        df.to_excel(file_path, sheet_name=sheet_name, index=False)
+            # Write data to a particular cell
+            df.loc[row, column_header] = cls._to_xl_val(data)
+            # Write DataFrame back to Excel file
+            ExcelCache.save_df(file_path, sheet_name, df)
 
     @classmethod
     def append_to_xlcell(cls, filepath: str, row_header, col_header: str, cell_value):
-        """Appends str to existing cell value
+        """Appends str to existing cell value, the file is written once
         """
-        try:
-            # TODO write a new line for THREAD_ID if not found
-            df = cls._get_excel_as_df(filepath, 'Sheet1')
+        with ExcelCache.write_lock(filepath):
+            df = cls._get_excel_as_df(filepath, 'Sheet1').copy()
 
             row_header_dict, col_header_dict, max_row, max_col = cls._get_df_attr(df)
 
-            # Write new row_header to excel
+            # Add new row_header
             if str(row_header) not in row_header_dict.keys():
-                df.loc[len(df.index)] = [row_header, '', '', '', '', '']
-                df.to_excel(filepath, 'Sheet1', index=False)
+                df.loc[len(df.index)] = [str(row_header)] + [''] * (max_col - 1)
+                row_header_dict[str(row_header)] = len(df.index) - 1
+            row = row_header_dict[str(row_header)]
 
-            curr_val = cls.read_from_excel_with_header(filepath, 'Sheet1', row_header, col_header)
-            if curr_val and len(curr_val) > 0 and curr_val.strip != '':
+            curr_val = str(cls._to_xl_val(df.loc[row, col_header]))
+            if curr_val and len(curr_val) > 0 and curr_val.strip() != '':
                 new_val = curr_val + ',' + cell_value
             else:
                 new_val = cell_value
-            cls.write_to_excel_with_header(filepath, 'Sheet1', row_header, col_header, new_val)
-        finally:
-            pass
+            df.loc[row, col_header] = cls._to_xl_val(new_val)
+            ExcelCache.save_df(filepath, 'Sheet1', df)
 
     @classmethod
     def clear_xlcells(cls, filepath: str, row_header, col_header: str = None):
-        """"""
+        """Clears 1 cell or all cells of the row, the file is written once
+        """
         thread_id = threading.current_thread().native_id
 
-        try:
-            df = cls._get_excel_as_df(filepath, 'Sheet1')
+        with ExcelCache.write_lock(filepath):
+            df = cls._get_excel_as_df(filepath, 'Sheet1').copy()
 
             row_header_dict, col_header_dict, max_row, max_col = cls._get_df_attr(df)
             row = row_header_dict[row_header]
@@ -440,16 +646,15 @@ class ExcelDFUtil:
                 print(Commons.build_date_forfilename(), f"{thread_id} clearing xl ({row_header},{col_header})")
 
                 printit(f"xl ({row_header},{col_header})", isToPrint=False)
-                cls.write_to_excel_with_header(filepath, 'Sheet1', row_header, col_header, '')
+                df.loc[row, col_header] = ''
             else:
                 '''Clear all cells for 1 row'''
                 print(Commons.build_date_forfilename(), f"{thread_id} clearing xl ({row_header},)")
 
                 for c in range(1, max_col):
                     printit(f"xl ({row},{c})", isToPrint=False)
-                    cls.write_to_excel(filepath, 'Sheet1', row, c, '')
-        finally:
-            pass
+                    df.iat[row, c] = ''
+            ExcelCache.save_df(filepath, 'Sheet1', df)
 
 
 class XMLUtil:
@@ -491,6 +696,94 @@ class XMLUtil:
         pass
 
 
+class XMLEnvelopeWriter:
+    """Streams the messages of many xmls into 1 envelope (eg tXML) by XMLGenerator, only 1 xml is in memory at a time.
+    Envelope root and Header are taken from the 1st xml, Message elements (else all non Header elements) from every xml.
+    Namespaced xmls are written with their prefixes, Header/Message are matched by local name
+    """
+
+    def __init__(self, out, encoding: str = 'utf-8'):
+        """out: text/binary stream, eg open file or socket.makefile('wb')"""
+        self._gen = XMLGenerator(out, encoding=encoding, short_empty_elements=True)
+        self._rootName = None
+        self._rootNs = {}  # Pair of namespace uri and prefix declared on the envelope root
+        self.msgCount = 0
+
+    @staticmethod
+    def _parse(xml_str: str):
+        """Returns root element and (prefix, uri) namespace declarations of the xml"""
+        nsDecls, root = [], None
+        for event, item in ET.iterparse(io.StringIO(xml_str), events=('start-ns', 'end')):
+            if event == 'start-ns':
+                nsDecls.append((item[0] or None, item[1]))
+            else:
+                root = item
+        return root, nsDecls
+
+    @staticmethod
+    def _ns_name(tag: str) -> tuple:
+        """ET tag/attr name ({uri}local) to XMLGenerator (uri, local) name"""
+        if tag[0] == '{':
+            uri, localName = tag[1:].split('}', 1)
+            return uri, localName
+        return None, tag
+
+    @classmethod
+    def _ns_attrs(cls, element) -> dict:
+        return {cls._ns_name(k): v for k, v in element.attrib.items()}
+
+    def add_xml(self, xml_str: str) -> int:
+        """Writes the messages of the xml, returns no. of messages written"""
+        root, nsDecls = self._parse(xml_str)
+        if self._rootName is None:
+            self._rootName = self._ns_name(root.tag)
+            self._rootNs = {uri: prefix for prefix, uri in nsDecls}
+            self._gen.startDocument()
+            for prefix, uri in nsDecls:
+                self._gen.startPrefixMapping(prefix, uri)
+            self._gen.startElementNS(self._rootName, None, self._ns_attrs(root))
+            header = next((e for e in root if self._ns_name(e.tag)[1] == 'Header'), None)
+            if header is not None:
+                self._write_element(header)
+            msgNsDecls = []
+        else:
+            '''Namespaces not declared on the envelope root are declared on each message'''
+            msgNsDecls = [(prefix, uri) for prefix, uri in nsDecls if uri not in self._rootNs]
+
+        messages = [e for e in root if self._ns_name(e.tag)[1] == 'Message']
+        if len(messages) == 0:
+            messages = [e for e in root if self._ns_name(e.tag)[1] != 'Header']
+        for message in messages:
+            for prefix, uri in msgNsDecls:
+                self._gen.startPrefixMapping(prefix, uri)
+            self._write_element(message)
+            for prefix, uri in reversed(msgNsDecls):
+                self._gen.endPrefixMapping(prefix)
+        self.msgCount += len(messages)
+        return len(messages)
+
+    def _write_element(self, element, isTopLevel: bool = True):
+        if isTopLevel:
+            self._gen.ignorableWhitespace('\n')
+        name = self._ns_name(element.tag)
+        self._gen.startElementNS(name, None, self._ns_attrs(element))
+        if element.text:
+            self._gen.characters(element.text)
+        for child in element:
+            self._write_element(child, isTopLevel=False)
+        self._gen.endElementNS(name, None)
+        if element.tail and not isTopLevel:
+            self._gen.characters(element.tail)
+
+    def close(self):
+        """Ends the envelope (out is not closed)"""
+        if self._rootName is not None:
+            self._gen.ignorableWhitespace('\n')
+            self._gen.endElementNS(self._rootName, None)
+            self._gen.endDocument()
+            self._rootName = None
+
+
 class JsonUtil:
     @staticmethod
     def get_json_str_from_dict(json_dict: dict, clsEncoder=None) -> str:
@@ -765,6 +1058,55 @@ class DataHandler:
 # print(var)
 
 
+class PlaceholderTemplate:
+    """Text tokenised once by 1 compiled regex of all the placeholders, rendered in 1 pass by a resolver.
+    {MMDDYYYY_S+1} (dyn), #{ITEM_HEIGHT} (varfile), #DO_NUM# (user)
+    """
+    DYN, VARFILE, USER = 'dyn', 'varfile', 'user'
+    PATTERN = re.compile(r'\{(?P<dyn>[A-Z_]+)(?P<days>[+-]\d+(?:\.\d+)?)\}'
+                         r'|#\{(?P<varfile>[^{}#\n]+)\}'
+                         r'|#(?P<user>[A-Za-z0-9_]+)#')
+
+    _TEMPLATES = {}  # Pair of template text and tokenised template (oldest dropped after _MAX_TEMPLATES)
+    _MAX_TEMPLATES = 256
+
+    def __init__(self, text: str):
+        self.parts = []  # Literal str or token tuple of (kind, name, days, token text)
+        pos = 0
+        for m in self.PATTERN.finditer(text):
+            if m.start() > pos:
+                self.parts.append(text[pos:m.start()])
+            kind = m.lastgroup if m.lastgroup != 'days' else self.DYN
+            self.parts.append((kind, m.group(kind), m.group('days'), m.group(0)))
+            pos = m.end()
+        if pos < len(text):
+            self.parts.append(text[pos:])
+
+    @classmethod
+    def get(cls, text: str, isToCache: bool = True) -> 'PlaceholderTemplate':
+        """isToCache: keep the tokenised text for reuse, for templates (not for one time texts)"""
+        if not isToCache:
+            return cls(text)
+        template = cls._TEMPLATES.get(text)
+        if template is None:
+            template = cls(text)
+            if len(cls._TEMPLATES) >= cls._MAX_TEMPLATES:
+                cls._TEMPLATES.pop(next(iter(cls._TEMPLATES)), None)
+            cls._TEMPLATES[text] = template
+        return template
+
+    def render(self, resolveFunc) -> str:
+        """resolveFunc(kind, name, days) returns the value, None keeps the placeholder as is"""
+        out = []
+        for part in self.parts:
+            if type(part) == str:
+                out.append(part)
+            else:
+                value = resolveFunc(part[0], part[1], part[2])
+                out.append(part[3] if value is None else str(value))
+        return ''.join(out)
+
+
 class DataGeneric:
     """ Provides func to replace all defined placeholders at run time
     eg: #ABC# means user has to replace during code developement (user defined)
@@ -777,29 +1119,30 @@ class DataGeneric:
     # MMDDYYYY_S means '02/21/2022'
 
     @classmethod
-    def replace_dyn(cls, data: str) -> str:
+    def _resolve_dyn(cls, name: str, days: str, today: datetime):
+        """Returns formatted date for eg: name MMDDYYYY_S, days -1. None if not a system variable"""
+        if name not in cls.DATE_PLACEHOLDERS:
+            return None
+        finaldate_unformtd = today + timedelta(days=float(days))  # today-1
+        return Commons.format_date(finaldate_unformtd, cls.DATE_PLACEHOLDERS[name])
+
+    @classmethod
+    def replace_dyn(cls, data: str, isTemplate: bool = False) -> str:
         """Provided data will be returned with all dynamic data replaced at run time
-           Placeholder eg: {MMDDYYYY_S+0} """
+           Placeholder eg: {MMDDYYYY_S+0}
+           isTemplate: data is reused (eg json template), its tokens are cached"""
         today = datetime.today()
-        for key in cls.DATE_PLACEHOLDERS.keys():  # 'MMDDYYYY_S'
-            initial_var = '{' + key  # '{MMDDYYYY_S'
-            while data.count(initial_var) > 0:
-                start_index = data.index(initial_var)  # 100
-                end_index = data.index('}', start_index)  # 113
-                actual_var = data[start_index:end_index + 1]  # '{MMDDYYYY_S-1}'
-                opertr_with_val = actual_var.replace(key, '').replace('{', '').replace('}', '')  # '-1'
-                only_val = opertr_with_val[1:]  # '1'
-
-                if opertr_with_val.startswith('+'):
-                    finaldate_unformtd = today + timedelta(days=float(only_val))
-                else:
-                    finaldate_unformtd = today + timedelta(days=-float(only_val))  # today-1
-
-                # finaldate_formtd = final_dt_unformtd.strftime(cls.DATE_DICT[key])  # today-1 as formatted
-                finaldate_formtd = Commons.format_date(finaldate_unformtd, cls.DATE_PLACEHOLDERS[key])
-                data = data.replace(actual_var, str(finaldate_formtd))  # data with current placeholer replaced
+        return PlaceholderTemplate.get(data, isToCache=isTemplate).render(
+            lambda kind, name, days: cls._resolve_dyn(name, days, today) if kind == PlaceholderTemplate.DYN else None)
         # TODO code for other placeholders
-        return data
+
+    @classmethod
+    def replace_user(cls, data: str, userVars: dict, isTemplate: bool = True) -> str:
+        """Provided data will be returned with user defined placeholders replaced by userVars in 1 pass
+           Placeholder eg: #DO_NUM# replaced by userVars['DO_NUM']
+           isTemplate: data is a reused template (eg xml tags), its tokens are cached"""
+        return PlaceholderTemplate.get(data, isToCache=isTemplate).render(
+            lambda kind, name, days: userVars.get(name) if kind == PlaceholderTemplate.USER else None)
 
     @classmethod
     def get_vardata(cls, exlfilepath: str, sheet: str, column: str) -> dict:
@@ -807,19 +1150,11 @@ class DataGeneric:
         if column is None or column == '':
             assert False, 'Column in variable file is not correct'
         else:
-            worksheet = ExcelUtil.read_xlsheet(exlfilepath, sheet)
-            maxcol = worksheet.max_column
-            maxrow = worksheet.max_row
-            col_index = None
-            for c in range(2, maxcol + 1):
-                if worksheet.cell(1, c).value == column:
-                    col_index = c
-                    break
-            if col_index is None:
+            sheetColumns = ExcelBinCache.get_columns(exlfilepath, sheet)
+            if column not in sheetColumns['columns']:
                 assert False, 'Column in varibale file not found'
             else:
-                for r in range(2, maxrow + 1):
-                    vardata[worksheet.cell(r, 1).value] = worksheet.cell(r, col_index).value
+                vardata = dict(zip(sheetColumns['row_headers'], sheetColumns['columns'][column]))
         return vardata
 
     @classmethod
@@ -827,10 +1162,9 @@ class DataGeneric:
         """Provided data will be returned with all user variables replaced at run time
            Placeholder eg: #{ITEM_HEIGHT} """
         varfiledict = DataGeneric.get_vardata(exlfilepath, sheet, column)
-        for k, v in varfiledict.items():
-            actual_var = '#{' + str(k) + '}'
-            while data.count(actual_var) > 0:
-                data = data.replace(actual_var, str(v))
+        strVarfiledict = {str(k): str(v) for k, v in varfiledict.items()}
+        data = PlaceholderTemplate.get(data, isToCache=False).render(
+            lambda kind, name, days: strVarfiledict.get(name) if kind == PlaceholderTemplate.VARFILE else None)
         return data, varfiledict
 
     @classmethod
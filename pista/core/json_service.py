@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 from jsonpath_ng import parse
 
-from core.file_service import ExcelUtil, JsonUtil, DataGeneric
+from core.file_service import ExcelCache, ExcelUtil, JsonUtil, DataGeneric
 
 
 class NpEncoder(json.JSONEncoder):  # Numpy encoder for datatypes
@@ -272,9 +272,27 @@ def _nested_dict_update_rowlist_by_path(nested_dict, key_path, value):
 
 
 class JsonService:
-
     @staticmethod
     def get_json_from_xl(xlfilepath: str, sheet: str, column: str, isChildJson:bool=None):
+        """Returns (json dict, json str) of the column, dyn values are replaced per call.
+        The json( and rows( resolved template is built once per file change
+        """
+        templateStr = JsonService._get_json_template(xlfilepath, sheet, column, isChildJson)
+
+        '''Replace dyn values'''
+        jsonStr = DataGeneric.replace_dyn(templateStr, isTemplate=True)  # replace dyn values
+        jsonDict = JsonUtil.get_json_dict_from_str(jsonStr)
+
+        return jsonDict, jsonStr
+
+    @staticmethod
+    def _get_json_template(xlfilepath: str, sheet: str, column: str, isChildJson:bool=None) -> str:
+        """Json str before dyn replace, cached in ExcelCache till the file changes"""
+        return ExcelCache.get_loaded(xlfilepath, ('json', sheet, column, bool(isChildJson)),
+                                     lambda: JsonService._build_json_template(xlfilepath, sheet, column, isChildJson))
+
+    @staticmethod
+    def _build_json_template(xlfilepath: str, sheet: str, column: str, isChildJson:bool=None) -> str:
         worksheet = ExcelUtil.read_xlsheet(xlfilepath, sheet)
         maxcol, maxrow = worksheet.max_column, worksheet.max_row
         rootParentTag = worksheet.cell(2, 1).value
@@ -291,12 +309,8 @@ class JsonService:
         JsonService._json_replace_with_rowsList(final_dict, xlfilepath)
         print(f"Final dict {final_dict}")
 
-        '''Convert and replace'''
-        jsonStr = JsonUtil.get_json_str_from_dict(final_dict, clsEncoder=NpEncoder)
-        jsonStr = DataGeneric.replace_dyn(jsonStr)  # replace dyn values
-        jsonDict = JsonUtil.get_json_dict_from_str(jsonStr)
-
-        return jsonDict, jsonStr
+        '''Convert'''
+        return JsonUtil.get_json_str_from_dict(final_dict, clsEncoder=NpEncoder)
 
     @staticmethod
     def _json_replace_with_jsonData(jsonDict, xlfilepath: str):
@@ -347,8 +361,8 @@ class JsonService:
                     # colHdrRange_dict, rowHdrRange_dict, maxRow = ExcelUtil._get_all_xlheaders_numrange_dict(xlfilepath, rowSheet)
                     reqCol_list = calc_parentPath_colIdList_dict[colSheet]
                     for c in reqCol_list:
-                        temp_jsonDict, temp_jsonStr = JsonService.get_json_from_xl(xlfilepath, colSheet, c, isChildJson=True)
-                        subJson_list.append(temp_jsonDict)
+                        temp_jsonStr = JsonService._get_json_template(xlfilepath, colSheet, c, isChildJson=True)
+                        subJson_list.append(JsonUtil.get_json_dict_from_str(temp_jsonStr))
                     _nested_dict_update_jsondata_by_path(jsonDict, pp, subJson_list)
         return jsonDict
     
@@ -456,12 +470,17 @@ class ExcelDFUtil:
 
     @staticmethod
     def fetch_xl_df_data(xl_file_path, sheet: str = None):
+        """Returns the sheet df (nan as None), cached in ExcelCache till the file changes. Dont change it
+        """
+        return ExcelCache.get_loaded(xl_file_path, ('df_none', sheet), lambda: ExcelDFUtil._read_xl_df(xl_file_path, sheet))
+
+    @staticmethod
+    def _read_xl_df(xl_file_path, sheet: str = None):
         if sheet is not None:
             df = pd.read_excel(xl_file_path, sheet_name=sheet)
         else:
             df = pd.read_excel(xl_file_path)
-        df = df.replace({np.nan: None})
-        return df
+        return df.replace({np.nan: None})
 
     @staticmethod
     def get_xl_df_val_by_rowIndex_colName(df, rowIndex, colName):
@@ -1,37 +1,70 @@
-import inspect
+import atexit
 import logging
 import os
 import smtplib
 import ssl
+import sys
 import threading
+import weakref
 from datetime import datetime
 from email.message import EmailMessage
 from logging import Logger
 from types import FrameType
 
+from core.config_service import ENV_CONST
 from root import LOG_DIR
 
 LOG_DTTM_FORMAT = '%Y%m%dT%H%M%S'
 LOG_FILE_PATH = os.path.join(LOG_DIR, 'log_{}.log')
 
+'''printit_level=INFO skips isToPrint=False (debug) lines, DEBUG (default) logs them in log file'''
+PRINTIT_LEVEL = ENV_CONST.get('framework', 'printit_level', fallback='DEBUG').strip().upper()
+_IS_PRINTIT_DEBUG = PRINTIT_LEVEL == 'DEBUG'
+_THREAD_LOG_FILES = weakref.WeakValueDictionary()  # Pair of thread id and _ThreadLogFile, for closing at exit
+_THREAD_LOCAL = threading.local()
+
+
+class _ThreadLogFile:
+    """Opened (line buffered) log file of 1 thread, held in a thread local,
+    so it is closed when the thread ends and its thread local is cleared
+    """
+
+    def __init__(self, thread_id):
+        self.file = open(LOG_FILE_PATH.format(thread_id), mode='a', encoding='utf-8', buffering=1)
+
+    def __del__(self):
+        self.file.close()
+
+
+def _get_thread_log_file(thread_id):
+    threadLogFile = getattr(_THREAD_LOCAL, 'logFile', None)
+    if threadLogFile is None:
+        threadLogFile = _ThreadLogFile(thread_id)
+        _THREAD_LOCAL.logFile = threadLogFile
+        _THREAD_LOG_FILES[thread_id] = threadLogFile
+    return threadLogFile.file
+
+
+@atexit.register
+def _close_thread_log_files():
+    for threadLogFile in list(_THREAD_LOG_FILES.values()):
+        threadLogFile.file.close()
+
 
 def printit(*args, isToPrint:bool=True, isForLogFile:bool=True):
     global LOG_DTTM_FORMAT, LOG_FILE_PATH
 
+    if not isToPrint and not _IS_PRINTIT_DEBUG:
+        return
+
     currDate = datetime.now().strftime(LOG_DTTM_FORMAT)
     thread_id = threading.current_thread().native_id
 
-    # caller = inspect.stack()[1].function
-    # caller2 = inspect.stack()[2].function
-    # lineno = inspect.currentframe().f_back.f_lineno
-    # final_caller_info = f"{caller2}.{caller}:{lineno}"
-    
-    caller1 = inspect.getframeinfo(inspect.stack()[1][0])
-    caller2 = inspect.getframeinfo(inspect.stack()[2][0])
-    caller1_info = f"{caller1.function}:{caller1.lineno}"
-    caller2_info = f"{caller2.function}:{caller2.lineno}"
-    # final_caller_info = f"{caller2_info}({caller1_info})"
-    final_caller_info = f"({caller2_info})"
+    try:
+        caller2 = sys._getframe(2)
+        final_caller_info = f"({caller2.f_code.co_name}:{caller2.f_lineno})"
+    except ValueError:
+        final_caller_info = '()'
 
     all_msg = ' '.join(map(str, args))
 
@@ -43,8 +76,7 @@ def printit(*args, isToPrint:bool=True, isForLogFile:bool=True):
         msg_to_log = f"{currDate} {thread_id} PRNT {final_caller_info} {all_msg}"
         # FileUtil.append_file(LOG_FILE_PATH.format(thread_id), msg_to_log + '\n')
         content = msg_to_log + '\n'
-        with open(LOG_FILE_PATH.format(thread_id), mode='a', encoding='utf-8') as f:
-            f.write(content)
+        _get_thread_log_file(thread_id).write(content)
 
 
 class Logging:
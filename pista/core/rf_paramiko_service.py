@@ -1,12 +1,18 @@
-import re
+import select
+import threading
 import time
+from collections import deque
 from typing import Union
 
 import paramiko
 from paramiko.channel import Channel
 # from sshkeyboard import listen_keyboard
 
+from core.config_service import ENV_CONST
 from core.log_service import printit
+from core.rf_screen_snapshot import RFScreenSnapshot
+from core.rf_settle_service import RFScreenSettle
+from core.rf_vt100_screen import VT100Screen
 
 
 class RFParamikoService:
@@ -41,7 +47,14 @@ class RFParamikoService:
     KEY_CTRL_Y_AddDetail = '\x19'
 
     def __init__(self, sshHost, sshUser, sshPwd):
-        self.output = None
+        screenRows = int(ENV_CONST.get('rf', 'screen_rows', fallback='24'))
+        screenCols = int(ENV_CONST.get('rf', 'screen_cols', fallback='80'))
+        self.screen = VT100Screen(screenRows, screenCols)
+        self.outputBuffer = deque(maxlen=int(ENV_CONST.get('rf', 'reader_buffer_chunks', fallback='512')))  # Pair of screen version and chunk
+        self._screenChanged = threading.Condition()  # Guards screen/outputBuffer, notified on every chunk
+        self._snapshot = None  # Last RFScreenSnapshot, reused till the screen version changes
+        self._readerChannel = None  # Channel pumped into the screen, an older reader stops when it changes
+        self.channel = None
         self.channel = self._connect_host(sshHost, sshUser, sshPwd)
         # ssh.close() TODO Close it when done
 
@@ -55,13 +68,15 @@ class RFParamikoService:
             client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             client.connect(sshHost, username=sshUser, password=sshPwd)  # Connect to the host
             channel = client.get_transport().open_session()  # Open a new channel
-            channel.get_pty(term='VT100')  # Request a pseudo-terminal  # VT100+  # VT400
+            channel.get_pty(term='VT100', width=self.screen.cols, height=self.screen.rows)  # Request a pseudo-terminal  # VT100+  # VT400
             channel.invoke_shell()  # VT100+
             # listen_keyboard(on_press=self.press(), on_release=release)
-            time.sleep(5)
             if channel and not channel.closed:
-                all_texts, orig_texts = self._assertWaitForNextScreen(channel)
-                self.output = all_texts
+                with self._screenChanged:
+                    self.screen.reset()
+                    sinceVersion = self.screen.version
+                self._startReader(channel)
+                all_texts, orig_texts = self._assertWaitForNextScreen(channel, sinceVersion, isOutputExpected=False)
                 printit(all_texts)
                 printit('mmmmmmmmmmmmmmmmmmmm')
             else:
@@ -72,67 +87,101 @@ class RFParamikoService:
         return channel
 
     def _connect_ssh(self, sshHost, sshUser, sshPwd):
-        channel = self._connect_host(sshHost, sshUser, sshPwd)
-        return channel
+        """Reconnects: the curr channel (and its reader) is closed, sends go to the new channel"""
+        self._closeChannel()
+        self.channel = self._connect_host(sshHost, sshUser, sshPwd)
+        return self.channel
+
+    def _closeChannel(self):
+        channel, self.channel = self.channel, None
+        if channel is not None:
+            transport = channel.get_transport()
+            channel.close()
+            if transport is not None:
+                transport.close()
+
+    def _startReader(self, channel: Channel):
+        """Starts a daemon thread pumping the channel output into the ring buffer and the screen grid
+        """
+        with self._screenChanged:
+            self._readerChannel = channel
+        readerThread = threading.Thread(target=self._pumpChannel, args=(channel,), daemon=True,
+                                        name=f"rf-reader-{channel.get_id()}")
+        readerThread.start()
+
+    def _pumpChannel(self, channel: Channel):
+        try:
+            while not channel.closed:
+                readables, _, _ = select.select([channel], [], [], 1.0)
+                if not readables:
+                    continue
+                chunk = channel.recv(10240)
+                if chunk == b'':
+                    break
+                with self._screenChanged:
+                    if channel is not self._readerChannel:
+                        break
+                    self.screen.feed(chunk)
+                    self.outputBuffer.append((self.screen.version, chunk))
+                    self._screenChanged.notify_all()
+        except Exception as e:
+            printit('Exception found while reading ssh channel: ' + str(e))
+        printit(f"Ssh channel reader stopped ({channel.get_id()})", isToPrint=False)
 
-    def _assertWaitForNextScreen(self, channel: Channel, dataSent=''):
-        """Wait till blank screen exists
+    def waitForScreenChange(self, sinceVersion: int, maxWaitInSec: float) -> bool:
+        """Wait till the screen grid changes after sinceVersion (screen.version)
+        Returns False if nothing came within maxWaitInSec
+        """
+        with self._screenChanged:
+            return self._screenChanged.wait_for(lambda: self.screen.version > sinceVersion, max(maxWaitInSec, 0))
+
+    def getOutputSince(self, sinceVersion: int) -> str:
+        """Raw output (still in the ring buffer) received after sinceVersion
+        """
+        with self._screenChanged:
+            chunks = [chunk for version, chunk in self.outputBuffer if version > sinceVersion]
+        return b''.join(chunks).decode('utf-8', errors='replace')
+
+    def _assertWaitForNextScreen(self, channel: Channel, sinceVersion: int, isOutputExpected: bool = True):
+        """Wait till the screen settles (RFScreenSettle) after the output till sinceVersion
         Assert if blank screen is gone within waittime
         Return text displayed
         """
-        isBlankScreenGone = False
-        output = str()
-        optim_output = ''
-
-        max_waittime_in_sec, interval_waittime_in_sec = 60, 2
-        total_iteration = int(max_waittime_in_sec / interval_waittime_in_sec)
-        time.sleep(2.0)
-
-        # for it in range(total_iteration):
-        # while not channel.recv_ready():
-        #     continue
-
-        # while True:
-        #     if channel.recv_ready():
-        #         output_temp = channel.recv(10240).decode()
-        #         output_temp = re.sub(r'(\x1b(\[.*?[@-~]|\].*?(\x07|\x1b\\))|\x08|\x1b=|\x0f)', '', output_temp)
-        #         if output_temp.replace('\n', '').replace(' ', '').strip() != '':
-        #             output += '\n' + output_temp
-        #             isBlankScreenGone = True
-        #             break
-        #         else:
-        #             time.sleep(interval_waittime_in_sec)
-
-        for it in range(total_iteration):
-            if channel.recv_ready():
-                output = channel.recv(10240).decode('ascii')
-
-                optim_output = re.sub(r'(\x1b(\[.*?[@-~]|\\].*?(\x07|\x1b\\))|\x08|\x1b=|\x0f)', '', output)
-                optim_output = self._optimizeOutput(optim_output, dataSent)
-                optim_output_temp = optim_output.replace('\n', '').replace('*', '').replace(' ', '').strip()
-                if optim_output_temp != '':
-                    isBlankScreenGone = True
-                    break
-                else:
-                    time.sleep(interval_waittime_in_sec)
+        lastVersion = sinceVersion
+
+        def waitForOutputFunc(timeoutInSec) -> bool:
+            nonlocal lastVersion
+            assert not channel.closed and not channel.eof_received, 'Ssh channel is closed while reading screen'
+            if not self.waitForScreenChange(lastVersion, timeoutInSec):
+                return False
+            lastVersion = self.screen.version
+            return True
+
+        optim_output, isPromptShown = RFScreenSettle.wait_for_settle(waitForOutputFunc, self.readScreen, isOutputExpected)
+        output = self.getOutputSince(sinceVersion)
 
+        optim_output_temp = optim_output.replace('\n', '').replace('*', '').replace(' ', '').strip()
+        isBlankScreenGone = optim_output_temp != ''
         if not isBlankScreenGone:
             printit('Ssh blank screen didnt go within max waittime')
             printit('output: ', output)
         assert isBlankScreenGone, 'Ssh blank screen didnt go within max waittime'
         return optim_output, output
 
-    def _optimizeOutput(self, s, excludeStr):
-        """Remove sent data from 1st line
-        """
-        lines = s.split('\n')
-        lines = ['' if line.replace(' ', '') == '' else line for line in lines]
-        first_line = lines[0].replace(excludeStr, '', 1)
-        lines[0] = first_line
-        return '\n'.join(lines)
+    def isSessionAlive(self) -> bool:
+        channel = self.channel
+        return (channel is not None and not channel.closed and not channel.eof_received
+                and channel.get_transport() is not None and channel.get_transport().is_active())
 
     def readScreen(self):
-        return self.output
+        return self.getSnapshot().texts
+
+    def getSnapshot(self) -> RFScreenSnapshot:
+        """Screen parsed once, reused till the screen version changes"""
+        with self._screenChanged:
+            if self._snapshot is None or self._snapshot.version != self.screen.version:
+                self._snapshot = RFScreenSnapshot(self.screen.get_text(), self.screen.version)
+            return self._snapshot
 
     def sendData(self, data, channel: Channel = None, isConfidential=False, isEnter: bool = False, isEnterIfLT20: bool = False):
         if data is not None:
@@ -142,6 +191,7 @@ class RFParamikoService:
                 valToPrint = '*****'
             printit('Sending', str(valToPrint))
 
+        sinceVersion = self.screen.version
         try:
             channel = channel if channel else self.channel
             channel.sendall(str(data).encode('utf-8'))
@@ -155,13 +205,11 @@ class RFParamikoService:
 
         if data not in (self.KEY_UP, self.KEY_DOWN):
             channel = channel if channel else self.channel
-            all_texts, orig_texts = self._assertWaitForNextScreen(channel, data)
-            if all_texts != data:
-                self.output = all_texts
-                printit(all_texts)
-                # printit('mmmmmmmmmmmmmmmmmmmm')
+            all_texts, orig_texts = self._assertWaitForNextScreen(channel, sinceVersion)
+            printit(all_texts)
+            # printit('mmmmmmmmmmmmmmmmmmmm')
         else:
-            printit(f"data: {data}, self.output {self.output}")
+            printit(f"data: {data}, screen {self.readScreen()}")
 
     # def press(key, channel):
     #     print(f"'{key}' pressed")
@@ -171,16 +219,19 @@ class RFParamikoService:
     #     print(f"'{key}' released")
 
     def assertScreenTextExist(self, expectedTxts: Union[str, list]):
-        allTxtsFound = True
-        missing_texts = []
         expTextsList = expectedTxts if type(expectedTxts) == list else [expectedTxts]
 
-        screentxt = self.readScreen()
+        '''Recheck on every screen change till assert_screen_wait_in_sec'''
+        maxWaitInSec = float(ENV_CONST.get('rf', 'assert_screen_wait_in_sec', fallback='5'))
+        endTime = time.monotonic() + maxWaitInSec
+        while True:
+            snapshot = self.getSnapshot()
+            missing_texts = snapshot.missing(expTextsList)
+            allTxtsFound = len(missing_texts) == 0
+            if allTxtsFound or not self.waitForScreenChange(snapshot.version, endTime - time.monotonic()):
+                break
         for t in expTextsList:
-            if screentxt.count(t) == 0:
-                allTxtsFound = False
-                missing_texts.append(t)
-            else:
+            if t not in missing_texts:
                 printit('Found', t)
         assert allTxtsFound, f"<RF> Terminal texts not found, expected: {missing_texts}"
 
@@ -195,13 +246,7 @@ class RFParamikoService:
         """Accept if all the texts of a msg exist
         eg: textsIn1Msg = ['Exceed Max UOM', 'Location?']
         """
-        screentxt = self.readScreen()
-
-        msg_found = False
-        for i in textsIn1Msg:
-            msg_found = True if i in screentxt else False
-            if not msg_found:
-                break
+        msg_found = len(textsIn1Msg) > 0 and self.getSnapshot().hasAll(textsIn1Msg)
         if msg_found:
             self.sendData(self.KEY_CTRL_A_AcceptWarning)
 
@@ -218,17 +263,11 @@ class RFParamikoService:
         self.assertScreenTextExist('Choice:_')
 
     def readDataForTextInLine(self, textAsKeyInLine) -> str:
-        final_data_from_ln = str()
-        final_ln = str()
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
-        for ln in screenlns:
-            if ln.count(textAsKeyInLine) > 0:
-                final_ln = ln
-        if final_ln == '':
+        snapshot = self.getSnapshot()
+        lineIdxs = snapshot.linesHaving(textAsKeyInLine)
+        if len(lineIdxs) == 0:
             assert False, 'Didnt find screen line having ' + textAsKeyInLine
-        else:
-            final_data_from_ln = final_ln.replace(textAsKeyInLine, '')
+        final_data_from_ln = snapshot.lines[lineIdxs[-1]].replace(textAsKeyInLine, '')
         if final_data_from_ln == '':
             assert False, 'Screen not showing system data'
         return final_data_from_ln
@@ -236,10 +275,10 @@ class RFParamikoService:
     def readDataBetweenTextInLine(self, startTxtInLine: str, endTxtInLine: str) -> str:
         final_data_from_ln = str()
         final_ln = str()
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
-        for ln in screenlns:
-            if ln.count(startTxtInLine) > 0 and ln.count(endTxtInLine, ln.index(startTxtInLine) + len(startTxtInLine)) > 0:
+        snapshot = self.getSnapshot()
+        for lineIdx in snapshot.linesHaving(startTxtInLine):
+            ln = snapshot.lines[lineIdx]
+            if ln.count(endTxtInLine, ln.index(startTxtInLine) + len(startTxtInLine)) > 0:
                 final_ln = ln
                 break
         if final_ln == '':
@@ -247,27 +286,23 @@ class RFParamikoService:
         else:
             startLineTextEndIndex = final_ln.index(startTxtInLine) + len(startTxtInLine)
             endLineTextStartIndex = final_ln.index(endTxtInLine, startLineTextEndIndex)
-            final_data_from_ln = final_data_from_ln[startLineTextEndIndex:endLineTextStartIndex]
+            final_data_from_ln = final_ln[startLineTextEndIndex:endLineTextStartIndex]
         if final_data_from_ln == '':
             assert False, 'Screen not showing system data'
         return final_data_from_ln
 
     def readDataBetween2LineTexts(self, startLineTxt: str, endLineTxt: str) -> str:
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
+        snapshot = self.getSnapshot()
+        screenlns = snapshot.lines
 
         final_ln_start = final_ln_end = None
         final_data_from_ln = str()
 
-        for i in range(len(screenlns)):
-            if screenlns[i].count(startLineTxt) > 0 and screenlns[i].startswith(startLineTxt):
-                final_ln_start = i
-                break
+        final_ln_start = next((i for i in snapshot.linesHaving(startLineTxt) if screenlns[i].startswith(startLineTxt)),
+                              None)
         if final_ln_start is not None:
-            for i in range(final_ln_start, len(screenlns)):
-                if screenlns[i].count(endLineTxt) > 0 and screenlns[i].startswith(endLineTxt):
-                    final_ln_end = i
-                    break
+            final_ln_end = next((i for i in snapshot.linesHaving(endLineTxt)
+                                 if i >= final_ln_start and screenlns[i].startswith(endLineTxt)), None)
         if final_ln_start and final_ln_end:
             final_data_arr = screenlns[final_ln_start + 1:final_ln_end]
             final_data_from_ln = '\n'.join(final_data_arr)
@@ -276,8 +311,7 @@ class RFParamikoService:
         return final_data_from_ln
 
     def readDataBetweenLines(self, startLine: int, endLine: int) -> str:
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
+        screenlns = self.getSnapshot().lines
         req_lns = screenlns[startLine:endLine - 1]
         if req_lns is None or req_lns == '':
             assert False, 'Didnt find data betwee lines ' + str(startLine) + ' & ' + str(endLine)
@@ -286,9 +320,8 @@ class RFParamikoService:
         return req_lns_str
 
     def readDataFromLine(self, lineNum: int) -> str:
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
+        screenlns = self.getSnapshot().lines
         final_ln_text = screenlns[lineNum - 1]
         if final_ln_text is None or final_ln_text == '':
             assert False, 'Didnt find data in line ' + str(lineNum)
-        return final_ln_text
\ No newline at end of file
+        return final_ln_text
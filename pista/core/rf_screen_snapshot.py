@@ -0,0 +1,109 @@
+import threading
+from bisect import bisect_right
+from collections import deque
+
+
+class TextMatcher:
+    """Aho-Corasick automaton of the patterns, finds all of them in 1 pass of the text
+    """
+    MATCHERS = {}  # Pair of patterns tuple and compiled matcher (oldest dropped after _MAX_MATCHERS)
+    _MAX_MATCHERS = 256
+    _LOCK = threading.Lock()
+
+    def __init__(self, patterns: tuple):
+        self.patterns = patterns
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for patternIdx, pattern in enumerate(patterns):
+            node = 0
+            for ch in pattern:
+                nextNode = self._goto[node].get(ch)
+                if nextNode is None:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    nextNode = len(self._goto) - 1
+                    self._goto[node][ch] = nextNode
+                node = nextNode
+            self._out[node].append(patternIdx)
+
+        '''Failure links in breadth first order'''
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nextNode in self._goto[node].items():
+                queue.append(nextNode)
+                failNode = self._fail[node]
+                while failNode and ch not in self._goto[failNode]:
+                    failNode = self._fail[failNode]
+                failNextNode = self._goto[failNode].get(ch, 0)
+                self._fail[nextNode] = failNextNode if failNextNode != nextNode else 0
+                self._out[nextNode] = self._out[nextNode] + self._out[self._fail[nextNode]]
+
+    @classmethod
+    def get(cls, patterns) -> 'TextMatcher':
+        """Compiled matcher of the (non empty, unique) patterns, reused across screens"""
+        patterns = tuple(dict.fromkeys(p for p in patterns if p != ''))
+        matcher = cls.MATCHERS.get(patterns)
+        if matcher is None:
+            matcher = cls(patterns)
+            with cls._LOCK:
+                if len(cls.MATCHERS) >= cls._MAX_MATCHERS:
+                    cls.MATCHERS.pop(next(iter(cls.MATCHERS)), None)
+                cls.MATCHERS[patterns] = matcher
+        return matcher
+
+    def search(self, text: str) -> dict[str, list[int]]:
+        """Returns pair of pattern and start positions in text"""
+        positions = {p: [] for p in self.patterns}
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for patternIdx in out[node]:
+                pattern = self.patterns[patternIdx]
+                positions[pattern].append(i - len(pattern) + 1)
+        return positions
+
+
+class RFScreenSnapshot:
+    """RF screen texts parsed once (lines, line index of texts), shared by the assertions/extractors
+    till the terminal changes
+    """
+
+    def __init__(self, texts: str, version=None):
+        self.texts = texts
+        self.version = version
+        self.lines = texts.split('\n')
+        self._lineStarts = []
+        lineStart = 0
+        for line in self.lines:
+            self._lineStarts.append(lineStart)
+            lineStart += len(line) + 1
+        self._positions = {'': [0]}  # Pair of text and start positions in texts
+
+    def find(self, texts: list[str]) -> dict[str, list[int]]:
+        """Returns pair of text and start positions, texts not searched yet are searched in 1 pass"""
+        notSearched = [t for t in texts if t not in self._positions]
+        if notSearched:
+            self._positions.update(TextMatcher.get(notSearched).search(self.texts))
+        return {t: self._positions[t] for t in texts}
+
+    def has(self, text: str) -> bool:
+        return len(self.find([text])[text]) > 0
+
+    def missing(self, texts: list[str]) -> list[str]:
+        """Texts not in the screen, in the given order"""
+        positions = self.find(texts)
+        return [t for t in texts if len(positions[t]) == 0]
+
+    def hasAll(self, texts: list[str]) -> bool:
+        return len(self.missing(texts)) == 0
+
+    def linesHaving(self, text: str) -> list[int]:
+        """Indexes (from 0) of the lines having text"""
+        lineIdxs = [bisect_right(self._lineStarts, pos) - 1 for pos in self.find([text])[text]]
+        return list(dict.fromkeys(lineIdxs))
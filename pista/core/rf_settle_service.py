@@ -0,0 +1,115 @@
+import re
+import threading
+import time
+
+from core.config_service import ENV_CONST
+from core.log_service import printit
+
+
+class RFScreenSettle:
+    """Screen settle detector shared by the rf service providers (RFXtermService, RFParamikoService).
+    A screen is settled when the terminal output is quiet for settle_quiet_in_ms and a prompt (settle_prompt_regex)
+    is shown, or when it is quiet without a prompt for settle_no_prompt_quiet_in_sec. settle_max_wait_in_sec is the hard deadline
+    """
+    TRAN_STATS = {}  # Pair of thread id and curr rf tran name/start time/no. of screens/total settle time
+
+    _STATS_LOCK = threading.Lock()
+    _PROMPT_PATTERNS = {}  # Pair of prompt regex text and compiled pattern
+    _DEFAULT_PROMPT_REGEX = r'(_|\?|password:|>)\s*$|Choice:'
+
+    @classmethod
+    def _get_settings(cls) -> tuple[float, float, float, float, re.Pattern]:
+        """Returns (quiet, no output max wait, no prompt quiet, max wait) in sec and the prompt pattern
+        """
+        quietInMs = ENV_CONST.get('rf', 'settle_quiet_in_ms', fallback='200')
+        noOutputMaxWaitInSec = ENV_CONST.get('rf', 'settle_no_output_max_wait_in_sec', fallback='3')
+        noPromptQuietInSec = ENV_CONST.get('rf', 'settle_no_prompt_quiet_in_sec', fallback='3')
+        maxWaitInSec = ENV_CONST.get('rf', 'settle_max_wait_in_sec', fallback='60')
+        promptRegex = ENV_CONST.get('rf', 'settle_prompt_regex', fallback=cls._DEFAULT_PROMPT_REGEX)
+
+        promptPattern = cls._PROMPT_PATTERNS.get(promptRegex)
+        if promptPattern is None:
+            promptPattern = re.compile(promptRegex, re.MULTILINE)
+            cls._PROMPT_PATTERNS[promptRegex] = promptPattern
+        return (int(quietInMs) / 1000, float(noOutputMaxWaitInSec), float(noPromptQuietInSec), float(maxWaitInSec),
+                promptPattern)
+
+    @classmethod
+    def wait_for_settle(cls, waitForOutputFunc, readScreenFunc, isOutputExpected: bool = True) -> tuple[str, bool]:
+        """Waits till the screen settles, returns (screen texts, is prompt shown).
+        waitForOutputFunc(timeoutInSec) blocks till new output comes (returns True) or timeout (returns False),
+        readScreenFunc() returns the screen texts.
+        isOutputExpected: screen is not read till 1st output comes, gives up after settle_no_output_max_wait_in_sec
+        """
+        quietInSec, noOutputMaxWaitInSec, noPromptQuietInSec, maxWaitInSec, promptPattern = cls._get_settings()
+        startTime = lastOutputTime = time.monotonic()
+        deadline = startTime + maxWaitInSec
+
+        isOutputSeen = not isOutputExpected
+        isPromptShown = False
+        screentxt = None
+        while True:
+            remainingInSec = deadline - time.monotonic()
+            if remainingInSec <= 0:
+                printit(f"RF screen didnt settle within {maxWaitInSec}s")
+                break
+            if waitForOutputFunc(min(quietInSec, remainingInSec)):
+                isOutputSeen = True
+                lastOutputTime = time.monotonic()
+                continue
+
+            quietForInSec = time.monotonic() - lastOutputTime
+            if not isOutputSeen:
+                if quietForInSec >= noOutputMaxWaitInSec:
+                    break
+                continue
+            screentxt = readScreenFunc()
+            if screentxt.replace('\n', '').replace(' ', '').strip() == '':
+                continue
+            if promptPattern.search(screentxt):
+                isPromptShown = True
+                break
+            if quietForInSec >= noPromptQuietInSec:
+                break
+
+        if screentxt is None:
+            screentxt = readScreenFunc()
+        cls._add_settle_time(time.monotonic() - startTime, isPromptShown)
+        return screentxt, isPromptShown
+
+    @classmethod
+    def _add_settle_time(cls, settleInSec: float, isPromptShown: bool):
+        thread_id = threading.current_thread().native_id
+        with cls._STATS_LOCK:
+            stats = cls.TRAN_STATS.setdefault(thread_id, cls._new_tran_stats(None))
+            stats['screens'] += 1
+            stats['total_settle_sec'] += settleInSec
+        printit(f"RF screen settled in {round(settleInSec, 3)}s (prompt {isPromptShown})", isToPrint=False)
+
+    @staticmethod
+    def _new_tran_stats(tranName) -> dict:
+        return {'tran': tranName, 'start': time.monotonic(), 'screens': 0, 'total_settle_sec': 0.0}
+
+    @classmethod
+    def start_tran(cls, tranName: str):
+        """Logs the timing of the prev rf tran of the thread and starts timing tranName
+        """
+        cls.end_tran()
+        thread_id = threading.current_thread().native_id
+        with cls._STATS_LOCK:
+            cls.TRAN_STATS[thread_id] = cls._new_tran_stats(tranName)
+
+    @classmethod
+    def end_tran(cls) -> dict:
+        """Logs and returns the timing of the curr rf tran of the thread
+        """
+        thread_id = threading.current_thread().native_id
+        with cls._STATS_LOCK:
+            stats = cls.TRAN_STATS.pop(thread_id, None)
+        if stats is None or stats['tran'] is None:
+            return {}
+        stats = {'tran': stats['tran'], 'total_sec': round(time.monotonic() - stats['start'], 3),
+                 'screens': stats['screens'], 'total_settle_sec': round(stats['total_settle_sec'], 3)}
+        printit(f"RF tran {stats['tran']} took {stats['total_sec']}s, {stats['screens']} screens, "
+                f"settle wait {stats['total_settle_sec']}s")
+        return stats
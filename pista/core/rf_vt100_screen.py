@@ -0,0 +1,235 @@
+import codecs
+
+
+class VT100Screen:
+    """Minimal VT100 emulator (pyte style), consumes the ssh stream incrementally into a rows x cols cell grid.
+    Covers cursor moves/addressing, erase in line/display, scroll region, index/reverse index,
+    insert/delete lines and chars, save/restore cursor. SGR, modes, charsets and OSC are consumed and ignored.
+    Escape sequences split across packets are continued on the next feed()
+    """
+    _GROUND, _ESC, _CSI, _OSC, _OSC_ESC, _CHARSET = range(6)
+
+    def __init__(self, rows: int = 24, cols: int = 80):
+        self.rows = rows
+        self.cols = cols
+        self.version = 0  # Incremented on every feed() with data
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.reset()
+
+    def reset(self):
+        self.grid = [[' '] * self.cols for _ in range(self.rows)]
+        self.cursorRow = self.cursorCol = 0
+        self.scrollTop, self.scrollBottom = 0, self.rows - 1
+        self._savedCursor = (0, 0)
+        self._isWrapPending = False
+        self._state = self._GROUND
+        self._seq = ''
+
+    def feed(self, data):
+        """Consumes bytes/str of the terminal stream"""
+        text = self._decoder.decode(bytes(data)) if isinstance(data, (bytes, bytearray)) else data
+        if text == '':
+            return
+        for ch in text:
+            if self._state == self._GROUND:
+                if ch >= ' ' and ch != '\x7f':
+                    self._draw(ch)
+                elif ch == '\x1b':
+                    self._state = self._ESC
+                else:
+                    self._control(ch)
+            elif self._state == self._ESC:
+                self._escape(ch)
+            elif self._state == self._CSI:
+                if '\x40' <= ch <= '\x7e':
+                    self._state = self._GROUND
+                    self._csi(self._seq, ch)
+                elif ch == '\x1b':
+                    self._state = self._ESC
+                elif ch < ' ':
+                    self._control(ch)
+                else:
+                    self._seq += ch
+            elif self._state == self._OSC:
+                if ch == '\x07':
+                    self._state = self._GROUND
+                elif ch == '\x1b':
+                    self._state = self._OSC_ESC
+            elif self._state == self._OSC_ESC:
+                self._state = self._GROUND if ch == '\\' else self._OSC
+            else:
+                self._state = self._GROUND  # Charset designator
+        self.version += 1
+
+    def get_lines(self) -> list[str]:
+        return [''.join(row).rstrip() for row in self.grid]
+
+    def get_text(self) -> str:
+        return '\n'.join(self.get_lines())
+
+    def get_line(self, lineNum: int) -> str:
+        """lineNum starts from 1"""
+        return ''.join(self.grid[lineNum - 1]).rstrip()
+
+    '''Stream handlers'''
+
+    def _draw(self, ch: str):
+        if self._isWrapPending:
+            self.cursorCol = 0
+            self._linefeed()
+            self._isWrapPending = False
+        self.grid[self.cursorRow][self.cursorCol] = ch
+        if self.cursorCol == self.cols - 1:
+            self._isWrapPending = True
+        else:
+            self.cursorCol += 1
+
+    def _control(self, ch: str):
+        if ch == '\r':
+            self._moveTo(self.cursorRow, 0)
+        elif ch in '\n\x0b\x0c':
+            self._isWrapPending = False
+            self._linefeed()
+        elif ch == '\x08':
+            self._moveTo(self.cursorRow, self.cursorCol - 1)
+        elif ch == '\t':
+            self._moveTo(self.cursorRow, (self.cursorCol // 8 + 1) * 8)
+        # BEL, SO/SI, NUL etc are ignored
+
+    def _escape(self, ch: str):
+        self._state = self._GROUND
+        if ch == '[':
+            self._state, self._seq = self._CSI, ''
+        elif ch == ']':
+            self._state = self._OSC
+        elif ch in '()*+#':
+            self._state = self._CHARSET
+        elif ch == '7':
+            self._savedCursor = (self.cursorRow, self.cursorCol)
+        elif ch == '8':
+            self._moveTo(*self._savedCursor)
+        elif ch == 'D':
+            self._linefeed()
+        elif ch == 'E':
+            self._moveTo(self.cursorRow, 0)
+            self._linefeed()
+        elif ch == 'M':
+            self._reverseIndex()
+        elif ch == 'c':
+            self.reset()
+        # ESC = / ESC > (keypad modes) are ignored
+
+    def _csi(self, seq: str, final: str):
+        isPrivate = seq[:1] in ('?', '>', '=')
+        params = [int(p) if p.isdigit() else 0 for p in seq.lstrip('?>=').split(';')]
+
+        def param(i: int, default: int = 1) -> int:
+            return params[i] if i < len(params) and params[i] != 0 else default
+
+        row, col = self.cursorRow, self.cursorCol
+        if isPrivate:
+            return  # Private modes (eg cursor visibility) dont change cells
+        if final == 'A':
+            self._moveTo(row - param(0), col)
+        elif final == 'B':
+            self._moveTo(row + param(0), col)
+        elif final == 'C':
+            self._moveTo(row, col + param(0))
+        elif final == 'D':
+            self._moveTo(row, col - param(0))
+        elif final == 'E':
+            self._moveTo(row + param(0), 0)
+        elif final == 'F':
+            self._moveTo(row - param(0), 0)
+        elif final in 'G`':
+            self._moveTo(row, param(0) - 1)
+        elif final == 'd':
+            self._moveTo(param(0) - 1, col)
+        elif final in 'Hf':
+            self._moveTo(param(0) - 1, param(1) - 1)
+        elif final == 'J':
+            self._eraseInDisplay(param(0, 0))
+        elif final == 'K':
+            self._eraseInLine(param(0, 0))
+        elif final == 'L':
+            self._insertLines(param(0))
+        elif final == 'M':
+            self._deleteLines(param(0))
+        elif final == 'P':
+            line = self.grid[row]
+            del line[col:col + param(0)]
+            line.extend([' '] * (self.cols - len(line)))
+        elif final == '@':
+            line = self.grid[row]
+            line[col:col] = [' '] * param(0)
+            del line[self.cols:]
+        elif final == 'X':
+            n = min(param(0), self.cols - col)
+            self.grid[row][col:col + n] = [' '] * n
+        elif final == 'r':
+            top, bottom = param(0) - 1, param(1, self.rows) - 1
+            if 0 <= top < bottom < self.rows:
+                self.scrollTop, self.scrollBottom = top, bottom
+                self._moveTo(0, 0)
+        elif final == 's':
+            self._savedCursor = (row, col)
+        elif final == 'u':
+            self._moveTo(*self._savedCursor)
+        # SGR (m), modes (h/l), reports (n/c) etc are ignored
+
+    '''Grid operations'''
+
+    def _moveTo(self, row: int, col: int):
+        self.cursorRow = min(max(row, 0), self.rows - 1)
+        self.cursorCol = min(max(col, 0), self.cols - 1)
+        self._isWrapPending = False
+
+    def _blankLine(self) -> list[str]:
+        return [' '] * self.cols
+
+    def _linefeed(self):
+        if self.cursorRow == self.scrollBottom:
+            del self.grid[self.scrollTop]
+            self.grid.insert(self.scrollBottom, self._blankLine())
+        elif self.cursorRow < self.rows - 1:
+            self.cursorRow += 1
+
+    def _reverseIndex(self):
+        if self.cursorRow == self.scrollTop:
+            del self.grid[self.scrollBottom]
+            self.grid.insert(self.scrollTop, self._blankLine())
+        elif self.cursorRow > 0:
+            self.cursorRow -= 1
+
+    def _eraseInLine(self, mode: int):
+        line = self.grid[self.cursorRow]
+        start, end = {0: (self.cursorCol, self.cols), 1: (0, self.cursorCol + 1)}.get(mode, (0, self.cols))
+        line[start:end] = [' '] * (end - start)
+
+    def _eraseInDisplay(self, mode: int):
+        if mode == 0:
+            self._eraseInLine(0)
+            rowsToErase = range(self.cursorRow + 1, self.rows)
+        elif mode == 1:
+            self._eraseInLine(1)
+            rowsToErase = range(0, self.cursorRow)
+        else:
+            rowsToErase = range(0, self.rows)
+        for r in rowsToErase:
+            self.grid[r] = self._blankLine()
+
+    def _insertLines(self, n: int):
+        if not self.scrollTop <= self.cursorRow <= self.scrollBottom:
+            return
+        for _ in range(min(n, self.scrollBottom - self.cursorRow + 1)):
+            del self.grid[self.scrollBottom]
+            self.grid.insert(self.cursorRow, self._blankLine())
+        self.cursorCol = 0
+
+    def _deleteLines(self, n: int):
+        if not self.scrollTop <= self.cursorRow <= self.scrollBottom:
+            return
+        for _ in range(min(n, self.scrollBottom - self.cursorRow + 1)):
+            del self.grid[self.cursorRow]
+            self.grid.insert(self.scrollBottom, self._blankLine())
+        self.cursorCol = 0
@@ -9,6 +9,8 @@ from selenium.webdriver.common.by import By
 from core.common_service import Commons
 from core.config_service import ENV_CONST
 from core.log_service import printit
+from core.rf_screen_snapshot import RFScreenSnapshot
+from core.rf_settle_service import RFScreenSettle
 from core.ui_service import UIService
 from root import ROOT_DIR, OUTPUT_DIR
 
@@ -58,6 +60,36 @@ class RFXtermService(UIService):
     # _CANVAS_CURSOR_AREA = "//canvas[@class='xterm-cursor-layer']"
     _CANVAS_CURSOR_AREA = "//div[@class='xterm-screen']"
 
+    '''Terminal buffer api (xterm.js demo exposes the terminal as window.term), xterm without onWriteParsed uses reader mode'''
+    _JS_READ_VIEWPORT_LINES = """
+        const term = window.term;
+        if (!term) { return null; }
+        const buf = term.buffer.active;
+        const lines = [];
+        for (let i = buf.viewportY; i < buf.viewportY + term.rows; i++) {
+            const line = buf.getLine(i);
+            lines.push(line ? line.translateToString(true) : '');
+        }
+        return lines;"""
+    _JS_GET_WRITE_COUNT = """
+        const term = window.term;
+        if (!term || !term.onWriteParsed) { return null; }
+        if (window.__pistaWriteCnt === undefined) {
+            window.__pistaWriteCnt = 0;
+            term.onWriteParsed(() => { window.__pistaWriteCnt++; });
+        }
+        return window.__pistaWriteCnt;"""
+    _JS_WAIT_FOR_WRITE = """
+        const sinceCnt = arguments[0], timeoutInMs = arguments[1], done = arguments[arguments.length - 1];
+        const term = window.term;
+        if (!term || window.__pistaWriteCnt === undefined) { done(null); return; }
+        if (window.__pistaWriteCnt > sinceCnt) { done(window.__pistaWriteCnt); return; }
+        let listener = null;
+        const timer = setTimeout(() => { listener.dispose(); done(-1); }, timeoutInMs);
+        listener = term.onWriteParsed(() => { clearTimeout(timer); listener.dispose(); done(window.__pistaWriteCnt); });"""
+
+    _snapshot = None  # Last RFScreenSnapshot, reused till the terminal gets a new write
+
     XTERMJS_CODE_PATH = ENV_CONST.get('rf', 'xtermjs_code_path')
     XTERMJS_CODE_PATH = XTERMJS_CODE_PATH if XTERMJS_CODE_PATH.strip()[1] == ':' else os.path.join(ROOT_DIR, XTERMJS_CODE_PATH)
     XTERMJS_LOG_FILE = os.path.join(OUTPUT_DIR, ENV_CONST.get('rf', 'xtermjs_logfile'))
@@ -191,12 +223,19 @@ class RFXtermService(UIService):
         # self.wait_for(5)
         self.accept_alert_if_present()
 
-        for i in range(7):
-            time.sleep(2.0)
+        endTime = time.time() + 14
+        while True:
+            writeCnt = self._getWriteCount()
             texts = self.readScreen()
             if texts.strip().endswith('>'):
                 is_host_connected = True
                 break
+            if time.time() >= endTime:
+                break
+            if writeCnt is None:
+                time.sleep(2.0)
+            else:
+                self.waitForScreenChange(writeCnt, endTime - time.time())
 
         # self.assertScreenTextExist(['PS', '>'])
         # texts = self.readScreen()
@@ -220,14 +259,73 @@ class RFXtermService(UIService):
         output = self.readScreen()
         return output
 
+    def _getWriteCount(self) -> Union[int, None]:
+        """Count of terminal writes parsed since page load (hooks the counter on 1st call)
+            None if the page doesnt expose the terminal api"""
+        return self.driver.execute_script(self._JS_GET_WRITE_COUNT)
+
+    def waitForScreenChange(self, sinceWriteCnt: int, maxWaitInSec: float = 10) -> bool:
+        """Wait till the terminal parses a write after sinceWriteCnt (from _getWriteCount())
+            Return False if nothing is written within maxWaitInSec"""
+        if maxWaitInSec <= 0:
+            return False
+        oldScriptTimeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(maxWaitInSec + 5)
+        try:
+            writeCnt = self.driver.execute_async_script(self._JS_WAIT_FOR_WRITE, sinceWriteCnt,
+                                                        int(maxWaitInSec * 1000))
+        finally:
+            self.driver.set_script_timeout(oldScriptTimeout)
+        return writeCnt is not None and writeCnt > sinceWriteCnt
+
+    def _waitForScreenSettle(self, sinceWriteCnt: int) -> tuple[str, bool]:
+        """Wait till the screen settles (RFScreenSettle) after the writes till sinceWriteCnt
+            Return (texts displayed, is prompt shown)"""
+        lastWriteCnt = sinceWriteCnt
+
+        def waitForOutputFunc(timeoutInSec) -> bool:
+            nonlocal lastWriteCnt
+            if not self.waitForScreenChange(lastWriteCnt, timeoutInSec):
+                return False
+            lastWriteCnt = self._getWriteCount()
+            return True
+
+        return RFScreenSettle.wait_for_settle(waitForOutputFunc, self._readViewport)
+
+    def _readViewport(self) -> Union[str, None]:
+        """Read all viewport lines in 1 call, formatted as the reader mode read ('\n' + line per terminal row,
+            trailing spaces and blank rows after the last text trimmed), so line numbers match the terminal rows.
+            None if the page doesnt expose the terminal api"""
+        lines = self.driver.execute_script(self._JS_READ_VIEWPORT_LINES)
+        if lines is None:
+            return None
+        lines = [ln.rstrip() for ln in lines]
+        while len(lines) > 0 and lines[-1] == '':
+            lines.pop()
+        return ''.join('\n' + ln for ln in lines)
+
     def _assertWaitUntilNoBlankScreen(self):
         """Wait till blank screen exists
             Assert if blank screen is gone within waittime
             Return text displayed"""
+        max_waittime_in_sec = 60
+
+        '''Read terminal buffer, wait for the next write while blank'''
+        endTime = time.time() + max_waittime_in_sec
+        while True:
+            writeCnt = self._getWriteCount()
+            all_texts = self._readViewport() if writeCnt is not None else None
+            if all_texts is None:
+                break
+            if all_texts.replace('\n', '').replace(' ', '').strip() != '':
+                return all_texts
+            assert time.time() < endTime, '<RF> RF blank screen didnt go within max waittime'
+            self.waitForScreenChange(writeCnt, endTime - time.time())
+
+        '''Fallback to reader mode (page without terminal api)'''
         isBlankScreenGone = False
         all_texts = str()
 
-        max_waittime_in_sec = 60
         interval_waittime_in_sec = 2
         total_iteration = int(max_waittime_in_sec / interval_waittime_in_sec)
         time.sleep(1.0)
@@ -261,13 +359,27 @@ class RFXtermService(UIService):
         assert isBlankScreenGone, '<RF> RF blank screen didnt go within max waittime'
         return all_texts
 
+    def isSessionAlive(self) -> bool:
+        """Browser is still showing the terminal"""
+        try:
+            return len(self.driver.find_elements(By.XPATH, self._CANVAS_CURSOR_AREA)) > 0
+        except Exception:
+            return False
+
     def readScreen(self) -> str:
         """Assert for no blank screen
             Return texts displayed in the terminal"""
-        all_texts = self._assertWaitUntilNoBlankScreen()
-        printit(all_texts)
-        # printit('mmmmmmmmmmmmmmmmmmmm')
-        return all_texts
+        return self.getSnapshot().texts
+
+    def getSnapshot(self) -> RFScreenSnapshot:
+        """Screen parsed once, reused till the terminal gets a new write"""
+        writeCnt = self._getWriteCount()
+        if writeCnt is None or self._snapshot is None or self._snapshot.version != writeCnt:
+            all_texts = self._assertWaitUntilNoBlankScreen()
+            printit(all_texts)
+            # printit('mmmmmmmmmmmmmmmmmmmm')
+            self._snapshot = RFScreenSnapshot(all_texts, writeCnt)
+        return self._snapshot
 
     # def readScreen(self) -> str:
     #     """ To get the texts displayed in the terminal """
@@ -310,16 +422,21 @@ class RFXtermService(UIService):
             action.click(console_cursor_area).perform()
 
             active_ele = self.driver.switch_to.active_element
+            writeCnt = self._getWriteCount()
             active_ele.send_keys(data)
-            self.wait_for(1)
-            
+            if writeCnt is None:
+                self.wait_for(1)
+
             if isEnter:
                 printit('Sending', 'enter')
                 active_ele.send_keys(self.KEY_ENTER)
             elif isEnterIfLT20 and len(data) < 20:
                 printit('Sending', 'enter')
                 active_ele.send_keys(self.KEY_ENTER)
-            self.wait_for(2)
+            if writeCnt is None:
+                self.wait_for(2)
+            else:
+                self._waitForScreenSettle(writeCnt)
         except Exception as e:
             assert False, 'Exception found while interacting terminal: ' + str(e)
 
@@ -329,32 +446,12 @@ class RFXtermService(UIService):
     #         assert False, 'Terminal text didnt match, expected: ' + expectedtxt + ', actual: ' + screentxt
 
     def assertScreenTextExist(self, expectedTxts: Union[str, list]):
-        # max_waittime_in_sec = 25
-        # interval_waittime_in_sec = 2
-        # total_iteration = int(max_waittime_in_sec / interval_waittime_in_sec)
-
-        allTxtsFound = True
-        missing_texts = []
         expTextsList = expectedTxts if type(expectedTxts) == list else [expectedTxts]
 
-        screentxt = self.readScreen()
-
-        # for i in range(0, total_iteration):
-        #     allTxtsFound = True
-        #     missing_text = ''
-        #     screentxt = self.readScreen()
-        for t in expTextsList:
-            if screentxt.count(t) == 0:
-                allTxtsFound = False
-                missing_texts.append(t)
-                # self.wait_for(interval_waittime_in_sec)
-                # break
-            # if allTxtsFound:
-            #     break
-
-        # if not allTxtsFound:
-        #     printit('Curr screen texts:', screentxt)
-        assert allTxtsFound, f"<RF> Terminal texts not found, expected: {missing_texts}, actual: {screentxt}"
+        snapshot = self.getSnapshot()
+        missing_texts = snapshot.missing(expTextsList)
+        allTxtsFound = len(missing_texts) == 0
+        assert allTxtsFound, f"<RF> Terminal texts not found, expected: {missing_texts}, actual: {snapshot.texts}"
 
     def acceptListOfMsgsIfExist(self, listOfTextsInMsgs: list[list[str]]):
         """Calls acceptMsgIfExist()
@@ -367,16 +464,10 @@ class RFXtermService(UIService):
         """Accept if all the texts of a msg exist
         eg: textsIn1Msg = ['Exceed Max UOM', 'Location?']
         """
-        screentxt = self.readScreen()
-
-        msg_found = False
-        for i in textsIn1Msg:
-            msg_found = True if i in screentxt else False
-            if not msg_found:
-                break
+        msg_found = len(textsIn1Msg) > 0 and self.getSnapshot().hasAll(textsIn1Msg)
         if msg_found:
             self.sendData(self.KEY_CTRL_A_AcceptWarning)
-            
+
     def _loginRF(self, rfUser, rfPwd):
         if rfUser is None or rfPwd is None:
             assert False, 'RF creds not provided'
@@ -390,18 +481,11 @@ class RFXtermService(UIService):
         self.assertScreenTextExist('Choice:_')
 
     def readDataForTextInLine(self, textAsKeyInLine) -> str:
-        final_data_from_ln = str()
-        final_ln = str()
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
-        for ln in screenlns:
-            if ln.count(textAsKeyInLine) > 0:
-                final_ln = ln
-                break
-        if final_ln == '':
+        snapshot = self.getSnapshot()
+        lineIdxs = snapshot.linesHaving(textAsKeyInLine)
+        if len(lineIdxs) == 0:
             assert False, 'Didnt find screen line having ' + textAsKeyInLine
-        else:
-            final_data_from_ln = final_ln.replace(textAsKeyInLine, '')
+        final_data_from_ln = snapshot.lines[lineIdxs[0]].replace(textAsKeyInLine, '')
         if final_data_from_ln == '':
             assert False, 'Screen not showing system data'
         return final_data_from_ln
@@ -409,11 +493,10 @@ class RFXtermService(UIService):
     def readDataBetweenTextInLine(self, startTxtInLine: str, endTxtInLine: str) -> str:
         final_data_from_ln = str()
         final_ln = str()
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
-        for ln in screenlns:
-            if ln.count(startTxtInLine) > 0 \
-                    and ln.count(endTxtInLine, ln.index(startTxtInLine) + len(startTxtInLine)) > 0:
+        snapshot = self.getSnapshot()
+        for lineIdx in snapshot.linesHaving(startTxtInLine):
+            ln = snapshot.lines[lineIdx]
+            if ln.count(endTxtInLine, ln.index(startTxtInLine) + len(startTxtInLine)) > 0:
                 final_ln = ln
                 break
         if final_ln == '':
@@ -427,31 +510,26 @@ class RFXtermService(UIService):
         return final_data_from_ln
 
     def readDataBetween2LineTexts(self, startLineTxt: str, endLineTxt: str) -> str:
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
+        snapshot = self.getSnapshot()
+        screenlns = snapshot.lines
 
         final_ln_start = final_ln_end = None
         final_data_from_ln = str()
 
-        for i in range(len(screenlns)):
-            if screenlns[i].count(startLineTxt) > 0 and screenlns[i].startswith(startLineTxt):
-                final_ln_start = i
-                break
+        final_ln_start = next((i for i in snapshot.linesHaving(startLineTxt) if screenlns[i].startswith(startLineTxt)),
+                              None)
         if final_ln_start is not None:
-            for i in range(final_ln_start, len(screenlns)):
-                if screenlns[i].count(endLineTxt) > 0 and screenlns[i].startswith(endLineTxt):
-                    final_ln_end = i
-                    break
+            final_ln_end = next((i for i in snapshot.linesHaving(endLineTxt)
+                                 if i >= final_ln_start and screenlns[i].startswith(endLineTxt)), None)
         if final_ln_start and final_ln_end:
             final_data_arr = screenlns[final_ln_start + 1:final_ln_end]
             final_data_from_ln = '\n'.join(final_data_arr)
-            
+
         assert final_data_from_ln != '', 'Screen not showing system data'
         return final_data_from_ln
 
     def readDataBetweenLines(self, startLine: int, endLine: int) -> str:
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
+        screenlns = self.getSnapshot().lines
         req_lns = screenlns[startLine:endLine - 1]
         if req_lns is None or req_lns == '':
             assert False, 'Didnt find data betwee lines ' + str(startLine) + ' & ' + str(endLine)
@@ -460,8 +538,7 @@ class RFXtermService(UIService):
         return req_lns_str
 
     def readDataFromLine(self, lineNum: int) -> str:
-        screentxt = self.readScreen()
-        screenlns = screentxt.split('\n')
+        screenlns = self.getSnapshot().lines
         final_ln_text = screenlns[lineNum - 1]
         if final_ln_text is None or final_ln_text == '':
             assert False, 'Didnt find data in line ' + str(lineNum)
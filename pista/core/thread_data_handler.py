@@ -1,9 +1,15 @@
 import os
 import random
+import sqlite3
 import threading
 import time
 from enum import Enum
 
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
 from core.common_service import Commons
 from core.config_service import ENV_CONST
 from core.file_service import ExcelUtil
@@ -19,6 +25,156 @@ class RuntimeAttr(Enum):
     LOCNS = 'LOCNS'
 
 
+class RuntimeStore:
+    """WAL mode sqlite store for runtime threadData, 1 lease row per (attr, val) owned by 1 thread.
+    Vals are claimed with compare-and-set, a lease not renewed within thread_data_lease_sec (per attr) expires,
+    so vals of a dead worker become free again.
+    Shared by all the xdist workers of the run, rows of older runs are purged on first connect.
+    Lock is an exclusive flock (msvcrt lock on windows) on a lock file, released with the thread lock.
+    Connection and lock file are held in a thread local, so they are closed when the thread ends
+    """
+    STORE_FILE_PATH = os.path.splitext(THREAD_DATA_RUNTIME_FILE)[0] + '.db'
+    LOCK_FILE_PATH = STORE_FILE_PATH + '.lock'
+    RUN_ID = os.environ.get('PYTEST_XDIST_TESTRUNUID', str(os.getpid()))
+
+    LOCK_POLL_SEC = 0.01
+    _THREAD_LOCAL = threading.local()  # sqlite connection (conn) and locked file (lockFile) of curr thread
+    _IS_OLD_RUNS_PURGED = False
+    _INIT_LOCK = threading.Lock()
+
+    @classmethod
+    def _get_conn(cls) -> sqlite3.Connection:
+        conn = getattr(cls._THREAD_LOCAL, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(cls.STORE_FILE_PATH, timeout=30, isolation_level=None)
+            conn.execute('pragma journal_mode=WAL')
+            conn.execute('pragma synchronous=NORMAL')
+            conn.execute("""create table if not exists thread_data_lease (run_id text, attr text, val text,
+                            thread_id text, lease_until real, primary key (run_id, attr, val))""")
+            with cls._INIT_LOCK:
+                if not cls._IS_OLD_RUNS_PURGED:
+                    conn.execute('delete from thread_data_lease where run_id != ?', (cls.RUN_ID,))
+                    cls._IS_OLD_RUNS_PURGED = True
+            cls._THREAD_LOCAL.conn = conn
+        return conn
+
+    @classmethod
+    def close_conn(cls):
+        """Closes the sqlite connection of curr thread, next call reconnects"""
+        conn = getattr(cls._THREAD_LOCAL, 'conn', None)
+        if conn is not None:
+            cls._THREAD_LOCAL.conn = None
+            conn.close()
+
+    @classmethod
+    def acquire_lock(cls, maxWaitSec: float) -> bool:
+        """Returns True once the lock is taken by curr thread, False if not taken within maxWaitSec
+        """
+        lockFile = open(cls.LOCK_FILE_PATH, 'a+')
+        deadline = time.monotonic() + maxWaitSec
+        while True:
+            try:
+                if os.name == 'nt':
+                    lockFile.seek(0)
+                    msvcrt.locking(lockFile.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                cls._THREAD_LOCAL.lockFile = lockFile
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    lockFile.close()
+                    return False
+                time.sleep(cls.LOCK_POLL_SEC)
+
+    @classmethod
+    def release_lock(cls):
+        lockFile = getattr(cls._THREAD_LOCAL, 'lockFile', None)
+        if lockFile is not None:
+            cls._THREAD_LOCAL.lockFile = None
+            try:
+                if os.name == 'nt':
+                    lockFile.seek(0)
+                    msvcrt.locking(lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+            finally:
+                lockFile.close()
+
+    @staticmethod
+    def _get_lease_sec(attr: str) -> float:
+        LEASE_SEC = ENV_CONST.get('framework', 'thread_data_lease_sec', fallback='3600')
+        return float(ENV_CONST.get('framework', 'thread_data_lease_sec_' + attr.lower(), fallback=LEASE_SEC))
+
+    @classmethod
+    def get_vals_from_other_threads(cls, attr: str) -> list[str]:
+        """Returns the vals under a live lease of other threads
+        """
+        thread_id = str(threading.current_thread().native_id)
+        rows = cls._get_conn().execute(
+            'select val from thread_data_lease where run_id = ? and attr = ? and thread_id != ? and lease_until > ?',
+            (cls.RUN_ID, attr, thread_id, time.time())).fetchall()
+        return [r[0] for r in rows]
+
+    @classmethod
+    def get_vals_of_curr_thread(cls, attr: str) -> list[str]:
+        """Returns the vals leased by curr thread
+        """
+        thread_id = str(threading.current_thread().native_id)
+        rows = cls._get_conn().execute(
+            'select val from thread_data_lease where run_id = ? and attr = ? and thread_id = ?',
+            (cls.RUN_ID, attr, thread_id)).fetchall()
+        return [r[0] for r in rows]
+
+    @classmethod
+    def claim_vals(cls, attr: str, vals: list) -> list[str]:
+        """Claims the vals for curr thread in 1 transaction, a val is taken only if free, expired or already owned.
+        Leases of all the curr thread vals of the attr are renewed.
+        Returns the vals owned by curr thread after the claim
+        """
+        thread_id = str(threading.current_thread().native_id)
+        vals = list(dict.fromkeys(str(v) for v in vals))
+        now = time.time()
+        leaseUntil = now + cls._get_lease_sec(attr)
+
+        conn = cls._get_conn()
+        conn.execute('begin immediate')
+        try:
+            conn.executemany("""insert into thread_data_lease (run_id, attr, val, thread_id, lease_until) values (?, ?, ?, ?, ?)
+                                on conflict (run_id, attr, val) do update 
+                                set thread_id = excluded.thread_id, lease_until = excluded.lease_until
+                                where thread_data_lease.thread_id = excluded.thread_id or thread_data_lease.lease_until <= ?""",
+                             [(cls.RUN_ID, attr, v, thread_id, leaseUntil, now) for v in vals])
+            conn.execute('update thread_data_lease set lease_until = ? where run_id = ? and attr = ? and thread_id = ?',
+                         (leaseUntil, cls.RUN_ID, attr, thread_id))
+            ownedVals = {r[0] for r in conn.execute(
+                'select val from thread_data_lease where run_id = ? and attr = ? and thread_id = ?',
+                (cls.RUN_ID, attr, thread_id)).fetchall()}
+            conn.execute('commit')
+        except Exception:
+            conn.execute('rollback')
+            raise
+
+        return [v for v in vals if v in ownedVals]
+
+    @classmethod
+    def clear_vals(cls, attr: str = None, vals: list = None):
+        """Releases the leases of curr thread (all attrs if attr not provided, the connection is closed too)
+        """
+        thread_id = str(threading.current_thread().native_id)
+        if attr is None:
+            cls._get_conn().execute('delete from thread_data_lease where run_id = ? and thread_id = ?',
+                                    (cls.RUN_ID, thread_id))
+            cls.close_conn()
+        elif vals is None:
+            cls._get_conn().execute('delete from thread_data_lease where run_id = ? and thread_id = ? and attr = ?',
+                                    (cls.RUN_ID, thread_id, attr))
+        else:
+            cls._get_conn().executemany(
+                'delete from thread_data_lease where run_id = ? and thread_id = ? and attr = ? and val = ?',
+                [(cls.RUN_ID, thread_id, attr, str(v)) for v in vals])
+
+
 class RuntimeXL:
     """Provides utilities to handle runtime threadData
     """
@@ -28,8 +184,24 @@ class RuntimeXL:
 
     ITER_WAITTIME_SEC = 3
     RUNTIME_FILE_LOCK_STAT = {}  # {threadId:isLockCreated} e.g: {thread1:True, thread2:False}
-    # _IS_USE_THREAD_DATAFILE = ENV_CONST.get('framework', 'is_use_thread_data_file')  # for runtime threadData use
-    _IS_USE_THREAD_DATAFILE = ''
+    _IS_USE_THREAD_DATAFILE = ENV_CONST.get('framework', 'is_use_thread_data_file', fallback='false')  # excel backend
+    _THREAD_DATA_BACKEND = ENV_CONST.get('framework', 'thread_data_backend', fallback='sqlite')
+
+    @classmethod
+    def _is_use_runtime_store(cls) -> bool:
+        """thread_data_backend=sqlite (default) uses RuntimeStore, independent of is_use_thread_data_file
+        """
+        return 'sqlite' in cls._THREAD_DATA_BACKEND
+
+    @classmethod
+    def _is_use_thread_datafile(cls) -> bool:
+        """thread_data_backend=excel with is_use_thread_data_file=true uses the threadData xlsx
+        """
+        return not cls._is_use_runtime_store() and 'true' in cls._IS_USE_THREAD_DATAFILE
+
+    @classmethod
+    def _is_thread_data_on(cls) -> bool:
+        return cls._is_use_runtime_store() or cls._is_use_thread_datafile()
 
     # @classmethod
     # def _waitFor_lockFile_remove(cls):
@@ -81,7 +253,14 @@ class RuntimeXL:
         """Wait if lock file is available
         Else create
         """
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_use_runtime_store():
+            thread_id = threading.current_thread().native_id
+            if not RuntimeXL.RUNTIME_FILE_LOCK_STAT.get(thread_id):
+                MAX_WAITTIME_SEC = 300 if maxWaitSec is None else maxWaitSec
+                isLocked = RuntimeStore.acquire_lock(MAX_WAITTIME_SEC)
+                RuntimeXL.RUNTIME_FILE_LOCK_STAT[thread_id] = isLocked
+                printit(f"... Thread {thread_id} thread data lock taken: {isLocked}")
+        elif cls._is_use_thread_datafile():
             thread_id = threading.current_thread().native_id
             if not RuntimeXL.RUNTIME_FILE_LOCK_STAT[thread_id]:
                 printit('... Thread data lock file status', RuntimeXL.RUNTIME_FILE_LOCK_STAT)
@@ -108,7 +287,13 @@ class RuntimeXL:
     def removeThreadLockFile(cls):
         """Remove lock file if available
         """
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_use_runtime_store():
+            thread_id = threading.current_thread().native_id
+            if RuntimeXL.RUNTIME_FILE_LOCK_STAT.get(thread_id):
+                RuntimeStore.release_lock()
+                RuntimeXL.RUNTIME_FILE_LOCK_STAT[thread_id] = False
+                printit(f"... Thread {thread_id} thread data lock released")
+        elif cls._is_use_thread_datafile():
             thread_id = threading.current_thread().native_id
             printit('... Thread data lock file status', RuntimeXL.RUNTIME_FILE_LOCK_STAT)
             printit(f"... Thread {thread_id} removing thread data lock file")
@@ -129,7 +314,9 @@ class RuntimeXL:
         """
         thisAttrVals = None
 
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_use_runtime_store():
+            thisAttrVals = ','.join(RuntimeStore.get_vals_from_other_threads(attr_name.value))
+        elif cls._is_use_thread_datafile():
             try:
                 thisAttrVals = ExcelUtil.read_all_xlrows_for_column(filepath=cls.RUNTIME_FILE_PATH, col_header=attr_name.value,
                                                                     row_header_to_avoid=row_header_to_avoid)
@@ -146,7 +333,7 @@ class RuntimeXL:
         """
         thisAttrVals = None
 
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_thread_data_on():
             thisAttrVals = cls._fetchThisAttrFromAllThreads(attr_name=attr_name)
 
             if thisAttrVals == '':
@@ -169,7 +356,7 @@ class RuntimeXL:
         """
         thisAttrVals = None
 
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_thread_data_on():
             thread_id = threading.current_thread().native_id
             
             thisAttrVals = cls._fetchThisAttrFromAllThreads(attr_name=attr_name, row_header_to_avoid=thread_id)
@@ -189,7 +376,7 @@ class RuntimeXL:
     def updateThisAttrForThread(cls, attr_name: RuntimeAttr, cell_val_as_csv):
         """Update/append provided attr val for provided thread
         """
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_thread_data_on():
             thread_id = threading.current_thread().native_id
 
             discard_vals = ['None', '', ' ']
@@ -199,11 +386,54 @@ class RuntimeXL:
                 cell_val_as_csv = ','.join(set(cell_val_as_list).difference(discard_vals))
 
             try:
-                if len(cell_val_as_csv) > 0:
+                if len(cell_val_as_csv) > 0 and cls._is_use_runtime_store():
+                    printit(f"... Thread {thread_id} updating thread data ({attr_name.value}): {cell_val_as_csv}")
+                    vals = cell_val_as_csv.split(',')
+                    claimedVals = RuntimeStore.claim_vals(attr_name.value, vals)
+                    if len(claimedVals) < len(vals):
+                        printit(f"... Thread {thread_id} {attr_name.value} already claimed by other thread: "
+                                f"{set(vals).difference(claimedVals)}")
+                elif len(cell_val_as_csv) > 0:
                     ExcelUtil.append_to_xlcell(cls.RUNTIME_FILE_PATH, thread_id, attr_name.value, cell_val_as_csv)
             finally:
                 pass
 
+    @classmethod
+    def isClaimSupported(cls) -> bool:
+        """Claims (compare-and-set leases) need the sqlite backend (RuntimeStore)
+        """
+        return cls._is_use_runtime_store()
+
+    @classmethod
+    def claimThisAttrForThread(cls, attr_name: RuntimeAttr, vals: list) -> list[str]:
+        """Claims provided vals for curr thread without the thread lock.
+        Returns the vals claimed (vals claimed by other threads are left out)
+        """
+        vals = [str(v) for v in vals if v is not None and str(v).strip() != '']
+        if not cls.isClaimSupported():
+            return vals
+
+        thread_id = threading.current_thread().native_id
+        claimedVals = RuntimeStore.claim_vals(attr_name.value, vals)
+        printit(f"... Thread {thread_id} claimed {attr_name.value} {claimedVals}")
+
+        return claimedVals
+
+    @classmethod
+    def getClaimedAttrForThread(cls, attr_name: RuntimeAttr) -> list[str]:
+        """Returns the vals claimed by curr thread (empty if claims not supported)
+        """
+        if not cls.isClaimSupported():
+            return []
+        return RuntimeStore.get_vals_of_curr_thread(attr_name.value)
+
+    @classmethod
+    def releaseThisAttrForThread(cls, attr_name: RuntimeAttr, vals: list):
+        """Releases provided vals claimed by curr thread
+        """
+        if cls.isClaimSupported():
+            RuntimeStore.clear_vals(attr_name.value, vals)
+
     # @classmethod
     # def update_waitFor_allThread_1AttrVal_clear(cls, thread_id, attr_name: RuntimeAttr, cell_value):
     #     """Wait until 1 attr val for all threads get clear
@@ -221,12 +451,15 @@ class RuntimeXL:
     def clearThisAttrForThread(cls, attr_name: RuntimeAttr):
         """Clear provided attr for provided thread
         """
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_thread_data_on():
             thread_id = threading.current_thread().native_id
 
             try:
-                ExcelUtil.clear_xlcells(filepath=cls.RUNTIME_FILE_PATH, row_header=thread_id,
-                                        col_header=attr_name.value)
+                if cls._is_use_runtime_store():
+                    RuntimeStore.clear_vals(attr_name.value)
+                else:
+                    ExcelUtil.clear_xlcells(filepath=cls.RUNTIME_FILE_PATH, row_header=thread_id,
+                                            col_header=attr_name.value)
             finally:
                 pass
 
@@ -234,11 +467,14 @@ class RuntimeXL:
     def clearAllAttrForThread(cls):
         """Clear all attrs for provided thread
         """
-        if 'true' in cls._IS_USE_THREAD_DATAFILE:
+        if cls._is_thread_data_on():
             thread_id = threading.current_thread().native_id
 
             try:
-                ExcelUtil.clear_xlcells(filepath=cls.RUNTIME_FILE_PATH, row_header=thread_id)
+                if cls._is_use_runtime_store():
+                    RuntimeStore.clear_vals()
+                else:
+                    ExcelUtil.clear_xlcells(filepath=cls.RUNTIME_FILE_PATH, row_header=thread_id)
             finally:
                 pass
 
@@ -5,7 +5,7 @@ import time
 
 from PIL import ImageGrab
 from selenium.common import NoSuchElementException, StaleElementReferenceException, \
-    NoAlertPresentException
+    NoAlertPresentException, TimeoutException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -32,6 +32,22 @@ class UIService:
     ITERATIONS_FOR_PAGE = int(MAX_WAITTIME_FOR_PAGELOAD / INTERVAL_WAITTIME_FOR_PAGE)
     INTERVAL_WAITTIME_FOR_ELEMENT = 0.5
     ITERATIONS_FOR_ELEMENT = int(MAX_WAITTIME_FOR_ELEMENT / INTERVAL_WAITTIME_FOR_ELEMENT)
+    ELEMENT_POLL_IN_SEC = float(ENV_CONST.get('ui', 'element_poll_in_sec', fallback='0.2'))
+    JS_FILL_MIN_LEN = int(ENV_CONST.get('ui', 'js_fill_min_len', fallback='200'))
+
+    # Sets the value by the native setter (frameworks tracking the value see it), fires input/change, returns the value
+    _JS_FILL_VALUE = """
+        var ele = arguments[0], text = arguments[1], isAppend = arguments[2];
+        var proto = ele.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+        setter.call(ele, isAppend ? ele.value + text : text);
+        ele.dispatchEvent(new Event('input', {bubbles: true}));
+        ele.dispatchEvent(new Event('change', {bubbles: true}));
+        return ele.value;
+    """
+
+    ACTION_STATS = {}  # Pair of action name and [no. of actions, total sec]
+    _STATS_LOCK = threading.Lock()
 
     # AJAXTRACER_PATH = os.path.join(RESOURCE_DIR, 'ajaxtracer.js')
 
@@ -46,7 +62,9 @@ class UIService:
                 self.driver = driver
 
             self.wait_for_pageload()
-            self.elementwait = WebDriverWait(self.driver, self.MAX_WAITTIME_FOR_ELEMENT, poll_frequency=1.0)
+            self.elementwait = WebDriverWait(self.driver, self.MAX_WAITTIME_FOR_ELEMENT,
+                                             poll_frequency=self.ELEMENT_POLL_IN_SEC,
+                                             ignored_exceptions=[StaleElementReferenceException])
             self.driver.switch_to.default_content()
 
             if page_title_xpath is not None:
@@ -63,6 +81,25 @@ class UIService:
         # printit('waiting for ' + str(time_in_sec))
         time.sleep(float(time_in_sec))
 
+    @classmethod
+    def _log_action_time(cls, action: str, xpath: str, startTime: float):
+        actionInSec = time.monotonic() - startTime
+        with cls._STATS_LOCK:
+            stats = cls.ACTION_STATS.setdefault(action, [0, 0.0])
+            stats[0] += 1
+            stats[1] += actionInSec
+        printit(f"UI {action} took {round(actionInSec, 3)}s for {xpath}", isToPrint=False)
+
+    @classmethod
+    def log_action_stats(cls) -> dict:
+        """Logs and returns pair of action name and (no. of actions, total sec, avg sec) of all threads
+        """
+        with cls._STATS_LOCK:
+            stats = {a: (n, round(t, 3), round(t / n, 3)) for a, (n, t) in cls.ACTION_STATS.items()}
+        for action, (n, totalInSec, avgInSec) in stats.items():
+            printit(f"UI {action}: {n} actions, total {totalInSec}s, avg {avgInSec}s")
+        return stats
+
     def wait_for_pageload(self):
         for i in range(0, self.ITERATIONS_FOR_PAGE):
             if self.driver.execute_script("return document.readyState") == 'complete':
@@ -112,26 +149,31 @@ class UIService:
         webelements = self.driver.find_elements(By.XPATH, xpath)
         return webelements
 
+    def _find_displayed(self, xpath) -> WebElement:
+        webelement = self.driver.find_element(By.XPATH, xpath)
+        return webelement if webelement.is_displayed() else None
+
     def get_webelement(self, xpath) -> WebElement:
+        """Returns the displayed element at once if present, else waits (polls element_poll_in_sec) till displayed.
+        Returns the not displayed element or None after element_waittime_in_sec
+        """
+        startTime = time.monotonic()
         webelement = None
-        self.wait_for(1)
-        self.wait_for_pageload()
-        for i in range(0, self.ITERATIONS_FOR_ELEMENT):
+        try:
             try:
-                webelement = self.driver.find_element(By.XPATH, xpath)
-                if webelement is not None and webelement.is_displayed():
-                    break
-                else:
-                    self.wait_for(self.INTERVAL_WAITTIME_FOR_ELEMENT)
-                    self.wait_for_pageload()
-            except StaleElementReferenceException as e:
-                printit('StaleElementReferenceException found while finding ' + xpath)
-                self.wait_for(self.INTERVAL_WAITTIME_FOR_ELEMENT)
-            except NoSuchElementException as e:
-                printit('NoSuchElementException found while finding ' + xpath)
-                self.wait_for(self.INTERVAL_WAITTIME_FOR_ELEMENT)
-            except Exception as e:
-                assert False, 'Exception found while finding ' + xpath
+                webelement = self._find_displayed(xpath)
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            if webelement is None:
+                self.wait_for_pageload()
+                webelement = self.elementwait.until(EC.visibility_of_element_located((By.XPATH, xpath)))
+        except TimeoutException as e:
+            printit('Element not displayed within max waittime: ' + xpath)
+            webelements = self.driver.find_elements(By.XPATH, xpath)
+            webelement = webelements[0] if len(webelements) > 0 else None
+        except Exception as e:
+            assert False, 'Exception found while finding ' + xpath + ' ' + str(e)
+        self._log_action_time('locate', xpath, startTime)
         return webelement
 
     def is_displayed_by_xpath(self, xpath) -> bool:
@@ -169,8 +211,10 @@ class UIService:
         self.driver.switch_to.frame(webelement)
 
     def scroll_to(self, xpath):
+        startTime = time.monotonic()
         webelement = self.get_webelement(xpath)
         self.driver.execute_script("arguments[0].scrollIntoView(false);", webelement)
+        self._log_action_time('scroll', xpath, startTime)
 
     def switch_default_content(self):
         self.driver.switch_to.default_content()
@@ -185,10 +229,27 @@ class UIService:
         for i in range(0, len(value)):
             webelement.send_keys(Keys.BACKSPACE)
 
-    def fill_by_xpath(self, xpath, text, clearVal=False):
-        self._fill_by(xpath, text, clearVal=clearVal)
-
-    def _fill_by(self, xpath, text, isJSFill: bool = False, clearVal: bool = False):
+    def fill_by_xpath(self, xpath, text, clearVal=False, isJSFill: bool = None):
+        """isJSFill: None picks js fill when text is longer than js_fill_min_len, True/False forces it for the locator
+        """
+        startTime = time.monotonic()
+        self._fill_by(xpath, text, isJSFill=isJSFill, clearVal=clearVal)
+        self._log_action_time('fill', xpath, startTime)
+
+    def _js_fill(self, webelement: WebElement, text: str, clearVal: bool = False):
+        """Fills the value in 1 round trip, falls back to typing when the value read back doesnt match
+        """
+        expValue = ('' if clearVal else webelement.get_attribute('value') or '') + text
+        actValue = self.driver.execute_script(self._JS_FILL_VALUE, webelement, text, not clearVal)
+        if (actValue or '').replace('\r\n', '\n') != expValue.replace('\r\n', '\n'):
+            printit(f"JS fill value mismatch (exp len {len(expValue)}, act len {len(actValue or '')}), typing it")
+            webelement.clear()
+            webelement.send_keys(expValue)
+
+    def _fill_by(self, xpath, text, isJSFill: bool = None, clearVal: bool = False):
+        text = str(text)  # Callers pass int qty too
+        if isJSFill is None:
+            isJSFill = len(text) > self.JS_FILL_MIN_LEN
         ele_filled = False
         try:
             for i in range(0, self.ITERATIONS_FOR_ELEMENT):
@@ -203,12 +264,12 @@ class UIService:
                             else:
                                 self.wait_for(self.INTERVAL_WAITTIME_FOR_ELEMENT)
                     if webelement is not None:
-                        if clearVal:
-                            self.clear_textbox_by_value(xpath)
                         self.driver.execute_script("arguments[0].scrollIntoView(false);", webelement)
                         if isJSFill:
-                            self.driver.execute_script("arguments[0].value='" + text + "';", webelement)
+                            self._js_fill(webelement, text, clearVal)
                         else:
+                            if clearVal:
+                                self.clear_textbox_by_value(xpath)
                             webelement.send_keys(text)
                         ele_filled = True
                         break
@@ -236,7 +297,9 @@ class UIService:
             assert False, xpath + ' exception found during enter. ' + str(e)
 
     def click_by_xpath(self, xpath, isJSClick: bool = None):
+        startTime = time.monotonic()
         self._click_by(xpath, isJSClick)
+        self._log_action_time('click', xpath, startTime)
 
     def _click_by(self, xpath, isJSClick: bool = False):
         ele_clicked = False
@@ -298,24 +361,28 @@ class UIService:
             assert False, xpath + ' exception found during right click. ' + str(e)
 
     def select_in_dropdown_by_xpath(self, xpath, visibletext):
-        self.wait_for(1)
+        startTime = time.monotonic()
         webelement = self.get_webelement(xpath)
         select = Select(webelement)
         select.select_by_visible_text(visibletext)
+        self._log_action_time('select', xpath, startTime)
 
     def select_in_dropdown_by_value(self, xpath, value):
-        self.wait_for(1)
+        startTime = time.monotonic()
         webelement = self.get_webelement(xpath)
         select = Select(webelement)
         select.select_by_value(value)
+        self._log_action_time('select', xpath, startTime)
 
     def select_from_dropdown_by_xpath(self, dropdownXpath, optionXpath):
         self.click_by_xpath(dropdownXpath)
         self.click_by_xpath(optionXpath)
 
     def get_text_by_xpath(self, xpath) -> str:
+        startTime = time.monotonic()
         webelement = self.get_webelement(xpath)
         act_text = webelement.text
+        self._log_action_time('get text', xpath, startTime)
         printit('Element text: ' + act_text + ' for xpath: ' + xpath)
         return act_text
 
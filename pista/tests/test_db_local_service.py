@@ -0,0 +1,109 @@
+import pytest
+
+from apps.wms.app_db_lib import DBLib
+from apps.wms.app_status import DOStat
+from core.config_service import ENV_CONFIG
+from core.db_local_service import OracleToSQLite
+from core.db_service import DBService
+
+SCHEMA = 'local_test'
+
+FIXTURES = {
+    'asn.csv': ['TC_ASN_ID,ASN_ID:NUMBER,ASN_STATUS:NUMBER',
+                'ASN1,1,10',
+                'ASN2,2,30'],
+    'orders.csv': ['TC_ORDER_ID,ORDER_ID:NUMBER,DO_STATUS:NUMBER,CREATED_DTTM',
+                   'DO1,11,110,2024-05-06 10:11:12',
+                   'DO2,12,130,2024-05-06 18:00:00',
+                   'DO3,13,110,2024-05-07 08:00:00'],
+    'item_cbo.csv': ['ITEM_ID,ITEM_NAME',
+                     '1001,ITEM1'],
+    'item_wms.csv': ['ITEM_ID,SLOT_MISC_1',
+                     '1001,'],
+    'item_facility_mapping_wms.csv': ['ITEM_ID,MAX_UNITS_IN_DYNAMIC_ACTV:NUMBER',
+                                      '1001,5'],
+}
+
+
+@pytest.fixture
+def localSchema(tmp_path, monkeypatch):
+    """DBService on the local sqlite backend, seeded from csv fixtures"""
+    for fileName, lines in FIXTURES.items():
+        (tmp_path / fileName).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    isSectionAdded = not ENV_CONFIG.has_section('orcl_db')
+    if isSectionAdded:
+        ENV_CONFIG.add_section('orcl_db')
+    oldOptions = dict(ENV_CONFIG.items('orcl_db'))
+    ENV_CONFIG.set('orcl_db', 'db_backend', 'sqlite')
+    ENV_CONFIG.set('orcl_db', 'local_db_filepath', ':memory:')
+    ENV_CONFIG.set('orcl_db', 'local_db_fixture_dirpath', str(tmp_path))
+    monkeypatch.setattr(DBService, '_DB_SETTINGS', None)
+
+    DBService.connect_db(SCHEMA)
+    yield SCHEMA
+
+    DBService.DB_CONNS.pop(SCHEMA).close()
+    if isSectionAdded:
+        ENV_CONFIG.remove_section('orcl_db')
+    else:
+        for option in ('db_backend', 'local_db_filepath', 'local_db_fixture_dirpath'):
+            ENV_CONFIG.remove_option('orcl_db', option)
+        for option, val in oldOptions.items():
+            ENV_CONFIG.set('orcl_db', option, val)
+
+
+@pytest.fixture
+def dbLib(localSchema):
+    """DBLib without the env settings, only the schema is needed by the sql methods"""
+    dbLib = DBLib.__new__(DBLib)
+    dbLib.schema = localSchema
+    return dbLib
+
+
+@pytest.mark.parametrize('oracleSql, sqliteSql', [
+    ("select * from asn where tc_asn_id = :a and rownum <= 1",
+     "select * from asn where tc_asn_id = :a limit 1"),
+    ("select * from orders where rownum < 3 and do_status = 110 order by order_id",
+     "select * from orders where do_status = 110 order by order_id limit 2"),
+    ("select (select 1 from orders t where rownum = 1) W0 from dual",
+     "select (select 1 from orders t limit 1) W0"),
+    ("select * from orders where trunc(created_dttm) = trunc(sysdate)",
+     "select * from orders where trunc(created_dttm) = date('now', 'localtime')"),
+])
+def test_translate(oracleSql, sqliteSql):
+    assert OracleToSQLite._translate(oracleSql) == sqliteSql
+
+
+def test_trunc():
+    assert OracleToSQLite.trunc('2024-05-06 10:11:12') == '2024-05-06'
+    assert OracleToSQLite.trunc('2024-05-06 10:11:12', 'MM') == '2024-05-01'
+    assert OracleToSQLite.trunc(3.79) == 3
+    assert OracleToSQLite.trunc('3.79', 1) == 3.7
+
+
+def test_fetch_with_bind_and_rownum(localSchema):
+    row = DBService.fetch_row(DBLib._fetchASNHdrByASNNum, localSchema, bind_var={'tc_asn_id': 'ASN2'})
+    assert row['ASN_STATUS'] == 30
+
+    rows = DBService.fetch_rows("select tc_order_id from orders where do_status = :do_status and rownum <= 1",
+                                localSchema, bind_var={'do_status': 110})
+    assert len(rows) == 1
+
+    rows = DBService.fetch_rows("select tc_order_id from orders where trunc(created_dttm) = :created_date "
+                                "order by order_id", localSchema, bind_var={'created_date': '2024-05-06'})
+    assert [r['TC_ORDER_ID'] for r in rows] == ['DO1', 'DO2']
+
+
+def test_dblib_queries(dbLib):
+    assert dbLib.getItemIdFromBrcd('ITEM1') == '1001'
+
+    dbLib.assertWaitASNsStatus(['ASN1'], 10)
+    dbLib.assertWaitDOsStatus(['DO1', 'DO2', 'DO3'], [DOStat.RELEASED, DOStat.DC_ALLOCATED, DOStat.RELEASED])
+
+
+def test_wait_for_all_reports_pending_waits(dbLib):
+    with pytest.raises(AssertionError, match='1 of 2 waits not met'):
+        DBService.wait_for_all([dbLib._getDOStatusWait('DO1', DOStat.RELEASED.value),
+                                dbLib._getDOStatusWait('DO2', DOStat.RELEASED.value)],
+                               dbLib.schema, maxWaitInSec=0)
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+
+from core.file_service import DataGeneric, PlaceholderTemplate
+
+
+def test_replace_dyn_date():
+    yesterday = (datetime.today() - timedelta(days=1)).strftime('%m/%d/%Y')
+    tomorrow = (datetime.today() + timedelta(days=1)).strftime('%m/%d/%Y')
+    data = '{"fromDate": "{MMDDYYYY_S-1}", "toDate": "{MMDDYYYY_S+1}"}'
+    assert DataGeneric.replace_dyn(data) == '{"fromDate": "' + yesterday + '", "toDate": "' + tomorrow + '"}'
+
+
+def test_replace_user():
+    data = '<DO>#DO_NUM#</DO><Item>#ITEM#</Item>'
+    assert DataGeneric.replace_user(data, {'DO_NUM': 'DO1', 'ITEM': 'I1'}) == '<DO>DO1</DO><Item>I1</Item>'
+
+
+def test_all_kinds_rendered_in_one_pass():
+    template = PlaceholderTemplate.get('#DO_NUM#|{MMDDYYYY_S+0}|#{ITEM_HEIGHT}|#DO_NUM#', isToCache=False)
+    calls = []
+
+    def _resolve(kind, name, days):
+        calls.append((kind, name, days))
+        return {PlaceholderTemplate.USER: 'DO1', PlaceholderTemplate.DYN: 'TODAY',
+                PlaceholderTemplate.VARFILE: '10.5'}[kind]
+
+    assert template.render(_resolve) == 'DO1|TODAY|10.5|DO1'
+    assert calls == [(PlaceholderTemplate.USER, 'DO_NUM', None), (PlaceholderTemplate.DYN, 'MMDDYYYY_S', '+0'),
+                     (PlaceholderTemplate.VARFILE, 'ITEM_HEIGHT', None), (PlaceholderTemplate.USER, 'DO_NUM', None)]
+
+
+def test_unknown_tokens_left_as_is():
+    data = '{FOO+1} {MMDDYYYY_S} #UNKNOWN# #{NOT_IN_FILE} {"a": 1} #1 tag#'
+    assert DataGeneric.replace_dyn(data) == data
+    assert DataGeneric.replace_user(data, {'DO_NUM': 'DO1'}, isTemplate=False) == data
+
+
+def test_templates_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(PlaceholderTemplate, '_TEMPLATES', {})
+    first = PlaceholderTemplate.get('#T0#')
+    assert PlaceholderTemplate.get('#T0#') is first
+    for i in range(1, PlaceholderTemplate._MAX_TEMPLATES + 1):
+        PlaceholderTemplate.get(f'#T{i}#')
+    assert len(PlaceholderTemplate._TEMPLATES) == PlaceholderTemplate._MAX_TEMPLATES
+    assert '#T0#' not in PlaceholderTemplate._TEMPLATES
+    assert PlaceholderTemplate.get('x', isToCache=False) is not PlaceholderTemplate.get('x', isToCache=False)
@@ -0,0 +1,43 @@
+import re
+
+from core.rf_screen_snapshot import RFScreenSnapshot, TextMatcher
+
+
+def _findAll(pattern, text):
+    return [m.start() for m in re.finditer('(?=' + re.escape(pattern) + ')', text)]
+
+
+def test_overlapping_patterns():
+    text = 'ushers she said his hers'
+    patterns = ['he', 'she', 'his', 'hers', 'ers', 's', 'xyz']
+    positions = TextMatcher.get(patterns).search(text)
+    assert positions == {p: _findAll(p, text) for p in patterns}
+
+
+def test_repeated_and_empty_patterns():
+    matcher = TextMatcher.get(['aa', '', 'aa', 'a'])
+    assert matcher.patterns == ('aa', 'a')
+    assert matcher.search('aaa') == {'aa': [0, 1], 'a': [0, 1, 2]}
+    assert TextMatcher.get(['aa', 'a']) is matcher
+
+
+def test_matchers_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(TextMatcher, 'MATCHERS', {})
+    first = TextMatcher.get(['p0'])
+    for i in range(1, TextMatcher._MAX_MATCHERS + 1):
+        TextMatcher.get([f'p{i}'])
+    assert len(TextMatcher.MATCHERS) == TextMatcher._MAX_MATCHERS
+    assert ('p0',) not in TextMatcher.MATCHERS
+    assert TextMatcher.get(['p0']) is not first
+
+
+def test_snapshot_find_and_lines():
+    snapshot = RFScreenSnapshot('Item: I1\nLocn: L1\nItem: I2\n', version=7)
+    assert snapshot.find(['Item:', 'Locn:']) == {'Item:': [0, 18], 'Locn:': [9]}
+    assert snapshot.has('L1')
+    assert not snapshot.has('L2')
+    assert snapshot.missing(['Qty', 'Locn:', 'Ctrl-X']) == ['Qty', 'Ctrl-X']
+    assert snapshot.hasAll(['Item:', 'I2', ''])
+    assert snapshot.linesHaving('Item:') == [0, 2]
+    assert snapshot.linesHaving(': ') == [0, 1, 2]
+    assert snapshot.linesHaving('Qty') == []
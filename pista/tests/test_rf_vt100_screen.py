@@ -0,0 +1,70 @@
+from core.rf_vt100_screen import VT100Screen
+
+
+def test_escape_sequence_split_across_packets():
+    screen = VT100Screen(5, 20)
+    screen.feed(b'abc\x1b')
+    screen.feed(b'[2;')
+    screen.feed(b'5Hxy')
+    assert screen.get_line(1) == 'abc'
+    assert screen.get_line(2) == '    xy'
+    assert screen.version == 3
+
+
+def test_utf8_char_split_across_packets():
+    screen = VT100Screen(5, 20)
+    data = 'Qté'.encode('utf-8')
+    screen.feed(data[:-1])
+    screen.feed(data[-1:])
+    assert screen.get_line(1) == 'Qté'
+
+
+def test_cursor_addressing_and_erase():
+    screen = VT100Screen(5, 20)
+    screen.feed('\x1b[3;4HLocn?\x1b[1;1HItem:\x1b[5G123')
+    assert screen.get_lines()[:3] == ['Item123', '', '   Locn?']
+    assert (screen.cursorRow, screen.cursorCol) == (0, 7)
+
+    screen.feed('\x1b[3;6H\x1b[K')
+    assert screen.get_line(3) == '   Lo'
+    screen.feed('\x1b[2J')
+    assert screen.get_text() == '\n' * 4
+
+
+def test_cursor_moves_are_clamped():
+    screen = VT100Screen(5, 20)
+    screen.feed('\x1b[99;99H*\x1b[99A\x1b[99D#')
+    assert screen.get_line(5) == ' ' * 19 + '*'
+    assert screen.get_line(1) == '#'
+
+
+def test_line_wrap_and_scroll():
+    screen = VT100Screen(3, 5)
+    screen.feed('12345678\r\nline3\r\nline4')
+    assert screen.get_lines() == ['678', 'line3', 'line4']
+
+
+def test_scroll_region():
+    screen = VT100Screen(5, 10)
+    screen.feed('hdr\x1b[5;1Hftr')
+    screen.feed('\x1b[2;4r')  # Rows 2 to 4 scroll, cursor goes home
+    screen.feed('\x1b[2;1Ha\r\nb\r\nc\r\nd')
+    assert screen.get_lines() == ['hdr', 'b', 'c', 'd', 'ftr']
+
+    screen.feed('\x1b[2;1H\x1bM')  # Reverse index at the top of the region
+    assert screen.get_lines() == ['hdr', '', 'b', 'c', 'ftr']
+
+
+def test_insert_and_delete_lines_in_scroll_region():
+    screen = VT100Screen(4, 10)
+    screen.feed('r1\r\nr2\r\nr3\r\nr4')
+    screen.feed('\x1b[1;3r\x1b[2;1H\x1b[L')
+    assert screen.get_lines() == ['r1', '', 'r2', 'r4']
+    screen.feed('\x1b[M')
+    assert screen.get_lines() == ['r1', 'r2', '', 'r4']
+
+
+def test_private_modes_sgr_and_osc_are_ignored():
+    screen = VT100Screen(3, 20)
+    screen.feed('\x1b[?25l\x1b[1;7mBold\x1b[0m\x1b]0;title\x07 \x1b(BText')
+    assert screen.get_line(1) == 'Bold Text'
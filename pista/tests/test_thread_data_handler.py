@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+
+from apps.wms.app_db_lib import DBLib
+from core.db_service import DBService
+from core.thread_data_handler import RuntimeAttr, RuntimeStore, RuntimeXL
+
+ITEMS = RuntimeAttr.ITEMS.value
+
+
+@pytest.fixture
+def runtimeStore(tmp_path, monkeypatch):
+    """RuntimeStore on a temp store file, sqlite backend on"""
+    storeFilePath = str(tmp_path / 'thread_data.db')
+    monkeypatch.setattr(RuntimeStore, 'STORE_FILE_PATH', storeFilePath)
+    monkeypatch.setattr(RuntimeStore, 'LOCK_FILE_PATH', storeFilePath + '.lock')
+    monkeypatch.setattr(RuntimeStore, 'RUN_ID', 'test_run')
+    monkeypatch.setattr(RuntimeStore, '_IS_OLD_RUNS_PURGED', False)
+    monkeypatch.setattr(RuntimeXL, '_THREAD_DATA_BACKEND', 'sqlite')
+    RuntimeStore.close_conn()
+    yield RuntimeStore
+    RuntimeStore.clear_vals()
+
+
+def _runInThread(func, *args):
+    """Runs func in a new thread, returns its result (or raises its exception)"""
+    result = {}
+
+    def _run():
+        try:
+            result['val'] = func(*args)
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['val']
+
+
+def test_claim_and_release(runtimeStore):
+    assert RuntimeXL.isClaimSupported()
+    assert runtimeStore.claim_vals(ITEMS, ['I1', 'I2', 'I1']) == ['I1', 'I2']
+    assert sorted(runtimeStore.get_vals_of_curr_thread(ITEMS)) == ['I1', 'I2']
+
+    runtimeStore.clear_vals(ITEMS, ['I1'])
+    assert runtimeStore.get_vals_of_curr_thread(ITEMS) == ['I2']
+
+    runtimeStore.clear_vals()
+    assert runtimeStore.get_vals_of_curr_thread(ITEMS) == []
+
+
+def test_two_threads_claim_same_val(runtimeStore):
+    isClaimed, isChecked = threading.Event(), threading.Event()
+
+    def _claimAndHold():
+        claimedVals = runtimeStore.claim_vals(ITEMS, ['I1', 'I2'])
+        isClaimed.set()
+        isChecked.wait(10)
+        runtimeStore.clear_vals()
+        return claimedVals
+
+    holder = threading.Thread(target=_claimAndHold)
+    holder.start()
+    try:
+        assert isClaimed.wait(10)
+        assert runtimeStore.claim_vals(ITEMS, ['I2', 'I3']) == ['I3']
+        assert sorted(runtimeStore.get_vals_from_other_threads(ITEMS)) == ['I1', 'I2']
+    finally:
+        isChecked.set()
+        holder.join()
+
+    assert runtimeStore.claim_vals(ITEMS, ['I2']) == ['I2']
+
+
+def test_expired_lease_is_claimable(runtimeStore, monkeypatch):
+    isClaimed, isChecked = threading.Event(), threading.Event()
+
+    def _claimAndHold():
+        runtimeStore.claim_vals(ITEMS, ['I1'])
+        isClaimed.set()
+        isChecked.wait(10)
+        runtimeStore.close_conn()
+
+    monkeypatch.setattr(RuntimeStore, '_get_lease_sec', staticmethod(lambda attr: 0))
+    holder = threading.Thread(target=_claimAndHold)
+    holder.start()
+    try:
+        assert isClaimed.wait(10)
+        assert runtimeStore.get_vals_from_other_threads(ITEMS) == []
+        assert runtimeStore.claim_vals(ITEMS, ['I1']) == ['I1']
+    finally:
+        isChecked.set()
+        holder.join()
+
+
+def test_lock_is_exclusive(runtimeStore):
+    assert runtimeStore.acquire_lock(1)
+    try:
+        assert not _runInThread(runtimeStore.acquire_lock, 0.05)
+    finally:
+        runtimeStore.release_lock()
+
+    def _lockAndRelease():
+        isLocked = runtimeStore.acquire_lock(1)
+        runtimeStore.release_lock()
+        return isLocked
+
+    assert _runInThread(_lockAndRelease)
+
+
+def test_fetch_rows_and_claim_releases_unused_claims(runtimeStore, monkeypatch):
+    dbLib = DBLib.__new__(DBLib)
+    dbLib.schema = 'local_test'
+    results = [[{'ITEM_NAME': 'I1'}, {'ITEM_NAME': 'I2'}],
+               [{'ITEM_NAME': 'I1'}, {'ITEM_NAME': 'I3'}]]
+    monkeypatch.setattr(DBService, 'fetch_rows', lambda sql, schema: results.pop(0))
+
+    isClaimed, isChecked = threading.Event(), threading.Event()
+
+    def _claimAndHold():
+        runtimeStore.claim_vals(ITEMS, ['I2'])
+        isClaimed.set()
+        isChecked.wait(10)
+        runtimeStore.clear_vals()
+
+    holder = threading.Thread(target=_claimAndHold)
+    holder.start()
+    try:
+        assert isClaimed.wait(10)
+        dbRows, sql = dbLib._fetchRowsAndClaim(RuntimeAttr.ITEMS, 'ITEM_NAME', lambda: 'finder sql')
+        assert [r['ITEM_NAME'] for r in dbRows] == ['I1', 'I3']
+        assert sorted(runtimeStore.get_vals_of_curr_thread(ITEMS)) == ['I1', 'I3']
+    finally:
+        isChecked.set()
+        holder.join()
+
+    '''Less than minRows found, the new claims are released'''
+    results.append([{'ITEM_NAME': 'I4'}])
+    dbRows, sql = dbLib._fetchRowsAndClaim(RuntimeAttr.ITEMS, 'ITEM_NAME', lambda: 'finder sql', minRows=2)
+    assert len(dbRows) == 1
+    assert sorted(runtimeStore.get_vals_of_curr_thread(ITEMS)) == ['I1', 'I3']
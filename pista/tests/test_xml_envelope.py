@@ -0,0 +1,88 @@
+import io
+import xml.etree.ElementTree as ET
+
+from apps.wms.app_utils import XMLBuilder
+from core.file_service import XMLEnvelopeWriter
+
+NS = 'http://www.manh.com/ILSNET/Interface'
+
+
+def _xml(docNum: str, nsPrefix: str = None, isDefaultNs: bool = False) -> str:
+    if nsPrefix is not None:
+        tag, nsDecl = nsPrefix + ':', f' xmlns:{nsPrefix}="{NS}"'
+    else:
+        tag, nsDecl = '', f' xmlns="{NS}"' if isDefaultNs else ''
+    return (f'<{tag}tXML{nsDecl}><{tag}Header><{tag}Source>Host</{tag}Source></{tag}Header>'
+            f'<{tag}Message><{tag}Order><{tag}OrderId>{docNum}</{tag}OrderId></{tag}Order></{tag}Message>'
+            f'</{tag}tXML>')
+
+
+def _writeEnvelope(xmls: list[str]) -> tuple:
+    out = io.BytesIO()
+    writer = XMLEnvelopeWriter(out)
+    for xml in xmls:
+        writer.add_xml(xml)
+    writer.close()
+    return writer.msgCount, out.getvalue()
+
+
+def _orderIds(root, ns: str = None) -> list[str]:
+    q = f'{{{ns}}}' if ns else ''
+    return [e.text for e in root.iter(f'{q}OrderId')]
+
+
+def test_envelope_without_namespace():
+    msgCount, data = _writeEnvelope([_xml('DO1'), _xml('DO2')])
+    root = ET.fromstring(data)
+    assert msgCount == 2
+    assert root.tag == 'tXML'
+    assert [e.tag for e in root] == ['Header', 'Message', 'Message']
+    assert _orderIds(root) == ['DO1', 'DO2']
+
+
+def test_envelope_with_namespace_prefix():
+    msgCount, data = _writeEnvelope([_xml('DO1', nsPrefix='ns0'), _xml('DO2', nsPrefix='ns0')])
+    root = ET.fromstring(data)
+    assert msgCount == 2
+    assert data.count(f'xmlns:ns0="{NS}"'.encode()) == 1
+    assert b'<ns0:Message>' in data
+    assert [e.tag for e in root] == [f'{{{NS}}}Header', f'{{{NS}}}Message', f'{{{NS}}}Message']
+    assert _orderIds(root, NS) == ['DO1', 'DO2']
+
+
+def test_envelope_with_default_namespace():
+    msgCount, data = _writeEnvelope([_xml('DO1', isDefaultNs=True), _xml('DO2', isDefaultNs=True)])
+    root = ET.fromstring(data)
+    assert msgCount == 2
+    assert data.count(f'xmlns="{NS}"'.encode()) == 1
+    assert root.tag == f'{{{NS}}}tXML'
+    assert _orderIds(root, NS) == ['DO1', 'DO2']
+
+
+def test_envelope_declares_other_namespaces_on_message():
+    msgCount, data = _writeEnvelope([_xml('DO1'), _xml('DO2', nsPrefix='ns1')])
+    root = ET.fromstring(data)
+    assert msgCount == 2
+    assert _orderIds(root) == ['DO1']
+    assert _orderIds(root, NS) == ['DO2']
+
+
+def _buildXml(docNum: str, isToLog: bool = True):
+    return docNum, _xml(docNum)
+
+
+def test_write_bulk_xmls_split_by_msgs_per_envelope(tmp_path):
+    specs = ({'docNum': f'DO{i}'} for i in range(1, 6))
+    docNums, filePaths = XMLBuilder.writeBulkXmls(_buildXml, specs, outFilePath=str(tmp_path / 'dos.xml'),
+                                                  msgsPerEnvelope=2)
+    assert docNums == ['DO1', 'DO2', 'DO3', 'DO4', 'DO5']
+    assert filePaths == [str(tmp_path / f'dos_{n}.xml') for n in (1, 2, 3)]
+    assert [_orderIds(ET.parse(f).getroot()) for f in filePaths] == [['DO1', 'DO2'], ['DO3', 'DO4'], ['DO5']]
+
+
+def test_write_bulk_xmls_to_stream():
+    out = io.BytesIO()
+    docNums, filePaths = XMLBuilder.writeBulkXmls(_buildXml, [{'docNum': 'DO1'}, {'docNum': 'DO2'}], outStream=out)
+    assert docNums == ['DO1', 'DO2']
+    assert filePaths == []
+    assert _orderIds(ET.fromstring(out.getvalue())) == ['DO1', 'DO2']
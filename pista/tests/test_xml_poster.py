@@ -0,0 +1,43 @@
+import pytest
+
+from apps.wms.app_xml_poster import XMLPoster, XMLPostStubServer
+from core.config_service import ENV_CONFIG
+
+
+@pytest.fixture
+def stubServer():
+    """Xml post stub server, xml_post_channel=http to the stub url. Answers echo the posted xml"""
+    stubServer = XMLPostStubServer(respFunc=lambda xml: f"<Response><Error_Type>0</Error_Type><Echo>{xml}</Echo></Response>")
+    stubServer.start()
+
+    isSectionAdded = not ENV_CONFIG.has_section('api')
+    if isSectionAdded:
+        ENV_CONFIG.add_section('api')
+    oldOptions = dict(ENV_CONFIG.items('api'))
+    ENV_CONFIG.set('api', 'xml_post_channel', 'http')
+    ENV_CONFIG.set('api', 'xml_post_url', stubServer.url)
+    ENV_CONFIG.set('api', 'xml_post_max_workers', '3')
+    ENV_CONFIG.set('api', 'xml_post_user', '')
+
+    yield stubServer
+
+    stubServer.stop()
+    if isSectionAdded:
+        ENV_CONFIG.remove_section('api')
+    else:
+        for option in ('xml_post_channel', 'xml_post_url', 'xml_post_max_workers', 'xml_post_user'):
+            ENV_CONFIG.remove_option('api', option)
+        for option, val in oldOptions.items():
+            ENV_CONFIG.set('api', option, val)
+
+
+def test_post_batch_by_http(stubServer):
+    xmls = [f"<tXML><Message><Order><OrderId>DO{i}</OrderId></Order></Message></tXML>" for i in range(10)]
+
+    responses = XMLPoster.postBatch(xmls)
+
+    assert len(responses) == len(xmls)
+    for xml, response in zip(xmls, responses):
+        assert f"<Echo>{xml}</Echo>" in response
+    assert sorted(stubServer.postedXmls) == sorted(xmls)
+    assert XMLPoster._HTTP_SESSIONS == {}